@@ -0,0 +1,74 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Import time and memory benchmark of the mct_quantizers package.
+
+Each scenario runs in a new interpreter, and reports the time of its statements and the process peak resident
+memory after them (median over the runs):
+  - import mct_quantizers: the package import alone, which doesn't import the frameworks.
+  - pytorch: the first access to a Pytorch attribute, which imports torch only.
+  - keras: the first access to a Keras attribute, which imports tensorflow only.
+  - onnxruntime: creating the onnxruntime session options, which registers the custom ops of the quantizers.
+  - all attributes: access to all the package attributes, as the package import did before the attributes
+    were loaded lazily.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/import_time.py [--runs N]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ('import mct_quantizers', 'import mct_quantizers'),
+    ('pytorch', 'import mct_quantizers\nmct_quantizers.PytorchQuantizationWrapper'),
+    ('keras', 'import mct_quantizers\nmct_quantizers.KerasQuantizationWrapper'),
+    ('onnxruntime', 'import mct_quantizers\nmct_quantizers.get_ort_session_options()'),
+    ('all attributes', 'import mct_quantizers\n[getattr(mct_quantizers, a) for a in dir(mct_quantizers)]'),
+]
+
+TIMED_SCRIPT = """
+import time
+start = time.perf_counter()
+{statements}
+elapsed = time.perf_counter() - start
+import json, resource
+print(json.dumps({{'sec': elapsed, 'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+"""
+
+
+def run_scenario(statements):
+    outputs = subprocess.run([sys.executable, '-c', TIMED_SCRIPT.format(statements=statements)],
+                             capture_output=True, text=True, check=True).stdout
+    return json.loads(outputs.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"scenario":<24}{"time [ms]":>12}{"peak RSS [MB]":>16}')
+    for name, statements in SCENARIOS:
+        results = [run_scenario(statements) for _ in range(args.runs)]
+        ms = 1e3 * statistics.median(r['sec'] for r in results)
+        rss_mb = statistics.median(r['max_rss_mb'] for r in results)
+        print(f'{name:<24}{ms:>12.1f}{rss_mb:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
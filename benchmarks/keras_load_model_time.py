@@ -0,0 +1,80 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Load time benchmark of a large quantized Keras model, and of the quantizer classes lookups done while loading it.
+
+The model has parallel Dense layers, each wrapped in a KerasQuantizationWrapper (symmetric weights) and followed
+by a KerasActivationQuantizationHolder (power-of-two activations), saved in the Keras format and loaded with
+keras_load_quantized_model. Every wrapper and holder looks up the quantizer classes by name on deserialization,
+which is timed per lookup:
+  - scan: building the names of the quantizer classes from a scan of the classes tree (get_all_subclasses).
+  - registry: the cached names of the quantizers registry.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/keras_load_model_time.py [--layers N]
+"""
+import argparse
+import os
+import tempfile
+import time
+import timeit
+
+import tensorflow as tf
+
+from mct_quantizers import KerasActivationQuantizationHolder, KerasQuantizationWrapper, keras_load_quantized_model
+from mct_quantizers.common.base_inferable_quantizer import QUANTIZERS_REGISTRY
+from mct_quantizers.common.get_all_subclasses import get_all_subclasses
+from mct_quantizers.keras.quantizers import ActivationPOTInferableQuantizer, BaseKerasInferableQuantizer, \
+    WeightsSymmetricInferableQuantizer
+
+
+def quantized_model(num_layers, units=8):
+    # Parallel branches, as the Keras functional model construction recurses over the model depth.
+    inputs = tf.keras.layers.Input(shape=(units,))
+    outputs = []
+    for _ in range(num_layers // 2):
+        x = KerasQuantizationWrapper(tf.keras.layers.Dense(units),
+                                     {'kernel': WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False,
+                                                                                   threshold=[1.])})(inputs)
+        outputs.append(KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.],
+                                                                                         signed=True))(x))
+    return tf.keras.Model(inputs=inputs, outputs=tf.keras.layers.Concatenate()(outputs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layers', type=int, default=1000)
+    args = parser.parse_args()
+
+    scan_us = 1e6 * min(timeit.repeat(
+        lambda: {c.__name__: c for c in get_all_subclasses(BaseKerasInferableQuantizer)}, number=1000, repeat=3)) / 1000
+    registry_us = 1e6 * min(timeit.repeat(
+        lambda: QUANTIZERS_REGISTRY.subclasses_by_name(BaseKerasInferableQuantizer), number=1000, repeat=3)) / 1000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = os.path.join(tmp_dir, 'model.keras')
+        quantized_model(args.layers).save(model_path)
+        start = time.perf_counter()
+        keras_load_quantized_model(model_path)
+        load_sec = time.perf_counter() - start
+
+    print(f'Quantizer classes lookup: scan {scan_us:.1f} us, registry {registry_us:.2f} us '
+          f'({scan_us / registry_us:.0f}x), {args.layers + 1} lookups per load: '
+          f'{1e-3 * (args.layers + 1) * scan_us:.1f} ms -> {1e-3 * (args.layers + 1) * registry_us:.2f} ms')
+    print(f'keras_load_quantized_model of {args.layers} quantized layers: {load_sec:.2f} sec')
+
+
+if __name__ == '__main__':
+    main()
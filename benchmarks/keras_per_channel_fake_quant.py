@@ -0,0 +1,91 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Per-channel fake quantization time benchmark of the Keras weights quantizers, on kernels of common layers.
+
+Each kernel is quantized by a per-channel WeightsSymmetricInferableQuantizer (a WeightsUniformInferableQuantizer)
+along its output channels axis, which broadcasts the quantization parameters along the channel axis, and by the
+permute path it replaced: transposing the channel axis to the last axis,
+tf.quantization.fake_quant_with_min_max_vars_per_channel, and transposing back.
+Both are timed in eager mode and as a tf.function, and their outputs are compared (they should be identical).
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/keras_per_channel_fake_quant.py [--num-bits N] [--calls N]
+"""
+import argparse
+import timeit
+
+import numpy as np
+import tensorflow as tf
+
+from mct_quantizers.keras.quantizers import WeightsSymmetricInferableQuantizer
+
+# (layer, kernel shape, output channels axis)
+KERNELS = [
+    ('Conv2D 3x3 64->64', (3, 3, 64, 64), 3),
+    ('Conv2D 3x3 256->256', (3, 3, 256, 256), 3),
+    ('DepthwiseConv2D 3x3 512', (3, 3, 512, 1), 2),
+    ('DepthwiseConv2D 5x5 1024', (5, 5, 1024, 1), 2),
+    ('Conv2DTranspose 4x4 512->256', (4, 4, 256, 512), 2),
+    ('Dense 1024->1024', (1024, 1024), 1),
+    ('Dense 4096->1024', (4096, 1024), 1),
+]
+
+
+def permute_fake_quant(quantizer):
+    perm_vec = list(range(quantizer.input_rank))
+    perm_vec[quantizer.channel_axis], perm_vec[-1] = perm_vec[-1], perm_vec[quantizer.channel_axis]
+
+    def fake_quant(inputs):
+        q_tensor = tf.quantization.fake_quant_with_min_max_vars_per_channel(tf.transpose(inputs, perm=perm_vec),
+                                                                            min=quantizer.min_range_np,
+                                                                            max=quantizer.max_range_np,
+                                                                            num_bits=quantizer.num_bits)
+        return tf.transpose(q_tensor, perm=perm_vec)
+    return fake_quant
+
+
+def time_per_call_us(fn, x, calls):
+    fn(x)  # Warmup (tracing).
+    return 1e6 * min(timeit.repeat(lambda: fn(x), number=calls, repeat=5)) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--num-bits', type=int, default=8)
+    parser.add_argument('--calls', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{"kernel":<30}{"permute eager":>15}{"eager":>10}{"permute graph":>15}{"graph":>10}'
+          f'{"speedup":>9}  identical  [us]')
+    for name, shape, channel_axis in KERNELS:
+        num_channels = shape[channel_axis]
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=args.num_bits,
+                                                       per_channel=True,
+                                                       threshold=(np.random.rand(num_channels) + 0.5).tolist(),
+                                                       channel_axis=channel_axis,
+                                                       input_rank=len(shape))
+        kernel = tf.constant(np.random.randn(*shape), dtype=tf.float32)
+        permute = permute_fake_quant(quantizer)
+        identical = np.array_equal(permute(kernel).numpy(), quantizer(kernel).numpy())
+
+        times = [time_per_call_us(fn, kernel, args.calls) for fn in
+                 [permute, quantizer, tf.function(permute), tf.function(quantizer.__call__)]]
+        print(f'{name:<30}{times[0]:>15.0f}{times[1]:>10.0f}{times[2]:>15.0f}{times[3]:>10.0f}'
+              f'{times[2] / times[3]:>8.1f}x  {identical}')
+
+
+if __name__ == '__main__':
+    main()
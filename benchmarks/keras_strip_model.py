@@ -0,0 +1,96 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Inference and load time benchmark of a quantized Keras model and of its stripped model
+(keras_strip_quantized_model), in which the wrappers are replaced with their layers with the quantized kernels and
+the holders with fake quant ops.
+
+The model is a chain of Conv2D layers, each wrapped in a KerasQuantizationWrapper (per-channel symmetric weights)
+and followed by a KerasActivationQuantizationHolder (power-of-two activations). Both models are timed in eager
+mode and as a tf.function, saved in the Keras format and loaded (the quantized model with
+keras_load_quantized_model, the stripped model with tf.keras.models.load_model), and their outputs are compared
+(they should be identical).
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/keras_strip_model.py [--layers N] [--channels C] [--batch B] [--calls N]
+"""
+import argparse
+import os
+import tempfile
+import time
+import timeit
+
+import numpy as np
+import tensorflow as tf
+
+from mct_quantizers import KerasActivationQuantizationHolder, KerasQuantizationWrapper, keras_load_quantized_model, \
+    keras_strip_quantized_model
+from mct_quantizers.keras.quantizers import ActivationPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
+
+
+def quantized_model(num_layers, channels):
+    inputs = tf.keras.layers.Input(shape=(32, 32, channels))
+    x = inputs
+    for _ in range(num_layers):
+        weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True,
+                                                               threshold=[1.] * channels, channel_axis=3,
+                                                               input_rank=4)
+        x = KerasQuantizationWrapper(tf.keras.layers.Conv2D(channels, 3, padding='same'),
+                                     {'kernel': weights_quantizer})(x)
+        x = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[8.],
+                                                                              signed=True))(x)
+    return tf.keras.Model(inputs=inputs, outputs=x)
+
+
+def time_per_call_ms(fn, x, calls):
+    fn(x)  # Warmup (tracing).
+    return 1e3 * min(timeit.repeat(lambda: fn(x), number=calls, repeat=5)) / calls
+
+
+def save_and_load(model, load_fn, path):
+    model.save(path)
+    start = time.perf_counter()
+    loaded_model = load_fn(path)
+    return loaded_model, os.path.getsize(path), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layers', type=int, default=20)
+    parser.add_argument('--channels', type=int, default=32)
+    parser.add_argument('--batch', type=int, default=1)
+    parser.add_argument('--calls', type=int, default=20)
+    args = parser.parse_args()
+
+    model = quantized_model(args.layers, args.channels)
+    start = time.perf_counter()
+    stripped_model = keras_strip_quantized_model(model)
+    strip_sec = time.perf_counter() - start
+    x = tf.constant(np.random.randn(args.batch, 32, 32, args.channels), dtype=tf.float32)
+
+    print(f'keras_strip_quantized_model: {strip_sec:.2f} sec')
+    print(f'{"model":<12}{"eager [ms]":>12}{"tf.function [ms]":>18}{"file [KB]":>11}{"load [sec]":>12}  identical')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, m, load_fn in [('quantized', model, keras_load_quantized_model),
+                                 ('stripped', stripped_model, tf.keras.models.load_model)]:
+            eager = time_per_call_ms(lambda t: m(t, training=False), x, args.calls)
+            graph = time_per_call_ms(tf.function(lambda t: m(t, training=False)), x, args.calls)
+            loaded_model, file_size, load_sec = save_and_load(m, load_fn, os.path.join(tmp_dir, f'{name}.keras'))
+            identical = np.array_equal(model(x).numpy(), loaded_model(x).numpy())
+            print(f'{name:<12}{eager:>12.2f}{graph:>18.2f}{file_size / 1024:>11.0f}{load_sec:>12.2f}  {identical}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+CPU latency benchmark of a quantized Keras model exported to a full-integer TFLite model with
+keras_export_tflite_model, and its parity with the (fake quant) Keras model (keras_tflite_model_parity).
+
+The model is a small MobileNet-like network: a Conv2D stem and blocks of a DepthwiseConv2D and a pointwise Conv2D,
+followed by global pooling and a Dense classifier, with per-channel symmetric weights wrappers and power-of-two
+activation holders. The Keras model is timed in eager mode and as a tf.function, and the TFLite model with the
+TFLite interpreter (with its default XNNPACK delegate).
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/keras_tflite_export_latency.py [--blocks N] [--size S] [--threads N] [--calls N]
+"""
+import argparse
+import time
+import timeit
+
+import numpy as np
+import tensorflow as tf
+
+from mct_quantizers import KerasActivationQuantizationHolder, KerasQuantizationWrapper, keras_export_tflite_model, \
+    keras_tflite_model_parity
+from mct_quantizers.keras.quantizers import ActivationPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
+
+
+def holder(threshold, signed=True):
+    return KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[threshold],
+                                                                             signed=signed))
+
+
+def wrapper(layer, attr, channels, channel_axis, input_rank):
+    return KerasQuantizationWrapper(layer, {attr: WeightsSymmetricInferableQuantizer(
+        num_bits=8, threshold=(np.random.rand(channels) + 0.5).tolist(), per_channel=True,
+        channel_axis=channel_axis, input_rank=input_rank)})
+
+
+def quantized_model(num_blocks, size, channels=32, classes=100):
+    inputs = tf.keras.layers.Input(shape=(size, size, 3))
+    x = holder(4.)(inputs)
+    x = wrapper(tf.keras.layers.Conv2D(channels, 3, strides=2, padding='same', activation='relu'), 'kernel',
+                channels, 3, 4)(x)
+    x = holder(8., signed=False)(x)
+    for _ in range(num_blocks):
+        x = wrapper(tf.keras.layers.DepthwiseConv2D(3, padding='same', activation='relu'), 'depthwise_kernel',
+                    channels, 2, 4)(x)
+        x = holder(8., signed=False)(x)
+        x = wrapper(tf.keras.layers.Conv2D(channels, 1, activation='relu'), 'kernel', channels, 3, 4)(x)
+        x = holder(8., signed=False)(x)
+    x = holder(8., signed=False)(tf.keras.layers.GlobalAveragePooling2D()(x))
+    x = wrapper(tf.keras.layers.Dense(classes), 'kernel', classes, 1, 2)(x)
+    return tf.keras.Model(inputs=inputs, outputs=holder(16.)(x))
+
+
+def time_per_call_ms(fn, calls):
+    fn()  # Warmup (tracing).
+    return 1e3 * min(timeit.repeat(fn, number=calls, repeat=5)) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blocks', type=int, default=6)
+    parser.add_argument('--size', type=int, default=96)
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--calls', type=int, default=20)
+    args = parser.parse_args()
+
+    model = quantized_model(args.blocks, args.size)
+    x = np.random.randn(1, args.size, args.size, 3).astype(np.float32)
+
+    start = time.perf_counter()
+    tflite_model = keras_export_tflite_model(model)
+    export_sec = time.perf_counter() - start
+
+    interpreter = tf.lite.Interpreter(model_content=tflite_model, num_threads=args.threads)
+    interpreter.allocate_tensors()
+    input_details = interpreter.get_input_details()[0]
+    scale, zero_point = input_details['quantization']
+    interpreter.set_tensor(input_details['index'],
+                           np.clip(np.floor(x / scale + 0.5) + zero_point, -128, 127).astype(np.int8))
+
+    graph_fn = tf.function(lambda t: model(t, training=False))
+    latencies = {'Keras eager': time_per_call_ms(lambda: model(x, training=False), args.calls),
+                 'Keras tf.function': time_per_call_ms(lambda: graph_fn(x), args.calls),
+                 'TFLite int8': time_per_call_ms(interpreter.invoke, args.calls)}
+
+    print(f'keras_export_tflite_model: {export_sec:.2f} sec, {len(tflite_model) / 1024:.0f} KB')
+    print(f'parity: {keras_tflite_model_parity(model, tflite_model, x)}')
+    for name, ms in latencies.items():
+        print(f'{name:<20}{ms:>8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Inference time benchmark of a quantized Keras model, in eager mode, as a tf.function, and compiled with XLA
+(tf.function with jit_compile=True).
+
+The model is a chain of small Conv2D layers, each wrapped in a KerasQuantizationWrapper (per-channel symmetric
+weights) and followed by a KerasActivationQuantizationHolder (power-of-two activations), and a float model of the
+same layers is timed for reference. The layers are small, so the eager time is dominated by the per-call python
+overhead of the layers, which is also timed per layer (the call of a wrapper of a Dense layer, and of a holder).
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/keras_wrapper_call_time.py [--layers N] [--batch B] [--calls N]
+"""
+import argparse
+import timeit
+
+import numpy as np
+import tensorflow as tf
+
+from mct_quantizers import KerasActivationQuantizationHolder, KerasQuantizationWrapper
+from mct_quantizers.keras.quantizers import ActivationPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
+
+
+def models(num_layers, channels=8):
+    inputs = tf.keras.layers.Input(shape=(16, 16, channels))
+    x, q = inputs, inputs
+    for _ in range(num_layers):
+        x = tf.keras.layers.Conv2D(channels, 3, padding='same')(x)
+        weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True,
+                                                               threshold=[1.] * channels, channel_axis=3,
+                                                               input_rank=4)
+        q = KerasQuantizationWrapper(tf.keras.layers.Conv2D(channels, 3, padding='same'),
+                                     {'kernel': weights_quantizer})(q)
+        q = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[8.],
+                                                                              signed=True))(q)
+    return tf.keras.Model(inputs=inputs, outputs=x), tf.keras.Model(inputs=inputs, outputs=q)
+
+
+def time_per_call_ms(fn, x, calls):
+    fn(x)  # Warmup (tracing and compilation).
+    return 1e3 * min(timeit.repeat(lambda: fn(x), number=calls, repeat=5)) / calls
+
+
+def layers_call_us(calls):
+    x = tf.ones((1, 4))
+    wrapper = KerasQuantizationWrapper(tf.keras.layers.Dense(4), {'kernel': WeightsSymmetricInferableQuantizer(
+        num_bits=8, per_channel=False, threshold=[1.])})
+    holder = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[8.],
+                                                                              signed=True))
+    wrapper(x), holder(x)  # Build the layers.
+    return {name: 1e3 * time_per_call_ms(lambda t: layer.call(t, training=False), x, calls)
+            for name, layer in [('KerasQuantizationWrapper', wrapper), ('KerasActivationQuantizationHolder', holder)]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layers', type=int, default=20)
+    parser.add_argument('--batch', type=int, default=1)
+    parser.add_argument('--calls', type=int, default=50)
+    args = parser.parse_args()
+
+    float_model, quantized_model = models(args.layers)
+    x = tf.constant(np.random.randn(args.batch, 16, 16, 8), dtype=tf.float32)
+
+    print(f'{"model":<12}{"eager [ms]":>14}{"tf.function [ms]":>20}{"XLA [ms]":>12}')
+    for name, model in [('float', float_model), ('quantized', quantized_model)]:
+        eager = time_per_call_ms(lambda t: model(t, training=False), x, args.calls)
+        graph = time_per_call_ms(tf.function(lambda t: model(t, training=False)), x, args.calls)
+        xla = time_per_call_ms(tf.function(lambda t: model(t, training=False), jit_compile=True), x, args.calls)
+        print(f'{name:<12}{eager:>14.2f}{graph:>20.3f}{xla:>12.3f}')
+
+    for name, us in layers_call_us(20 * args.calls).items():
+        print(f'{name} eager call: {us:.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark of the lut value assignment kernels.
+
+The previous kernels expanded the tensor with a trailing dimension of the lut size and ran argmin over the
+distances to all lut values. The current kernels search the sorted lut values and compare only the two
+neighbours of each value. For every available framework (numpy, torch and tensorflow) the benchmark first
+checks that both kernels assign exactly the same indices, on random data and on values placed exactly
+half-way between lut values and on repeated lut values (where argmin's first-index tie-breaking decides),
+and then times them.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/lut_quantizer_kernels.py [--size N] [--lut-size K] [--chunk-size C]
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from mct_quantizers.common.constants import FOUND_TORCH, FOUND_TF
+from mct_quantizers.common.quant_utils import sort_lut_values_np, lut_nearest_indices_np
+
+
+def argmin_indices_np(tensor, lut_values):
+    expanded_lut_values = lut_values.reshape([*[1 for _ in range(tensor.ndim)], -1])
+    return np.argmin(np.abs(np.expand_dims(tensor, -1) - expanded_lut_values), axis=-1)
+
+
+def build_inputs(size, lut_size, seed=0):
+    rng = np.random.default_rng(seed)
+    # Integer lut values in an 8-bit range, in random order and with a repeated value.
+    lut_values = rng.choice(np.arange(-128, 128), size=lut_size - 1, replace=False)
+    lut_values = np.append(lut_values, lut_values[0]).astype(np.float32)
+    rng.shuffle(lut_values)
+
+    # Values exactly on and half-way between the lut values, where the tie-breaking decides.
+    sorted_values = np.unique(lut_values)
+    midpoints = (sorted_values[1:] + sorted_values[:-1]) / 2
+    ties = np.concatenate([midpoints, sorted_values])
+    tensor = np.concatenate([rng.uniform(-140, 140, size=size - len(ties)), ties]).astype(np.float32)
+    rng.shuffle(tensor)
+    return tensor.reshape(-1, 8), lut_values
+
+
+def run_numpy(tensor, lut_values, args):
+    sorted_lut = sort_lut_values_np(lut_values)
+    expected = argmin_indices_np(tensor, lut_values)
+    assert np.array_equal(lut_nearest_indices_np(tensor, *sorted_lut), expected)
+    assert np.array_equal(lut_nearest_indices_np(tensor, *sorted_lut, chunk_size=args.chunk_size), expected)
+    return (lambda: argmin_indices_np(tensor, lut_values),
+            lambda: lut_nearest_indices_np(tensor, *sorted_lut),
+            lambda: lut_nearest_indices_np(tensor, *sorted_lut, chunk_size=args.chunk_size))
+
+
+def run_torch(tensor, lut_values, args):
+    import torch
+    from mct_quantizers.pytorch.quantizer_utils import sort_lut_values, lut_nearest_indices
+
+    tensor, lut_values = torch.from_numpy(tensor), torch.from_numpy(lut_values)
+    sorted_lut = sort_lut_values(lut_values)
+
+    def argmin_indices(t):
+        return torch.argmin(torch.abs(t.unsqueeze(-1) - lut_values.reshape([1] * t.dim() + [-1])), dim=-1)
+
+    expected = argmin_indices(tensor)
+    assert torch.equal(lut_nearest_indices(tensor, *sorted_lut), expected)
+    assert torch.equal(lut_nearest_indices(tensor, *sorted_lut, chunk_size=args.chunk_size), expected)
+    return (lambda: argmin_indices(tensor),
+            lambda: lut_nearest_indices(tensor, *sorted_lut),
+            lambda: lut_nearest_indices(tensor, *sorted_lut, chunk_size=args.chunk_size))
+
+
+def run_tf(tensor, lut_values, args):
+    import tensorflow as tf
+    from mct_quantizers.keras.quantizer_utils import lut_nearest_indices
+
+    tensor = tf.constant(tensor)
+    sorted_lut = sort_lut_values_np(lut_values)
+
+    def argmin_indices(t):
+        expanded_lut_values = lut_values.reshape([*[1 for _ in range(len(t.shape))], -1])
+        return tf.argmin(tf.abs(tf.expand_dims(t, -1) - expanded_lut_values), axis=-1)
+
+    expected = argmin_indices(tensor).numpy()
+    assert np.array_equal(lut_nearest_indices(tensor, *sorted_lut).numpy(), expected)
+    assert np.array_equal(lut_nearest_indices(tensor, *sorted_lut, chunk_size=args.chunk_size).numpy(), expected)
+    return (lambda: argmin_indices(tensor).numpy(),
+            lambda: lut_nearest_indices(tensor, *sorted_lut).numpy(),
+            lambda: lut_nearest_indices(tensor, *sorted_lut, chunk_size=args.chunk_size).numpy())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=2 ** 20, help='Number of values, a multiple of 8.')
+    parser.add_argument('--lut-size', type=int, default=16)
+    parser.add_argument('--chunk-size', type=int, default=2 ** 16)
+    parser.add_argument('--iters', type=int, default=5)
+    args = parser.parse_args()
+
+    tensor, lut_values = build_inputs(args.size, args.lut_size)
+    frameworks = {'numpy': run_numpy}
+    if FOUND_TORCH:
+        frameworks['torch'] = run_torch
+    if FOUND_TF:
+        frameworks['tensorflow'] = run_tf
+
+    print(f'{"framework":<12}{"argmin [ms]":>14}{"sorted [ms]":>14}{"chunked [ms]":>14}{"speedup":>10}')
+    for name, run in frameworks.items():
+        argmin, search, chunked = run(tensor, lut_values, args)
+        argmin_ms, search_ms, chunked_ms = [1e3 * min(timeit.repeat(f, number=args.iters, repeat=3)) / args.iters
+                                            for f in (argmin, search, chunked)]
+        print(f'{name:<12}{argmin_ms:>14.2f}{search_ms:>14.2f}{chunked_ms:>14.2f}{argmin_ms / search_ms:>9.2f}x')
+    print('All kernels assigned identical indices.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+ONNX Runtime CPU latency of an exported quantized model, before and after folding its weights quantizers.
+
+The model is a stack of PytorchQuantizationWrapper linear layers with per-channel weights quantizers (symmetric,
+power-of-two and uniform, in turn), exported to ONNX with the mct_quantizers custom ops. The weights quantizer
+nodes re-quantize their constant weights in Python (numpy) on every inference run. fold_onnx_weights_quantizers
+evaluates them once and replaces them with the quantized weights, and the folded model runs without the custom
+ops library. The outputs of both models are checked to match (up to float round-off: with constant weights,
+ONNX Runtime fuses the linear layers into different kernels).
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/onnx_fold_weights_latency.py [--layers L] [--features F]
+"""
+import argparse
+import tempfile
+import timeit
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import torch
+
+from mct_quantizers import PytorchQuantizationWrapper
+from mct_quantizers import fold_onnx_weights_quantizers, get_ort_session_options
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, WeightsPOTInferableQuantizer, \
+    WeightsUniformInferableQuantizer
+
+
+def weights_quantizer(i, features):
+    if i % 3 == 0:
+        return WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True, threshold=[0.5] * features,
+                                                  channel_axis=0)
+    if i % 3 == 1:
+        return WeightsPOTInferableQuantizer(num_bits=8, per_channel=True, threshold=[0.5] * features,
+                                            channel_axis=0)
+    return WeightsUniformInferableQuantizer(num_bits=8, per_channel=True, min_range=[-0.5] * features,
+                                            max_range=[0.5] * features, channel_axis=0)
+
+
+def build_model(layers, features):
+    model = torch.nn.Sequential(*[PytorchQuantizationWrapper(torch.nn.Linear(features, features),
+                                                            {'weight': weights_quantizer(i, features)})
+                                 for i in range(layers)]).eval()
+    for wrapper in model:
+        wrapper.weights_quantizers['weight'].enable_custom_impl()
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layers', type=int, default=6)
+    parser.add_argument('--features', type=int, default=1024)
+    parser.add_argument('--iters', type=int, default=20)
+    args = parser.parse_args()
+
+    model = build_model(args.layers, args.features)
+    _, onnx_file_path = tempfile.mkstemp('.onnx')
+    torch.onnx.export(model, torch.randn(1, args.features), onnx_file_path, opset_version=16,
+                      input_names=['input'], output_names=['output'],
+                      dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+    onnx_model = onnx.load(onnx_file_path)
+    sessions = {'custom ops': ort.InferenceSession(onnx_model.SerializeToString(), get_ort_session_options(),
+                                                   providers=['CPUExecutionProvider'])}
+    fold_s = timeit.timeit(lambda: fold_onnx_weights_quantizers(onnx_model), number=1)
+    sessions['folded'] = ort.InferenceSession(onnx_model.SerializeToString(), ort.SessionOptions(),
+                                              providers=['CPUExecutionProvider'])
+
+    print(f'Folding time: {fold_s:.2f} sec')
+    print(f'{"batch":<8}{"custom ops [ms]":>18}{"folded [ms]":>14}{"speedup":>10}')
+    for batch in [1, 32]:
+        input_feed = {'input': np.random.randn(batch, args.features).astype(np.float32)}
+        outputs = [sess.run(None, input_feed)[0] for sess in sessions.values()]
+        assert np.allclose(outputs[0], outputs[1], rtol=1e-5, atol=1e-6)
+        ms = [1e3 * min(timeit.repeat(lambda: sess.run(None, input_feed), number=args.iters, repeat=3)) / args.iters
+              for sess in sessions.values()]
+        print(f'{batch:<8}{ms[0]:>18.2f}{ms[1]:>14.2f}{ms[0] / ms[1]:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
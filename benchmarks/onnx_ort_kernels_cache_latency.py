@@ -0,0 +1,112 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+ONNX Runtime CPU latency of an exported quantized model with custom ops, with and without the kernels cache.
+
+The model is a stack of PytorchQuantizationWrapper linear layers with per-channel weights quantizers (symmetric,
+power-of-two and uniform, in turn), exported to ONNX with the mct_quantizers custom ops. It is run:
+  - no cache: the weights quantizers kernels re-quantize the constant weights on every inference run
+    (ORT_KERNELS_CACHE disabled with maxsize=0).
+  - cache: the kernels outputs are memoized in ORT_KERNELS_CACHE, so the weights are quantized on the first run,
+    and later runs only fingerprint the weights and compare them to the cached copy.
+The outputs of both are checked to be identical. Both the time spent in the weights quantizers kernels and the
+end-to-end latency are reported: onnxruntime-extensions converts every custom op output through a Python list,
+which the cache does not save and which dominates the latency of large weights (folding the weights quantizers
+with fold_onnx_weights_quantizers removes it).
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/onnx_ort_kernels_cache_latency.py [--layers L] [--features F]
+"""
+import argparse
+import tempfile
+import time
+import timeit
+
+import numpy as np
+import onnxruntime as ort
+import torch
+
+from mct_quantizers import PytorchQuantizationWrapper, get_ort_session_options
+from mct_quantizers.pytorch.onnxruntime_kernels_cache import ORT_KERNELS_CACHE, ORT_KERNELS_CACHE_MAXSIZE, \
+    OrtKernelsCache
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, WeightsPOTInferableQuantizer, \
+    WeightsUniformInferableQuantizer
+
+
+def weights_quantizer(i, features):
+    if i % 3 == 0:
+        return WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True, threshold=[0.5] * features,
+                                                  channel_axis=0)
+    if i % 3 == 1:
+        return WeightsPOTInferableQuantizer(num_bits=8, per_channel=True, threshold=[0.5] * features,
+                                            channel_axis=0)
+    return WeightsUniformInferableQuantizer(num_bits=8, per_channel=True, min_range=[-0.5] * features,
+                                            max_range=[0.5] * features, channel_axis=0)
+
+
+def build_model(layers, features):
+    model = torch.nn.Sequential(*[PytorchQuantizationWrapper(torch.nn.Linear(features, features),
+                                                            {'weight': weights_quantizer(i, features)})
+                                 for i in range(layers)]).eval()
+    for wrapper in model:
+        wrapper.weights_quantizers['weight'].enable_custom_impl()
+    return model
+
+
+class TimedOrtKernelsCache(OrtKernelsCache):
+    """
+    Accumulates the time spent in the (memoized) kernels.
+    """
+    kernels_sec = 0.
+
+    def get_or_compute(self, *args, **kwargs):
+        start = time.perf_counter()
+        outputs = super().get_or_compute(*args, **kwargs)
+        TimedOrtKernelsCache.kernels_sec += time.perf_counter() - start
+        return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layers', type=int, default=6)
+    parser.add_argument('--features', type=int, default=1024)
+    parser.add_argument('--iters', type=int, default=10)
+    args = parser.parse_args()
+
+    _, onnx_file_path = tempfile.mkstemp('.onnx')
+    torch.onnx.export(build_model(args.layers, args.features), torch.randn(1, args.features), onnx_file_path,
+                      opset_version=16, input_names=['input'], output_names=['output'],
+                      dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+    sess = ort.InferenceSession(onnx_file_path, get_ort_session_options(), providers=['CPUExecutionProvider'])
+
+    ORT_KERNELS_CACHE.__class__ = TimedOrtKernelsCache
+    print(f'{"batch":<8}{"cache":<8}{"kernels [ms]":>14}{"latency [ms]":>14}{"speedup":>10}')
+    for batch in [1, 32]:
+        input_feed = {'input': np.random.randn(batch, args.features).astype(np.float32)}
+        outputs, no_cache_ms = [], None
+        for maxsize in [0, ORT_KERNELS_CACHE_MAXSIZE]:
+            ORT_KERNELS_CACHE.maxsize = maxsize
+            ORT_KERNELS_CACHE.clear()
+            outputs.append(sess.run(None, input_feed)[0])
+            TimedOrtKernelsCache.kernels_sec = 0.
+            ms = 1e3 * min(timeit.repeat(lambda: sess.run(None, input_feed), number=args.iters, repeat=3)) / args.iters
+            kernels_ms = 1e3 * TimedOrtKernelsCache.kernels_sec / (3 * args.iters)
+            no_cache_ms = no_cache_ms or ms
+            print(f'{batch:<8}{"on" if maxsize else "off":<8}{kernels_ms:>14.2f}{ms:>14.2f}{no_cache_ms / ms:>9.2f}x')
+        assert np.array_equal(outputs[0], outputs[1])
+
+
+if __name__ == '__main__':
+    main()
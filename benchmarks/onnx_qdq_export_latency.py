@@ -0,0 +1,138 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+ONNX Runtime CPU latency of a quantized ResNet-style model exported with custom quantizer ops and with QDQ nodes.
+
+The model quantizes its input with a PytorchActivationQuantizationHolder, followed by a stem convolution and
+residual blocks of PytorchQuantizationWrapper convolutions (per-channel symmetric weights), each followed by a
+PytorchActivationQuantizationHolder (power-of-two activations). It is exported to ONNX twice:
+  - custom ops: the quantizers are exported as mct_quantizers custom ops, run by ONNX Runtime through the
+    Python callbacks of get_ort_session_options.
+  - QDQ: the quantizers are exported as QuantizeLinear/DequantizeLinear pairs
+    (pytorch_set_quantizers_qdq_export), which ONNX Runtime fuses into integer kernels (QLinearConv).
+The outputs of both sessions are compared to the Pytorch model. The integer kernels of the QDQ session may round
+values on a rounding boundary to the neighbouring quantization step, and these differences propagate through the
+following layers.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/onnx_qdq_export_latency.py [--batch B] [--resolution R]
+"""
+import argparse
+import copy
+import os
+import tempfile
+import timeit
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers import get_ort_session_options, pytorch_set_quantizers_qdq_export
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, ActivationPOTInferableQuantizer
+
+
+def quantized_conv(in_channels, out_channels, stride=1):
+    weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                           per_channel=True,
+                                                           threshold=[0.25] * out_channels,
+                                                           channel_axis=0)
+    return PytorchQuantizationWrapper(torch.nn.Conv2d(in_channels, out_channels, 3, stride=stride, padding=1),
+                                      {'weight': weights_quantizer})
+
+
+def activation_holder(signed=False):
+    return PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                               threshold=[8.],
+                                                                               signed=signed))
+
+
+class ResidualBlock(torch.nn.Module):
+    def __init__(self, channels):
+        super().__init__()
+        self.conv1, self.act1 = quantized_conv(channels, channels), activation_holder()
+        self.conv2, self.act2 = quantized_conv(channels, channels), activation_holder(signed=True)
+        self.add_act = activation_holder()
+
+    def forward(self, inputs):
+        x = self.act1(torch.relu(self.conv1(inputs)))
+        x = self.act2(self.conv2(x))
+        return self.add_act(torch.relu(x + inputs))
+
+
+class QuantizedResNet(torch.nn.Module):
+    def __init__(self, channels=(32, 64, 128), blocks=2):
+        super().__init__()
+        layers = [activation_holder(signed=True), quantized_conv(3, channels[0], stride=2), torch.nn.ReLU(),
+                  activation_holder()]
+        for i, c in enumerate(channels):
+            if i > 0:
+                layers += [quantized_conv(channels[i - 1], c, stride=2), torch.nn.ReLU(), activation_holder()]
+            layers += [ResidualBlock(c) for _ in range(blocks)]
+        self.layers = torch.nn.Sequential(*layers)
+
+    def forward(self, inputs):
+        return self.layers(inputs)
+
+
+def export(model, inputs, qdq):
+    model = copy.deepcopy(model)
+    if qdq:
+        pytorch_set_quantizers_qdq_export(model)
+    else:
+        for module in model.modules():
+            if isinstance(module, PytorchQuantizationWrapper):
+                module.weights_quantizers['weight'].enable_custom_impl()
+            elif isinstance(module, PytorchActivationQuantizationHolder):
+                module.activation_holder_quantizer.enable_custom_impl()
+    _, onnx_file_path = tempfile.mkstemp('.onnx')
+    torch.onnx.export(model, inputs, onnx_file_path, opset_version=16, input_names=['input'],
+                      output_names=['output'], dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+    return onnx_file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=8)
+    parser.add_argument('--resolution', type=int, default=128)
+    parser.add_argument('--iters', type=int, default=10)
+    args = parser.parse_args()
+
+    model = QuantizedResNet().eval()
+    inputs = torch.randn(args.batch, 3, args.resolution, args.resolution)
+    with torch.no_grad():
+        expected = model(inputs).numpy()
+    input_feed = {'input': inputs.numpy()}
+
+    print(f'{"export":<14}{"onnx nodes":>12}{"latency [ms]":>14}{"speedup":>10}{"max diff [steps]":>18}{"different":>11}')
+    custom_ms = None
+    for name, qdq in [('custom ops', False), ('QDQ', True)]:
+        onnx_file_path = export(model, inputs, qdq)
+        options = ort.SessionOptions() if qdq else get_ort_session_options()
+        sess = ort.InferenceSession(onnx_file_path, options, providers=['CPUExecutionProvider'])
+        outputs = sess.run(None, input_feed)[0]
+        ms = 1e3 * min(timeit.repeat(lambda: sess.run(None, input_feed), number=args.iters, repeat=3)) / args.iters
+        custom_ms = custom_ms or ms
+        num_nodes = len(onnx.load(onnx_file_path).graph.node)
+        os.remove(onnx_file_path)
+        # The output quantization step is 8 / 256.
+        max_steps = np.abs(outputs - expected).max() / (8 / 256)
+        different = np.mean(np.abs(outputs - expected) > 1e-6)
+        print(f'{name:<14}{num_nodes:>12}{ms:>14.2f}{custom_ms / ms:>9.2f}x{max_steps:>18.0f}{different:>11.2%}')
+
+
+if __name__ == '__main__':
+    main()
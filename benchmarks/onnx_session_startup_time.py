@@ -0,0 +1,135 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Startup time of an onnxruntime inference session of a quantized model, as paid by a new inference worker.
+
+The model is a ResNet-style model of PytorchQuantizationWrapper convolutions (per-channel symmetric weights) and
+PytorchActivationQuantizationHolder (power-of-two activations), exported to ONNX with QDQ nodes, whose fusion into
+integer kernels is a costly graph optimization. The session creation time is measured, each in a fresh worker
+process:
+  - new session: ort.InferenceSession with get_ort_session_options, optimizing the model.
+  - cached optimized model: get_ort_session with an optimized_model_dir populated by an earlier worker, loading
+    the optimized model.
+and within a worker:
+  - pooled session: a second get_ort_session of the same model, reusing the session.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/onnx_session_startup_time.py [--blocks B]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers import get_ort_session, get_ort_session_options, pytorch_set_quantizers_qdq_export
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, ActivationPOTInferableQuantizer
+
+
+def quantized_conv(in_channels, out_channels, stride=1):
+    weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                           per_channel=True,
+                                                           threshold=[0.25] * out_channels,
+                                                           channel_axis=0)
+    return PytorchQuantizationWrapper(torch.nn.Conv2d(in_channels, out_channels, 3, stride=stride, padding=1),
+                                      {'weight': weights_quantizer})
+
+
+def activation_holder(signed=False):
+    return PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                               threshold=[8.],
+                                                                               signed=signed))
+
+
+class ResidualBlock(torch.nn.Module):
+    def __init__(self, channels):
+        super().__init__()
+        self.conv1, self.act1 = quantized_conv(channels, channels), activation_holder()
+        self.conv2, self.act2 = quantized_conv(channels, channels), activation_holder(signed=True)
+        self.add_act = activation_holder()
+
+    def forward(self, inputs):
+        x = self.act1(torch.relu(self.conv1(inputs)))
+        x = self.act2(self.conv2(x))
+        return self.add_act(torch.relu(x + inputs))
+
+
+class QuantizedResNet(torch.nn.Module):
+    def __init__(self, channels=(64, 128, 256), blocks=4):
+        super().__init__()
+        layers = [activation_holder(signed=True), quantized_conv(3, channels[0], stride=2), torch.nn.ReLU(),
+                  activation_holder()]
+        for i, c in enumerate(channels):
+            if i > 0:
+                layers += [quantized_conv(channels[i - 1], c, stride=2), torch.nn.ReLU(), activation_holder()]
+            layers += [ResidualBlock(c) for _ in range(blocks)]
+        self.layers = torch.nn.Sequential(*layers)
+
+    def forward(self, inputs):
+        return self.layers(inputs)
+
+
+def start_worker(mode, onnx_file_path, optimized_model_dir):
+    import onnxruntime as ort
+    start = time.perf_counter()
+    if mode == 'new':
+        ort.InferenceSession(onnx_file_path, get_ort_session_options(), providers=['CPUExecutionProvider'])
+        print(time.perf_counter() - start)
+        return
+    get_ort_session(onnx_file_path, optimized_model_dir=optimized_model_dir)
+    pooled_start = time.perf_counter()
+    get_ort_session(onnx_file_path, optimized_model_dir=optimized_model_dir)
+    print(pooled_start - start, time.perf_counter() - pooled_start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blocks', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=3, help='Worker processes per measurement.')
+    parser.add_argument('--worker', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        start_worker(*args.worker)
+        return
+
+    tmp_dir = tempfile.mkdtemp()
+    onnx_file_path, optimized_model_dir = os.path.join(tmp_dir, 'model.onnx'), os.path.join(tmp_dir, 'optimized')
+    model = pytorch_set_quantizers_qdq_export(QuantizedResNet(blocks=args.blocks).eval())
+    torch.onnx.export(model, torch.randn(1, 3, 224, 224), onnx_file_path, opset_version=16,
+                      input_names=['input'], output_names=['output'],
+                      dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+
+    def run_worker(mode):
+        output = subprocess.run([sys.executable, __file__, '--worker', mode, onnx_file_path, optimized_model_dir],
+                                check=True, capture_output=True, text=True).stdout
+        return [float(t) for t in output.split()[-2 if mode == 'pool' else -1:]]
+
+    new_sec = min(run_worker('new')[0] for _ in range(args.workers))
+    run_worker('pool')  # The first worker populates the optimized model cache.
+    cached_sec, pooled_sec = min(run_worker('pool') for _ in range(args.workers))
+
+    print(f'{"session":<26}{"startup [ms]":>14}{"speedup":>10}')
+    for name, sec in [('new session', new_sec), ('cached optimized model', cached_sec),
+                      ('pooled session', pooled_sec)]:
+        print(f'{name:<26}{1e3 * sec:>14.2f}{new_sec / sec:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
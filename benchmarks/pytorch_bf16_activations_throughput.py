@@ -0,0 +1,119 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+CPU throughput benchmark of a quantized ResNet-style model in bfloat16.
+
+The model is a stem convolution followed by residual blocks of PytorchQuantizationWrapper convolutions
+(per-channel symmetric weights), with a PytorchActivationQuantizationHolder (power-of-two activations) after
+each convolution and each residual addition. It is timed:
+  - float32: the model in float32.
+  - bfloat16, float32 fake quant: the model in bfloat16, with the activation holders quantizing in float32
+    (torch.fake_quantize_per_tensor_affine), as before the reduced precision path.
+  - bfloat16: the model in bfloat16, with the activation holders quantizing in bfloat16.
+The bfloat16 outputs of both activation paths are checked to be identical.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/pytorch_bf16_activations_throughput.py [--batch B] [--resolution R]
+"""
+import argparse
+import timeit
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, ActivationPOTInferableQuantizer
+
+
+def quantized_conv(in_channels, out_channels, stride=1):
+    weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                           per_channel=True,
+                                                           threshold=[1.] * out_channels,
+                                                           channel_axis=0)
+    return PytorchQuantizationWrapper(torch.nn.Conv2d(in_channels, out_channels, 3, stride=stride, padding=1),
+                                      {'weight': weights_quantizer})
+
+
+def activation_holder(signed=False):
+    return PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                               threshold=[8.],
+                                                                               signed=signed))
+
+
+class ResidualBlock(torch.nn.Module):
+    def __init__(self, channels):
+        super().__init__()
+        self.conv1, self.act1 = quantized_conv(channels, channels), activation_holder()
+        self.conv2, self.act2 = quantized_conv(channels, channels), activation_holder(signed=True)
+        self.add_act = activation_holder()
+
+    def forward(self, inputs):
+        x = self.act1(torch.relu(self.conv1(inputs)))
+        x = self.act2(self.conv2(x))
+        return self.add_act(torch.relu(x + inputs))
+
+
+class QuantizedResNet(torch.nn.Module):
+    def __init__(self, channels=(32, 64, 128), blocks=2):
+        super().__init__()
+        layers = [quantized_conv(3, channels[0], stride=2), torch.nn.ReLU(), activation_holder()]
+        for i, c in enumerate(channels):
+            if i > 0:
+                layers += [quantized_conv(channels[i - 1], c, stride=2), torch.nn.ReLU(), activation_holder()]
+            layers += [ResidualBlock(c) for _ in range(blocks)]
+        self.layers = torch.nn.Sequential(*layers)
+
+    def forward(self, inputs):
+        return self.layers(inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=16)
+    parser.add_argument('--resolution', type=int, default=128)
+    parser.add_argument('--iters', type=int, default=5)
+    args = parser.parse_args()
+
+    model = QuantizedResNet().eval()
+    inputs = torch.randn(args.batch, 3, args.resolution, args.resolution)
+    activation_quantizers = [m.activation_holder_quantizer for m in model.modules()
+                             if isinstance(m, PytorchActivationQuantizationHolder)]
+
+    def images_per_sec(x):
+        return args.batch * args.iters / min(timeit.repeat(lambda: model(x), number=args.iters, repeat=3))
+
+    with torch.no_grad():
+        throughput = {'float32': images_per_sec(inputs)}
+
+        model.to(torch.bfloat16)
+        bf16_inputs = inputs.to(torch.bfloat16)
+        # Force the float32 fake quant path of the activation quantizers.
+        for quantizer in activation_quantizers:
+            quantizer._reduced_precision_exact[torch.bfloat16] = False
+        expected = model(bf16_inputs)
+        throughput['bfloat16, float32 fake quant'] = images_per_sec(bf16_inputs)
+
+        for quantizer in activation_quantizers:
+            quantizer._reduced_precision_exact.clear()
+        assert torch.equal(model(bf16_inputs), expected)
+        throughput['bfloat16'] = images_per_sec(bf16_inputs)
+
+    print(f'{"model":<32}{"images/sec":>12}{"speedup":>10}')
+    for name, images in throughput.items():
+        print(f'{name:<32}{images:>12.1f}{images / throughput["float32"]:>9.2f}x')
+    print('The bfloat16 outputs of both fake quant paths are identical.')
+
+
+if __name__ == '__main__':
+    main()
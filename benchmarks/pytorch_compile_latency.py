@@ -0,0 +1,93 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+CPU latency benchmark of a quantized model in eager mode and compiled with torch.compile.
+
+The model is a small CNN built from PytorchQuantizationWrapper convolutions (per-channel symmetric weights)
+followed by ReLU and PytorchActivationQuantizationHolder (power-of-two activations). It is timed:
+  - eager: the regular quantizers, without compiling.
+  - eager, compile mode: the quantizers in compile mode, without compiling.
+  - compiled: compiled with pytorch_compile_quantized_model (inductor), in a single graph with the
+    fake-quant ops fused into the neighbouring kernels.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/pytorch_compile_latency.py [--batch B] [--resolution R] [--iters N]
+"""
+import argparse
+import timeit
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers.pytorch.compile_model import pytorch_compile_quantized_model, pytorch_set_quantizers_compile_mode
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, ActivationPOTInferableQuantizer
+
+
+class QuantizedCNN(torch.nn.Module):
+    def __init__(self, channels=(3, 16, 32, 32, 64)):
+        super().__init__()
+        layers = []
+        for in_channels, out_channels in zip(channels[:-1], channels[1:]):
+            weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                                   per_channel=True,
+                                                                   threshold=[1.] * out_channels,
+                                                                   channel_axis=0)
+            layers += [PytorchQuantizationWrapper(torch.nn.Conv2d(in_channels, out_channels, 3, padding=1),
+                                                  {'weight': weights_quantizer}),
+                       torch.nn.ReLU(),
+                       PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                           threshold=[4.],
+                                                                                           signed=False))]
+        self.layers = torch.nn.Sequential(*layers)
+
+    def forward(self, inputs):
+        return self.layers(inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=1)
+    parser.add_argument('--resolution', type=int, default=64)
+    parser.add_argument('--iters', type=int, default=50)
+    args = parser.parse_args()
+
+    model = QuantizedCNN().eval()
+    inputs = torch.randn(args.batch, 3, args.resolution, args.resolution)
+
+    def latency_ms(f):
+        return 1e3 * min(timeit.repeat(f, number=args.iters, repeat=3)) / args.iters
+
+    with torch.no_grad():
+        expected = model(inputs)
+        eager_ms = latency_ms(lambda: model(inputs))
+
+        pytorch_set_quantizers_compile_mode(model)
+        compile_mode_ms = latency_ms(lambda: model(inputs))
+
+        compiled_model = pytorch_compile_quantized_model(model, fullgraph=True)
+        outputs = compiled_model(inputs)
+        # Inductor may reorder the floating point ops of the convolutions, so the outputs can differ in the
+        # rounding of a few values by a single quantization step.
+        mismatch = (outputs != expected).float().mean().item()
+        compiled_ms = latency_ms(lambda: compiled_model(inputs))
+
+    print(f'{"mode":<22}{"latency [ms]":>14}{"speedup":>10}')
+    for name, ms in [('eager', eager_ms), ('eager, compile mode', compile_mode_ms), ('compiled', compiled_ms)]:
+        print(f'{name:<22}{ms:>14.3f}{eager_ms / ms:>9.2f}x')
+    print(f'Fraction of compiled outputs differing from eager: {mismatch:.2e}')
+
+
+if __name__ == '__main__':
+    main()
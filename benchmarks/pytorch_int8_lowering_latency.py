@@ -0,0 +1,119 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+CPU latency benchmark of a quantized ResNet-style model lowered to integer kernels.
+
+The model quantizes its input with a PytorchActivationQuantizationHolder, followed by a stem convolution and
+residual blocks of PytorchQuantizationWrapper convolutions (per-channel symmetric weights), each followed by a
+PytorchActivationQuantizationHolder (power-of-two activations), and a linear classifier. It is timed:
+  - fake quant: the model as is, in float32 with fake quantization.
+  - int8: the model lowered with pytorch_lower_quantized_model, with the convolutions and the classifier
+    running as integer kernels of the current torch quantized engine.
+The parity of every lowered layer with the fake quant layers it replaced is checked with
+pytorch_lowered_model_parity.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/pytorch_int8_lowering_latency.py [--batch B] [--resolution R]
+"""
+import argparse
+import timeit
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers.pytorch.lower_model import pytorch_lower_quantized_model, pytorch_lowered_model_parity
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer, ActivationPOTInferableQuantizer
+
+
+def quantized_layer(layer):
+    out_channels = layer.weight.shape[0]
+    weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                           per_channel=True,
+                                                           threshold=[0.25] * out_channels,
+                                                           channel_axis=0)
+    return PytorchQuantizationWrapper(layer, {'weight': weights_quantizer})
+
+
+def activation_holder(signed=False):
+    return PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                               threshold=[8.],
+                                                                               signed=signed))
+
+
+def quantized_conv(in_channels, out_channels, stride=1):
+    return quantized_layer(torch.nn.Conv2d(in_channels, out_channels, 3, stride=stride, padding=1))
+
+
+class ResidualBlock(torch.nn.Module):
+    def __init__(self, channels):
+        super().__init__()
+        self.conv1, self.act1 = quantized_conv(channels, channels), activation_holder()
+        self.conv2, self.act2 = quantized_conv(channels, channels), activation_holder(signed=True)
+        self.add_act = activation_holder()
+
+    def forward(self, inputs):
+        x = self.act1(torch.relu(self.conv1(inputs)))
+        x = self.act2(self.conv2(x))
+        return self.add_act(torch.relu(x + inputs))
+
+
+class QuantizedResNet(torch.nn.Module):
+    def __init__(self, channels=(32, 64, 128), blocks=2, num_classes=100):
+        super().__init__()
+        layers = [activation_holder(signed=True), quantized_conv(3, channels[0], stride=2), torch.nn.ReLU(),
+                  activation_holder()]
+        for i, c in enumerate(channels):
+            if i > 0:
+                layers += [quantized_conv(channels[i - 1], c, stride=2), torch.nn.ReLU(), activation_holder()]
+            layers += [ResidualBlock(c) for _ in range(blocks)]
+        self.layers = torch.nn.Sequential(*layers)
+        self.pool = torch.nn.AdaptiveAvgPool2d(1)
+        self.pool_act = activation_holder()
+        self.classifier = quantized_layer(torch.nn.Linear(channels[-1], num_classes))
+        self.classifier_act = activation_holder(signed=True)
+
+    def forward(self, inputs):
+        x = self.pool_act(self.pool(self.layers(inputs)))
+        return self.classifier_act(self.classifier(torch.flatten(x, 1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=8)
+    parser.add_argument('--resolution', type=int, default=128)
+    parser.add_argument('--iters', type=int, default=10)
+    args = parser.parse_args()
+
+    model = QuantizedResNet().eval()
+    inputs = torch.randn(args.batch, 3, args.resolution, args.resolution)
+    lowered_model = pytorch_lower_quantized_model(model)
+
+    def latency_ms(m):
+        return 1e3 * min(timeit.repeat(lambda: m(inputs), number=args.iters, repeat=3)) / args.iters
+
+    with torch.no_grad():
+        fake_quant_ms, int8_ms = latency_ms(model), latency_ms(lowered_model)
+    parity = pytorch_lowered_model_parity(model, lowered_model, inputs)
+
+    print(f'Quantized engine: {torch.backends.quantized.engine}, lowered layers: {len(parity)}')
+    print(f'{"model":<14}{"latency [ms]":>14}{"speedup":>10}')
+    for name, ms in [('fake quant', fake_quant_ms), ('int8', int8_ms)]:
+        print(f'{name:<14}{ms:>14.2f}{fake_quant_ms / ms:>9.2f}x')
+    print(f'Parity: max difference {max(p["max_steps"] for p in parity.values()):.0f} quantization step(s), '
+          f'max fraction of different outputs per layer {max(p["mismatch"] for p in parity.values()):.2e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Peak memory of loading a quantized model checkpoint, with and without construction on the meta device.
+
+The model is a stack of PytorchQuantizationWrapper linear layers (per-channel symmetric weights). Its state_dict
+is saved once, and then loaded in a fresh process:
+  - eager: the model is constructed with allocated (randomly initialized) weights, and the checkpoint is read
+    into memory and copied into them with load_state_dict.
+  - meta: the model is constructed under "with torch.device('meta')" and materialized from the memory-mapped
+    checkpoint with pytorch_materialize_quantized_model.
+Both are run with float and with frozen integer (int_weights) checkpoints, each in a fresh process, and the
+peak resident memory increase of the load is reported. All the loaded weights are read once, so memory-mapped
+checkpoint pages count as resident.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/pytorch_meta_materialize_memory.py [--layers L] [--features F]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import torch
+
+from mct_quantizers import PytorchQuantizationWrapper
+from mct_quantizers.pytorch.freeze_model import pytorch_freeze_quantized_model
+from mct_quantizers.pytorch.load_model import pytorch_materialize_quantized_model
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer
+
+
+def build_model(layers, features, int_weights):
+    model = torch.nn.Sequential(*[PytorchQuantizationWrapper(torch.nn.Linear(features, features),
+                                                             {'weight': WeightsSymmetricInferableQuantizer(
+                                                                 num_bits=8,
+                                                                 per_channel=True,
+                                                                 threshold=[1.] * features,
+                                                                 channel_axis=0)})
+                                  for _ in range(layers)])
+    if int_weights:
+        pytorch_freeze_quantized_model(model, int_weights=True)
+    return model
+
+
+def rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def load(mode, checkpoint, layers, features, int_weights):
+    # The peak is sampled from the resident memory after the imports, whose own peak would hide the load.
+    baseline_mb, peak_mb, done = rss_mb(), [0.], threading.Event()
+
+    def sample():
+        while not done.is_set():
+            peak_mb[0] = max(peak_mb[0], rss_mb())
+            time.sleep(1e-3)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    if mode == 'eager':
+        model = build_model(layers, features, int_weights)
+        model.load_state_dict(torch.load(checkpoint, weights_only=True))
+    else:
+        with torch.device('meta'):
+            model = build_model(layers, features, int_weights)
+        pytorch_materialize_quantized_model(model, checkpoint)
+    # Read all the weights, so memory-mapped pages become resident like they do on the first forward pass.
+    sum([tensor.sum().item() for tensor in model.state_dict().values()])
+    done.set()
+    sampler.join()
+    print(peak_mb[0] - baseline_mb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layers', type=int, default=8)
+    parser.add_argument('--features', type=int, default=2048)
+    parser.add_argument('--load', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load:
+        mode, checkpoint, int_weights = args.load
+        load(mode, checkpoint, args.layers, args.features, int_weights == '1')
+        return
+
+    print(f'{"checkpoint":<12}{"size [MB]":>12}{"eager peak [MB]":>18}{"meta peak [MB]":>18}')
+    for int_weights in [False, True]:
+        _, checkpoint = tempfile.mkstemp('.pt')
+        torch.save(build_model(args.layers, args.features, int_weights).state_dict(), checkpoint)
+        size_mb = os.path.getsize(checkpoint) / 2 ** 20
+        peaks = []
+        for mode in ['eager', 'meta']:
+            output = subprocess.run([sys.executable, __file__, '--layers', str(args.layers),
+                                     '--features', str(args.features),
+                                     '--load', mode, checkpoint, str(int(int_weights))],
+                                    check=True, capture_output=True, text=True).stdout
+            peaks.append(float(output.split()[-1]))
+        os.remove(checkpoint)
+        print(f'{"int" if int_weights else "float":<12}{size_mb:>12.1f}{peaks[0]:>18.1f}{peaks[1]:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
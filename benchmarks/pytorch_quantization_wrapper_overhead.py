@@ -0,0 +1,108 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Microbenchmark of the Python dispatch overhead of PytorchQuantizationWrapper.forward.
+
+The wrapped layers and quantizers are tiny so the measured time is dominated by the wrapper's own
+Python work. The current forward (running the precompiled dispatch plan) is compared against a
+re-implementation of the previous forward, which inspected every quantizer's signature, sorted the
+positional weights and merged the call kwargs on each call.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/pytorch_quantization_wrapper_overhead.py [--iters N]
+"""
+import argparse
+import inspect
+import timeit
+
+import torch
+
+from mct_quantizers.common.constants import TRAINING, QUANTIZED_POSITIONAL_WEIGHT
+from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+
+
+class IdentityQuantizer:
+    """
+    A no-op weights quantizer, so the benchmark measures the wrapper and not the quantization.
+    """
+
+    def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        return inputs
+
+    def initialize_quantization(self, tensor_shape, name, layer):
+        return {}
+
+
+def legacy_forward(wrapper: PytorchQuantizationWrapper, *args, **kwargs):
+    """
+    The wrapper forward as it was before the dispatch plan was introduced.
+    """
+    if wrapper.is_weights_quantization:
+        quantized_weights = {}
+        for name, unquantized_weight, quantizer in wrapper._weights_vars:
+            s = inspect.signature(quantizer.__call__)
+            if TRAINING in s.parameters.keys():
+                quantized_weight = quantizer(unquantized_weight, wrapper.training)
+            else:
+                quantized_weight = quantizer(unquantized_weight)
+            quantized_weights.update({name: quantized_weight})
+        wrapper.set_quantize_weights(quantized_weights)
+
+    if not wrapper.is_str_attr:
+        args = list(args)
+        weight_positions = [w[0] for w in wrapper._weights_vars]
+        for pos in sorted(weight_positions):
+            args.insert(pos, getattr(wrapper, f'{QUANTIZED_POSITIONAL_WEIGHT}_{pos}'))
+
+    _kwargs = {**wrapper.op_call_kwargs, **kwargs}
+    if wrapper.is_inputs_as_list:
+        return wrapper.layer(args, *wrapper.op_call_args, **_kwargs)
+    return wrapper.layer(*args, *wrapper.op_call_args, **_kwargs)
+
+
+def build_wrappers():
+    return {
+        'linear (weight+bias)': (PytorchQuantizationWrapper(torch.nn.Linear(8, 8),
+                                                            {'weight': IdentityQuantizer(),
+                                                             'bias': IdentityQuantizer()}),
+                                 torch.randn(1, 8)),
+        'sub (1 positional)': (PytorchQuantizationWrapper(torch.sub, {0: IdentityQuantizer()},
+                                                          weight_values={0: torch.randn(8)}),
+                               torch.randn(1, 8)),
+        'cat (2 positional)': (PytorchQuantizationWrapper(torch.cat, {0: IdentityQuantizer(), 2: IdentityQuantizer()},
+                                                          weight_values={0: torch.randn(1, 8), 2: torch.randn(1, 8)},
+                                                          op_call_kwargs={'dim': 1}, is_inputs_as_list=True),
+                               torch.randn(1, 8)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iters', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f'{"wrapper":<24}{"legacy [us/call]":>18}{"plan [us/call]":>18}{"speedup":>10}')
+    with torch.no_grad():
+        for name, (wrapper, x) in build_wrappers().items():
+            assert torch.equal(legacy_forward(wrapper, x), wrapper(x))
+            legacy = min(timeit.repeat(lambda: legacy_forward(wrapper, x), number=args.iters, repeat=3))
+            # Call forward directly (not through nn.Module.__call__), same as the legacy forward.
+            plan = min(timeit.repeat(lambda: wrapper.forward(x), number=args.iters, repeat=3))
+            legacy_us, plan_us = 1e6 * legacy / args.iters, 1e6 * plan / args.iters
+            print(f'{name:<24}{legacy_us:>18.2f}{plan_us:>18.2f}{legacy_us / plan_us:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
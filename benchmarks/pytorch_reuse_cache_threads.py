@@ -0,0 +1,99 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Multithreaded inference throughput of one quantized model with the weights quantizers reuse cache.
+
+A stack of PytorchQuantizationWrapper linear layers (per-channel symmetric weights) is served from 1, 2, 4, ...
+threads that share the model, with and without the reuse cache. Each thread runs single-threaded torch ops
+(torch.set_num_threads(1)), so the throughput scales with the threads as long as they don't serialize on the
+quantizers: with the reuse cache, the weights are quantized once and the cached outputs are read without locking.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/pytorch_reuse_cache_threads.py [--max-threads T] [--features F]
+"""
+import argparse
+import threading
+import time
+
+import torch
+
+from mct_quantizers import PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizers import WeightsSymmetricInferableQuantizer
+
+
+def build_model(layers, features):
+    return torch.nn.Sequential(*[PytorchQuantizationWrapper(torch.nn.Linear(features, features),
+                                                            {'weight': WeightsSymmetricInferableQuantizer(
+                                                                num_bits=8,
+                                                                per_channel=True,
+                                                                threshold=[1.] * features,
+                                                                channel_axis=0)})
+                                 for _ in range(layers)]).eval()
+
+
+def throughput(model, inputs, num_threads, calls_per_thread):
+    barrier = threading.Barrier(num_threads + 1)
+
+    def run():
+        barrier.wait()
+        with torch.no_grad():
+            for _ in range(calls_per_thread):
+                model(inputs)
+
+    threads = [threading.Thread(target=run) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return num_threads * calls_per_thread / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-threads', type=int, default=8)
+    parser.add_argument('--layers', type=int, default=4)
+    parser.add_argument('--features', type=int, default=1024)
+    parser.add_argument('--batch', type=int, default=16)
+    parser.add_argument('--calls', type=int, default=20, help='Calls per thread.')
+    args = parser.parse_args()
+
+    torch.set_num_threads(1)
+    model = build_model(args.layers, args.features)
+    inputs = torch.randn(args.batch, args.features)
+    quantizers = [m.weights_quantizers['weight'] for m in model]
+
+    print(f'{"threads":<10}{"no reuse [calls/sec]":>22}{"reuse [calls/sec]":>20}{"reuse scaling":>16}'
+          f'{"quantizations":>16}')
+    num_threads, single_thread = 1, None
+    while num_threads <= args.max_threads:
+        results = []
+        for reuse in [False, True]:
+            for quantizer in quantizers:
+                quantizer.enable_reuse_quantizer() if reuse else quantizer.disable_reuse_quantizer()
+            misses = sum(q.reuse_cache.misses for q in quantizers)
+            throughput(model, inputs, num_threads, 2)  # Warm up (and populate the reuse cache).
+            results.append(throughput(model, inputs, num_threads, args.calls))
+        # Number of weights quantizations with the reuse cache, by all the threads together.
+        quantizations = sum(q.reuse_cache.misses for q in quantizers) - misses
+        single_thread = single_thread or results[1]
+        print(f'{num_threads:<10}{results[0]:>22.1f}{results[1]:>20.1f}{results[1] / single_thread:>15.2f}x'
+              f'{quantizations:>16}')
+        num_threads *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmark suite of all the inferable quantizers, with a machine-readable baseline to gate performance regressions.
+
+Every inferable quantizer class (weights and activations; symmetric, power-of-two, uniform and LUT) is benchmarked
+in every available framework:
+  - pytorch: the Pytorch quantizers, called eagerly under torch.no_grad().
+  - keras: the Keras quantizers, called eagerly on tf tensors.
+  - ort: the numpy implementations of the onnxruntime custom ops of the Pytorch quantizers (without the kernels
+    cache of the weights quantizers). The activation LUT quantizer has no onnxruntime custom op.
+Weights quantizers are run per-tensor and per-channel. Each case sweeps the bit widths and the tensor shapes (in
+the framework layout), and reports:
+  - throughput: million quantized elements per second (best of the repeats).
+  - latency: milliseconds per call.
+  - peak memory: the peak resident memory increase of a single call, including its output. It is read from the
+    kernel peak RSS counter (VmHWM, reset through /proc/self/clear_refs), with a fixed malloc mmap threshold so
+    large temporary buffers are returned on free. It is reported as null where not supported (non Linux).
+
+Each case has an id '<framework>/<quantizer class>/<per_tensor|per_channel>/<bits>bit/<shape>'. The results are
+saved as a JSON baseline with --save, and compared to a baseline with --compare, which lists the cases whose
+throughput dropped or peak memory grew beyond the tolerances and exits with status 1 if there are any. Baselines
+are only comparable on the same machine and library versions, which are recorded in the baseline metadata.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/quantizers_suite.py [--frameworks pytorch keras ort] [--filter F] [--quick]
+        [--save baseline.json] [--compare baseline.json [--tolerance T] [--memory-tolerance M]]
+"""
+import os
+import sys
+
+# Allocations larger than this are mapped and returned to the system on free, so the peak memory counter sees
+# the temporary buffers of each call. Set before the process starts, so the process is re-executed with it.
+MMAP_THRESHOLD = str(2 ** 16)
+if sys.platform.startswith('linux') and os.environ.get('MALLOC_MMAP_THRESHOLD_') != MMAP_THRESHOLD:
+    os.execve(sys.executable, [sys.executable] + sys.argv, {**os.environ, 'MALLOC_MMAP_THRESHOLD_': MMAP_THRESHOLD})
+
+import argparse
+import inspect
+import json
+import platform
+import time
+import timeit
+
+import numpy as np
+
+import mct_quantizers
+from mct_quantizers.common.constants import FOUND_TORCH, FOUND_TF, FOUND_ONNXRUNTIME_EXTENSIONS, \
+    LUT_VALUES_BITWIDTH, EPS
+from mct_quantizers.common.get_all_subclasses import get_all_subclasses
+from mct_quantizers.common.base_inferable_quantizer import QuantizationTarget
+from mct_quantizers.common.quant_info import QuantizationMethod
+
+FRAMEWORKS = ['pytorch', 'keras', 'ort']
+
+# Shapes in the Pytorch (and ONNX) layout: conv kernels (out, in, h, w), a linear kernel (out, in), and
+# activations (batch, channels, h, w). The Keras shapes are the same tensors in the Keras layout.
+WEIGHTS_SHAPES = [(64, 64, 3, 3), (256, 256, 3, 3), (1024, 4096)]
+ACTIVATION_SHAPES = [(1, 64, 56, 56), (8, 64, 56, 56), (32, 256, 14, 14)]
+BITS = [2, 4, 8]
+# The LUT quantizers compare every element to every LUT value, so 8-bit LUTs are left out of the sweep.
+LUT_BITS = [2, 4]
+LUT_METHODS = [QuantizationMethod.LUT_POT_QUANTIZER, QuantizationMethod.LUT_SYM_QUANTIZER]
+
+
+def keras_shape(shape, target):
+    if target == QuantizationTarget.Activation:
+        # NCHW -> NHWC
+        return (shape[0],) + shape[2:] + (shape[1],)
+    # (out, in, h, w) -> (h, w, in, out), (out, in) -> (in, out)
+    return tuple(reversed(shape[2:])) + (shape[1], shape[0]) if len(shape) == 4 else (shape[1], shape[0])
+
+
+def quantizer_kwargs(quantizer_class, num_bits, per_channel, shape, channel_axis):
+    """
+    Arguments of a quantizer class constructor, filtered by its signature.
+    """
+    method = quantizer_class.quantization_method[0]
+    channels = shape[channel_axis] if per_channel else 1
+    kwargs = {'num_bits': num_bits, 'per_channel': per_channel, 'channel_axis': channel_axis,
+              'input_rank': len(shape), 'signed': True}
+    if method in LUT_METHODS:
+        lut_values = np.unique(np.round(np.linspace(-2 ** (LUT_VALUES_BITWIDTH - 1), 2 ** (LUT_VALUES_BITWIDTH - 1) - 1,
+                                                    2 ** num_bits)))
+        kwargs.update(lut_values=lut_values.tolist(), threshold=[2.] * channels)
+    elif method == QuantizationMethod.UNIFORM:
+        kwargs.update(min_range=[-1.] * channels, max_range=[1.5] * channels)
+    else:
+        kwargs.update(threshold=[2.] * channels)
+    parameters = inspect.signature(quantizer_class.__init__).parameters
+    return {k: v for k, v in kwargs.items() if k in parameters}
+
+
+def inferable_quantizer_classes(base_class):
+    return sorted([c for c in get_all_subclasses(base_class) if getattr(c, 'quantization_target', None) is not None],
+                  key=lambda c: c.__name__)
+
+
+def pytorch_case(quantizer_class, kwargs, shape):
+    import torch
+    quantizer = quantizer_class(**kwargs)
+    inputs = torch.randn(*shape)
+
+    def run():
+        with torch.no_grad():
+            return quantizer(inputs)
+    return run
+
+
+def keras_case(quantizer_class, kwargs, shape):
+    import tensorflow as tf
+    quantizer = quantizer_class(**kwargs)
+    inputs = tf.random.normal(shape)
+    return lambda: quantizer(inputs)
+
+
+def ort_case(quantizer_class, kwargs, shape):
+    """
+    The numpy implementation of the onnxruntime custom op of a Pytorch quantizer, or None if it has none.
+    """
+    from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_symmetric_inferable_quantizer \
+        import quantize_sym_weights_numpy
+    from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_uniform_inferable_quantizer \
+        import quantize_uniform_weights_numpy
+    from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_lut_symmetric_inferable_quantizer \
+        import quantize_lut_sym_weights_numpy
+    from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_symmetric_inferable_quantizer \
+        import quantize_sym_activations_numpy
+    from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_uniform_inferable_quantizer \
+        import quantize_uniform_activations_numpy
+
+    inputs = np.random.randn(*shape).astype(np.float32)
+    method = quantizer_class.quantization_method[0]
+    array = lambda name: np.asarray(kwargs[name], dtype=np.float32)
+    if quantizer_class.quantization_target == QuantizationTarget.Weights:
+        if method in LUT_METHODS:
+            return lambda: quantize_lut_sym_weights_numpy(inputs, array('lut_values'), array('threshold'),
+                                                          LUT_VALUES_BITWIDTH, EPS, kwargs['per_channel'],
+                                                          kwargs['channel_axis'], kwargs['input_rank'])
+        if method == QuantizationMethod.UNIFORM:
+            return lambda: quantize_uniform_weights_numpy(inputs, kwargs['num_bits'], array('min_range'),
+                                                          array('max_range'), kwargs['per_channel'],
+                                                          kwargs['channel_axis'])
+        return lambda: quantize_sym_weights_numpy(inputs, kwargs['num_bits'], array('threshold'),
+                                                  kwargs['per_channel'], kwargs['channel_axis'])
+    if method in LUT_METHODS:
+        return None
+    if method == QuantizationMethod.UNIFORM:
+        return lambda: quantize_uniform_activations_numpy(inputs, kwargs['min_range'][0], kwargs['max_range'][0],
+                                                          kwargs['num_bits'])
+    return lambda: quantize_sym_activations_numpy(inputs, kwargs['threshold'][0], kwargs['signed'],
+                                                  kwargs['num_bits'])
+
+
+def framework_cases(framework):
+    """
+    Yields (case id, number of elements, case builder) of all the cases of a framework.
+    """
+    if framework == 'keras':
+        from mct_quantizers.keras.quantizers import BaseKerasInferableQuantizer
+        classes, build_case = inferable_quantizer_classes(BaseKerasInferableQuantizer), keras_case
+    else:
+        from mct_quantizers.pytorch.quantizers import BasePyTorchInferableQuantizer
+        classes = inferable_quantizer_classes(BasePyTorchInferableQuantizer)
+        build_case = pytorch_case if framework == 'pytorch' else ort_case
+
+    for quantizer_class in classes:
+        target = quantizer_class.quantization_target
+        is_weights = target == QuantizationTarget.Weights
+        bits = LUT_BITS if quantizer_class.quantization_method[0] in LUT_METHODS else BITS
+        for per_channel in ([False, True] if is_weights else [False]):
+            for num_bits in bits:
+                for shape in (WEIGHTS_SHAPES if is_weights else ACTIVATION_SHAPES):
+                    if framework == 'keras':
+                        shape = keras_shape(shape, target)
+                    channel_axis = (len(shape) - 1 if framework == 'keras' else 0) if is_weights else None
+                    kwargs = quantizer_kwargs(quantizer_class, num_bits, per_channel, shape, channel_axis)
+                    case_id = '/'.join([framework, quantizer_class.__name__,
+                                        'per_channel' if per_channel else 'per_tensor', f'{num_bits}bit',
+                                        'x'.join(str(s) for s in shape)])
+                    yield case_id, int(np.prod(shape)), lambda c=quantizer_class, k=kwargs, s=shape: build_case(c, k, s)
+
+
+def _read_status_mb(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1]) / 2 ** 10
+
+
+def peak_memory_mb(run):
+    """
+    Peak resident memory increase of a call, or None if the peak counter can't be reset.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return None
+    baseline = _read_status_mb('VmRSS')
+    outputs = run()
+    peak = _read_status_mb('VmHWM') - baseline
+    del outputs
+    return max(peak, 0.)
+
+
+def measure(run, num_elements, min_time, repeats):
+    run()  # Warm up.
+    memory_mb = peak_memory_mb(run)
+    start = time.perf_counter()
+    run()
+    number = max(1, int(min_time / max(time.perf_counter() - start, 1e-9)))
+    sec = min(timeit.repeat(run, number=number, repeat=repeats)) / number
+    return {'throughput_melems': num_elements / sec / 1e6,
+            'latency_ms': 1e3 * sec,
+            'peak_memory_mb': memory_mb}
+
+
+def metadata():
+    versions = {'mct_quantizers': mct_quantizers.__version__, 'python': platform.python_version(),
+                'numpy': np.__version__}
+    if FOUND_TORCH:
+        import torch
+        versions.update(torch=torch.__version__, torch_num_threads=torch.get_num_threads())
+    if FOUND_TF:
+        import tensorflow as tf
+        versions.update(tensorflow=tf.__version__)
+    return {**versions, 'platform': platform.platform(), 'processor': platform.processor(),
+            'cpu_count': os.cpu_count()}
+
+
+def compare(results, baseline, tolerance, memory_tolerance):
+    """
+    Print the regressions of the results relative to a baseline.
+
+    Returns: The number of regressions.
+    """
+    regressions, compared = [], 0
+    for case_id, result in results.items():
+        base = baseline['results'].get(case_id)
+        if base is None:
+            continue
+        compared += 1
+        if result['throughput_melems'] < base['throughput_melems'] * (1 - tolerance):
+            regressions.append(f'{case_id}: throughput {result["throughput_melems"]:.1f} < '
+                               f'baseline {base["throughput_melems"]:.1f} M elements/sec')
+        # 1MB of slack for allocations that are not proportional to the tensors.
+        if None not in (result['peak_memory_mb'], base['peak_memory_mb']) and \
+                result['peak_memory_mb'] > base['peak_memory_mb'] * (1 + memory_tolerance) + 1.:
+            regressions.append(f'{case_id}: peak memory {result["peak_memory_mb"]:.1f} > '
+                               f'baseline {base["peak_memory_mb"]:.1f} MB')
+    if baseline.get('metadata') != metadata():
+        print('Warning: the baseline was recorded on another machine or with other library versions.')
+    print(f'Compared {compared} cases to the baseline ({len(results) - compared} new): '
+          f'{len(regressions)} regression(s).')
+    for regression in regressions:
+        print(f'  {regression}')
+    return len(regressions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frameworks', nargs='+', choices=FRAMEWORKS, default=FRAMEWORKS)
+    parser.add_argument('--filter', nargs='+', default=[], help='Run only the cases whose id contains one of these.')
+    parser.add_argument('--quick', action='store_true', help='Only the smallest shape and the largest bit width.')
+    parser.add_argument('--min-time', type=float, default=0.1, help='Minimal time of each repeat (sec).')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--save', help='Save the results as a JSON baseline.')
+    parser.add_argument('--compare', help='Compare the results to a JSON baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Allowed relative throughput drop.')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1, help='Allowed relative peak memory growth.')
+    args = parser.parse_args()
+
+    if args.quick:
+        WEIGHTS_SHAPES[1:], ACTIVATION_SHAPES[1:], BITS[:-1], LUT_BITS[:-1] = [], [], [], []
+    available = {'pytorch': FOUND_TORCH, 'keras': FOUND_TF, 'ort': FOUND_TORCH and FOUND_ONNXRUNTIME_EXTENSIONS}
+
+    results = {}
+    print(f'{"case":<86}{"M elem/s":>10}{"ms":>10}{"peak MB":>9}')
+    for framework in args.frameworks:
+        if not available[framework]:
+            print(f'Skipping {framework}: the framework is not installed.')
+            continue
+        for case_id, num_elements, build_case in framework_cases(framework):
+            if args.filter and not any(f in case_id for f in args.filter):
+                continue
+            run = build_case()
+            if run is None:
+                continue
+            result = measure(run, num_elements, args.min_time, args.repeats)
+            results[case_id] = result
+            memory = '-' if result['peak_memory_mb'] is None else f'{result["peak_memory_mb"]:.1f}'
+            print(f'{case_id:<86}{result["throughput_melems"]:>10.1f}{result["latency_ms"]:>10.3f}{memory:>9}')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'metadata': metadata(), 'results': results}, f, indent=1)
+        print(f'Saved {len(results)} results to {args.save}')
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance, args.memory_tolerance) > 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
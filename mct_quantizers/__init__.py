@@ -15,22 +15,71 @@
 
 __version__ = "1.7.0"
 
+import importlib
 
 from mct_quantizers.common.base_inferable_quantizer import QuantizationTarget, BaseInferableQuantizer, mark_quantizer
 from mct_quantizers.common.quant_info import QuantizationMethod
-from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
-from mct_quantizers.pytorch.activation_quantization_holder import PytorchActivationQuantizationHolder
-from mct_quantizers.pytorch.fln_activation_quantization_holder import PytorchFLNActivationQuantizationHolder
-from mct_quantizers.pytorch.preserving_activation_quantization_holder import PytorchPreservingActivationQuantizationHolder
-from mct_quantizers.keras.load_model import keras_load_quantized_model
-from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
-from mct_quantizers.pytorch.load_model import pytorch_load_quantized_model
-from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
-
 from mct_quantizers.common import constants
-from mct_quantizers.keras import quantizers as keras_quantizers
-from mct_quantizers.pytorch import quantizers as pytorch_quantizers
 
-from mct_quantizers.pytorch.onnxruntime_session_options import get_ort_session_options
+# The framework (Keras, Pytorch and onnxruntime) attributes of the package are imported on their first access,
+# so importing mct_quantizers does not import tensorflow or torch: attribute name -> (module, attribute in module),
+# where an attribute None is the module itself.
+_LAZY_ATTRIBUTES = {
+    'KerasActivationQuantizationHolder': ('mct_quantizers.keras.activation_quantization_holder',
+                                          'KerasActivationQuantizationHolder'),
+    'PytorchActivationQuantizationHolder': ('mct_quantizers.pytorch.activation_quantization_holder',
+                                            'PytorchActivationQuantizationHolder'),
+    'PytorchFLNActivationQuantizationHolder': ('mct_quantizers.pytorch.fln_activation_quantization_holder',
+                                               'PytorchFLNActivationQuantizationHolder'),
+    'PytorchPreservingActivationQuantizationHolder': (
+        'mct_quantizers.pytorch.preserving_activation_quantization_holder',
+        'PytorchPreservingActivationQuantizationHolder'),
+    'keras_export_tflite_model': ('mct_quantizers.keras.export_model', 'keras_export_tflite_model'),
+    'keras_load_quantized_model': ('mct_quantizers.keras.load_model', 'keras_load_quantized_model'),
+    'keras_strip_quantized_model': ('mct_quantizers.keras.strip_model', 'keras_strip_quantized_model'),
+    'keras_tflite_model_parity': ('mct_quantizers.keras.export_model', 'keras_tflite_model_parity'),
+    'KerasQuantizationWrapper': ('mct_quantizers.keras.quantize_wrapper', 'KerasQuantizationWrapper'),
+    'pytorch_load_quantized_model': ('mct_quantizers.pytorch.load_model', 'pytorch_load_quantized_model'),
+    'pytorch_materialize_quantized_model': ('mct_quantizers.pytorch.load_model',
+                                            'pytorch_materialize_quantized_model'),
+    'pytorch_freeze_quantized_model': ('mct_quantizers.pytorch.freeze_model', 'pytorch_freeze_quantized_model'),
+    'pytorch_compile_quantized_model': ('mct_quantizers.pytorch.compile_model', 'pytorch_compile_quantized_model'),
+    'pytorch_set_quantizers_compile_mode': ('mct_quantizers.pytorch.compile_model',
+                                            'pytorch_set_quantizers_compile_mode'),
+    'pytorch_lower_quantized_model': ('mct_quantizers.pytorch.lower_model', 'pytorch_lower_quantized_model'),
+    'pytorch_lowered_model_parity': ('mct_quantizers.pytorch.lower_model', 'pytorch_lowered_model_parity'),
+    'pytorch_set_quantizers_qdq_export': ('mct_quantizers.pytorch.export_model', 'pytorch_set_quantizers_qdq_export'),
+    'PytorchQuantizationWrapper': ('mct_quantizers.pytorch.quantize_wrapper', 'PytorchQuantizationWrapper'),
+    'PytorchQuantizationProfiler': ('mct_quantizers.pytorch.profiler', 'PytorchQuantizationProfiler'),
+    'KerasQuantizationProfiler': ('mct_quantizers.keras.profiler', 'KerasQuantizationProfiler'),
+    'keras_quantizers': ('mct_quantizers.keras.quantizers', None),
+    'pytorch_quantizers': ('mct_quantizers.pytorch.quantizers', None),
+    'get_ort_session_options': ('mct_quantizers.pytorch.onnxruntime_session_options', 'get_ort_session_options'),
+    'get_ort_session': ('mct_quantizers.pytorch.onnxruntime_session_options', 'get_ort_session'),
+    'clear_ort_sessions_pool': ('mct_quantizers.pytorch.onnxruntime_session_options', 'clear_ort_sessions_pool'),
+    'clear_ort_kernels_cache': ('mct_quantizers.pytorch.onnxruntime_kernels_cache', 'clear_ort_kernels_cache'),
+    'fold_onnx_weights_quantizers': ('mct_quantizers.pytorch.onnx_fold_weights', 'fold_onnx_weights_quantizers'),
+}
+
+
+# The subpackages are imported on their first access too (e.g. mct_quantizers.keras.quantizers).
+_LAZY_SUBPACKAGES = ('common', 'keras', 'pytorch')
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBPACKAGES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    elif name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = importlib.import_module(module_name)
+        if attribute is not None:
+            value = getattr(value, attribute)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    # Cache the attribute, so following accesses don't go through __getattr__.
+    globals()[name] = value
+    return value
 
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBPACKAGES))
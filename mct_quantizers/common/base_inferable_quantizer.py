@@ -16,6 +16,7 @@ from enum import Enum
 from typing import Any, Dict, List
 
 from mct_quantizers.common.quant_info import QuantizationMethod
+from mct_quantizers.common.quantizers_registry import QuantizersRegistry
 
 
 class QuantizationTarget(Enum):
@@ -58,6 +59,8 @@ def mark_quantizer(quantization_target: QuantizationTarget = None,
         quantizer_class_object.quantization_target = quantization_target
         quantizer_class_object.quantization_method = quantization_method
         quantizer_class_object.identifier = identifier
+        if QUANTIZERS_REGISTRY.is_tracked(quantizer_class_object):
+            QUANTIZERS_REGISTRY.index(quantizer_class_object)
 
         return quantizer_class_object
 
@@ -73,6 +76,10 @@ class BaseInferableQuantizer:
         """
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        QUANTIZERS_REGISTRY.register(cls)
+
     def initialize_quantization(self,
                                 tensor_shape: Any,
                                 name: str,
@@ -89,3 +96,7 @@ class BaseInferableQuantizer:
             Dictionary of parameters names to the variables.
         """
         return {}
+
+
+# The registry of all the quantizer classes (see QuantizersRegistry).
+QUANTIZERS_REGISTRY = QuantizersRegistry(BaseInferableQuantizer)
@@ -82,13 +82,30 @@ STEPS = "optimizer_step"
 TRAINING = "training"
 EPS = 1e-8
 LUT_VALUES_BITWIDTH = 8
+# Tensors with more elements are assigned to lut values in chunks of this many elements, to bound the temporary memory.
+LUT_ASSIGNMENT_CHUNK_SIZE = 2 ** 20
 
 POSITIONAL_WEIGHT = 'positional_weight'
 QUANTIZED_POSITIONAL_WEIGHT = f'quantized_{POSITIONAL_WEIGHT}'
+# Positional weights with more elements are not serialized in the KerasQuantizationWrapper config, but referenced
+# from it and stored (in binary) with the model weights, when the wrapper references its positional weights.
+REFERENCE_POSITIONAL_WEIGHTS = 'reference_positional_weights'
+POSITIONAL_WEIGHT_REFERENCE = '__positional_weight__'
+POSITIONAL_WEIGHTS_CONFIG_MAX_SIZE = 1024
+
+# Integer weights storage
+INT_WEIGHTS_CODES = 'codes'
+INT_WEIGHTS_SCALES = 'scales'
+INT_WEIGHTS_ZERO_POINTS = 'zero_points'
+INT_WEIGHTS_LUT_VALUES = 'lut_values'
+INT_WEIGHTS_THRESHOLDS = 'thresholds'
 
 # ONNX ops domain
 ONNX_CUSTOM_OP_DOMAIN = f"mct_quantizers"
 
+# Prefix of the ONNX metadata_props keys that hold the quantization parameters of folded weights quantizers
+ONNX_FOLDED_WEIGHTS_METADATA_PREFIX = 'mctq_folded_weights'
+
 
 ## Metadata common fields
 FRAMEWORK_VERSION = 'framework_version'
@@ -12,19 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from mct_quantizers.common.base_inferable_quantizer import QuantizationTarget, QuantizerID
+from typing import List
+
+from mct_quantizers.common.base_inferable_quantizer import QuantizationTarget, QuantizerID, QUANTIZERS_REGISTRY
 from mct_quantizers.common.constants import QUANTIZATION_TARGET, QUANTIZATION_METHOD, QUANTIZER_ID
 from mct_quantizers.common.get_all_subclasses import get_all_subclasses
 from mct_quantizers.common.quant_info import QuantizationMethod
 from mct_quantizers.logger import Logger
 
 
+def _search_inferable_quantizers(quant_target: QuantizationTarget,
+                                 quant_method: QuantizationMethod,
+                                 quantizer_base_class: type) -> List[type]:
+    """
+    Scans the subclasses of a class that is not a quantizer class (so not in the quantizers registry) for the
+    inferable quantizer classes that match the requested QuantizationTarget and QuantizationMethod.
+    """
+    return list(filter(lambda q_class: getattr(q_class, QUANTIZATION_TARGET, None) == quant_target and
+                                       getattr(q_class, QUANTIZATION_METHOD, None) is not None and
+                                       quant_method in getattr(q_class, QUANTIZATION_METHOD) and
+                                       getattr(q_class, QUANTIZER_ID, None) is QuantizerID.INFERABLE,
+                       get_all_subclasses(quantizer_base_class)))
+
+
 def get_inferable_quantizer_class(quant_target: QuantizationTarget,
                                   quant_method: QuantizationMethod,
                                   quantizer_base_class: type) -> type:
     """
     Searches for an inferable quantizer class that matches the requested QuantizationTarget and QuantizationMethod.
-    Exactly one class should be found.
+    Exactly one class should be found. Quantizer classes are looked up in the quantizers registry.
 
     Args:
         quant_target: QuantizationTarget value (Weights or Activation) which indicates what is the target for
@@ -36,13 +52,11 @@ def get_inferable_quantizer_class(quant_target: QuantizationTarget,
     Returns: A class of a quantizer that inherits from the given quantizer_base_class.
 
     """
-    qat_quantizer_classes = get_all_subclasses(quantizer_base_class)
-
-    filtered_quantizers = list(filter(lambda q_class: getattr(q_class, QUANTIZATION_TARGET) == quant_target and
-                                                      getattr(q_class, QUANTIZATION_METHOD) is not None and
-                                                      quant_method in getattr(q_class, QUANTIZATION_METHOD) and
-                                                      getattr(q_class, QUANTIZER_ID) is QuantizerID.INFERABLE,
-                                      qat_quantizer_classes))
+    if QUANTIZERS_REGISTRY.is_tracked(quantizer_base_class):
+        filtered_quantizers = QUANTIZERS_REGISTRY.find(quantizer_base_class, quant_target, quant_method,
+                                                       QuantizerID.INFERABLE)
+    else:
+        filtered_quantizers = _search_inferable_quantizers(quant_target, quant_method, quantizer_base_class)
 
     if len(filtered_quantizers) != 1:
         Logger.error(f"Found {len(filtered_quantizers)} quantizer for target {quant_target.value} "
@@ -50,6 +50,99 @@ def adjust_range_to_include_zero(range_min: np.ndarray,
     return min_range_adj, max_range_adj
 
 
+def fake_quant_nudged_params(range_min: np.ndarray,
+                             range_max: np.ndarray,
+                             n_bits: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the float32 parameters TensorFlow's fake_quant_with_min_max_vars ops quantize with, where the range is
+    nudged so 0.0 is on the quantization grid, so a fake quantization with them matches these ops bit for bit.
+    A range of min=max=0 gets zero parameters, which quantize everything to 0.0 like the ops do.
+
+    Args:
+        range_min: min bound of the quantization range (per channel).
+        range_max: max bound of the quantization range (per channel).
+        n_bits: Number of bits to quantize the tensor.
+
+    Returns: nudged range min, nudged range max, scale, inverse scale and the zero point, as float32 arrays.
+    """
+    range_min = np.asarray(range_min, dtype=np.float32)
+    range_max = np.asarray(range_max, dtype=np.float32)
+    quant_max = np.float32(2 ** n_bits - 1)
+    zero_range = np.logical_and(range_min == 0, range_max == 0)
+    range_width = np.where(zero_range, np.float32(1), range_max - range_min)
+
+    scale = range_width / quant_max
+    # The inverse scale is re-calculated rather than taken as the reciprocal of the scale, like TensorFlow does.
+    inv_scale = quant_max / range_width
+    zero_point_from_min = -range_min / scale
+    # Round half away from zero like std::round (without adding 0.5, which may round up in float32).
+    floor_zero_point = np.floor(zero_point_from_min)
+    rounded_zero_point = floor_zero_point + (zero_point_from_min - floor_zero_point >= 0.5)
+    nudged_zero_point = np.clip(rounded_zero_point, 0, quant_max).astype(np.float32)
+    nudged_min = -nudged_zero_point * scale
+    nudged_max = (quant_max - nudged_zero_point) * scale
+    quant_zero = np.floor(-nudged_min * inv_scale + np.float32(0.5))
+
+    return tuple(np.where(zero_range, np.float32(0), v).astype(np.float32)
+                 for v in (nudged_min, nudged_max, scale, inv_scale, quant_zero))
+
+
+def sort_lut_values_np(lut_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort the lut values for a sorted-boundary search, keeping a single entry for repeated values.
+    Each sorted value keeps the first index it appears at in lut_values, which is the index
+    argmin over the distances to all lut values would choose.
+
+    Args:
+        lut_values: The values in the look-up table.
+
+    Returns:
+        The sorted unique lut values and their indices in lut_values.
+    """
+    lut_values = lut_values.flatten()
+    order = np.argsort(lut_values, kind='stable')
+    sorted_values = lut_values[order]
+    is_first = np.concatenate([[True], sorted_values[1:] != sorted_values[:-1]])
+    return sorted_values[is_first], order[is_first]
+
+
+def lut_nearest_indices_np(tensor: np.ndarray,
+                           sorted_lut_values: np.ndarray,
+                           sorted_lut_indices: np.ndarray,
+                           chunk_size: int = None) -> np.ndarray:
+    """
+    Assign each value of a tensor to the index of its nearest lut value, choosing the first index in the
+    original lut order on ties. Only the two sorted neighbours of each value are compared, so the temporary
+    memory is linear in the tensor size rather than in the tensor size times the number of lut values.
+
+    Args:
+        tensor: Tensor to assign.
+        sorted_lut_values: Sorted unique lut values, as returned by sort_lut_values_np.
+        sorted_lut_indices: Indices of the sorted values in the original lut values.
+        chunk_size: If given, assign the flattened tensor in chunks of this many values to bound
+            the temporary memory.
+
+    Returns:
+        A tensor of the indices of the assigned lut values, with the shape of the input tensor.
+    """
+    flat_tensor = tensor.reshape(-1)
+    if chunk_size is not None and flat_tensor.size > chunk_size:
+        return np.concatenate([lut_nearest_indices_np(flat_tensor[i:i + chunk_size],
+                                                      sorted_lut_values,
+                                                      sorted_lut_indices)
+                               for i in range(0, flat_tensor.size, chunk_size)]).reshape(tensor.shape)
+
+    last = len(sorted_lut_values) - 1
+    upper = np.minimum(np.searchsorted(sorted_lut_values, flat_tensor, side='left'), last)
+    lower = np.maximum(upper - 1, 0)
+    upper_dist = np.abs(flat_tensor - sorted_lut_values[upper])
+    lower_dist = np.abs(flat_tensor - sorted_lut_values[lower])
+    upper_indices = sorted_lut_indices[upper]
+    lower_indices = sorted_lut_indices[lower]
+    take_upper = (upper_dist < lower_dist) | ((upper_dist == lower_dist) & (upper_indices < lower_indices))
+    return np.where(take_upper, upper_indices, lower_indices).reshape(tensor.shape)
+
+
 def lut_quantizer_np(tensor_data: np.ndarray,
                      lut_values: np.ndarray,
                      signed: bool,
@@ -58,10 +151,14 @@ def lut_quantizer_np(tensor_data: np.ndarray,
                      eps: float,
                      per_channel: bool,
                      channel_axis: int=None,
-                     input_rank: int=None
+                     input_rank: int=None,
+                     sorted_lut: Tuple[np.ndarray, np.ndarray] = None,
+                     chunk_size: int = None
                      ) -> np.ndarray:
     """
     Quantize a tensor using a non-uniform quantization based on the pre-defined values.
+    The lut values are sorted by sort_lut_values_np if sorted_lut is not given, and the tensor is assigned to them
+    in chunks of chunk_size values if it is given.
     """
     if per_channel:
         threshold_target_shape = [1] * input_rank
@@ -73,10 +170,10 @@ def lut_quantizer_np(tensor_data: np.ndarray,
                                              signed=signed,
                                              threshold=threshold,
                                              eps=eps)
-    tensor = np.expand_dims(tensor, axis=-1)
 
-    expanded_lut_values = lut_values.reshape([*[1 for _ in range(len(tensor.shape) - 1)], -1])
-    lut_values_assignments = np.argmin(np.abs(tensor - expanded_lut_values), axis=-1)
+    if sorted_lut is None:
+        sorted_lut = sort_lut_values_np(lut_values)
+    lut_values_assignments = lut_nearest_indices_np(tensor, *sorted_lut, chunk_size=chunk_size)
     centers = lut_values.flatten()[lut_values_assignments]
 
     quant_tensor = (centers / (2 ** (lut_values_bitwidth - int(signed)))) * threshold
@@ -0,0 +1,260 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from mct_quantizers.logger import Logger
+
+# Profiled stages of the quantized layers.
+WEIGHTS_QUANTIZATION = 'weights_quantization'
+LAYER_OP = 'layer_op'
+ACTIVATION_QUANTIZATION = 'activation_quantization'
+PROFILED_STAGES = [WEIGHTS_QUANTIZATION, LAYER_OP, ACTIVATION_QUANTIZATION]
+
+_PROC_STATUS = '/proc/self/status'
+_PROC_CLEAR_REFS = '/proc/self/clear_refs'
+
+
+def _read_proc_status_bytes(field: str) -> int:
+    with open(_PROC_STATUS) as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1]) * 1024
+    raise OSError(f'{field} is not in {_PROC_STATUS}')
+
+
+def reset_process_peak_memory() -> Any:
+    """
+    Reset the peak resident memory counter of the process (Linux only). Note that the counter (VmHWM) is
+    process-wide, so this also resets the peak memory that any other tool in the process reads.
+
+    Returns: The current resident memory in bytes, or None if the peak counter can't be reset.
+    """
+    try:
+        with open(_PROC_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return _read_proc_status_bytes('VmRSS')
+    except OSError:
+        return None
+
+
+def process_peak_memory(baseline: Any) -> Any:
+    """
+    Peak resident memory growth of the process since reset_process_peak_memory.
+
+    Args:
+        baseline: The value returned by reset_process_peak_memory.
+
+    Returns: The peak memory growth in bytes, or None if it is unknown.
+    """
+    if baseline is None:
+        return None
+    return max(_read_proc_status_bytes('VmHWM') - baseline, 0)
+
+
+class LayerProfile:
+    def __init__(self, name: str, layer_type: str):
+        """
+        Accumulated profile of a quantized layer: the number of calls, and the total time and the peak transient
+        memory of each stage (see PROFILED_STAGES) over the calls.
+
+        Args:
+            name: Layer name.
+            layer_type: Layer type name (the wrapped layer type for quantization wrappers).
+        """
+        self.name = name
+        self.layer_type = layer_type
+        self.calls = {stage: 0 for stage in PROFILED_STAGES}
+        self.time = {stage: 0. for stage in PROFILED_STAGES}
+        self.peak_memory = {stage: None for stage in PROFILED_STAGES}
+
+    def add(self, stage: str, elapsed: float, peak_memory: Any):
+        self.calls[stage] += 1
+        self.time[stage] += elapsed
+        if peak_memory is not None:
+            self.peak_memory[stage] = max(self.peak_memory[stage] or 0, peak_memory)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns: The profile as a flat dictionary: times in milliseconds and peak memory in megabytes.
+        """
+        record = {'layer': self.name, 'type': self.layer_type, 'calls': max(self.calls.values())}
+        for stage in PROFILED_STAGES:
+            record[f'{stage}_ms'] = 1e3 * self.time[stage]
+        for stage in PROFILED_STAGES:
+            record[f'{stage}_peak_mb'] = None if self.peak_memory[stage] is None else self.peak_memory[stage] / 2 ** 20
+        record['quantization_ms'] = record[f'{WEIGHTS_QUANTIZATION}_ms'] + record[f'{ACTIVATION_QUANTIZATION}_ms']
+        record['total_ms'] = record['quantization_ms'] + record[f'{LAYER_OP}_ms']
+        record['quantization_fraction'] = record['quantization_ms'] / record['total_ms'] if record['total_ms'] else 0.
+        return record
+
+
+class BaseQuantizationProfiler(ABC):
+    def __init__(self, model: Any, track_memory: bool = False):
+        """
+        Base class of the quantization overhead profilers. A profiler instruments the quantization wrappers and the
+        activation quantization holders of a model, and records per layer the time and the peak transient memory
+        of the weights quantization, of the wrapped layer operation and of the activation quantization. Each
+        profiled stage is also labeled in the framework profiler traces as '<layer name>/<stage>'.
+
+        The model is instrumented only while the profiler is enabled (e.g. inside a 'with profiler:' block), and
+        is left untouched when it is disabled, so a disabled profiler has no overhead.
+
+        Args:
+            model: The quantized model to profile.
+            track_memory: Whether to record the peak transient memory of each stage, i.e. its peak memory growth
+             (device memory on GPUs, the process resident memory on CPU). Resetting the peak memory counters adds
+             some overhead to each stage, and changes the peak memory that other tools in the process read: the
+             framework device peak memory stats on GPUs, and the process peak resident memory (VmHWM, reset
+             through /proc/self/clear_refs) on CPU.
+        """
+        self.model = model
+        self.track_memory = track_memory
+        self.enabled = False
+        self.profiles: Dict[str, LayerProfile] = {}
+        self._open_stages = {}
+
+    @abstractmethod
+    def _instrument(self):
+        raise NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _remove_instrumentation(self):
+        raise NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _enter_trace_label(self, label: str) -> Any:
+        raise NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _reset_peak_memory(self) -> Any:
+        raise NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _peak_memory(self, baseline: Any) -> Any:
+        raise NotImplemented  # pragma: no cover
+
+    def _synchronize(self):
+        """
+        Wait for the pending asynchronous operations (e.g. GPU kernels) before reading the time.
+        """
+        pass
+
+    def enable(self):
+        """
+        Instrument the model and start recording.
+        """
+        if not self.enabled:
+            self._instrument()
+            self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording and remove the model instrumentation. The recorded profiles are kept.
+        """
+        if self.enabled:
+            self._remove_instrumentation()
+            self.enabled = False
+            for _, trace_label, _, _ in self._open_stages.values():
+                trace_label.__exit__(None, None, None)
+            self._open_stages = {}
+
+    def reset(self):
+        """
+        Drop the recorded profiles.
+        """
+        self.profiles = {}
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+
+    def _begin_stage(self, name: str, layer_type: str, stage: str):
+        self._end_stage(name)
+        if name not in self.profiles:
+            self.profiles[name] = LayerProfile(name, layer_type)
+        trace_label = self._enter_trace_label(f'{name}/{stage}')
+        trace_label.__enter__()
+        self._synchronize()
+        memory_baseline = self._reset_peak_memory() if self.track_memory else None
+        self._open_stages[name] = (stage, trace_label, memory_baseline, time.perf_counter())
+
+    def _end_stage(self, name: str):
+        if name not in self._open_stages:
+            return
+        stage, trace_label, memory_baseline, start = self._open_stages.pop(name)
+        self._synchronize()
+        elapsed = time.perf_counter() - start
+        peak_memory = self._peak_memory(memory_baseline) if self.track_memory else None
+        trace_label.__exit__(None, None, None)
+        self.profiles[name].add(stage, elapsed, peak_memory)
+
+    def records(self, sort_by: str = 'total_ms', descending: bool = True) -> List[Dict[str, Any]]:
+        """
+        The recorded layer profiles (see LayerProfile.as_dict), sorted by a record key.
+
+        Args:
+            sort_by: Record key to sort by (e.g. 'total_ms', 'quantization_ms', 'quantization_fraction',
+             'weights_quantization_peak_mb' or 'layer').
+            descending: Whether to sort in descending order.
+
+        Returns: A list of the layer records.
+        """
+        records = [profile.as_dict() for profile in self.profiles.values()]
+        if records and sort_by not in records[0]:
+            Logger.critical(f'Unknown sort key {sort_by}, expected one of {list(records[0].keys())}.')
+        # Missing values (e.g. peak memory when it is not tracked) are sorted last.
+        return sorted([r for r in records if r[sort_by] is not None], key=lambda r: r[sort_by],
+                      reverse=descending) + [r for r in records if r[sort_by] is None]
+
+    def report(self, sort_by: str = 'total_ms', descending: bool = True) -> str:
+        """
+        A table of the recorded layer profiles with a total row: the time of each stage (total over the calls),
+        the fraction of the layer time spent in quantization, and the peak transient memory of each stage.
+
+        Args:
+            sort_by: Record key to sort by (see records).
+            descending: Whether to sort in descending order.
+
+        Returns: The report table.
+        """
+        records = self.records(sort_by, descending)
+        columns = [('calls', 'calls', '{:d}'), ('weights q [ms]', f'{WEIGHTS_QUANTIZATION}_ms', '{:.3f}'),
+                   ('op [ms]', f'{LAYER_OP}_ms', '{:.3f}'), ('act q [ms]', f'{ACTIVATION_QUANTIZATION}_ms', '{:.3f}'),
+                   ('quant %', 'quantization_fraction', '{:.1%}'),
+                   ('weights q [MB]', f'{WEIGHTS_QUANTIZATION}_peak_mb', '{:.2f}'),
+                   ('op [MB]', f'{LAYER_OP}_peak_mb', '{:.2f}'),
+                   ('act q [MB]', f'{ACTIVATION_QUANTIZATION}_peak_mb', '{:.2f}')]
+        total = {key: sum(r[key] for r in records) for _, key, _ in columns[:4]}
+        quantization_ms = total[f'{WEIGHTS_QUANTIZATION}_ms'] + total[f'{ACTIVATION_QUANTIZATION}_ms']
+        total_ms = quantization_ms + total[f'{LAYER_OP}_ms']
+        total['quantization_fraction'] = quantization_ms / total_ms if total_ms else 0.
+        for _, key, _ in columns[5:]:
+            values = [r[key] for r in records if r[key] is not None]
+            total[key] = max(values) if values else None
+
+        rows = [[r['layer'], r['type']] + [('-' if r[key] is None else fmt.format(r[key])) for _, key, fmt in columns]
+                for r in records]
+        rows.append(['total', ''] + [('-' if total[key] is None else fmt.format(total[key]))
+                                     for _, key, fmt in columns])
+        header = ['layer', 'type'] + [title for title, _, _ in columns]
+        widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+        lines = ['  '.join(cell.ljust(w) if i < 2 else cell.rjust(w) for i, (cell, w) in enumerate(zip(row, widths)))
+                 for row in [header] + rows]
+        return '\n'.join(lines)
@@ -0,0 +1,119 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import threading
+import weakref
+from typing import Any, List, Mapping, Set
+
+from mct_quantizers.common.constants import QUANTIZATION_TARGET, QUANTIZATION_METHOD, QUANTIZER_ID
+
+
+class QuantizersRegistry:
+    def __init__(self, root_class: type):
+        """
+        An index of the quantizer classes, which replaces scans of the classes tree (get_all_subclasses) with
+        dictionary lookups. Every subclass of the root class is registered on its creation (by the root class
+        __init_subclass__) under all its quantizer base classes (e.g. the framework base class), and indexed by its
+        quantization target, methods and identifier, which are (re)indexed when it is marked by mark_quantizer.
+
+        The registry holds weak references to the classes, so like class.__subclasses__() it doesn't keep
+        classes alive.
+
+        Args:
+            root_class: The root class of the registered quantizers.
+        """
+        self.root_class = root_class
+        self._lock = threading.RLock()
+        # Base class -> all its registered subclasses.
+        self._subclasses = weakref.WeakKeyDictionary()
+        # Base class -> {(target, method, identifier): its registered subclasses}.
+        self._marked_subclasses = weakref.WeakKeyDictionary()
+        # Base class -> {subclass name: subclass}, built on demand.
+        self._subclasses_by_name = weakref.WeakKeyDictionary()
+        # Class -> the keys it is indexed by in _marked_subclasses.
+        self._marks = weakref.WeakKeyDictionary()
+
+    def _base_classes(self, cls: type) -> List[type]:
+        return [c for c in cls.__mro__[1:] if issubclass(c, self.root_class)]
+
+    @staticmethod
+    def _marks_of(cls: type) -> List[tuple]:
+        methods = getattr(cls, QUANTIZATION_METHOD, None) or []
+        return [(getattr(cls, QUANTIZATION_TARGET, None), m, getattr(cls, QUANTIZER_ID, None)) for m in methods]
+
+    def register(self, cls: type):
+        """
+        Register a new quantizer class under its base classes, and index it by its (possibly inherited)
+        quantization target, methods and identifier.
+
+        Args:
+            cls: A subclass of the root class.
+        """
+        with self._lock:
+            for base in self._base_classes(cls):
+                self._subclasses.setdefault(base, weakref.WeakSet()).add(cls)
+                self._subclasses_by_name.pop(base, None)
+            self.index(cls)
+
+    def index(self, cls: type):
+        """
+        (Re)index a registered quantizer class by its current quantization target, methods and identifier.
+
+        Args:
+            cls: A registered quantizer class.
+        """
+        with self._lock:
+            bases = self._base_classes(cls)
+            for mark in self._marks.pop(cls, []):
+                for base in bases:
+                    self._marked_subclasses.get(base, {}).get(mark, weakref.WeakSet()).discard(cls)
+            marks = self._marks_of(cls)
+            for mark in marks:
+                for base in bases:
+                    self._marked_subclasses.setdefault(base, {}).setdefault(mark, weakref.WeakSet()).add(cls)
+            self._marks[cls] = marks
+
+    def is_tracked(self, base: type) -> bool:
+        """
+        Returns: Whether the subclasses of a class are registered, i.e. whether it is a subclass of the root class.
+        """
+        return isinstance(base, type) and issubclass(base, self.root_class)
+
+    def subclasses(self, base: type) -> Set[type]:
+        """
+        Returns: All the registered classes that inherit from a class.
+        """
+        with self._lock:
+            return set(self._subclasses.get(base, ()))
+
+    def subclasses_by_name(self, base: type) -> Mapping[str, type]:
+        """
+        Returns: A dictionary of the names of the registered classes that inherit from a class to the classes
+         (e.g. custom objects for deserialization). It is cached until a new subclass is registered.
+        """
+        with self._lock:
+            names = self._subclasses_by_name.get(base)
+            if names is None:
+                names = weakref.WeakValueDictionary({c.__name__: c for c in self._subclasses.get(base, ())})
+                self._subclasses_by_name[base] = names
+            return names
+
+    def find(self, base: type, quantization_target: Any, quantization_method: Any, identifier: Any) -> List[type]:
+        """
+        Returns: The registered classes that inherit from a class and are marked with a quantization target, a
+         quantization method (one of their methods) and an identifier.
+        """
+        with self._lock:
+            return list(self._marked_subclasses.get(base, {}).get((quantization_target, quantization_method,
+                                                                    identifier), ()))
@@ -13,30 +13,19 @@
 # limitations under the License.
 # ==============================================================================
 
-from mct_quantizers.common.base_inferable_quantizer import BaseInferableQuantizer
-from mct_quantizers.common.constants import ACTIVATION_HOLDER_QUANTIZER, FOUND_TF, TRAINING, STEPS, MCTQ_VERSION
-from mct_quantizers.common.get_all_subclasses import get_all_subclasses
+from mct_quantizers.common.base_inferable_quantizer import BaseInferableQuantizer, QUANTIZERS_REGISTRY
+from mct_quantizers.common.constants import ACTIVATION_HOLDER_QUANTIZER, FOUND_TF, STEPS, MCTQ_VERSION
 from mct_quantizers.logger import Logger
 from mct_quantizers import __version__ as mctq_version
 
 if FOUND_TF:
     import tensorflow as tf
-    from tensorflow.python.util import tf_inspect
-    from tensorflow.python.keras.utils.control_flow_util import smart_cond
     from mct_quantizers.keras.quantizers import BaseKerasInferableQuantizer
+    from mct_quantizers.keras.quantizer_utils import accepts_training, call_quantizer
 
     keras = tf.keras
 
 
-    def _make_quantizer_fn(quantizer, x, training):
-        """Use currying to return True/False specialized fns to the cond."""
-
-        def quantizer_fn():
-            return quantizer(x, training)
-
-        return quantizer_fn
-
-
     class KerasActivationQuantizationHolder(keras.layers.Layer):
         """
         Keras layer to hold an activation quantizer and quantize during inference.
@@ -82,8 +71,7 @@ if FOUND_TF:
             Returns: A ActivationQuantizationHolder object
 
             """
-            qi_inferable_custom_objects = {subclass.__name__: subclass for subclass in
-                                           get_all_subclasses(BaseKerasInferableQuantizer)}
+            qi_inferable_custom_objects = QUANTIZERS_REGISTRY.subclasses_by_name(BaseKerasInferableQuantizer)
             config = config.copy()
             activation_holder_quantizer = keras.utils.deserialize_keras_object(config.pop(ACTIVATION_HOLDER_QUANTIZER),
                                                                                module_objects=globals(),
@@ -100,6 +88,17 @@ if FOUND_TF:
         def mctq_version(self):
             return self._mctq_version
 
+        @property
+        def activation_holder_quantizer(self) -> BaseInferableQuantizer:
+            return self._activation_holder_quantizer
+
+        @activation_holder_quantizer.setter
+        def activation_holder_quantizer(self, quantizer: BaseInferableQuantizer):
+            self._activation_holder_quantizer = quantizer
+            # Resolve the quantizer call arguments once, rather than inspecting them on every call. They are resolved
+            # again whenever the quantizer is replaced (e.g. by convert_to_inferable_quantizers).
+            self._quantizer_accepts_training = accepts_training(quantizer.__call__)
+
         def build(self, input_shape):
             """
             ActivationQuantizationHolder build function.
@@ -137,14 +136,7 @@ if FOUND_TF:
             if training is None:
                 training = tf.keras.backend.learning_phase()
 
-            activation_quantizer_args_spec = tf_inspect.getfullargspec(self.activation_holder_quantizer.__call__).args
-            if TRAINING in activation_quantizer_args_spec:
-                return smart_cond(
-                    training,
-                    _make_quantizer_fn(self.activation_holder_quantizer, inputs, True),
-                    _make_quantizer_fn(self.activation_holder_quantizer, inputs, False))
-
-            return self.activation_holder_quantizer(inputs)
+            return call_quantizer(self.activation_holder_quantizer, inputs, training, self._quantizer_accepts_training)
 
         def convert_to_inferable_quantizers(self):
             """
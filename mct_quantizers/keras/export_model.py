@@ -0,0 +1,297 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from mct_quantizers.common.constants import FOUND_TF
+from mct_quantizers.common.quant_utils import fake_quant_nudged_params
+from mct_quantizers.logger import Logger
+
+if FOUND_TF:
+    import tensorflow as tf
+    from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
+    from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
+    from mct_quantizers.keras.quantizers import ActivationUniformInferableQuantizer, WeightsUniformInferableQuantizer
+    from mct_quantizers.keras.strip_model import call_model_nodes
+
+    keras = tf.keras
+
+    # The TFLite integer kernels quantize the activations to int8, and the weights to int8 with a zero point of 0.
+    TFLITE_MAX_NUM_BITS = 8
+
+
+    def _validate_weights_quantizer(wrapper: KerasQuantizationWrapper, quantizer: Any):
+        """
+        Validate a weights quantizer maps to TFLite int8 weights: a uniform quantizer of up to 8 bits whose
+        (nudged) zero point is the middle of its quantization domain, i.e. 0 in int8.
+        """
+        if not isinstance(quantizer, WeightsUniformInferableQuantizer) or quantizer.num_bits > TFLITE_MAX_NUM_BITS:
+            Logger.critical(f'Only uniform, symmetric and power-of-two weights quantizers of up to '
+                            f'{TFLITE_MAX_NUM_BITS} bits can be exported to TFLite, but {wrapper.name} has a '
+                            f'{type(quantizer).__name__} of {quantizer.num_bits} bits.')
+        quant_zero = fake_quant_nudged_params(quantizer.min_range_np, quantizer.max_range_np, quantizer.num_bits)[4]
+        if np.any(quant_zero != 2 ** (quantizer.num_bits - 1)):
+            Logger.critical(f'TFLite weights are quantized symmetrically (with a zero point of 0), but the weights '
+                            f'quantizer of {wrapper.name} has the ranges min {quantizer.min_range} and max '
+                            f'{quantizer.max_range}.')
+
+
+    def _fake_quant_weight(weight: tf.Tensor,
+                           quantizer: WeightsUniformInferableQuantizer,
+                           channel_axis: int = None) -> tf.Tensor:
+        """
+        Fake quantize a weight with TensorFlow's fake quant ops, which the TFLite converter reads the weight scales
+        from. The per-channel op quantizes along the last axis, so the channel axis is moved to the end by a reshape
+        when the axes after it are of size 1 (e.g. a depthwise kernel), which the converter folds into the weight,
+        and by a transpose otherwise. The channel axis defaults to the channel axis of the quantizer.
+        """
+        if not quantizer.per_channel:
+            return tf.quantization.fake_quant_with_min_max_vars(weight,
+                                                                min=quantizer.min_range_np,
+                                                                max=quantizer.max_range_np,
+                                                                num_bits=quantizer.num_bits)
+
+        shape = weight.shape.as_list()
+        channel_axis = (quantizer.channel_axis if channel_axis is None else channel_axis) % len(shape)
+        num_channels = shape[channel_axis]
+        fake_quant = lambda x: tf.quantization.fake_quant_with_min_max_vars_per_channel(
+            x,
+            min=np.broadcast_to(quantizer.min_range_np, [num_channels]),
+            max=np.broadcast_to(quantizer.max_range_np, [num_channels]),
+            num_bits=quantizer.num_bits)
+
+        if channel_axis == len(shape) - 1:
+            return fake_quant(weight)
+        if all(d == 1 for d in shape[channel_axis + 1:]):
+            channels_last_shape = shape[:channel_axis] + shape[channel_axis + 1:] + [num_channels]
+            return tf.reshape(fake_quant(tf.reshape(weight, channels_last_shape)), shape)
+        perm = list(range(len(shape)))
+        perm[channel_axis], perm[-1] = perm[-1], perm[channel_axis]
+        return tf.transpose(fake_quant(tf.transpose(weight, perm=perm)), perm=perm)
+
+
+    def _call_dense_as_conv(wrapper: KerasQuantizationWrapper, inputs: tf.Tensor) -> tf.Tensor:
+        """
+        Call a wrapper of a Dense layer with a per-channel kernel as a 1x1 convolution. The TFLite converter
+        transposes a Dense kernel, which it can't do to a per-channel quantized kernel, while a convolution kernel
+        keeps its channel axis last.
+        """
+        dense = wrapper.layer
+        # The wrapper replaces the quantized attributes of the layer with their quantized tensors, so the weights are
+        # taken from its weights vars. The kernel is fake quantized in the shape of a 1x1 convolution kernel, as the
+        # converter can't reshape it either once it's quantized per channel.
+        weights = {name: tf.convert_to_tensor(weight) for name, weight, _ in wrapper.get_weights_vars()}
+        quantizers = {name: quantizer for name, _, quantizer in wrapper.get_weights_vars()}
+        kernel = tf.reshape(weights['kernel'], [1, 1] + weights['kernel'].shape.as_list())
+        outputs = tf.nn.conv2d(tf.reshape(inputs, [-1, 1, 1, kernel.shape[2]]),
+                               _fake_quant_weight(kernel, quantizers['kernel'], channel_axis=-1),
+                               strides=1, padding='VALID')
+        if dense.use_bias:
+            bias = _fake_quant_weight(weights['bias'], quantizers['bias']) if 'bias' in quantizers else dense.bias
+            outputs = tf.nn.bias_add(outputs, bias)
+        if inputs.shape[1:-1].is_fully_defined():
+            outputs_shape = [-1] + inputs.shape[1:-1].as_list() + [dense.units]
+        else:
+            outputs_shape = tf.concat([tf.shape(inputs)[:-1], [dense.units]], axis=0)
+        outputs = tf.reshape(outputs, outputs_shape)
+        return dense.activation(outputs) if dense.activation is not None else outputs
+
+
+    def _call_layer(layer: keras.layers.Layer, args: Tuple, kwargs: Dict) -> Any:
+        """
+        Call a layer of a quantized model on the arguments of a node of the layer, with TensorFlow's fake quant
+        ops for the activation holders and the quantized weights of the wrappers.
+        """
+        if isinstance(layer, keras.Model):
+            return call_model_nodes(layer, tf.nest.flatten(args[0]), _call_layer)
+
+        if isinstance(layer, KerasActivationQuantizationHolder):
+            quantizer = layer.activation_holder_quantizer
+            if not isinstance(quantizer, ActivationUniformInferableQuantizer) or \
+                    quantizer.num_bits != TFLITE_MAX_NUM_BITS:
+                Logger.critical(f'Only uniform, symmetric and power-of-two activation quantizers of '
+                                f'{TFLITE_MAX_NUM_BITS} bits can be exported to TFLite, but {layer.name} has a '
+                                f'{type(quantizer).__name__} of {quantizer.num_bits} bits.')
+            return tf.quantization.fake_quant_with_min_max_vars(args[0],
+                                                                min=quantizer.min_range[0],
+                                                                max=quantizer.max_range[0],
+                                                                num_bits=quantizer.num_bits)
+
+        if not isinstance(layer, KerasQuantizationWrapper):
+            return layer(*args, **kwargs)
+
+        weights_vars = layer.get_weights_vars()
+        for _, _, quantizer in weights_vars:
+            _validate_weights_quantizer(layer, quantizer)
+
+        if isinstance(layer.layer, keras.layers.Dense) and any(
+                name == 'kernel' and quantizer.per_channel for name, _, quantizer in weights_vars):
+            return _call_dense_as_conv(layer, args[0])
+
+        # Call the layer with the fake quantized weights, like the wrapper does, but without leaving the traced
+        # weights in the model: the layer attributes are restored after the call.
+        quantized_weights = {name: _fake_quant_weight(tf.convert_to_tensor(weight), quantizer)
+                             for name, weight, quantizer in weights_vars}
+        if layer.is_str_attr:
+            original_weights = {name: getattr(layer.layer, name) for name in quantized_weights}
+            try:
+                for name, weight in quantized_weights.items():
+                    setattr(layer.layer, name, weight)
+                return layer.layer.call(*args, **kwargs)
+            finally:
+                for name, weight in original_weights.items():
+                    setattr(layer.layer, name, weight)
+        inputs = list(args[0]) if isinstance(args[0], (list, tuple)) else [args[0]]
+        for pos in sorted(quantized_weights):
+            inputs.insert(pos, quantized_weights[pos])
+        if layer.is_inputs_as_list:
+            return layer.layer.call(inputs, *layer.op_call_args, **layer.op_call_kwargs)
+        return layer.layer.call(*(inputs + layer.op_call_args), **layer.op_call_kwargs)
+
+
+    def keras_export_tflite_model(model: keras.Model, save_model_path: str = None) -> bytes:
+        """
+        Export a quantized model to a full-integer (int8) TFLite model, whose quantization parameters are those of
+        the model quantizers, without a representative dataset. The model is traced with TensorFlow's fake quant
+        ops for its activation holders and the quantized weights of its wrappers, which the TFLite converter reads
+        the scales and zero points from:
+          - The activations are quantized per tensor, with the ranges of the activation holders, so every
+            activation (including the model inputs) should be quantized by an 8-bit uniform, symmetric or
+            power-of-two holder, except for the outputs of layers TFLite quantizes with the scale of their inputs
+            (e.g. Reshape, Flatten or MaxPooling2D).
+          - The weights are quantized per channel or per tensor like their quantizers, which should be uniform,
+            symmetric or power-of-two quantizers of up to 8 bits with a zero point of 0. Dense layers with
+            per-channel kernels are exported as 1x1 convolutions, as the converter can't transpose per-channel
+            quantized kernels.
+        The model inputs and outputs are int8 tensors, quantized with the input and output scales of the
+        TFLite model (see keras_tflite_model_parity).
+
+        Args:
+            model: A functional or Sequential Keras model with KerasQuantizationWrapper and
+                KerasActivationQuantizationHolder layers.
+            save_model_path: A path to save the TFLite model to (optional).
+
+        Returns: The TFLite model flatbuffer.
+
+        """
+        if not getattr(model, '_is_graph_network', False):
+            Logger.critical(f'Only functional and Sequential models with known inputs can be exported to TFLite, '
+                            f'but {model.name} is a subclassed model or has no inputs.')
+
+        # The signature names the model inputs and outputs like the Keras model does.
+        input_signature = [tf.TensorSpec(x.shape, x.dtype, name=name) for x, name in
+                           zip(model.inputs, model.input_names)]
+
+        def model_fn(*inputs):
+            outputs = tf.nest.flatten(call_model_nodes(model, list(inputs), _call_layer))
+            return dict(zip(model.output_names, outputs))
+
+        # The converter saves the function with its trackable object, which is a module of the function and the model
+        # variables: saving the Keras model would trace the layers calls, which leave traced tensors in the wrappers.
+        module = tf.Module()
+        module.model_variables = model.variables
+        module.model_fn = tf.function(model_fn, input_signature=input_signature)
+        converter = tf.lite.TFLiteConverter.from_concrete_functions([module.model_fn.get_concrete_function()], module)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+        tflite_model = converter.convert()
+
+        # The converter keeps float inputs and outputs it has no quantization ranges for.
+        interpreter = tf.lite.Interpreter(model_content=tflite_model)
+        for details in interpreter.get_input_details() + interpreter.get_output_details():
+            if details['dtype'] != np.int8:
+                Logger.critical(f'The TFLite model tensor {details["name"]} is not quantized: all the model inputs '
+                                f'and outputs should be quantized by activation holders.')
+
+        if save_model_path is not None:
+            with open(save_model_path, 'wb') as f:
+                f.write(tflite_model)
+        return tflite_model
+
+
+    def keras_tflite_model_parity(model: keras.Model,
+                                  tflite_model: bytes,
+                                  inputs: Any) -> Dict[str, Dict[str, float]]:
+        """
+        Compare the outputs of a TFLite model exported with keras_export_tflite_model to the (fake quant) outputs of
+        the quantized model. The inputs are quantized to the TFLite model input scales, and the TFLite outputs are
+        dequantized with its output scales.
+
+        Args:
+            model: The quantized model.
+            tflite_model: The TFLite model flatbuffer.
+            inputs: Inputs to the model (an array, or a list of arrays, one per model input).
+
+        Returns: A dictionary from the name of each model output to the maximal difference from the fake quant
+            outputs in quantization steps ('max_steps') and the fraction of different outputs ('mismatch').
+
+        """
+        inputs = [np.asarray(x, dtype=np.float32) for x in (inputs if isinstance(inputs, (list, tuple)) else
+                                                            [inputs])]
+        outputs = tf.nest.flatten(model(inputs if len(inputs) > 1 else inputs[0], training=False))
+
+        interpreter = tf.lite.Interpreter(model_content=tflite_model)
+        runner = interpreter.get_signature_runner()
+        input_details, output_details = runner.get_input_details(), runner.get_output_details()
+        quantized_inputs = {}
+        for name, x in zip(model.input_names, inputs):
+            scale, zero_point = input_details[name]['quantization']
+            # Round half up, like the fake quant ops.
+            quantized_inputs[name] = np.clip(np.floor(x / scale + 0.5) + zero_point, -128, 127).astype(np.int8)
+        tflite_outputs = runner(**quantized_inputs)
+
+        parity = {}
+        for name, fake_quant_outputs in zip(model.output_names, outputs):
+            scale, zero_point = output_details[name]['quantization']
+            steps = np.abs((tflite_outputs[name].astype(np.float32) - zero_point) - fake_quant_outputs.numpy() / scale)
+            parity[name] = {'max_steps': float(steps.max()),
+                            'mismatch': float((steps > 0.5).mean())}
+        return parity
+
+else:
+    def keras_export_tflite_model(model, save_model_path=None):
+        """
+        Export a quantized model to a full-integer (int8) TFLite model.
+
+        Args:
+            model: A functional or Sequential Keras model with KerasQuantizationWrapper and
+                KerasActivationQuantizationHolder layers.
+            save_model_path: A path to save the TFLite model to (optional).
+
+        Returns: The TFLite model flatbuffer.
+
+        """
+        Logger.critical('Installing tensorflow is mandatory '
+                        'when using keras_export_tflite_model. '
+                        'Could not find Tensorflow package.')  # pragma: no cover
+
+    def keras_tflite_model_parity(model, tflite_model, inputs):
+        """
+        Compare the outputs of a TFLite model exported with keras_export_tflite_model to the outputs of the
+        quantized model.
+
+        Args:
+            model: The quantized model.
+            tflite_model: The TFLite model flatbuffer.
+            inputs: Inputs to the model.
+
+        Returns: A dictionary from the name of each model output to its differences from the fake quant outputs.
+
+        """
+        Logger.critical('Installing tensorflow is mandatory '
+                        'when using keras_tflite_model_parity. '
+                        'Could not find Tensorflow package.')  # pragma: no cover
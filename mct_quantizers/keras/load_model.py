@@ -15,7 +15,7 @@
 from typing import Any
 
 from mct_quantizers.common.constants import FOUND_TF
-from mct_quantizers.common.get_all_subclasses import get_all_subclasses
+from mct_quantizers.common.base_inferable_quantizer import QUANTIZERS_REGISTRY
 from mct_quantizers.logger import Logger
 
 if FOUND_TF:
@@ -41,10 +41,8 @@ if FOUND_TF:
         Returns: A keras Model
 
         """
-        qi_inferable_custom_objects = {subclass.__name__: subclass for subclass in
-                                       get_all_subclasses(BaseKerasInferableQuantizer)}
-        all_inferable_names = list(qi_inferable_custom_objects.keys())
-        if len(set(all_inferable_names)) < len(all_inferable_names):
+        qi_inferable_custom_objects = dict(QUANTIZERS_REGISTRY.subclasses_by_name(BaseKerasInferableQuantizer))
+        if len(qi_inferable_custom_objects) < len(QUANTIZERS_REGISTRY.subclasses(BaseKerasInferableQuantizer)):
             Logger.error(f"Found multiple quantizers with the same name that inherit from BaseKerasInferableQuantizer"
                          f"while trying to load a model.")
 
@@ -0,0 +1,114 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable
+
+from mct_quantizers.common.constants import FOUND_TF
+from mct_quantizers.common.quantization_profiler import BaseQuantizationProfiler, WEIGHTS_QUANTIZATION, LAYER_OP, \
+    ACTIVATION_QUANTIZATION, reset_process_peak_memory, process_peak_memory
+from mct_quantizers.logger import Logger
+
+if FOUND_TF:
+    import tensorflow as tf
+    from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
+    from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
+
+    class KerasQuantizationProfiler(BaseQuantizationProfiler):
+        def __init__(self, model: tf.keras.Model, track_memory: bool = False):
+            """
+            Quantization overhead profiler of a Keras model. It records per layer the time and the peak transient
+            memory of the weights quantization and of the wrapped layer operation of every
+            KerasQuantizationWrapper, and of the activation quantization of every KerasActivationQuantizationHolder.
+            Each stage is labeled with tf.profiler.experimental.Trace as '<layer name>/<stage>', so it also shows
+            in the TensorFlow profiler traces.
+
+            The layers call functions are instrumented only while the profiler is enabled, and only eager calls are
+            profiled (e.g. model(inputs), not model.predict which runs a tf.function):
+
+            with KerasQuantizationProfiler(model) as profiler:
+                model(inputs)
+            print(profiler.report(sort_by='quantization_ms'))
+
+            The peak transient memory is measured on the first GPU if there is one, and otherwise as the process
+            peak resident memory (Linux only), which only accounts for memory the allocator requests from the
+            system.
+
+            Args:
+                model: The quantized model to profile.
+                track_memory: Whether to record the peak transient memory of each stage. It resets the process-wide
+                    peak memory counters on every stage (see BaseQuantizationProfiler).
+            """
+            super().__init__(model, track_memory)
+            self._instrumented_layers = []
+            self._gpu = None
+
+        def _profiled_call(self, call: Callable, name: str, layer_type: str, stage: str) -> Callable:
+            @tf.autograph.experimental.do_not_convert
+            def profiled_call(*args, **kwargs):
+                if not tf.executing_eagerly():
+                    return call(*args, **kwargs)
+                self._begin_stage(name, layer_type, stage)
+                outputs = call(*args, **kwargs)
+                self._end_stage(name)
+                return outputs
+            return profiled_call
+
+        def _instrument_call(self, layer: tf.keras.layers.Layer, profiled_call: Callable):
+            # Set as an instance attribute (bypassing the Keras attributes tracking), shadowing the class method.
+            object.__setattr__(layer, 'call', profiled_call)
+            self._instrumented_layers.append(layer)
+
+        def _instrument(self):
+            self._gpu = 'GPU:0' if tf.config.list_logical_devices('GPU') else None
+            for layer in self.model.submodules:
+                if isinstance(layer, KerasQuantizationWrapper):
+                    layer_type = type(layer.layer).__name__
+                    # The weights quantization stage ends when the wrapped layer call starts.
+                    self._instrument_call(layer, self._profiled_call(layer.call, layer.name, layer_type,
+                                                                     WEIGHTS_QUANTIZATION))
+                    self._instrument_call(layer.layer, self._profiled_call(layer.layer.call, layer.name, layer_type,
+                                                                           LAYER_OP))
+                elif isinstance(layer, KerasActivationQuantizationHolder):
+                    self._instrument_call(layer, self._profiled_call(layer.call, layer.name, type(layer).__name__,
+                                                                     ACTIVATION_QUANTIZATION))
+
+        def _remove_instrumentation(self):
+            for layer in self._instrumented_layers:
+                layer.__dict__.pop('call', None)
+            self._instrumented_layers = []
+
+        def _enter_trace_label(self, label: str) -> Any:
+            return tf.profiler.experimental.Trace(label)
+
+        def _synchronize(self):
+            if self._gpu is not None:
+                tf.test.experimental.sync_devices()
+
+        def _reset_peak_memory(self) -> Any:
+            if self._gpu is not None:
+                tf.config.experimental.reset_memory_stats(self._gpu)
+                return tf.config.experimental.get_memory_info(self._gpu)['current']
+            return reset_process_peak_memory()
+
+        def _peak_memory(self, baseline: Any) -> Any:
+            if self._gpu is not None:
+                return tf.config.experimental.get_memory_info(self._gpu)['peak'] - baseline
+            return process_peak_memory(baseline)
+
+else:
+    class KerasQuantizationProfiler:  # pragma: no cover
+        def __init__(self, *args, **kwargs):
+            Logger.critical('Installing tensorflow is mandatory '
+                            'when using KerasQuantizationProfiler. '
+                            'Could not find Tensorflow package.')
@@ -16,31 +16,21 @@ from typing import Dict, List, Any, Tuple, Union
 from packaging import version
 import numpy as np
 
-from mct_quantizers.common.base_inferable_quantizer import BaseInferableQuantizer
+from mct_quantizers.common.base_inferable_quantizer import BaseInferableQuantizer, QUANTIZERS_REGISTRY
 from mct_quantizers.common.constants import FOUND_TF, WEIGHTS_QUANTIZERS, STEPS, WEIGHTS_VALUES, IS_INPUT_AS_LIST, \
-    OP_CALL_ARGS, OP_CALL_KWARGS, LAYER, TRAINING, MCTQ_VERSION, POSITIONAL_WEIGHT, QUANTIZED_POSITIONAL_WEIGHT
+    OP_CALL_ARGS, OP_CALL_KWARGS, LAYER, MCTQ_VERSION, POSITIONAL_WEIGHT, QUANTIZED_POSITIONAL_WEIGHT, \
+    REFERENCE_POSITIONAL_WEIGHTS, POSITIONAL_WEIGHT_REFERENCE, POSITIONAL_WEIGHTS_CONFIG_MAX_SIZE
 from mct_quantizers.logger import Logger
-from mct_quantizers.common.get_all_subclasses import get_all_subclasses
 from mct_quantizers import __version__ as mctq_version
 
 if FOUND_TF:
     import tensorflow as tf
-    from tensorflow.python.util import tf_inspect
-    from tensorflow.python.keras.utils.control_flow_util import smart_cond
 
     from mct_quantizers.keras.quantizers import BaseKerasInferableQuantizer
+    from mct_quantizers.keras.quantizer_utils import accepts_training, call_quantizer
 
     keras = tf.keras
 
-    def _make_quantizer_fn(quantizer, x, training):
-        """Use currying to return True/False specialized fns to the cond."""
-
-        def quantizer_fn():
-            return quantizer(x, training)
-
-        return quantizer_fn
-
-
     def _weight_name(name: str) -> str:
         """Extracts the weight name from the full TensorFlow variable name.
 
@@ -80,6 +70,21 @@ if FOUND_TF:
             Logger.error(f'_serialize_object only accepts tf.Tensor or np.ndarray but got type {type(obj)}.')
 
 
+    def _positional_weight_placeholder(shape: List[int], dtype: str) -> np.ndarray:
+        """
+        A placeholder of a positional weight that is referenced from the wrapper config. It is a read-only zeros
+        array that doesn't allocate the weight memory, whose value is loaded with the model weights.
+
+        Args:
+          shape: The weight shape.
+          dtype: The weight dtype name.
+
+        Returns:
+            A zeros array of the weight shape and dtype.
+        """
+        return np.broadcast_to(np.zeros((), dtype=dtype), shape)
+
+
     class KerasQuantizationWrapper(tf.keras.layers.Wrapper):
         def __init__(self,
                      layer: tf.keras.layers.Layer,
@@ -88,6 +93,7 @@ if FOUND_TF:
                      op_call_args: List = None,
                      op_call_kwargs: Dict[str, Any] = None,
                      is_inputs_as_list: bool = False,
+                     reference_positional_weights: bool = False,
                      **kwargs):
             """
             The KerasQuantizationWrapper takes a keras layer and quantization information and creates
@@ -106,6 +112,11 @@ if FOUND_TF:
                 op_call_args: A list containing the layer's call arguments.
                 op_call_kwargs: A dictionary containing the layer's call keyword arguments.
                 is_inputs_as_list: A boolean indicating the layer accepts the input tensors as a list.
+                reference_positional_weights: A boolean indicating large positional weights (with more than
+                    POSITIONAL_WEIGHTS_CONFIG_MAX_SIZE elements) of the built wrapper are referenced from its config
+                    by their shape and dtype, rather than serialized in it, and get their values from the saved model
+                    weights (e.g. when loading the model, or with set_weights after keras.models.clone_model).
+                    Models with referenced weights can't be loaded by versions before this argument was added.
 
             Examples:
 
@@ -141,6 +152,9 @@ if FOUND_TF:
                 if not isinstance(weight_val, (np.ndarray, tf.Tensor)):
                     Logger.error(f'Positional weight at position {pos} should be either an ndarray or a tf.Tensor,'
                                  f'but type is {type(weight_val)}')
+            self.reference_positional_weights = reference_positional_weights
+            # Positions of positional weights whose values are loaded with the model weights (see from_config).
+            self._referenced_positional_weights = set()
             if version.parse(tf.__version__) < version.parse("2.13"):
                 # Convert all values to tensors because keras.utils.serialize_keras_object fails for numpy array
                 # before version 2.13. (TODO: remove this if-else when not supporting TF 2.12 and below)
@@ -203,15 +217,40 @@ if FOUND_TF:
             # Only create the wrapper attributes that handle positional weights if they exist, so the wrapper is forward
             # compatible with older MCTQ versions (at least until MCT will start quantizing positional weights)
             if len(self.weight_values) > 0:
-                config[WEIGHTS_VALUES] = {k: self.serialize_fn(v) for k, v in self.weight_values.items()}
+                config[WEIGHTS_VALUES] = {k: self._serialize_positional_weight(k, v)
+                                          for k, v in self.weight_values.items()}
                 config[OP_CALL_ARGS] = self.op_call_args
                 config[OP_CALL_KWARGS] = self.op_call_kwargs
                 config[IS_INPUT_AS_LIST] = self.is_inputs_as_list
+                if self.reference_positional_weights:
+                    config[REFERENCE_POSITIONAL_WEIGHTS] = True
             return_config = {**base_config, **config}
             return_config[MCTQ_VERSION] = self._mctq_version
 
             return return_config
 
+        def _serialize_positional_weight(self, pos: int, value: Union[np.ndarray, tf.Tensor, tf.Variable]) -> Dict:
+            """
+            Serialize a positional weight for the wrapper config. If the wrapper references its positional weights,
+            large weights are stored in binary with the model weights, as the positional weights variables, so the
+            config only references them by their shape and dtype. Otherwise, and for small weights and weights that
+            aren't stored in a variable yet (the wrapper isn't built), the weight is serialized in the config.
+
+            Args:
+                pos: The weight position.
+                value: The weight value.
+
+            Returns:
+                A dictionary with the weight serialization.
+            """
+            in_variable = self.built or pos in self._referenced_positional_weights
+            if self.reference_positional_weights and in_variable and \
+                    np.prod(value.shape) > POSITIONAL_WEIGHTS_CONFIG_MAX_SIZE:
+                return {'class_name': POSITIONAL_WEIGHT_REFERENCE,
+                        'config': {'shape': list(value.shape),
+                                   'dtype': value.dtype.name}}
+            return self.serialize_fn(value)
+
         @property
         def mctq_version(self):
             return self._mctq_version
@@ -237,11 +276,17 @@ if FOUND_TF:
                 elif isinstance(name, int):
                     weight_value = self.weight_values[name]
                     _name = None
+                    # A referenced weight value is a placeholder, and its variable is assigned when loading the
+                    # model weights.
+                    is_referenced = name in self._referenced_positional_weights
                     weight = self.add_weight(name=f'{POSITIONAL_WEIGHT}_{name}',
                                              shape=weight_value.shape,
-                                             initializer=tf.keras.initializers.Constant(weight_value),
+                                             initializer='zeros' if is_referenced else
+                                             tf.keras.initializers.Constant(weight_value),
                                              trainable=False)
                     setattr(self, f'{POSITIONAL_WEIGHT}_{name}', weight)
+                    if is_referenced:
+                        self.weight_values[name] = weight
                 else:
                     Logger.error(f'A weight name ({name}) should be either "str" or "int", but has type {type(name)}')
 
@@ -265,34 +310,44 @@ if FOUND_TF:
             numpy_deserialization = lambda **_config: tf.constant(**_config).numpy()
             tensor_deserialization = lambda **_config: tf.constant(**_config)
             # When reading weight quantizers keys, which may be either a string with attribute name or an integer, the
-            # key is always a string, so this function checks whether it was a string or integer before serialization.
-            maybe_int = lambda x: int(x) if x.isdigit() else x
+            # key is a string after a JSON round trip, so this function checks whether it was a string or integer before
+            # serialization (config-only round trips keep the integer keys).
+            maybe_int = lambda x: int(x) if isinstance(x, int) or x.isdigit() else x
 
             config = config.copy()
-            qi_inferable_custom_objects = {subclass.__name__: subclass for subclass in
-                                           get_all_subclasses(BaseKerasInferableQuantizer)}
+            qi_inferable_custom_objects = QUANTIZERS_REGISTRY.subclasses_by_name(BaseKerasInferableQuantizer)
             with keras.utils.custom_object_scope(qi_inferable_custom_objects):
                 weights_quantizers = {maybe_int(k): keras.utils.deserialize_keras_object(v, module_objects=globals())
                                       for k, v in config.pop(WEIGHTS_QUANTIZERS).items()}
 
             # read weights_values in this scope so deserialize_keras_object knows how to interpret the serialization.
+            # Weights referenced from the config get placeholders, as their values are loaded with the model weights.
+            weights_values, referenced_positional_weights = {}, set()
             with keras.utils.custom_object_scope({'__numpy__': numpy_deserialization,
                                                   '__tensor__': tensor_deserialization}):
-                weights_values = {int(k): keras.utils.deserialize_keras_object(v)
-                                  for k, v in config.pop(WEIGHTS_VALUES, {}).items()}
+                for k, v in config.pop(WEIGHTS_VALUES, {}).items():
+                    if isinstance(v, dict) and v.get('class_name') == POSITIONAL_WEIGHT_REFERENCE:
+                        weights_values[int(k)] = _positional_weight_placeholder(v['config']['shape'],
+                                                                                v['config']['dtype'])
+                        referenced_positional_weights.add(int(k))
+                    else:
+                        weights_values[int(k)] = keras.utils.deserialize_keras_object(v)
 
             layer = tf.keras.layers.deserialize(config.pop(LAYER))
 
             op_call_args = config.pop(OP_CALL_ARGS, [])
             op_call_kwargs = config.pop(OP_CALL_KWARGS, {})
             is_inputs_as_list = config.pop(IS_INPUT_AS_LIST, False)
+            reference_positional_weights = config.pop(REFERENCE_POSITIONAL_WEIGHTS, False)
 
             v = config.pop(MCTQ_VERSION, None)
 
             obj = cls(layer=layer, weights_quantizers=weights_quantizers, weight_values=weights_values,
                       op_call_args=op_call_args, op_call_kwargs=op_call_kwargs,
-                      is_inputs_as_list=is_inputs_as_list, **config)
+                      is_inputs_as_list=is_inputs_as_list, reference_positional_weights=reference_positional_weights,
+                      **config)
             obj._mctq_version = mctq_version if v is None else v
+            obj._referenced_positional_weights = referenced_positional_weights
 
             return obj
 
@@ -315,6 +370,11 @@ if FOUND_TF:
 
             self._set_weights_vars()
 
+            # Resolve the call arguments once, rather than inspecting them on every call.
+            self._layer_accepts_training = accepts_training(self.layer.call)
+            self._quantizers_accept_training = {name: accepts_training(quantizer.__call__)
+                                                for name, _, quantizer in self._weights_vars}
+
         def set_quantize_weights(self, quantized_weights: dict):
             """
             This function update layer weights after quantization.
@@ -366,24 +426,14 @@ if FOUND_TF:
             # Quantize all weights, and replace them in the underlying layer.
             quantized_weights = {}
             for name, unquantized_weight, quantizer in self._weights_vars:
-
-                weights_quantizer_args_spec = tf_inspect.getfullargspec(quantizer.__call__).args
-                if TRAINING in weights_quantizer_args_spec:
-                    quantized_weight = smart_cond(
-                        training,
-                        _make_quantizer_fn(quantizer, unquantized_weight, True),
-                        _make_quantizer_fn(quantizer, unquantized_weight, False))
-                    quantized_weights.update({name: quantized_weight})
-                else:
-                    # Keras weights inferable quantizer.
-                    quantized_weight = quantizer(unquantized_weight)
-                    quantized_weights.update({name: quantized_weight})
+                # Keras weights inferable quantizers don't accept the training flag, unlike trainable quantizers.
+                quantized_weights[name] = call_quantizer(quantizer, unquantized_weight, training,
+                                                          self._quantizers_accept_training[name])
 
             self.set_quantize_weights(quantized_weights)
 
             if self.is_str_attr:
-                args_spec = tf_inspect.getfullargspec(self.layer.call).args
-                if TRAINING in args_spec:
+                if self._layer_accepts_training:
                     kwargs.update({'training': training})
                 outputs = self.layer.call(inputs, **kwargs)
             else:
@@ -12,9 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+from typing import Tuple
 
 import numpy as np
 import tensorflow as tf
+from tensorflow.python.keras.utils.control_flow_util import smart_cond
+from tensorflow.python.util import tf_inspect
+
+from mct_quantizers.common.constants import TRAINING
+from mct_quantizers.common.quant_utils import sort_lut_values_np
+
+
+def lut_nearest_indices(tensor: tf.Tensor,
+                        sorted_lut_values: np.ndarray,
+                        sorted_lut_indices: np.ndarray,
+                        chunk_size: int = None) -> tf.Tensor:
+    """
+    Assign each value of a tensor to the index of its nearest lut value, choosing the first index in the
+    original lut order on ties. Only the two sorted neighbours of each value are compared, so the temporary
+    memory is linear in the tensor size rather than in the tensor size times the number of lut values.
+
+    Args:
+        tensor: Tensor to assign.
+        sorted_lut_values: Sorted unique lut values, as returned by sort_lut_values_np.
+        sorted_lut_indices: Indices of the sorted values in the original lut values.
+        chunk_size: If given, assign the flattened tensor in chunks of this many values to bound
+            the temporary memory. Only tensors with a static shape are chunked.
+
+    Returns:
+        A tensor of the indices of the assigned lut values, with the shape of the input tensor.
+    """
+    flat_tensor = tf.reshape(tensor, [-1])
+    num_elements = tensor.shape.num_elements()
+    if chunk_size is not None and num_elements is not None and num_elements > chunk_size:
+        chunk_sizes = [chunk_size] * (num_elements // chunk_size)
+        if num_elements % chunk_size:
+            chunk_sizes.append(num_elements % chunk_size)
+        return tf.reshape(tf.concat([lut_nearest_indices(chunk, sorted_lut_values, sorted_lut_indices)
+                                     for chunk in tf.split(flat_tensor, chunk_sizes)], axis=0), tf.shape(tensor))
+
+    sorted_lut_values = tf.constant(sorted_lut_values, dtype=tensor.dtype)
+    sorted_lut_indices = tf.constant(sorted_lut_indices, dtype=tf.int64)
+
+    last = len(sorted_lut_indices) - 1
+    upper = tf.minimum(tf.searchsorted(sorted_lut_values, flat_tensor, side='left', out_type=tf.int64), last)
+    lower = tf.maximum(upper - 1, 0)
+    upper_dist = tf.abs(flat_tensor - tf.gather(sorted_lut_values, upper))
+    lower_dist = tf.abs(flat_tensor - tf.gather(sorted_lut_values, lower))
+    upper_indices = tf.gather(sorted_lut_indices, upper)
+    lower_indices = tf.gather(sorted_lut_indices, lower)
+    take_upper = tf.logical_or(upper_dist < lower_dist,
+                               tf.logical_and(upper_dist == lower_dist, upper_indices < lower_indices))
+    return tf.reshape(tf.where(take_upper, upper_indices, lower_indices), tf.shape(tensor))
 
 
 def lut_quantizer(tensor_data: tf.Tensor,
@@ -22,7 +71,9 @@ def lut_quantizer(tensor_data: tf.Tensor,
                   signed: bool,
                   threshold: np.ndarray,
                   lut_values_bitwidth: int,
-                  eps: float) -> tf.Tensor:
+                  eps: float,
+                  sorted_lut: Tuple[np.ndarray, np.ndarray] = None,
+                  chunk_size: int = None) -> tf.Tensor:
     """
     Quantize a tensor using a non-uniform quantization based on the pre-defined values.
     1. Scales tensor_data with the threshold into lut_values_bitwidth quantization range.
@@ -37,16 +88,18 @@ def lut_quantizer(tensor_data: tf.Tensor,
         threshold: threshold for quantization.
         lut_values_bitwidth: Number of bits that determines the quantization range
         eps: Small value for numerical stability in division.
+        sorted_lut: The lut values sorted by sort_lut_values_np. Sorted here if not given.
+        chunk_size: If given, assign the tensor to lut values in chunks of this many values.
 
     Returns: Quantized tensor.
     """
 
     tensor = int_quantization_with_threshold(tensor_data, n_bits=lut_values_bitwidth, signed=signed, threshold=threshold,
                                              eps=eps)
-    tensor = tf.expand_dims(tensor, -1)
 
-    expanded_lut_values = lut_values.reshape([*[1 for _ in range(len(tensor.shape) - 1)], -1])
-    lut_values_assignments = tf.argmin(tf.abs(tensor - expanded_lut_values), axis=-1)
+    if sorted_lut is None:
+        sorted_lut = sort_lut_values_np(lut_values)
+    lut_values_assignments = lut_nearest_indices(tensor, *sorted_lut, chunk_size=chunk_size)
     centers = tf.gather(lut_values.flatten(), lut_values_assignments)
 
     quant_tensor = (centers / (2 ** (lut_values_bitwidth - int(signed)))) * threshold
@@ -83,3 +136,71 @@ def int_quantization_with_threshold(data: tf.Tensor,
 
     return tf.clip_by_value((data / (threshold + eps)) * (2 ** (n_bits - int(signed))),
                             clip_value_max=clip_max, clip_value_min=clip_min)
+
+
+def fake_quant_per_channel(tensor: tf.Tensor,
+                           nudged_min: tf.Tensor,
+                           nudged_max: tf.Tensor,
+                           scale: tf.Tensor,
+                           inv_scale: tf.Tensor,
+                           quant_zero: tf.Tensor) -> tf.Tensor:
+    """
+    Per-channel fake quantization along any axis, by broadcasting the quantization parameters against the
+    tensor, so it needs no transposes of the tensor. It matches tf.quantization.fake_quant_with_min_max_vars_per_channel
+    bit for bit (with parameters from fake_quant_nudged_params), including its straight-through gradient.
+
+    Args:
+        tensor: Tensor to quantize.
+        nudged_min: The nudged ranges min, in a shape that broadcasts along the channel axis.
+        nudged_max: The nudged ranges max, in the same shape.
+        scale: The scales, in the same shape.
+        inv_scale: The inverse scales, in the same shape.
+        quant_zero: The zero points, in the same shape.
+
+    Returns:
+        The fake quantized tensor.
+    """
+    clamped = tf.maximum(tf.minimum(tensor, nudged_max), nudged_min)
+    q_tensor = tf.floor((clamped - nudged_min) * inv_scale - quant_zero + 0.5) * scale
+    # Add the clamped tensor gradient (1 inside the range and 0 outside it) as the straight-through gradient, by
+    # adding zero, which is cheaper than a custom gradient in eager mode.
+    return q_tensor + (clamped - tf.stop_gradient(clamped))
+
+
+def _make_quantizer_fn(quantizer, x, training):
+    """Use currying to return True/False specialized fns to the cond."""
+
+    def quantizer_fn():
+        return quantizer(x, training)
+
+    return quantizer_fn
+
+
+def accepts_training(fn) -> bool:
+    """
+    Returns: Whether a function (a layer or quantizer call) has a training argument.
+    """
+    return TRAINING in tf_inspect.getfullargspec(fn).args
+
+
+def call_quantizer(quantizer, x, training, quantizer_accepts_training: bool):
+    """
+    Call a quantizer, passing it the training flag if it accepts one. A static training flag (a python boolean,
+    or the 0/1 learning phase) is passed as is, so a cond is only built for a training tensor.
+
+    Args:
+        quantizer: The quantizer to call.
+        x: The quantizer input.
+        training: The training flag.
+        quantizer_accepts_training: Whether the quantizer accepts the training flag.
+
+    Returns:
+        The quantizer output.
+    """
+    if not quantizer_accepts_training:
+        return quantizer(x)
+    if isinstance(training, (bool, int)):
+        return quantizer(x, bool(training))
+    return smart_cond(training,
+                      _make_quantizer_fn(quantizer, x, True),
+                      _make_quantizer_fn(quantizer, x, False))
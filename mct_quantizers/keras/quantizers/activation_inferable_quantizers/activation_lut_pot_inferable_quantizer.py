@@ -18,8 +18,9 @@ from typing import List
 import numpy as np
 
 from mct_quantizers.common.base_inferable_quantizer import mark_quantizer, QuantizationTarget, QuantizerID
-from mct_quantizers.common.constants import FOUND_TF, LUT_VALUES_BITWIDTH, EPS
+from mct_quantizers.common.constants import FOUND_TF, LUT_VALUES_BITWIDTH, EPS, LUT_ASSIGNMENT_CHUNK_SIZE
 from mct_quantizers.common.quant_info import QuantizationMethod
+from mct_quantizers.common.quant_utils import sort_lut_values_np
 from mct_quantizers.logger import Logger
 
 
@@ -107,6 +108,8 @@ if FOUND_TF:
             self.num_bits = num_bits
             # Save as a numpy array to avoid conversion during inference
             self._lut_values_as_np = lut_values
+            # Sort once, so values are assigned to the lut values with a sorted-boundary search
+            self._sorted_lut = sort_lut_values_np(lut_values.astype(np.float32))
             # Save as a list for serialization purposes
             self.lut_values = lut_values.tolist()
             self.signed = signed
@@ -133,7 +136,9 @@ if FOUND_TF:
                                  # thus we expect a single threshold value. Assertion is made in init.
                                  threshold=self.threshold[0],
                                  lut_values_bitwidth=self.lut_values_bitwidth,
-                                 eps=self.eps)
+                                 eps=self.eps,
+                                 sorted_lut=self._sorted_lut,
+                                 chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
 
         def get_config(self):
             """
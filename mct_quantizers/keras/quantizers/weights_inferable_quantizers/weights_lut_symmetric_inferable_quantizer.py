@@ -18,8 +18,9 @@ from typing import List
 import numpy as np
 
 from mct_quantizers.common.base_inferable_quantizer import QuantizationTarget, mark_quantizer, QuantizerID
-from mct_quantizers.common.constants import FOUND_TF, LUT_VALUES_BITWIDTH, EPS
+from mct_quantizers.common.constants import FOUND_TF, LUT_VALUES_BITWIDTH, EPS, LUT_ASSIGNMENT_CHUNK_SIZE
 from mct_quantizers.common.quant_info import QuantizationMethod
+from mct_quantizers.common.quant_utils import sort_lut_values_np
 
 
 if FOUND_TF:
@@ -108,19 +109,15 @@ if FOUND_TF:
             self.channel_axis = channel_axis
             self.input_rank = input_rank
 
-            # Tensorflow's fake_quant_with_min_max_vars_per_channel only works on last axis, so
-            # need to move the quantization axis to the last axis
-            if per_channel and channel_axis not in [-1, self.input_rank - 1]:
-                # If per-channel quantization is being used and the channel axis is not the last axis,
-                # create a permutation vector to move the channel axis to the last position
-                self.perm_vec = list(np.arange(self.input_rank))
-                channel_axis = self.perm_vec[self.channel_axis]
-                self.perm_vec[channel_axis] = self.input_rank - 1
-                self.perm_vec[self.input_rank - 1] = channel_axis
-            else:
-                # If per-channel quantization is not being used or the channel axis is already the last axis,
-                # set the permutation vector to None
-                self.perm_vec = None
+            # Sort once, so values are assigned to the lut values with a sorted-boundary search
+            self._sorted_lut = sort_lut_values_np(self._np_lut_values)
+
+            # In per-channel quantization, the thresholds are broadcast along the channel axis, so the inputs
+            # are quantized along any axis without transposing them.
+            if per_channel:
+                broadcast_shape = [1] * self.input_rank
+                broadcast_shape[self.channel_axis] = -1
+                self._channel_threshold = np.reshape(self._np_threshold, broadcast_shape)
 
         def __call__(self, inputs: tf.Tensor) -> tf.Tensor:
             """
@@ -135,35 +132,25 @@ if FOUND_TF:
             assert inputs.dtype == tf.float32, f'Input tensor was expected to be a float tensor but is of type ' \
                                                f'{inputs.dtype}'
 
-            # If per-channel quantization is being used
+            # If per-channel quantization is being used, quantize the input tensor along the channel axis
             if self.per_channel:
-                # If a permutation vector has been created to move the channel axis to the last position
-                if self.perm_vec:
-                    # Transpose the input tensor to move the channel axis to the last position
-                    inputs = tf.transpose(inputs,
-                                          perm=self.perm_vec)
-
-                # Quantize the input tensor using per-channel quantization
-                q_tensor = lut_quantizer(inputs,
-                                         lut_values=self._np_lut_values.astype(np.float32),
-                                         signed=True,
-                                         threshold=self._np_threshold,
-                                         lut_values_bitwidth=self.lut_values_bitwidth,
-                                         eps=self.eps)
-                if self.perm_vec:
-                    # Transpose the quantized tensor back to its original shape
-                    q_tensor = tf.transpose(q_tensor,
-                                            perm=self.perm_vec)
-
-                # Return the quantized tensor
-                return q_tensor
+                return lut_quantizer(inputs,
+                                     lut_values=self._np_lut_values.astype(np.float32),
+                                     signed=True,
+                                     threshold=self._channel_threshold,
+                                     lut_values_bitwidth=self.lut_values_bitwidth,
+                                     eps=self.eps,
+                                     sorted_lut=self._sorted_lut,
+                                     chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
             else:
                 return lut_quantizer(inputs,
                                      lut_values=self._np_lut_values,
                                      signed=True,
                                      threshold=self._np_threshold,
                                      lut_values_bitwidth=self.lut_values_bitwidth,
-                                     eps=self.eps)
+                                     eps=self.eps,
+                                     sorted_lut=self._sorted_lut,
+                                     chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
 
         def get_config(self):
             """
@@ -19,12 +19,13 @@ import numpy as np
 from mct_quantizers.common.base_inferable_quantizer import QuantizationTarget, mark_quantizer, QuantizerID
 from mct_quantizers.common.constants import FOUND_TF
 from mct_quantizers.common.quant_info import QuantizationMethod
-from mct_quantizers.common.quant_utils import adjust_range_to_include_zero
+from mct_quantizers.common.quant_utils import adjust_range_to_include_zero, fake_quant_nudged_params
 
 
 if FOUND_TF:
     import tensorflow as tf
     from mct_quantizers.keras.quantizers.base_keras_inferable_quantizer import BaseKerasInferableQuantizer
+    from mct_quantizers.keras.quantizer_utils import fake_quant_per_channel
     from mct_quantizers.keras.validation_functions import validate_uniform_min_max_ranges, \
         validate_adjusted_min_max_ranges
 
@@ -98,19 +99,14 @@ if FOUND_TF:
             self.channel_axis = channel_axis
             self.input_rank = input_rank
 
-            # Tensorflow's fake_quant_with_min_max_vars_per_channel only works on last axis, so
-            # need to move the quantization axis to the last axis
-            if per_channel and channel_axis not in [-1, self.input_rank - 1]:
-                # If per-channel quantization is being used and the channel axis is not the last axis,
-                # create a permutation vector to move the channel axis to the last position
-                self.perm_vec = list(np.arange(self.input_rank))
-                channel_axis = self.perm_vec[self.channel_axis]
-                self.perm_vec[channel_axis] = self.input_rank - 1
-                self.perm_vec[self.input_rank - 1] = channel_axis
-            else:
-                # If per-channel quantization is not being used or the channel axis is already the last axis,
-                # set the permutation vector to None
-                self.perm_vec = None
+            # Tensorflow's fake_quant_with_min_max_vars_per_channel only works on the last axis, and loops over
+            # the channels. Instead, per-channel quantization broadcasts the (nudged) quantization parameters
+            # along the channel axis, which quantizes along any axis without transposing the inputs.
+            if per_channel:
+                broadcast_shape = [1] * self.input_rank
+                broadcast_shape[self.channel_axis] = -1
+                self.per_channel_params = [tf.constant(np.reshape(p, broadcast_shape)) for p in
+                                           fake_quant_nudged_params(self.min_range_np, self.max_range_np, num_bits)]
 
         def __call__(self, inputs: tf.Tensor) -> tf.Tensor:
             """
@@ -124,24 +120,9 @@ if FOUND_TF:
             """
             assert inputs.dtype==tf.float32, f'Input tensor was expected to be a float tensor but is of type {inputs.dtype}'
 
-            # If per-channel quantization is being used
+            # If per-channel quantization is being used, quantize the input tensor along the channel axis
             if self.per_channel:
-                # If a permutation vector has been created to move the channel axis to the last position
-                if self.perm_vec:
-                    # Transpose the input tensor to move the channel axis to the last position
-                    inputs = tf.transpose(inputs, perm=self.perm_vec)
-
-                # Quantize the input tensor using per-channel quantization
-                q_tensor = tf.quantization.fake_quant_with_min_max_vars_per_channel(inputs,
-                                                                                    min=self.min_range_np,
-                                                                                    max=self.max_range_np,
-                                                                                    num_bits=self.num_bits)
-                if self.perm_vec:
-                    # Transpose the quantized tensor back to its original shape
-                    q_tensor = tf.transpose(q_tensor, perm=self.perm_vec)
-
-                # Return the quantized tensor
-                return q_tensor
+                return fake_quant_per_channel(inputs, *self.per_channel_params)
             else:
                 # If per-channel quantization is not being used, quantize the input tensor using regular quantization
                 return tf.quantization.fake_quant_with_min_max_vars(inputs,
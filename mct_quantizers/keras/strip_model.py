@@ -0,0 +1,228 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, Dict, List, Tuple
+
+from mct_quantizers.common.constants import FOUND_TF
+from mct_quantizers.logger import Logger
+
+if FOUND_TF:
+    import tensorflow as tf
+    from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
+    from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
+    from mct_quantizers.keras.quantizers import ActivationUniformInferableQuantizer
+
+    keras = tf.keras
+
+
+    def _short_weight_name(weight: tf.Variable) -> str:
+        # E.g. 'kernel' for 'conv2d/kernel:0'.
+        return weight.name.split(':')[0].split('/')[-1]
+
+
+    def _clone_layer(layer: keras.layers.Layer) -> keras.layers.Layer:
+        return layer.__class__.from_config(layer.get_config())
+
+
+    # call_model_nodes reads the nodes of Keras functional models, which are not a public API.
+    _SUPPORTED_KERAS_VERSIONS = 'Keras 2 (tf.keras of TensorFlow 2.12 to 2.15)'
+
+
+    def _functional_model_nodes(model: keras.Model) -> Tuple[Dict[int, List[Any]], Any, type]:
+        """
+        The private attributes of a Keras 2 functional model that describe its nodes: the nodes by their depth, the
+        model outputs (in their structure) and the type of the symbolic tensors between the nodes. Fails with an
+        error naming the supported Keras versions if the Keras version doesn't have them.
+        """
+        nodes_by_depth = getattr(model, '_nodes_by_depth', None)
+        nested_outputs = getattr(model, '_nested_outputs', None)
+        keras_tensor_type = getattr(getattr(keras, '__internal__', None), 'KerasTensor', None)
+        if nodes_by_depth is None or nested_outputs is None or keras_tensor_type is None:
+            Logger.critical(f'Calling the nodes of the model {model.name} is only supported with '
+                            f'{_SUPPORTED_KERAS_VERSIONS}, but got TensorFlow {tf.__version__}.')
+        return nodes_by_depth, nested_outputs, keras_tensor_type
+
+
+    def call_model_nodes(model: keras.Model, inputs: List[Any], call_layer: Callable) -> Any:
+        """
+        Call the layers of a functional model node by node (like the model's call does) on new inputs, with a
+        function that replaces the call of each layer. Only supported with Keras 2 (tf.keras of TensorFlow 2.12 to
+        2.15), as it reads the model nodes.
+
+        Args:
+            model: A functional (or Sequential) model.
+            inputs: The tensors to call the model on, one per model input.
+            call_layer: A function of a layer and the (mapped) arguments and keyword arguments of a node of the layer,
+                which returns the node outputs.
+
+        Returns: The outputs of the model, in the structure of the model outputs.
+
+        """
+        nodes_by_depth, nested_outputs, keras_tensor_type = _functional_model_nodes(model)
+        tensors = {id(x): y for x, y in zip(model.inputs, inputs)}
+        map_tensors = lambda structure: tf.nest.map_structure(
+            lambda t: tensors[id(t)] if isinstance(t, keras_tensor_type) else t, structure)
+
+        for depth in sorted(nodes_by_depth, reverse=True):
+            for node in nodes_by_depth[depth]:
+                if node.is_input:
+                    continue
+                outputs = call_layer(node.layer, map_tensors(node.call_args), map_tensors(node.call_kwargs))
+                for x, y in zip(tf.nest.flatten(node.outputs), tf.nest.flatten(outputs)):
+                    tensors[id(x)] = y
+
+        return map_tensors(nested_outputs)
+
+
+    class _ModelStripper:
+        """
+        Rebuilds a functional model node by node (like the model's call does), replacing the quantization wrappers
+        and holders. Every layer of the model is replaced by a single new layer, so shared layers stay shared.
+        """
+        def __init__(self):
+            self._layers = {}
+            self.kept_holders = []
+
+        def _stripped_layer(self, layer: keras.layers.Layer) -> keras.layers.Layer:
+            """
+            Create the (unbuilt) layer that replaces a layer.
+            """
+            if isinstance(layer, keras.Model):
+                return self.strip_model(layer)
+            if isinstance(layer, KerasQuantizationWrapper):
+                return _clone_layer(layer.layer)
+            if isinstance(layer, KerasActivationQuantizationHolder):
+                self.kept_holders.append(layer.name)
+            return _clone_layer(layer)
+
+        @staticmethod
+        def _set_weights(layer: keras.layers.Layer, stripped_layer: keras.layers.Layer):
+            """
+            Set the weights of a (built) layer that replaces a layer.
+            """
+            if isinstance(layer, keras.Model):
+                # The weights of a stripped model are set when it's stripped.
+                return
+            if isinstance(layer, KerasQuantizationWrapper):
+                # Copy the layer weights, with the quantized weights instead of the float weights. The wrapper
+                # replaces the quantized weights attributes of its layer, so they are taken from the wrapper's
+                # weights vars.
+                values = {_short_weight_name(w): w.numpy() for w in layer.layer.weights}
+                for name, weight, quantizer in layer.get_weights_vars():
+                    if isinstance(name, str):
+                        values[_short_weight_name(weight)] = quantizer(weight).numpy()
+                if not all(_short_weight_name(w) in values for w in stripped_layer.weights):
+                    Logger.critical(f'Failed to match the weights of the {layer.layer.name} layer '
+                                    f'{[w.name for w in stripped_layer.weights]} to the weights of the wrapper '
+                                    f'{layer.name} {list(values)}.')
+                stripped_layer.set_weights([values[_short_weight_name(w)] for w in stripped_layer.weights])
+            elif layer.weights:
+                stripped_layer.set_weights(layer.get_weights())
+
+        def _call_layer(self, layer: keras.layers.Layer, args: Tuple, kwargs: Dict) -> Any:
+            """
+            Call the replacement of a layer on the arguments of a node of the layer.
+            """
+            if isinstance(layer, KerasActivationQuantizationHolder) and \
+                    isinstance(layer.activation_holder_quantizer, ActivationUniformInferableQuantizer):
+                # A uniform (symmetric or power-of-two) activation quantizer is a single fake quant op.
+                quantizer = layer.activation_holder_quantizer
+                return tf.quantization.fake_quant_with_min_max_vars(args[0],
+                                                                    min=quantizer.min_range[0],
+                                                                    max=quantizer.max_range[0],
+                                                                    num_bits=quantizer.num_bits)
+
+            is_new_layer = id(layer) not in self._layers
+            if is_new_layer:
+                self._layers[id(layer)] = self._stripped_layer(layer)
+            stripped_layer = self._layers[id(layer)]
+
+            if isinstance(layer, KerasQuantizationWrapper) and not layer.is_str_attr:
+                # Call the layer with the quantized positional weights as constants, like the wrapper does.
+                inputs = list(args[0]) if isinstance(args[0], (list, tuple)) else [args[0]]
+                quantized_weights = layer.get_quantized_weights()
+                for pos in sorted(quantized_weights):
+                    inputs.insert(pos, quantized_weights[pos].numpy())
+                if layer.is_inputs_as_list:
+                    outputs = stripped_layer(inputs, *layer.op_call_args, **layer.op_call_kwargs)
+                else:
+                    outputs = stripped_layer(*(inputs + layer.op_call_args), **layer.op_call_kwargs)
+            else:
+                outputs = stripped_layer(*args, **kwargs)
+
+            # The layer is built by its first call.
+            if is_new_layer:
+                self._set_weights(layer, stripped_layer)
+            return outputs
+
+        def strip_model(self, model: keras.Model) -> keras.Model:
+            """
+            Rebuild a functional (or Sequential) model with the stripped layers.
+            """
+            if not getattr(model, '_is_graph_network', False):
+                Logger.critical(f'Only functional and Sequential models with known inputs can be stripped, but '
+                                f'{model.name} is a subclassed model or has no inputs.')
+
+            inputs = [keras.Input(batch_size=x.shape[0], shape=x.shape[1:], dtype=x.dtype, name=name)
+                      for x, name in zip(model.inputs, model.input_names)]
+            outputs = call_model_nodes(model, inputs, self._call_layer)
+            return keras.Model(inputs=inputs, outputs=outputs, name=model.name)
+
+
+    def keras_strip_quantized_model(model: keras.Model) -> keras.Model:
+        """
+        Strip the quantization wrappers and holders of a quantized model into a deployment model of built-in Keras
+        layers, which doesn't quantize its weights on every call and can be loaded with tf.keras.models.load_model
+        without custom objects. In the stripped model:
+          - A KerasQuantizationWrapper of a layer with weights attributes (e.g. Conv2D) is replaced with a copy of
+            the layer, whose weights are the quantized weights (without the wrapper's optimizer_step variable).
+          - A KerasQuantizationWrapper of a layer with positional weights (e.g. tf.add with a constant) is replaced
+            with a copy of the layer, called on the quantized positional weights as constants.
+          - A KerasActivationQuantizationHolder of a uniform, symmetric or power-of-two quantizer is replaced with a
+            tf.quantization.fake_quant_with_min_max_vars op (a TFOpLambda layer). Holders of other quantizers
+            (e.g. LUT) are kept, so such a model still has to be loaded with keras_load_quantized_model.
+        The other layers are copied with their weights. The quantized weights are constants of the inference
+        graph, so Grappler constant folding applies to them.
+
+        Args:
+            model: A functional or Sequential Keras model with KerasQuantizationWrapper and
+                KerasActivationQuantizationHolder layers (possibly in nested functional models).
+
+        Returns: The stripped model.
+
+        """
+        stripper = _ModelStripper()
+        stripped_model = stripper.strip_model(model)
+        if stripper.kept_holders:
+            Logger.warning(f'The activation quantization holders {stripper.kept_holders} have quantizers that are '
+                           f'not fake quant ops, and are kept in the stripped model, which has to be loaded with '
+                           f'keras_load_quantized_model.')
+        return stripped_model
+
+else:
+    def keras_strip_quantized_model(model):
+        """
+        Strip the quantization wrappers and holders of a quantized model into a deployment model of built-in Keras
+        layers.
+
+        Args:
+            model: A functional or Sequential Keras model with KerasQuantizationWrapper and
+                KerasActivationQuantizationHolder layers.
+
+        Returns: The stripped model.
+
+        """
+        Logger.critical('Installing tensorflow is mandatory '
+                        'when using keras_strip_quantized_model. '
+                        'Could not find Tensorflow package.')  # pragma: no cover
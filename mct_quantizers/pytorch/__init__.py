@@ -11,4 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-# ==============================================================================
\ No newline at end of file
+# ==============================================================================
+import importlib
+
+
+def __getattr__(name: str):
+    # The submodules are imported on their first access (e.g. mct_quantizers.pytorch.quantizers), like they were
+    # when importing mct_quantizers imported them.
+    try:
+        value = importlib.import_module(f'{__name__}.{name}')
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value
+    return value
@@ -0,0 +1,112 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from mct_quantizers.common.constants import FOUND_TORCH
+from mct_quantizers.logger import Logger
+
+if FOUND_TORCH:
+    import torch
+    from mct_quantizers.pytorch.activation_quantization_holder import PytorchActivationQuantizationHolder
+    from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+
+    def _set_quantizers_flag(model: torch.nn.Module, enable: bool, enable_attr: str, disable_attr: str,
+                             name: str) -> torch.nn.Module:
+        """
+        Enable (or disable) a mode of the quantizers of all the PytorchQuantizationWrapper and
+        PytorchActivationQuantizationHolder modules in a model, by calling their enable (or disable) method.
+        The model is modified in place.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            enable: Whether to enable or disable the mode.
+            enable_attr: Name of the quantizer method that enables the mode.
+            disable_attr: Name of the quantizer method that disables the mode.
+            name: Name of the mode, for the error of quantizers that don't support it.
+
+        Returns: The model.
+
+        """
+        for module in model.modules():
+            if isinstance(module, PytorchQuantizationWrapper):
+                quantizers = list(module.weights_quantizers.values())
+            elif isinstance(module, PytorchActivationQuantizationHolder):
+                quantizers = [module.activation_holder_quantizer]
+            else:
+                continue
+            for quantizer in quantizers:
+                if not hasattr(quantizer, enable_attr):
+                    Logger.critical(f'Quantizer {type(quantizer).__name__} does not support the {name}.')
+                getattr(quantizer, enable_attr if enable else disable_attr)()
+        return model
+
+    def pytorch_set_quantizers_compile_mode(model: torch.nn.Module, enable: bool = True) -> torch.nn.Module:
+        """
+        Enable (or disable) the compile mode of the quantizers of all the PytorchQuantizationWrapper and
+        PytorchActivationQuantizationHolder modules in a model. In compile mode the quantizers use side-effect
+        free, pointwise ops only, so torch.compile captures the model in a single graph and fuses the
+        quantization into the neighbouring kernels. The model is modified in place.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            enable: Whether to enable or disable the compile mode.
+
+        Returns: The model.
+
+        """
+        return _set_quantizers_flag(model, enable, 'enable_compile_mode', 'disable_compile_mode', 'compile mode')
+
+    def pytorch_compile_quantized_model(model: torch.nn.Module, **compile_kwargs) -> torch.nn.Module:
+        """
+        Compile a quantized model with torch.compile, after setting its quantizers to compile mode
+        (see pytorch_set_quantizers_compile_mode).
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            **compile_kwargs: Key-word arguments to pass to torch.compile.
+
+        Returns: The compiled model.
+
+        """
+        return torch.compile(pytorch_set_quantizers_compile_mode(model), **compile_kwargs)
+
+else:
+    def pytorch_set_quantizers_compile_mode(model, enable=True):
+        """
+        Enable (or disable) the compile mode of the quantizers in a model.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            enable: Whether to enable or disable the compile mode.
+
+        Returns: The model.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_set_quantizers_compile_mode. '
+                        'Could not find torch package.')  # pragma: no cover
+
+    def pytorch_compile_quantized_model(model, **compile_kwargs):
+        """
+        Compile a quantized model with torch.compile.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            **compile_kwargs: Key-word arguments to pass to torch.compile.
+
+        Returns: The compiled model.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_compile_quantized_model. '
+                        'Could not find torch package.')  # pragma: no cover
@@ -0,0 +1,53 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from mct_quantizers.common.constants import FOUND_TORCH
+from mct_quantizers.logger import Logger
+
+if FOUND_TORCH:
+    import torch
+    from mct_quantizers.pytorch.compile_model import _set_quantizers_flag
+
+    def pytorch_set_quantizers_qdq_export(model: torch.nn.Module, enable: bool = True) -> torch.nn.Module:
+        """
+        Enable (or disable) the QDQ export of the quantizers of all the PytorchQuantizationWrapper and
+        PytorchActivationQuantizationHolder modules in a model. When exported to ONNX, the symmetric, power-of-two
+        and uniform quantizers are then mapped to standard QuantizeLinear/DequantizeLinear pairs, which ONNX Runtime
+        runs natively (without get_ort_session_options) and fuses into integer kernels such as QLinearConv.
+        Quantizers without a QDQ mapping (e.g. LUT quantizers) keep their custom op. The model is modified in place.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            enable: Whether to enable or disable the QDQ export.
+
+        Returns: The model.
+
+        """
+        return _set_quantizers_flag(model, enable, 'enable_qdq_export', 'disable_qdq_export', 'QDQ export')
+
+else:
+    def pytorch_set_quantizers_qdq_export(model, enable=True):
+        """
+        Enable (or disable) the QDQ export of the quantizers in a model.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+            enable: Whether to enable or disable the QDQ export.
+
+        Returns: The model.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_set_quantizers_qdq_export. '
+                        'Could not find torch package.')  # pragma: no cover
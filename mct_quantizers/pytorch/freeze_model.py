@@ -0,0 +1,60 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from mct_quantizers.common.constants import FOUND_TORCH
+from mct_quantizers.logger import Logger
+
+if FOUND_TORCH:
+    import torch
+    from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+
+    def pytorch_freeze_quantized_model(model: torch.nn.Module,
+                                       int_weights: bool = False,
+                                       cache_dequantized_weights: bool = False) -> torch.nn.Module:
+        """
+        Freeze all the PytorchQuantizationWrapper modules in a model: the weights are quantized once
+        and stored as buffers instead of the float weights. The model is modified in place.
+        A frozen model state_dict can be loaded to a model that was frozen the same way.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper modules.
+            int_weights: Whether to store the quantized weights as integer codes.
+            cache_dequantized_weights: When storing integer weights, whether to keep the dequantized weights
+                instead of decoding them on each call.
+
+        Returns: The frozen model.
+
+        """
+        for module in model.modules():
+            if isinstance(module, PytorchQuantizationWrapper):
+                module.freeze(int_weights=int_weights, cache_dequantized_weights=cache_dequantized_weights)
+        return model
+
+else:
+    def pytorch_freeze_quantized_model(model, int_weights=False, cache_dequantized_weights=False):
+        """
+        Freeze all the PytorchQuantizationWrapper modules in a model.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper modules.
+            int_weights: Whether to store the quantized weights as integer codes.
+            cache_dequantized_weights: When storing integer weights, whether to keep the dequantized weights
+                instead of decoding them on each call.
+
+        Returns: The frozen model.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_freeze_quantized_model. '
+                        'Could not find torch package.')  # pragma: no cover
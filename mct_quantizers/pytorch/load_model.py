@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any
+import os
+from typing import Any, Dict, Union
 
 from mct_quantizers.common.constants import FOUND_TORCH
 from mct_quantizers.logger import Logger
@@ -33,6 +34,38 @@ if FOUND_TORCH:
         """
         return torch.load(filepath, **kwargs)
 
+    def pytorch_materialize_quantized_model(model: torch.nn.Module,
+                                            checkpoint: Union[str, os.PathLike, Dict[str, torch.Tensor]],
+                                            map_location: Any = None,
+                                            mmap: bool = True,
+                                            strict: bool = True) -> torch.nn.Module:
+        """
+        Materialize a quantized model constructed on the meta device (e.g. under "with torch.device('meta'):")
+        from a state_dict checkpoint. The checkpoint tensors are assigned to the model instead of being copied
+        into allocated tensors, and a checkpoint file is memory-mapped, so the peak memory stays close to the
+        final model size. The quantizers quantization parameters are computed from their arguments at
+        construction (also under a meta device context) and are not part of the checkpoint.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper modules, constructed on the meta device.
+            checkpoint: A state_dict, or a path to a state_dict file saved with torch.save.
+            map_location: The device to load the checkpoint file to (see torch.load).
+            mmap: Whether to memory-map the checkpoint file instead of reading it into memory.
+            strict: Whether the checkpoint keys must match the model state_dict keys.
+
+        Returns: The materialized model.
+
+        """
+        if isinstance(checkpoint, (str, os.PathLike)):
+            checkpoint = torch.load(checkpoint, map_location=map_location, mmap=mmap, weights_only=True)
+        model.load_state_dict(checkpoint, strict=strict, assign=True)
+
+        meta_tensors = [name for name, tensor in list(model.named_parameters()) + list(model.named_buffers())
+                        if tensor.is_meta]
+        if len(meta_tensors) > 0:
+            Logger.critical(f'The checkpoint does not materialize the model tensors: {meta_tensors}.')
+        return model
+
 else:
     def pytorch_load_quantized_model(filepath, **kwargs):
         """
@@ -48,3 +81,21 @@ else:
         Logger.critical('Installing Pytorch is mandatory '
                         'when using pytorch_load_quantized_model. '
                         'Could not find torch package.')  # pragma: no cover
+
+    def pytorch_materialize_quantized_model(model, checkpoint, map_location=None, mmap=True, strict=True):
+        """
+        Materialize a quantized model constructed on the meta device from a state_dict checkpoint.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper modules, constructed on the meta device.
+            checkpoint: A state_dict, or a path to a state_dict file saved with torch.save.
+            map_location: The device to load the checkpoint file to (see torch.load).
+            mmap: Whether to memory-map the checkpoint file instead of reading it into memory.
+            strict: Whether the checkpoint keys must match the model state_dict keys.
+
+        Returns: The materialized model.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_materialize_quantized_model. '
+                        'Could not find torch package.')  # pragma: no cover
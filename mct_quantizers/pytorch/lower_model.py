@@ -0,0 +1,344 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from mct_quantizers.common.constants import FOUND_TORCH
+from mct_quantizers.logger import Logger
+
+if FOUND_TORCH:
+    import torch
+    import torch.fx
+    from torch.ao.nn import quantized as nnq
+    from torch.ao.nn.intrinsic import quantized as nniq
+    from mct_quantizers.pytorch.activation_quantization_holder import PytorchActivationQuantizationHolder
+    from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+    from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_symmetric_inferable_quantizer \
+        import ActivationSymmetricInferableQuantizer
+    from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_uniform_inferable_quantizer \
+        import ActivationUniformInferableQuantizer
+    from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_symmetric_inferable_quantizer import \
+        WeightsSymmetricInferableQuantizer
+
+    _RELU_FUNCTIONS = (torch.relu, torch.nn.functional.relu)
+    # Ops that keep their input values, and so their quantization grid.
+    _RESHAPE_FUNCTIONS = (torch.flatten, torch.reshape)
+    _RESHAPE_METHODS = ('flatten', 'reshape', 'view')
+
+
+    class PytorchLoweredQuantizedLayer(torch.nn.Module):
+        """
+        A Conv2d or Linear layer, with an optional ReLU, lowered from a PytorchQuantizationWrapper and the
+        PytorchActivationQuantizationHolder after it to an integer kernel (torch.ao.nn.quantized) of the current
+        quantized engine (torch.backends.quantized.engine). The float inputs, which are on the quantization grid
+        of the preceding activation quantizer, are quantized exactly to quint8, and the quint8 outputs, on the
+        grid of the following activation quantizer, are dequantized. Between two consecutive lowered layers the
+        quint8 tensor is passed as is.
+        """
+        def __init__(self,
+                     quantized_layer: torch.nn.Module,
+                     input_scale: float,
+                     input_zero_point: int,
+                     wrapper_name: str,
+                     holder_name: str):
+            """
+
+            Args:
+                quantized_layer: The torch.ao.nn.quantized layer.
+                input_scale: Scale of the quint8 inputs.
+                input_zero_point: Zero point of the quint8 inputs.
+                wrapper_name: Name of the lowered PytorchQuantizationWrapper in the original model.
+                holder_name: Name of the lowered PytorchActivationQuantizationHolder in the original model.
+            """
+            super(PytorchLoweredQuantizedLayer, self).__init__()
+            self.quantized_layer = quantized_layer
+            self.input_scale = input_scale
+            self.input_zero_point = input_zero_point
+            self.wrapper_name = wrapper_name
+            self.holder_name = holder_name
+            self.quantize_inputs = True
+            self.dequantize_outputs = True
+
+        @property
+        def output_qparams(self) -> Tuple[float, int]:
+            """
+            Returns: The scale and zero point of the quint8 outputs.
+            """
+            return self.quantized_layer.scale, self.quantized_layer.zero_point
+
+        def forward(self, inputs: torch.Tensor) -> torch.Tensor:
+            """
+            Run the integer kernel.
+
+            Args:
+                inputs: Float inputs on the input quantization grid, or quint8 inputs of a preceding lowered layer.
+
+            Returns: The float outputs (or the quint8 outputs, when passed to a following lowered layer).
+
+            """
+            if self.quantize_inputs:
+                inputs = torch.quantize_per_tensor(inputs, self.input_scale, self.input_zero_point, torch.quint8)
+            outputs = self.quantized_layer(inputs)
+            return outputs.dequantize() if self.dequantize_outputs else outputs
+
+
+    class _QuantizedModelTracer(torch.fx.Tracer):
+        """
+        FX tracer that keeps the quantization wrappers and holders as single modules in the graph.
+        """
+        def is_leaf_module(self, m: torch.nn.Module, module_qualified_name: str) -> bool:
+            return isinstance(m, (PytorchQuantizationWrapper, PytorchActivationQuantizationHolder)) or \
+                super().is_leaf_module(m, module_qualified_name)
+
+
+    def _activation_qparams(holder: torch.nn.Module) -> Optional[Tuple[float, int]]:
+        """
+        Get the quint8 quantization parameters of a holder's 8-bit activation quantizer grid, if it has one.
+        """
+        if not isinstance(holder, PytorchActivationQuantizationHolder) or \
+                getattr(holder, 'quantization_bypass', False):
+            return None
+        quantizer = holder.activation_holder_quantizer
+        if isinstance(quantizer, ActivationSymmetricInferableQuantizer):
+            scale, zero_point = quantizer.scales, quantizer.zero_points
+        elif isinstance(quantizer, ActivationUniformInferableQuantizer):
+            scale, zero_point = quantizer.scale, quantizer.zero_point
+        else:
+            return None
+        if quantizer.max_quantized_domain - quantizer.min_quantized_domain != 255:
+            return None
+        # The fake quant ops use single precision scales.
+        return float(np.float32(scale)), int(zero_point - quantizer.min_quantized_domain)
+
+
+    def _lower_layer(wrapper: PytorchQuantizationWrapper,
+                     with_relu: bool,
+                     output_qparams: Tuple[float, int]) -> Optional[torch.nn.Module]:
+        """
+        Create the torch.ao.nn.quantized layer of a wrapped Conv2d or Linear layer with symmetric
+        weights quantization of up to 8 bits, or None if it can't be lowered.
+        """
+        layer = wrapper.layer
+        if not isinstance(layer, (torch.nn.Conv2d, torch.nn.Linear)) or set(wrapper.weights_quantizers) != {'weight'}:
+            return None
+        quantizer = wrapper.weights_quantizers['weight']
+        if not isinstance(quantizer, WeightsSymmetricInferableQuantizer) or quantizer.num_bits > 8 or \
+                (quantizer.per_channel and quantizer.channel_axis != 0):
+            return None
+        if isinstance(layer, torch.nn.Conv2d) and (layer.padding_mode != 'zeros' or isinstance(layer.padding, str)):
+            return None
+
+        with torch.no_grad():
+            weight = wrapper.get_quantized_weights()['weight'].detach().float().cpu()
+            scales = quantizer.scales.detach().cpu().double().flatten()
+            if quantizer.per_channel:
+                quantized_weight = torch.quantize_per_channel(weight, scales, torch.zeros_like(scales, dtype=torch.long),
+                                                              axis=0, dtype=torch.qint8)
+            else:
+                quantized_weight = torch.quantize_per_tensor(weight, scales[0].item(), 0, torch.qint8)
+            bias = None if layer.bias is None else layer.bias.detach().float().cpu()
+
+        if isinstance(layer, torch.nn.Conv2d):
+            quantized_layer = (nniq.ConvReLU2d if with_relu else nnq.Conv2d)(
+                layer.in_channels, layer.out_channels, layer.kernel_size, stride=layer.stride, padding=layer.padding,
+                dilation=layer.dilation, groups=layer.groups, bias=bias is not None)
+        else:
+            quantized_layer = (nniq.LinearReLU if with_relu else nnq.Linear)(layer.in_features, layer.out_features,
+                                                                             bias is not None)
+        quantized_layer.set_weight_bias(quantized_weight, bias)
+        quantized_layer.scale, quantized_layer.zero_point = output_qparams
+        return quantized_layer
+
+
+    def _is_relu(node: torch.fx.Node, modules: Dict[str, torch.nn.Module]) -> bool:
+        return (node.op == 'call_module' and isinstance(modules[node.target], torch.nn.ReLU)) or \
+            (node.op == 'call_function' and node.target in _RELU_FUNCTIONS) or \
+            (node.op == 'call_method' and node.target == 'relu')
+
+
+    def _is_reshape(node: torch.fx.Node, modules: Dict[str, torch.nn.Module]) -> bool:
+        return (node.op == 'call_module' and isinstance(modules[node.target], torch.nn.Flatten)) or \
+            (node.op == 'call_function' and node.target in _RESHAPE_FUNCTIONS) or \
+            (node.op == 'call_method' and node.target in _RESHAPE_METHODS)
+
+
+    def _single_user(node: torch.fx.Node) -> Optional[torch.fx.Node]:
+        return next(iter(node.users)) if len(node.users) == 1 else None
+
+
+    def pytorch_lower_quantized_model(model: torch.nn.Module) -> torch.fx.GraphModule:
+        """
+        Lower a quantized model to integer kernels for CPU inference. Every PytorchQuantizationWrapper of a
+        Conv2d or Linear layer with 8-bit (or fewer) symmetric or power-of-two weights quantization, whose input
+        is quantized by an 8-bit activation quantizer (or is the output of another lowered layer), possibly through
+        reshapes, and which is
+        followed (optionally through a ReLU) by a PytorchActivationQuantizationHolder with an 8-bit symmetric,
+        power-of-two or uniform activation quantizer, is replaced with a PytorchLoweredQuantizedLayer: a quantized
+        Conv2d/Linear (or ConvReLU2d/LinearReLU) of the current torch quantized engine, which uses the quantizers'
+        thresholds and ranges. The layer is placed under the name of the holder it replaces. The rest of the model
+        keeps running in float with fake quantization.
+
+        The integer kernels compute the same grids as the fake quant path. The outputs may differ by a single
+        quantization step for values that fall on a rounding boundary, since the kernels requantize their integer
+        accumulators instead of rounding float outputs (see pytorch_lowered_model_parity).
+
+        The model must be traceable with torch.fx (the wrappers and holders are kept as leaf modules).
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+
+        Returns: The lowered model, a torch.fx.GraphModule for inference on CPU.
+
+        """
+        try:
+            graph = _QuantizedModelTracer().trace(model)
+        except Exception as e:
+            Logger.critical(f'Failed to trace the model with torch.fx for lowering: {e}')
+        lowered_model = torch.fx.GraphModule(model, graph)
+        modules = dict(lowered_model.named_modules())
+
+        for node in list(lowered_model.graph.nodes):
+            if node.op != 'call_module' or not isinstance(modules[node.target], PytorchQuantizationWrapper) or \
+                    len(node.args) != 1 or node.kwargs or not isinstance(node.args[0], torch.fx.Node):
+                continue
+            input_node = node.args[0]
+            # The quantization grid of the inputs is found through reshapes.
+            grid_node = input_node
+            while _is_reshape(grid_node, modules) and isinstance(grid_node.args[0], torch.fx.Node):
+                grid_node = grid_node.args[0]
+            if grid_node.op != 'call_module':
+                continue
+            input_module = modules[grid_node.target]
+            input_qparams = input_module.output_qparams if isinstance(input_module, PytorchLoweredQuantizedLayer) \
+                else _activation_qparams(input_module)
+            if input_qparams is None:
+                continue
+
+            relu_node, holder_node = None, _single_user(node)
+            if holder_node is not None and _is_relu(holder_node, modules):
+                relu_node, holder_node = holder_node, _single_user(holder_node)
+            if holder_node is None or holder_node.op != 'call_module':
+                continue
+            output_qparams = _activation_qparams(modules[holder_node.target])
+            if output_qparams is None:
+                continue
+            quantized_layer = _lower_layer(modules[node.target], relu_node is not None, output_qparams)
+            if quantized_layer is None:
+                continue
+
+            lowered_layer = PytorchLoweredQuantizedLayer(quantized_layer, *input_qparams,
+                                                         wrapper_name=node.target,
+                                                         holder_name=holder_node.target)
+            if grid_node is input_node and isinstance(input_module, PytorchLoweredQuantizedLayer) and \
+                    len(input_node.users) == 1:
+                # Pass the quint8 outputs of the preceding lowered layer as is.
+                input_module.dequantize_outputs = False
+                lowered_layer.quantize_inputs = False
+
+            # The lowered layer replaces the holder module, and takes the wrapper's input.
+            lowered_model.add_submodule(holder_node.target, lowered_layer)
+            modules[holder_node.target] = lowered_layer
+            holder_node.args = (input_node,)
+            for erased_node in [relu_node, node]:
+                if erased_node is not None:
+                    lowered_model.graph.erase_node(erased_node)
+
+        lowered_model.graph.lint()
+        lowered_model.delete_all_unused_submodules()
+        lowered_model.recompile()
+        return lowered_model.eval()
+
+
+    def pytorch_lowered_model_parity(model: torch.nn.Module,
+                                     lowered_model: torch.fx.GraphModule,
+                                     inputs: Any) -> Dict[str, Dict[str, float]]:
+        """
+        Compare each lowered layer of a model lowered with pytorch_lower_quantized_model to the fake quant
+        layers it replaced. The original model is run on the inputs, and each lowered layer is run on the inputs
+        of the wrapper it replaced, so the differences of preceding layers don't accumulate.
+
+        Args:
+            model: The original quantized model (on CPU).
+            lowered_model: The lowered model.
+            inputs: Inputs to the model (a tensor, or a tuple of tensors).
+
+        Returns: A dictionary from the name of each lowered layer to the maximal difference from the fake quant
+            outputs in quantization steps ('max_steps') and the fraction of different outputs ('mismatch').
+
+        """
+        lowered_layers = {name: m for name, m in lowered_model.named_modules()
+                          if isinstance(m, PytorchLoweredQuantizedLayer)}
+        original_modules = dict(model.named_modules())
+        captured, handles = {}, []
+        for name, lowered_layer in lowered_layers.items():
+            handles.append(original_modules[lowered_layer.wrapper_name].register_forward_hook(
+                lambda m, args, outputs, name=name: captured.setdefault(name, {}).update(inputs=args[0])))
+            handles.append(original_modules[lowered_layer.holder_name].register_forward_hook(
+                lambda m, args, outputs, name=name: captured.setdefault(name, {}).update(outputs=outputs)))
+        try:
+            with torch.no_grad():
+                model(*(inputs if isinstance(inputs, tuple) else (inputs,)))
+        finally:
+            for handle in handles:
+                handle.remove()
+
+        parity = {}
+        with torch.no_grad():
+            for name, lowered_layer in lowered_layers.items():
+                quantized_inputs = torch.quantize_per_tensor(captured[name]['inputs'], lowered_layer.input_scale,
+                                                             lowered_layer.input_zero_point, torch.quint8)
+                outputs = lowered_layer.quantized_layer(quantized_inputs).dequantize()
+                steps = torch.abs(outputs - captured[name]['outputs']) / lowered_layer.output_qparams[0]
+                parity[name] = {'max_steps': steps.max().item(),
+                                'mismatch': (steps > 0.5).float().mean().item()}
+        return parity
+
+else:
+    class PytorchLoweredQuantizedLayer:  # pragma: no cover
+        def __init__(self, *args, **kwargs):
+            Logger.critical('Installing Pytorch is mandatory '
+                            'when using PytorchLoweredQuantizedLayer. '
+                            'Could not find torch package.')  # pragma: no cover
+
+    def pytorch_lower_quantized_model(model):
+        """
+        Lower a quantized model to integer kernels for CPU inference.
+
+        Args:
+            model: A Pytorch model with PytorchQuantizationWrapper and PytorchActivationQuantizationHolder modules.
+
+        Returns: The lowered model.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_lower_quantized_model. '
+                        'Could not find torch package.')  # pragma: no cover
+
+    def pytorch_lowered_model_parity(model, lowered_model, inputs):
+        """
+        Compare each lowered layer of a lowered model to the fake quant layers it replaced.
+
+        Args:
+            model: The original quantized model.
+            lowered_model: The lowered model.
+            inputs: Inputs to the model.
+
+        Returns: A dictionary from the name of each lowered layer to its differences from the fake quant outputs.
+
+        """
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_lowered_model_parity. '
+                        'Could not find torch package.')  # pragma: no cover
@@ -0,0 +1,122 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+
+from mct_quantizers.common.constants import FOUND_ONNX, FOUND_ONNXRUNTIME, FOUND_ONNXRUNTIME_EXTENSIONS, \
+    ONNX_CUSTOM_OP_DOMAIN, ONNX_FOLDED_WEIGHTS_METADATA_PREFIX
+from mct_quantizers.logger import Logger
+
+# Names of the quantization parameters inputs (following the weights input) of the weights quantizers custom ops.
+WEIGHTS_QUANTIZERS_QPARAMS_INPUTS = {'WeightsSymmetricQuantizer': ['threshold'],
+                                     'WeightsPOTQuantizer': ['threshold'],
+                                     'WeightsUniformQuantizer': ['min_range', 'max_range'],
+                                     'WeightsLUTSymmetricQuantizer': ['lut_values', 'threshold'],
+                                     'WeightsLUTPOTQuantizer': ['lut_values', 'threshold']}
+
+if FOUND_ONNX and FOUND_ONNXRUNTIME and FOUND_ONNXRUNTIME_EXTENSIONS:
+    import onnx
+    import onnxruntime as ort
+    from onnx import numpy_helper, helper
+    from mct_quantizers.pytorch.onnxruntime_session_options import get_ort_session_options
+    from mct_quantizers.pytorch.onnxruntime_kernels_cache import ORT_KERNELS_CACHE
+
+    def _attribute_value(attribute: onnx.AttributeProto):
+        value = helper.get_attribute_value(attribute)
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def fold_onnx_weights_quantizers(model: onnx.ModelProto) -> onnx.ModelProto:
+        """
+        Fold the weights quantizers custom ops of an exported ONNX model into constants. Every weights quantizer
+        node whose inputs are all constants (initializers or Constant nodes) is evaluated once, with the same
+        onnxruntime kernels used for inference, and replaced by an initializer of its quantized weights, so the
+        weights are no longer re-quantized on every inference run. The constants that are no longer used are
+        removed, as well as the mct_quantizers opset import if no custom ops are left.
+
+        The op type, attributes and quantization parameters of every folded node are kept in the model
+        metadata_props, under the key '<ONNX_FOLDED_WEIGHTS_METADATA_PREFIX>/<quantized weights name>', as a JSON
+        string. The model is modified in place.
+
+        Args:
+            model (ModelProto): ONNX model exported with weights quantizers custom ops.
+
+        Returns:
+            The model with folded weights quantizers.
+
+        Example:
+            >>> folded_model = fold_onnx_weights_quantizers(onnx.load(onnx_file_path))
+        """
+        graph = model.graph
+        constants = {i.name: numpy_helper.to_array(i) for i in graph.initializer}
+        constants.update({n.output[0]: numpy_helper.to_array(n.attribute[0].t) for n in graph.node
+                          if n.op_type == 'Constant' and n.attribute[0].name == 'value'})
+        fold_nodes = [n for n in graph.node if n.domain == ONNX_CUSTOM_OP_DOMAIN and
+                      n.op_type in WEIGHTS_QUANTIZERS_QPARAMS_INPUTS and all(i in constants for i in n.input)]
+        if len(fold_nodes) == 0:
+            return model
+
+        # Evaluate all the folded nodes at once, in a graph of the nodes and their constant inputs.
+        fold_inputs = {i for n in fold_nodes for i in n.input}
+        fold_graph = helper.make_graph(
+            nodes=fold_nodes,
+            name='fold_weights_quantizers',
+            inputs=[],
+            outputs=[helper.make_tensor_value_info(n.output[0], onnx.TensorProto.FLOAT, None) for n in fold_nodes],
+            initializer=[numpy_helper.from_array(constants[name], name) for name in sorted(fold_inputs)])
+        fold_model = helper.make_model(fold_graph, opset_imports=model.opset_import, ir_version=model.ir_version)
+        sess = ort.InferenceSession(fold_model.SerializeToString(), get_ort_session_options(),
+                                    providers=['CPUExecutionProvider'])
+        folded_weights = sess.run([n.output[0] for n in fold_nodes], {})
+        # The folded nodes are not run again, so their outputs are not kept in the kernels cache.
+        ORT_KERNELS_CACHE.clear(fold_model)
+
+        for node, weights in zip(fold_nodes, folded_weights):
+            output_name = node.output[0]
+            qparams = {name: constants[input_name].tolist() for name, input_name in
+                       zip(WEIGHTS_QUANTIZERS_QPARAMS_INPUTS[node.op_type], node.input[1:])}
+            meta = model.metadata_props.add()
+            meta.key = f'{ONNX_FOLDED_WEIGHTS_METADATA_PREFIX}/{output_name}'
+            meta.value = json.dumps({'op_type': node.op_type,
+                                     'attributes': {a.name: _attribute_value(a) for a in node.attribute},
+                                     'qparams': qparams})
+            graph.node.remove(node)
+            graph.initializer.append(
+                numpy_helper.from_array(weights.astype(constants[node.input[0]].dtype), output_name))
+
+        # Remove the constants that only fed the folded nodes.
+        used_names = {i for n in graph.node for i in n.input} | {o.name for o in graph.output}
+        for initializer in [i for i in graph.initializer if i.name not in used_names]:
+            graph.initializer.remove(initializer)
+        for node in [n for n in graph.node if n.op_type == 'Constant' and n.output[0] not in used_names]:
+            graph.node.remove(node)
+
+        if not any(n.domain == ONNX_CUSTOM_OP_DOMAIN for n in graph.node):
+            for opset in [o for o in model.opset_import if o.domain == ONNX_CUSTOM_OP_DOMAIN]:
+                model.opset_import.remove(opset)
+        return model
+
+else:
+    def fold_onnx_weights_quantizers(model):
+        """
+        Fold the weights quantizers custom ops of an exported ONNX model into constants.
+
+        Args:
+            model (ModelProto): ONNX model exported with weights quantizers custom ops.
+
+        Returns:
+            The model with folded weights quantizers.
+        """
+        Logger.critical('Installing onnx, onnxruntime and onnxruntime-extensions is mandatory '
+                        'when using fold_onnx_weights_quantizers. '
+                        'Could not find a package.')  # pragma: no cover
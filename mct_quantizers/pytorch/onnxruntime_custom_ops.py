@@ -0,0 +1,81 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import threading
+from typing import Callable, Dict, List
+
+# The onnxruntime custom ops of the quantizers are registered with onnxruntime-extensions when the quantizers are
+# imported, so sessions created with the onnxruntime-extensions library (get_library_path) can run exported models.
+# register_ort_custom_ops registers the ops that are not registered yet.
+_ORT_CUSTOM_OPS = []
+_PENDING_ORT_CUSTOM_OPS = []
+_ORT_CUSTOM_OPS_LOCK = threading.Lock()
+
+
+class OrtCustomOpType:
+    """
+    Names of the onnxruntime-extensions PyCustomOpDef types of the custom ops inputs, outputs and attributes.
+    """
+    dt_float = 'dt_float'
+    dt_int64 = 'dt_int64'
+
+
+def _register_ort_custom_op(op_type: str, inputs: List[str], outputs: List[str], attrs: Dict[str, str],
+                            kernel: Callable):
+    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    onnx_op(op_type=op_type,
+            inputs=[getattr(PyCustomOpDef, t) for t in inputs],
+            outputs=[getattr(PyCustomOpDef, t) for t in outputs],
+            attrs={name: getattr(PyCustomOpDef, t) for name, t in attrs.items()})(kernel)
+
+
+def _register_pending_ort_custom_ops():
+    with _ORT_CUSTOM_OPS_LOCK:
+        while _PENDING_ORT_CUSTOM_OPS:
+            _register_ort_custom_op(*_PENDING_ORT_CUSTOM_OPS[0])
+            _PENDING_ORT_CUSTOM_OPS.pop(0)
+
+
+def ort_custom_op(op_type: str, inputs: List[str], outputs: List[str], attrs: Dict[str, str]) -> Callable:
+    """
+    Declare a kernel function of an onnxruntime custom op and register it with onnxruntime-extensions, like the
+    onnxruntime_extensions.onnx_op decorator.
+
+    Args:
+        op_type: The op type, including its domain.
+        inputs: The inputs types (OrtCustomOpType).
+        outputs: The outputs types (OrtCustomOpType).
+        attrs: A dictionary of the attributes names to their types (OrtCustomOpType).
+
+    Returns:
+        A decorator of the kernel function, that returns it as is.
+    """
+    def decorator(kernel: Callable) -> Callable:
+        op = (op_type, inputs, outputs, attrs, kernel)
+        with _ORT_CUSTOM_OPS_LOCK:
+            _ORT_CUSTOM_OPS.append(op)
+            _PENDING_ORT_CUSTOM_OPS.append(op)
+        _register_pending_ort_custom_ops()
+        return kernel
+    return decorator
+
+
+def register_ort_custom_ops():
+    """
+    Register the onnxruntime custom ops of all the quantizers with onnxruntime-extensions, if they are not registered
+    yet (they are registered when the quantizers are imported). get_ort_session_options calls it.
+    """
+    # Import the quantizers, which declare their custom ops.
+    import mct_quantizers.pytorch.quantizers  # noqa: F401
+    _register_pending_ort_custom_ops()
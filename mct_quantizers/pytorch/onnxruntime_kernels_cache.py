@@ -0,0 +1,185 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple, List
+
+import numpy as np
+
+from mct_quantizers.common.constants import FOUND_ONNX, ONNX_CUSTOM_OP_DOMAIN
+
+if FOUND_ONNX:
+    import onnx
+    from onnx import numpy_helper
+
+# Default number of cached outputs of the onnxruntime weights quantizers kernels.
+ORT_KERNELS_CACHE_MAXSIZE = 256
+
+# Number of evenly spaced elements of an input that are hashed in its fingerprint.
+_FINGERPRINT_SAMPLES = 64
+
+
+class OrtKernelsCache:
+    def __init__(self, maxsize: int = ORT_KERNELS_CACHE_MAXSIZE):
+        """
+        An LRU cache of the outputs of the onnxruntime custom ops kernels of the weights quantizers, whose inputs
+        (the weights and the quantization parameters) are constant across inference runs.
+
+        An output is looked up by a cheap fingerprint of the kernel inputs (their shape, dtype and a hash of a few
+        sampled elements) and the op attributes, and a fingerprint match is confirmed by comparing the inputs to a
+        copy of the inputs of the cached output. The data pointer of the inputs is not part of the fingerprint:
+        onnxruntime-extensions passes the kernels a new copy of their inputs on every run, in buffers that are
+        shared by the nodes and are not stable across runs.
+
+        The cache holds at most maxsize outputs (and the copies of their inputs). A maxsize of 0 disables the cache.
+        The cache is safe to use from several threads (e.g. from concurrent inference sessions).
+
+        Args:
+            maxsize: Maximal number of cached outputs.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def clear(self, model: 'onnx.ModelProto' = None):
+        """
+        Drop the cached outputs, or only the outputs of the weights quantizers nodes of an ONNX model (e.g. when
+        its inference sessions are released). The hit & miss counters are kept.
+
+        Args:
+            model: An ONNX model with weights quantizers custom ops. If None, all the outputs are dropped.
+        """
+        if model is None:
+            with self._lock:
+                self._entries.clear()
+            return
+
+        nodes_inputs = _onnx_constant_nodes_inputs(model)
+        with self._lock:
+            for key in [key for key, (inputs, _) in self._entries.items()
+                        if any(self._equal_inputs(inputs, node_inputs) for node_inputs in nodes_inputs)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _fingerprint(array: np.ndarray) -> tuple:
+        flat = array.reshape(-1)
+        samples = flat[::max(flat.size // _FINGERPRINT_SAMPLES, 1)]
+        return array.shape, array.dtype.str, hash(samples.tobytes())
+
+    @staticmethod
+    def _bits(array: np.ndarray) -> np.ndarray:
+        # A view of the array elements as unsigned integers of the same size, to compare them bitwise (so NaN
+        # elements match too) without comparing every byte.
+        itemsize = array.dtype.itemsize
+        return array.reshape(-1).view(f'u{itemsize}' if itemsize in (1, 2, 4, 8) else np.uint8)
+
+    @classmethod
+    def _equal_inputs(cls, inputs: Tuple[np.ndarray, ...], other_inputs: Tuple[np.ndarray, ...]) -> bool:
+        return len(inputs) == len(other_inputs) and all(
+            x.shape == y.shape and x.dtype == y.dtype and np.array_equal(cls._bits(x), cls._bits(y))
+            for x, y in zip(inputs, other_inputs))
+
+    def get_or_compute(self, kernel: Callable, inputs: Tuple[np.ndarray, ...], attrs: dict) -> np.ndarray:
+        """
+        Get the cached output of a kernel for the inputs and attributes, or compute it and cache it, evicting the
+        least recently used output when the cache is full.
+
+        Args:
+            kernel: The kernel function.
+            inputs: The kernel input arrays.
+            attrs: The kernel attributes (op attributes).
+
+        Returns:
+            The kernel output.
+        """
+        if self.maxsize <= 0:
+            with self._lock:
+                self.misses += 1
+            return kernel(*inputs, **attrs)
+
+        inputs = tuple(np.ascontiguousarray(x) for x in inputs)
+        key = (kernel, tuple(self._fingerprint(x) for x in inputs), tuple(sorted(attrs.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._equal_inputs(inputs, entry[0]):
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            return entry[1]
+
+        outputs = kernel(*inputs, **attrs)
+        # The outputs are shared by the following runs, so they are made read-only.
+        outputs = np.asarray(outputs)
+        outputs.flags.writeable = False
+        # The inputs buffers are reused by onnxruntime-extensions, so a copy is kept to confirm the matches.
+        entry = (tuple(x.copy() for x in inputs), outputs)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return outputs
+
+
+def _onnx_constant_nodes_inputs(model: 'onnx.ModelProto') -> List[Tuple[np.ndarray, ...]]:
+    """
+    The constant inputs (initializers or Constant nodes) of the custom ops nodes of an ONNX model whose inputs are
+    all constants, as the kernels of the nodes get them.
+    """
+    constants = {i.name: numpy_helper.to_array(i) for i in model.graph.initializer}
+    constants.update({n.output[0]: numpy_helper.to_array(n.attribute[0].t) for n in model.graph.node
+                      if n.op_type == 'Constant' and n.attribute[0].name == 'value'})
+    return [tuple(np.ascontiguousarray(constants[i]) for i in n.input) for n in model.graph.node
+            if n.domain == ONNX_CUSTOM_OP_DOMAIN and all(i in constants for i in n.input)]
+
+
+# The cache of all the memoized onnxruntime kernels.
+ORT_KERNELS_CACHE = OrtKernelsCache()
+
+
+def clear_ort_kernels_cache(model: 'onnx.ModelProto' = None):
+    """
+    Drop the outputs of the onnxruntime weights quantizers kernels that are cached for constant inputs, or only
+    the outputs of the weights quantizers nodes of an ONNX model.
+
+    Args:
+        model: An ONNX model with weights quantizers custom ops. If None, all the cached outputs are dropped.
+    """
+    ORT_KERNELS_CACHE.clear(model)
+
+
+def memoize_ort_kernel(kernel: Callable) -> Callable:
+    """
+    Memoize an onnxruntime custom op kernel of a weights quantizer in ORT_KERNELS_CACHE, so its output is computed
+    once for constant inputs instead of on every inference run.
+
+    Args:
+        kernel: A kernel function of numpy input arrays and op attributes (key-word arguments).
+
+    Returns:
+        The memoized kernel.
+    """
+    @functools.wraps(kernel)
+    def memoized_kernel(*inputs, **attrs):
+        return ORT_KERNELS_CACHE.get_or_compute(kernel, inputs, attrs)
+    return memoized_kernel
@@ -12,25 +12,158 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Sequence
 
 from mct_quantizers.common.constants import FOUND_ONNXRUNTIME, FOUND_ONNXRUNTIME_EXTENSIONS
 
 if FOUND_ONNXRUNTIME and FOUND_ONNXRUNTIME_EXTENSIONS:
     import onnxruntime as ort
     from onnxruntime_extensions import get_library_path
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import register_ort_custom_ops
 
-    def get_ort_session_options() -> ort.SessionOptions:
+    def get_ort_session_options(intra_op_num_threads: int = None,
+                                inter_op_num_threads: int = None,
+                                execution_mode: 'ort.ExecutionMode' = None,
+                                graph_optimization_level: 'ort.GraphOptimizationLevel' = None,
+                                optimized_model_filepath: str = None) -> ort.SessionOptions:
         """
+        Session options for loading an onnxruntime inference session with the custom implementation of the
+        onnx ops. Options that are not given keep the onnxruntime defaults. The custom ops of the quantizers are
+        registered with onnxruntime-extensions on the first call.
+
+        Args:
+            intra_op_num_threads: Number of threads used to parallelize the execution within nodes.
+            inter_op_num_threads: Number of threads used to parallelize the execution of the graph (across nodes).
+            execution_mode: Sequential or parallel execution of the graph nodes.
+            graph_optimization_level: Graph optimization level.
+            optimized_model_filepath: File path to serialize the optimized model to.
+
         Returns: Session options for loading onnxruntime inference session
          with custom implementation of onnx ops.
         """
+        register_ort_custom_ops()
         opt = ort.SessionOptions()
         opt.register_custom_ops_library(get_library_path())
+        if intra_op_num_threads is not None:
+            opt.intra_op_num_threads = intra_op_num_threads
+        if inter_op_num_threads is not None:
+            opt.inter_op_num_threads = inter_op_num_threads
+        if execution_mode is not None:
+            opt.execution_mode = execution_mode
+        if graph_optimization_level is not None:
+            opt.graph_optimization_level = graph_optimization_level
+        if optimized_model_filepath is not None:
+            opt.optimized_model_filepath = optimized_model_filepath
         return opt
 
+    # Inference sessions created by get_ort_session, by model file and session configuration.
+    _SESSIONS_POOL = {}
+    _SESSIONS_POOL_LOCK = threading.Lock()
+    _SESSIONS_CREATION_LOCKS = {}
+
+    def _file_digest(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(2 ** 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _create_ort_session(model_path: str,
+                            providers: Sequence[str],
+                            optimized_model_dir: str,
+                            options_kwargs: dict) -> ort.InferenceSession:
+        if optimized_model_dir is None:
+            return ort.InferenceSession(model_path, get_ort_session_options(**options_kwargs), providers=providers)
+
+        # The optimized model is cached by the model contents and the session configuration.
+        config = repr((_file_digest(model_path), list(providers), sorted(options_kwargs.items())))
+        stem = os.path.splitext(os.path.basename(model_path))[0]
+        optimized_path = os.path.join(optimized_model_dir,
+                                      f'{stem}.{hashlib.sha256(config.encode()).hexdigest()[:16]}.onnx')
+        if os.path.exists(optimized_path):
+            options = get_ort_session_options(**{**options_kwargs,
+                                                 'graph_optimization_level': ort.GraphOptimizationLevel.ORT_DISABLE_ALL})
+            return ort.InferenceSession(optimized_path, options, providers=providers)
+
+        os.makedirs(optimized_model_dir, exist_ok=True)
+        # Written to a temporary file and renamed, so concurrent processes never load a partially written model.
+        fd, tmp_path = tempfile.mkstemp('.onnx', dir=optimized_model_dir)
+        os.close(fd)
+        try:
+            sess = ort.InferenceSession(model_path,
+                                        get_ort_session_options(**options_kwargs, optimized_model_filepath=tmp_path),
+                                        providers=providers)
+            os.replace(tmp_path, optimized_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return sess
+
+    def get_ort_session(model_path: str,
+                        providers: Sequence[str] = ('CPUExecutionProvider',),
+                        optimized_model_dir: str = None,
+                        **options_kwargs) -> ort.InferenceSession:
+        """
+        Get an onnxruntime inference session of a model with the custom implementation of the onnx ops, from a pool
+        of sessions. A session is created once per model file (path, modification time and size), providers and
+        session options, and then reused: onnxruntime sessions can run from several threads at once.
+
+        If optimized_model_dir is given, the optimized model (after the onnxruntime graph optimizations) is saved
+        there on the first session creation, and sessions created later (e.g. in new worker processes) load it
+        instead of optimizing the model again. The optimized model is keyed by the contents of the model file and
+        the session configuration. Note that models optimized with ORT_ENABLE_ALL (the default level) may only be
+        valid for the hardware they were optimized on.
+
+        Args:
+            model_path: Path of the ONNX model file.
+            providers: onnxruntime execution providers.
+            optimized_model_dir: Directory to cache the optimized models in.
+            **options_kwargs: Key-word arguments of get_ort_session_options (e.g. intra_op_num_threads).
+
+        Returns: An onnxruntime inference session.
+        """
+        model_path = os.path.abspath(model_path)
+        stat = os.stat(model_path)
+        key = (model_path, stat.st_mtime_ns, stat.st_size, tuple(providers), optimized_model_dir,
+               tuple(sorted((k, str(v)) for k, v in options_kwargs.items())))
+        sess = _SESSIONS_POOL.get(key)
+        if sess is not None:
+            return sess
+        with _SESSIONS_POOL_LOCK:
+            creation_lock = _SESSIONS_CREATION_LOCKS.setdefault(key, threading.Lock())
+        # Sessions of different models are created concurrently, and of the same model once.
+        with creation_lock:
+            sess = _SESSIONS_POOL.get(key)
+            if sess is None:
+                sess = _create_ort_session(model_path, providers, optimized_model_dir, options_kwargs)
+                with _SESSIONS_POOL_LOCK:
+                    _SESSIONS_POOL[key] = sess
+        return sess
+
+    def clear_ort_sessions_pool():
+        """
+        Release the inference sessions in the pool of get_ort_session.
+        """
+        with _SESSIONS_POOL_LOCK:
+            _SESSIONS_POOL.clear()
+            _SESSIONS_CREATION_LOCKS.clear()
+
 else:
-    def get_ort_session_options():
+    def get_ort_session_options(*args, **kwargs):
         raise Exception('Installing onnxruntime onnxruntime-extensions and is mandatory '
                         'when using get_ort_session_options. '
                         'Could not find a package.')
 
+    def get_ort_session(*args, **kwargs):
+        raise Exception('Installing onnxruntime onnxruntime-extensions and is mandatory '
+                        'when using get_ort_session. '
+                        'Could not find a package.')
+
+    def clear_ort_sessions_pool():
+        raise Exception('Installing onnxruntime onnxruntime-extensions and is mandatory '
+                        'when using clear_ort_sessions_pool. '
+                        'Could not find a package.')
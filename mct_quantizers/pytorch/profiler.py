@@ -0,0 +1,135 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any
+
+from mct_quantizers.common.constants import FOUND_TORCH
+from mct_quantizers.common.quantization_profiler import BaseQuantizationProfiler, WEIGHTS_QUANTIZATION, LAYER_OP, \
+    ACTIVATION_QUANTIZATION, reset_process_peak_memory, process_peak_memory
+from mct_quantizers.logger import Logger
+
+if FOUND_TORCH:
+    import torch
+    from mct_quantizers.pytorch.activation_quantization_holder import PytorchActivationQuantizationHolder
+    from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+
+    def _layer_type(layer: Any) -> str:
+        return type(layer).__name__ if isinstance(layer, torch.nn.Module) else getattr(layer, '__name__',
+                                                                                       type(layer).__name__)
+
+    class _ProfiledOp:
+        def __init__(self, profiler: 'PytorchQuantizationProfiler', name: str, op: Any):
+            """
+            A functional (non module) layer of a PytorchQuantizationWrapper, with its call profiled.
+            """
+            self.profiler = profiler
+            self.name = name
+            self.op = op
+            self.op_type = _layer_type(op)
+
+        def __call__(self, *args, **kwargs):
+            self.profiler._begin_stage(self.name, self.op_type, LAYER_OP)
+            outputs = self.op(*args, **kwargs)
+            self.profiler._end_stage(self.name)
+            return outputs
+
+    class PytorchQuantizationProfiler(BaseQuantizationProfiler):
+        def __init__(self, model: torch.nn.Module, track_memory: bool = False):
+            """
+            Quantization overhead profiler of a Pytorch model. It records per layer the time and the peak transient
+            memory of the weights quantization and of the wrapped layer operation of every
+            PytorchQuantizationWrapper, and of the activation quantization of every activation quantization holder
+            (including the FLN and preserving holders). Each stage is labeled with torch.profiler.record_function
+            as '<module name>/<stage>', so it also shows in torch.profiler traces.
+
+            The model is instrumented with module hooks only while the profiler is enabled:
+
+            with PytorchQuantizationProfiler(model) as profiler:
+                model(inputs)
+            print(profiler.report(sort_by='quantization_ms'))
+
+            The peak transient memory is measured on the device of the model parameters: the CUDA allocator peak
+            on GPUs, and the process peak resident memory on CPU (Linux only). On CPU it only accounts for
+            memory the allocator requests from the system, so buffers reused from freed memory are not counted
+            (setting the MALLOC_MMAP_THRESHOLD_ environment variable to a small size, e.g. 65536, makes large
+            buffers always requested from the system).
+
+            Args:
+                model: The quantized model to profile.
+                track_memory: Whether to record the peak transient memory of each stage. It resets the process-wide
+                    peak memory counters on every stage (see BaseQuantizationProfiler).
+            """
+            super().__init__(model, track_memory)
+            self._handles = []
+            self._profiled_ops = []
+            self._device = torch.device('cpu')
+
+        def _instrument(self):
+            tensor = next(iter(self.model.parameters()), next(iter(self.model.buffers()), None))
+            self._device = torch.device('cpu') if tensor is None else tensor.device
+
+            for name, module in self.model.named_modules():
+                if isinstance(module, PytorchQuantizationWrapper):
+                    layer_type = _layer_type(module.layer)
+                    self._handles.append(module.register_forward_pre_hook(
+                        lambda m, args, n=name, t=layer_type: self._begin_stage(n, t, WEIGHTS_QUANTIZATION)))
+                    # The weights quantization stage ends when the layer operation starts.
+                    if isinstance(module.layer, torch.nn.Module):
+                        self._handles.append(module.layer.register_forward_pre_hook(
+                            lambda m, args, n=name, t=layer_type: self._begin_stage(n, t, LAYER_OP)))
+                        self._handles.append(module.layer.register_forward_hook(
+                            lambda m, args, outputs, n=name: self._end_stage(n)))
+                    else:
+                        self._profiled_ops.append((module, module.layer))
+                        module.layer = _ProfiledOp(self, name, module.layer)
+                    self._handles.append(module.register_forward_hook(
+                        lambda m, args, outputs, n=name: self._end_stage(n)))
+                elif isinstance(module, PytorchActivationQuantizationHolder):
+                    self._handles.append(module.register_forward_pre_hook(
+                        lambda m, args, n=name, t=type(module).__name__: self._begin_stage(n, t,
+                                                                                           ACTIVATION_QUANTIZATION)))
+                    self._handles.append(module.register_forward_hook(
+                        lambda m, args, outputs, n=name: self._end_stage(n)))
+
+        def _remove_instrumentation(self):
+            for handle in self._handles:
+                handle.remove()
+            for module, op in self._profiled_ops:
+                module.layer = op
+            self._handles, self._profiled_ops = [], []
+
+        def _enter_trace_label(self, label: str) -> Any:
+            return torch.profiler.record_function(label)
+
+        def _synchronize(self):
+            if self._device.type == 'cuda':
+                torch.cuda.synchronize(self._device)
+
+        def _reset_peak_memory(self) -> Any:
+            if self._device.type == 'cuda':
+                torch.cuda.reset_peak_memory_stats(self._device)
+                return torch.cuda.memory_allocated(self._device)
+            return reset_process_peak_memory()
+
+        def _peak_memory(self, baseline: Any) -> Any:
+            if self._device.type == 'cuda':
+                return torch.cuda.max_memory_allocated(self._device) - baseline
+            return process_peak_memory(baseline)
+
+else:
+    class PytorchQuantizationProfiler:  # pragma: no cover
+        def __init__(self, *args, **kwargs):
+            Logger.critical('Installing Pytorch is mandatory '
+                            'when using PytorchQuantizationProfiler. '
+                            'Could not find torch package.')
@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import copy
 from typing import List, Union, Any, Dict, Tuple, Callable
 
 import inspect
 
 from mct_quantizers.common.base_inferable_quantizer import BaseInferableQuantizer
 from mct_quantizers.common.constants import FOUND_TORCH, LAYER, TRAINING, POSITIONAL_WEIGHT, \
-    QUANTIZED_POSITIONAL_WEIGHT
+    QUANTIZED_POSITIONAL_WEIGHT, WEIGHTS_QUANTIZERS
 from mct_quantizers.logger import Logger
 
 if FOUND_TORCH:
@@ -115,6 +116,8 @@ if FOUND_TORCH:
                     Logger.error('Mismatch between "weights_quantizers" and "weight_values" keys')
                 self.is_str_attr = False
 
+            self.is_frozen = False
+            self._int_weights_info = {}
             self._set_weights_vars(True)
 
         @property
@@ -139,6 +142,8 @@ if FOUND_TORCH:
             Convert the wrapper quantizers with inferable quantizers.
 
             """
+            if self.is_frozen:
+                Logger.critical('Cannot convert the quantizers of a frozen PytorchQuantizationWrapper.')
             # Weight quantizers
             if self.is_weights_quantization:
                 inferable_weight_quantizers = {}
@@ -157,6 +162,7 @@ if FOUND_TORCH:
 
             """
             self._weights_vars = []
+            self._register_weights_quantizers()
 
             # Init weights quantizers
             for name, quantizer in self.weights_quantizers.items():
@@ -181,6 +187,167 @@ if FOUND_TORCH:
                 quantizer.initialize_quantization(weight.shape, name, self)
                 self._weights_vars.append((name, weight_var, quantizer))
 
+            self._build_forward_plan()
+
+        def _register_weights_quantizers(self):
+            """
+            Register the weights quantizers that are modules as submodules of the wrapper (replacing previously
+            registered quantizers), so their quantization parameters follow the wrapper device.
+
+            """
+            for module_name in [n for n in self._modules if n.startswith(f'{WEIGHTS_QUANTIZERS}_')]:
+                del self._modules[module_name]
+            for name, quantizer in self.weights_quantizers.items():
+                if isinstance(quantizer, nn.Module):
+                    self.add_module(f'{WEIGHTS_QUANTIZERS}_{name}', quantizer)
+
+        def _build_forward_plan(self):
+            """
+            Precompute everything the forward pass needs that does not depend on the call inputs:
+            which weights quantizers expect the training flag, the attribute each quantized weight
+            is written to and the (sorted) positions in which positional weights are inserted into
+            the layer inputs. Must be called whenever the weights quantizers change.
+
+            """
+            self._weights_quantization_plan = []
+            self._frozen_weights_plan = []
+            self._int_weights_plan = []
+            positional_weights_attrs = {}
+            for name, weight_var, quantizer in self._weights_vars:
+                weight_attr = name if self.is_str_attr else f'{POSITIONAL_WEIGHT}_{name}'
+                quantized_attr = name if self.is_str_attr else f'{QUANTIZED_POSITIONAL_WEIGHT}_{name}'
+                if self.is_frozen and weight_var is not None:
+                    # Frozen weights are already quantized: only point the layer attributes to the (possibly moved)
+                    # buffers, and insert the positional weights buffers as is.
+                    if self.is_str_attr:
+                        self._frozen_weights_plan.append(name)
+                    quantized_attr = weight_attr
+                elif self.is_frozen:
+                    # Integer weights are decoded on each call.
+                    encoded_keys, shape = self._int_weights_info[name]
+                    self._int_weights_plan.append((quantized_attr, quantizer, shape,
+                                                   [(k, f'{weight_attr}_{k}') for k in encoded_keys]))
+                else:
+                    with_training = TRAINING in inspect.signature(quantizer.__call__).parameters.keys()
+                    self._weights_quantization_plan.append((quantized_attr, weight_var, quantizer, with_training))
+                positional_weights_attrs[name] = quantized_attr
+
+            self._positional_weights_plan = [] if self.is_str_attr else \
+                [(pos, positional_weights_attrs[pos]) for pos in sorted(positional_weights_attrs)]
+
+        def __setstate__(self, state: Dict[str, Any]):
+            """
+            Restore a pickled wrapper, rebuilding the forward plan for wrappers saved before it existed.
+
+            Args:
+                state: The pickled state of the wrapper.
+
+            """
+            super().__setstate__(state)
+            if 'is_frozen' not in state:
+                self.is_frozen = False
+            if '_int_weights_info' not in state:
+                self._int_weights_info = {}
+            if '_int_weights_plan' not in state:
+                self._build_forward_plan()
+            if not any([n.startswith(f'{WEIGHTS_QUANTIZERS}_') for n in self._modules]):
+                self._register_weights_quantizers()
+
+        def freeze(self, int_weights: bool = False, cache_dequantized_weights: bool = False):
+            """
+            Quantize the weights once and replace the float weights with their quantized values, stored as buffers
+            under the same names. The forward pass of a frozen wrapper does not run the weights quantizers, and the
+            float weights memory is released. Freezing is irreversible, and a frozen wrapper is meant for inference.
+
+            With int_weights, the weights are stored as integer codes (packed for 4 bits or less) with their scales
+            and zero points, or as indices into the lut values with the lut values and thresholds for LUT quantizers.
+            They are kept in buffers named "<weight name>_<key>" (e.g. weight_codes, weight_scales). This requires
+            weights quantizers that implement encode_int_weights & decode_int_weights.
+
+            Args:
+                int_weights: Whether to store the quantized weights as integer codes.
+                cache_dequantized_weights: When storing integer weights, whether to keep the dequantized weights
+                    (in non-persistent buffers) instead of decoding them on each call.
+
+            """
+            if self.is_frozen:
+                return
+
+            with torch.no_grad():
+                frozen_weights_vars = []
+                for (name, weight_var, quantizer), plan in zip(self._weights_vars, self._weights_quantization_plan):
+                    weight_attr = name if self.is_str_attr else f'{POSITIONAL_WEIGHT}_{name}'
+                    if weight_var.is_meta:
+                        # A wrapper constructed on the meta device is frozen to meta placeholders, which are
+                        # materialized from a frozen checkpoint. The quantizer tensors are not on the meta device,
+                        # so the placeholders are computed by a meta copy of the quantizer.
+                        freeze_quantizer = copy.deepcopy(quantizer).to('meta')
+                    else:
+                        freeze_quantizer = quantizer
+                    if int_weights:
+                        if not hasattr(quantizer, 'encode_int_weights'):
+                            Logger.critical(f'{type(quantizer).__name__} does not support integer weights storage.')
+                        encoded_weights = freeze_quantizer.encode_int_weights(weight_var)
+                        shape = tuple(weight_var.shape)
+                        self._int_weights_info[name] = (tuple(encoded_weights.keys()), shape)
+                        quantized_weight = freeze_quantizer.decode_int_weights(encoded_weights, shape)
+                        delattr(self, weight_attr)
+                        for key, encoded_tensor in encoded_weights.items():
+                            self.register_buffer(f'{weight_attr}_{key}', encoded_tensor.detach())
+                        if cache_dequantized_weights:
+                            self.register_buffer(weight_attr, quantized_weight, persistent=False)
+                    else:
+                        quantized_weight = (freeze_quantizer(weight_var, False) if plan[3]
+                                            else freeze_quantizer(weight_var))
+                        delattr(self, weight_attr)
+                        self.register_buffer(weight_attr, quantized_weight.detach().clone())
+
+                    frozen_weight = getattr(self, weight_attr, None)
+                    frozen_weights_vars.append((name, frozen_weight, quantizer))
+                    if self.is_str_attr:
+                        setattr(self.layer, name, quantized_weight if frozen_weight is None else frozen_weight)
+                    else:
+                        self.weight_values[name] = quantized_weight if frozen_weight is None else frozen_weight
+                        setattr(self, f'{QUANTIZED_POSITIONAL_WEIGHT}_{name}', self.weight_values[name])
+
+            self._weights_vars = frozen_weights_vars
+            self.is_frozen = True
+            self._build_forward_plan()
+
+        def _decode_int_weights(self, name: Union[str, int], quantizer: BaseInferableQuantizer) -> torch.Tensor:
+            """
+            Decode integer weights from their buffers.
+
+            Args:
+                name: The weight's name or position.
+                quantizer: The weight's quantizer.
+
+            Returns: The dequantized weights.
+
+            """
+            weight_attr = name if self.is_str_attr else f'{POSITIONAL_WEIGHT}_{name}'
+            encoded_keys, shape = self._int_weights_info[name]
+            return quantizer.decode_int_weights({k: getattr(self, f'{weight_attr}_{k}') for k in encoded_keys}, shape)
+
+        def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+            super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+            # Loading with assign=True (e.g. to materialize a wrapper constructed on the meta device) replaces the
+            # weights tensors, so the weights variables are pointed to the loaded tensors.
+            weights_vars = []
+            for name, weight_var, quantizer in self._weights_vars:
+                weight_attr = name if self.is_str_attr else f'{POSITIONAL_WEIGHT}_{name}'
+                if weight_var is not None and name in self._int_weights_info:
+                    # Dequantized weights caches are not saved in the state_dict, so they are decoded from the
+                    # loaded codes.
+                    with torch.no_grad():
+                        self.register_buffer(weight_attr, self._decode_int_weights(name, quantizer), persistent=False)
+                weight_var = None if weight_var is None else getattr(self, weight_attr)
+                if self.is_str_attr and weight_var is not None:
+                    setattr(self.layer, name, weight_var if self.is_frozen else weight_var.detach())
+                weights_vars.append((name, weight_var, quantizer))
+            self._weights_vars = weights_vars
+            self._build_forward_plan()
+
         def set_quantize_weights(self, quantized_weights: dict):
             """
             This function updates layer weights after quantization.
@@ -225,28 +392,28 @@ if FOUND_TORCH:
             # ----------------------------------
             # Quantize all weights, and replace them in the underlying layer.
             # ----------------------------------
-            if self.is_weights_quantization:
-
-                quantized_weights = {}
-                for name, unquantized_weight, quantizer in self._weights_vars:
-                    s = inspect.signature(quantizer.__call__)
-                    if TRAINING in s.parameters.keys():
-                        quantized_weight = quantizer(unquantized_weight, self.training)
-                    else:
-                        quantized_weight = quantizer(unquantized_weight)
+            for name in self._frozen_weights_plan:
+                setattr(self.layer, name, getattr(self, name))
 
-                    quantized_weights.update({name: quantized_weight})
+            weights_holder = self.layer if self.is_str_attr else self
+            for quantized_attr, quantizer, shape, encoded_attrs in self._int_weights_plan:
+                setattr(weights_holder, quantized_attr,
+                        quantizer.decode_int_weights({k: getattr(self, a) for k, a in encoded_attrs}, shape))
 
-                self.set_quantize_weights(quantized_weights)
+            for quantized_attr, unquantized_weight, quantizer, with_training in self._weights_quantization_plan:
+                if with_training:
+                    quantized_weight = quantizer(unquantized_weight, self.training)
+                else:
+                    quantized_weight = quantizer(unquantized_weight)
+                setattr(weights_holder, quantized_attr, quantized_weight)
 
-            if not self.is_str_attr:
+            if self._positional_weights_plan:
                 # Positional weights need to be inserted in the wrapper input list according to their (key) position.
                 args = list(args)
-                weight_positions = [w[0] for w in self._weights_vars]
-                for pos in sorted(weight_positions):
-                    args.insert(pos, getattr(self, f'{QUANTIZED_POSITIONAL_WEIGHT}_{pos}'))
+                for pos, quantized_attr in self._positional_weights_plan:
+                    args.insert(pos, getattr(self, quantized_attr))
 
-            _kwargs = {**self.op_call_kwargs, **kwargs}
+            _kwargs = {**self.op_call_kwargs, **kwargs} if kwargs else self.op_call_kwargs
             # ----------------------------------
             # Layer operation
             # ----------------------------------
@@ -266,7 +433,10 @@ if FOUND_TORCH:
             quantized_weights = {}
             weights_var = self.get_weights_vars()
             for name, w, quantizer in weights_var:
-                quantized_weights[name] = quantizer(w)
+                if not self.is_frozen:
+                    quantized_weights[name] = quantizer(w)
+                else:
+                    quantized_weights[name] = self._decode_int_weights(name, quantizer) if w is None else w
             return quantized_weights
 
 else:
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Tuple
+from typing import Tuple, Dict, Sequence, Union
+
+import math
 
 import torch
 import numpy as np
 
+from mct_quantizers.common.constants import INT_WEIGHTS_CODES, INT_WEIGHTS_SCALES, INT_WEIGHTS_ZERO_POINTS
 from mct_quantizers.logger import Logger
 
 
@@ -85,13 +88,142 @@ def fix_range_to_include_zero(range_min: torch.Tensor,
     max_range_adj = max_range_adj * mid_range + min_positive * range_max
 
     grid_range = (range_max - range_min)
-    if not torch.all(torch.isclose((min_range_adj - range_min)/grid_range, torch.tensor(0.), atol=1e-6)) or not torch.all(torch.isclose((min_range_adj - range_min)/grid_range, torch.tensor(0.), atol=1e-6)):
+    if not torch.all(torch.isclose((min_range_adj - range_min)/grid_range, torch.tensor(0., device=grid_range.device), atol=1e-6)) or not torch.all(torch.isclose((min_range_adj - range_min)/grid_range, torch.tensor(0., device=grid_range.device), atol=1e-6)):
         Logger.warning(
                 f"Adjusting (min_range, max_range) from ({range_min},{range_max}) to ({min_range_adj},{max_range_adj})")  # pragma: no cover
 
     return min_range_adj, max_range_adj
 
 
+def fake_quantize(inputs: torch.Tensor,
+                  scale: Union[float, torch.Tensor],
+                  zero_point: Union[int, torch.Tensor],
+                  quant_min: int,
+                  quant_max: int,
+                  axis: int = None) -> torch.Tensor:
+    """
+    Fake-quantize a tensor like torch.fake_quantize_per_tensor_affine, or like
+    torch.fake_quantize_per_channel_affine when an axis is given, using pointwise ops only.
+    torch.compile fuses these ops into the neighbouring kernels, where the aten fake-quant ops
+    run as separate fallback kernels.
+
+    Args:
+        inputs: Tensor to quantize.
+        scale: Quantization scale (a tensor of per-channel scales when an axis is given).
+        zero_point: Quantization zero point (a tensor of per-channel zero points when an axis is given).
+        quant_min: Minimal value of the quantization domain.
+        quant_max: Maximal value of the quantization domain.
+        axis: Channel axis for per-channel quantization.
+
+    Returns:
+        Fake-quantized tensor.
+    """
+    if isinstance(scale, torch.Tensor):
+        if axis is not None:
+            target_shape = [1] * inputs.dim()
+            target_shape[axis] = -1
+            scale = scale.reshape(target_shape)
+            zero_point = zero_point.reshape(target_shape)
+        inv_scale = 1.0 / scale
+    else:
+        # Same single precision scale and inverse scale as the aten kernels.
+        scale = float(np.float32(scale))
+        inv_scale = float(np.float32(1.0) / np.float32(scale))
+    return (torch.clamp(torch.round(inputs * inv_scale) + zero_point, quant_min, quant_max) - zero_point) * scale
+
+
+def qdq_fake_quantize(inputs: torch.Tensor,
+                      scale: Union[float, torch.Tensor],
+                      zero_point: Union[int, torch.Tensor],
+                      quant_min: int,
+                      quant_max: int,
+                      axis: int = None) -> torch.Tensor:
+    """
+    Fake-quantize a tensor with the torch fake-quant ops over an 8-bit domain, which are exported to ONNX
+    as standard QuantizeLinear/DequantizeLinear pairs. A narrower quantization domain (fewer than 8 bits)
+    is applied by clipping the inputs to its range first.
+
+    Args:
+        inputs: Tensor to quantize.
+        scale: Quantization scale (a tensor of per-channel scales when an axis is given).
+        zero_point: Quantization zero point (an int32 tensor of per-channel zero points when an axis is given).
+        quant_min: Minimal value of the quantization domain.
+        quant_max: Maximal value of the quantization domain, at most 255 above quant_min.
+        axis: Channel axis for per-channel quantization.
+
+    Returns:
+        Fake-quantized tensor.
+    """
+    qdq_min, qdq_max = (-128, 127) if quant_min < 0 else (0, 255)
+    if (quant_min, quant_max) != (qdq_min, qdq_max):
+        clip_scale, clip_zero_point = scale, zero_point
+        if axis is not None:
+            target_shape = [1] * inputs.dim()
+            target_shape[axis] = -1
+            clip_scale, clip_zero_point = scale.reshape(target_shape), zero_point.reshape(target_shape)
+        inputs = torch.clamp(inputs,
+                             (quant_min - clip_zero_point) * clip_scale,
+                             (quant_max - clip_zero_point) * clip_scale)
+    if axis is None:
+        return torch.fake_quantize_per_tensor_affine(inputs, scale, zero_point, qdq_min, qdq_max)
+    return torch.fake_quantize_per_channel_affine(inputs, scale, zero_point, axis, qdq_min, qdq_max)
+
+
+def is_grid_exact_in_dtype(scale: float,
+                           zero_point: int,
+                           quant_min: int,
+                           quant_max: int,
+                           dtype: torch.dtype) -> bool:
+    """
+    Check whether per-tensor fake quantization computed in a reduced precision floating point dtype
+    (see fake_quantize_reduced_precision) is exact: the scale must be a power of two, so dividing by it
+    is exact, and every value of the quantization grid must be representable in the dtype.
+
+    Args:
+        scale: Quantization scale.
+        zero_point: Quantization zero point.
+        quant_min: Minimal value of the quantization domain.
+        quant_max: Maximal value of the quantization domain.
+        dtype: The floating point dtype to compute in.
+
+    Returns:
+        Whether fake quantization in dtype is identical to fake quantization in float32.
+    """
+    scale = float(np.float32(scale))
+    if scale <= 0 or math.frexp(scale)[0] != 0.5:
+        return False
+    grid = (torch.arange(quant_min, quant_max + 1, dtype=torch.float64) - zero_point) * scale
+    return bool(torch.equal(grid.to(dtype).to(torch.float64), grid))
+
+
+def fake_quantize_reduced_precision(inputs: torch.Tensor,
+                                    scale: float,
+                                    zero_point: int,
+                                    quant_min: int,
+                                    quant_max: int) -> torch.Tensor:
+    """
+    Per-tensor fake quantization computed in the dtype of the inputs (e.g. bfloat16), where
+    torch.fake_quantize_per_tensor_affine computes in float32. The result is identical to the float32
+    computation only when is_grid_exact_in_dtype holds for the inputs dtype.
+
+    Args:
+        inputs: Tensor to quantize.
+        scale: Quantization scale.
+        zero_point: Quantization zero point.
+        quant_min: Minimal value of the quantization domain.
+        quant_max: Maximal value of the quantization domain.
+
+    Returns:
+        Fake-quantized tensor, in the dtype of the inputs.
+    """
+    # Clamping the rounded values to the domain shifted by the zero point keeps all the intermediate values
+    # on the grid, so they are exact in the dtype.
+    outputs = torch.mul(inputs, 1.0 / scale)
+    outputs.round_()
+    outputs.clamp_(quant_min - zero_point, quant_max - zero_point)
+    return outputs.mul_(scale)
+
+
 def lut_quantizer(tensor_data: torch.Tensor,
                   lut_values: torch.Tensor,
                   signed: bool,
@@ -100,7 +232,9 @@ def lut_quantizer(tensor_data: torch.Tensor,
                   eps: float,
                   per_channel:bool=None,
                   channel_axis:int=None,
-                  input_rank:int=None) -> torch.Tensor:
+                  input_rank:int=None,
+                  sorted_lut: Tuple[torch.Tensor, torch.Tensor] = None,
+                  chunk_size: int = None) -> torch.Tensor:
     """
     Quantize a tensor using a non-uniform quantization based on the pre-defined values.
     1. Scales tensor_data with the threshold into n-bit quantization range.
@@ -115,28 +249,163 @@ def lut_quantizer(tensor_data: torch.Tensor,
         threshold: Threshold for quantization.
         lut_values_bitwidth: Number of bits that determines the quantization range
         eps: Small value for numerical stability in division.
+        sorted_lut: The lut values sorted by sort_lut_values. Sorted here if not given.
+        chunk_size: If given, assign the tensor to lut values in chunks of this many values.
 
     Returns: Quantized tensor.
     """
+    lut_values_assignments = lut_quantizer_indices(tensor_data,
+                                                   lut_values=lut_values,
+                                                   signed=signed,
+                                                   threshold=threshold,
+                                                   lut_values_bitwidth=lut_values_bitwidth,
+                                                   eps=eps,
+                                                   per_channel=per_channel,
+                                                   channel_axis=channel_axis,
+                                                   input_rank=input_rank,
+                                                   sorted_lut=sorted_lut,
+                                                   chunk_size=chunk_size)
+    return lut_dequantize(lut_values_assignments,
+                          lut_values=lut_values,
+                          signed=signed,
+                          threshold=threshold,
+                          lut_values_bitwidth=lut_values_bitwidth,
+                          per_channel=per_channel,
+                          channel_axis=channel_axis,
+                          input_rank=input_rank)
+
+
+def _reshape_lut_threshold(threshold: torch.Tensor,
+                           per_channel: bool,
+                           channel_axis: int,
+                           input_rank: int) -> torch.Tensor:
+    """
+    Reshape a per-channel threshold so it broadcasts along the channel axis.
+    """
     if per_channel:
         threshold_target_shape = [1] * input_rank
         threshold_target_shape[channel_axis] = -1
         threshold = torch.reshape(threshold, threshold_target_shape)
+    return threshold
+
+
+def sort_lut_values(lut_values: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Sort the lut values for a sorted-boundary search, keeping a single entry for repeated values.
+    Each sorted value keeps the first index it appears at in lut_values, which is the index
+    argmin over the distances to all lut values would choose.
+
+    Args:
+        lut_values: The values in the look-up table.
+
+    Returns:
+        The sorted unique lut values and their indices in lut_values.
+    """
+    lut_values = lut_values.flatten()
+    order = torch.argsort(lut_values, stable=True)
+    sorted_values = lut_values[order]
+    is_first = torch.ones_like(sorted_values, dtype=torch.bool)
+    is_first[1:] = sorted_values[1:] != sorted_values[:-1]
+    return sorted_values[is_first], order[is_first]
+
+
+def lut_nearest_indices(tensor: torch.Tensor,
+                        sorted_lut_values: torch.Tensor,
+                        sorted_lut_indices: torch.Tensor,
+                        chunk_size: int = None) -> torch.Tensor:
+    """
+    Assign each value of a tensor to the index of its nearest lut value, choosing the first index in the
+    original lut order on ties. Only the two sorted neighbours of each value are compared, so the temporary
+    memory is linear in the tensor size rather than in the tensor size times the number of lut values.
+
+    Args:
+        tensor: Tensor to assign.
+        sorted_lut_values: Sorted unique lut values, as returned by sort_lut_values.
+        sorted_lut_indices: Indices of the sorted values in the original lut values.
+        chunk_size: If given, assign the flattened tensor in chunks of this many values to bound
+            the temporary memory.
+
+    Returns:
+        A tensor of the indices of the assigned lut values, with the shape of the input tensor.
+    """
+    flat_tensor = tensor.reshape(-1)
+    if chunk_size is not None and flat_tensor.numel() > chunk_size:
+        return torch.cat([lut_nearest_indices(chunk, sorted_lut_values, sorted_lut_indices)
+                          for chunk in torch.split(flat_tensor, chunk_size)]).reshape(tensor.shape)
+
+    last = len(sorted_lut_values) - 1
+    upper = torch.bucketize(flat_tensor, sorted_lut_values).clamp_(max=last)
+    lower = (upper - 1).clamp_(min=0)
+    upper_dist = torch.abs(flat_tensor - sorted_lut_values[upper])
+    lower_dist = torch.abs(flat_tensor - sorted_lut_values[lower])
+    upper_indices = sorted_lut_indices[upper]
+    lower_indices = sorted_lut_indices[lower]
+    take_upper = (upper_dist < lower_dist) | ((upper_dist == lower_dist) & (upper_indices < lower_indices))
+    return torch.where(take_upper, upper_indices, lower_indices).reshape(tensor.shape)
+
+
+def lut_quantizer_indices(tensor_data: torch.Tensor,
+                          lut_values: torch.Tensor,
+                          signed: bool,
+                          threshold: torch.Tensor,
+                          lut_values_bitwidth: int,
+                          eps: float,
+                          per_channel: bool = None,
+                          channel_axis: int = None,
+                          input_rank: int = None,
+                          sorted_lut: Tuple[torch.Tensor, torch.Tensor] = None,
+                          chunk_size: int = None) -> torch.Tensor:
+    """
+    Assign each value of a tensor to its nearest lut value (the first one in lut_values order, on ties).
+
+    Args:
+        tensor_data: Input tensor.
+        lut_values: The values in the look-up table to assign the tensor values to.
+        signed: Whether the quantization is signed or not.
+        threshold: Threshold for quantization.
+        lut_values_bitwidth: Number of bits that determines the quantization range
+        eps: Small value for numerical stability in division.
+        sorted_lut: The lut values sorted by sort_lut_values. Sorted here if not given.
+        chunk_size: If given, assign the tensor in chunks of this many values.
+
+    Returns: A tensor of the indices of the assigned lut values.
+    """
+    threshold = _reshape_lut_threshold(threshold, per_channel, channel_axis, input_rank)
 
     tensor = int_quantization_with_threshold(tensor_data,
                                              n_bits=lut_values_bitwidth,
                                              signed=signed,
                                              threshold=threshold,
                                              eps=eps)
-    tensor = tensor.unsqueeze(-1)
 
-    expanded_lut_values = lut_values.reshape([*[1 for _ in range(len(tensor.shape) - 1)], -1])
-    lut_values_assignments = torch.argmin(torch.abs(tensor - expanded_lut_values), dim=-1)
-    centers = lut_values.flatten()[lut_values_assignments]
+    if sorted_lut is None:
+        sorted_lut = sort_lut_values(lut_values)
+    return lut_nearest_indices(tensor, *sorted_lut, chunk_size=chunk_size)
 
-    quant_tensor = (centers / (2 ** (lut_values_bitwidth - int(signed)))) * threshold
 
-    return quant_tensor
+def lut_dequantize(lut_values_assignments: torch.Tensor,
+                   lut_values: torch.Tensor,
+                   signed: bool,
+                   threshold: torch.Tensor,
+                   lut_values_bitwidth: int,
+                   per_channel: bool = None,
+                   channel_axis: int = None,
+                   input_rank: int = None) -> torch.Tensor:
+    """
+    Gather the assigned lut values and scale them back by the threshold.
+
+    Args:
+        lut_values_assignments: A tensor of indices of lut values.
+        lut_values: The values in the look-up table.
+        signed: Whether the quantization is signed or not.
+        threshold: Threshold for quantization.
+        lut_values_bitwidth: Number of bits that determines the quantization range
+
+    Returns: Quantized tensor.
+    """
+    threshold = _reshape_lut_threshold(threshold, per_channel, channel_axis, input_rank)
+    centers = lut_values.flatten()[lut_values_assignments]
+    return (centers / (2 ** (lut_values_bitwidth - int(signed)))) * threshold
 
 
 def int_quantization_with_threshold(data: torch.Tensor,
@@ -168,3 +437,122 @@ def int_quantization_with_threshold(data: torch.Tensor,
 
     return torch.clip((data / (threshold + eps)) * (2 ** (n_bits - int(signed))),
                       min=clip_min, max=clip_max)
+
+
+def get_packed_code_bits(num_bits: int) -> int:
+    """
+    Get the number of bits each code occupies when packed into bytes: codes of up to 2 bits are
+    packed four to a byte, codes of up to 4 bits two to a byte and wider codes one to a byte.
+
+    Args:
+        num_bits: Number of bits of the codes.
+
+    Returns:
+        Number of bits a packed code occupies.
+    """
+    if num_bits > 8:
+        Logger.critical(f'Packing integer codes supports up to 8 bits, but num_bits is {num_bits}.')
+    return 2 if num_bits <= 2 else 4 if num_bits <= 4 else 8
+
+
+def pack_int_codes(codes: torch.Tensor, num_bits: int) -> torch.Tensor:
+    """
+    Pack unsigned integer codes (in the range [0, 2 ** num_bits - 1]) into a flat uint8 tensor.
+
+    Args:
+        codes: Integer codes tensor.
+        num_bits: Number of bits of the codes.
+
+    Returns:
+        A flat uint8 tensor of the packed codes.
+    """
+    code_bits = get_packed_code_bits(num_bits)
+    codes = codes.flatten().to(torch.uint8)
+    codes_per_byte = 8 // code_bits
+    if codes_per_byte == 1:
+        return codes
+
+    padding = (-codes.numel()) % codes_per_byte
+    if padding:
+        codes = torch.cat([codes, codes.new_zeros(padding)])
+    shifts = torch.arange(0, 8, code_bits, dtype=torch.uint8, device=codes.device)
+    return (codes.reshape(-1, codes_per_byte) << shifts).sum(dim=-1).to(torch.uint8)
+
+
+def unpack_int_codes(packed_codes: torch.Tensor, num_bits: int, shape: Sequence[int]) -> torch.Tensor:
+    """
+    Unpack integer codes packed by pack_int_codes.
+
+    Args:
+        packed_codes: A flat uint8 tensor of the packed codes.
+        num_bits: Number of bits of the codes.
+        shape: Shape of the unpacked codes tensor.
+
+    Returns:
+        A uint8 tensor of the codes in the requested shape.
+    """
+    code_bits = get_packed_code_bits(num_bits)
+    if code_bits == 8:
+        return packed_codes.reshape(shape)
+
+    shifts = torch.arange(0, 8, code_bits, dtype=torch.uint8, device=packed_codes.device)
+    codes = (packed_codes.unsqueeze(-1) >> shifts) & ((1 << code_bits) - 1)
+    return codes.flatten()[:math.prod(shape)].reshape(shape)
+
+
+def encode_uniform_int_weights(quantized_weights: torch.Tensor,
+                               scales: torch.Tensor,
+                               zero_points: torch.Tensor,
+                               quant_min: int,
+                               num_bits: int,
+                               per_channel: bool,
+                               channel_axis: int = None) -> Dict[str, torch.Tensor]:
+    """
+    Encode weights that were quantized to a uniform grid as packed integer codes, with the grid scales
+    and zero points. The codes are offset by quant_min, so signed grids are stored unsigned.
+
+    Args:
+        quantized_weights: Quantized weights tensor (values on the quantization grid).
+        scales: Quantization scales (one per channel in per-channel quantization).
+        zero_points: Quantization zero points (one per channel in per-channel quantization).
+        quant_min: Minimal integer value of the quantization grid.
+        num_bits: Number of bits of the quantization grid.
+        per_channel: Whether the weights are quantized per-channel.
+        channel_axis: Axis of the per-channel quantization.
+
+    Returns:
+        A dictionary of the packed codes, scales and zero points tensors.
+    """
+    params_shape = [1] * quantized_weights.ndim
+    if per_channel:
+        params_shape[channel_axis] = -1
+    scales = scales.flatten().reshape(params_shape).float()
+    zero_points = zero_points.flatten().reshape(params_shape).int()
+
+    codes = torch.round(quantized_weights / scales) + zero_points - quant_min
+    codes = torch.clip(codes, 0, 2 ** num_bits - 1)
+    return {INT_WEIGHTS_CODES: pack_int_codes(codes, num_bits),
+            INT_WEIGHTS_SCALES: scales,
+            INT_WEIGHTS_ZERO_POINTS: zero_points}
+
+
+def decode_uniform_int_weights(encoded_weights: Dict[str, torch.Tensor],
+                               quant_min: int,
+                               num_bits: int,
+                               shape: Sequence[int]) -> torch.Tensor:
+    """
+    Decode weights encoded by encode_uniform_int_weights. The result is identical to the quantized weights
+    the codes were encoded from.
+
+    Args:
+        encoded_weights: A dictionary of the packed codes, scales and zero points tensors.
+        quant_min: Minimal integer value of the quantization grid.
+        num_bits: Number of bits of the quantization grid.
+        shape: Shape of the weights tensor.
+
+    Returns:
+        The dequantized weights tensor.
+    """
+    codes = unpack_int_codes(encoded_weights[INT_WEIGHTS_CODES], num_bits, shape)
+    return (codes.float() + (quant_min - encoded_weights[INT_WEIGHTS_ZERO_POINTS])) * \
+        encoded_weights[INT_WEIGHTS_SCALES]
@@ -17,7 +17,7 @@ from typing import List
 import numpy as np
 
 from mct_quantizers.common.base_inferable_quantizer import mark_quantizer, QuantizationTarget, QuantizerID
-from mct_quantizers.common.constants import FOUND_TORCH, LUT_VALUES_BITWIDTH, EPS
+from mct_quantizers.common.constants import FOUND_TORCH, LUT_VALUES_BITWIDTH, EPS, LUT_ASSIGNMENT_CHUNK_SIZE
 from mct_quantizers.common.quant_info import QuantizationMethod
 
 if FOUND_TORCH:
@@ -71,7 +71,7 @@ if FOUND_TORCH:
                                       f'should be of length 1 but is {len(threshold)}'
             self.threshold = self.threshold[0]
 
-            self.lut_values = to_torch_tensor(self._lut_values_np).to(get_working_device())
+            self._register_quantization_buffer('lut_values', to_torch_tensor(self._lut_values_np).to(get_working_device()))
 
         def __call__(self, inputs: torch.Tensor):
             """
@@ -88,7 +88,9 @@ if FOUND_TORCH:
                                  signed=self.signed,
                                  threshold=self.threshold,
                                  lut_values_bitwidth=self.lut_values_bitwidth,
-                                 eps=self.eps)
+                                 eps=self.eps,
+                                 sorted_lut=self._sorted_lut_torch,
+                                 chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
 
 else:
     class ActivationLutPOTInferableQuantizer:  # pragma: no cover
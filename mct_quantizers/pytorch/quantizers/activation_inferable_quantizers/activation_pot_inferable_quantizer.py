@@ -65,7 +65,8 @@ if FOUND_TORCH:
             Returns:
                 Quantized tensor.
             """
-            if self._use_custom_impl and torch.jit.is_tracing():
+            if self._use_custom_impl and not self._compile_mode and not self._export_as_qdq() and \
+                    torch.jit.is_tracing():
                 return ActivationPOTF.apply(inputs,
                                             self.threshold_np,
                                             self.signed,
@@ -133,17 +134,17 @@ else:
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
     from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_symmetric_inferable_quantizer import quantize_sym_activations_numpy
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
 
     # Add onnx op function to use during onnxruntime ActivationPOTQuantizer op inference.
     # Using this decorator the op ActivationPOTQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::ActivationPOTQuantizer",
-             inputs=[PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={"threshold": PyCustomOpDef.dt_float,
-                    "signed": PyCustomOpDef.dt_int64,
-                    "num_bits": PyCustomOpDef.dt_int64
-                    })
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::ActivationPOTQuantizer",
+                   inputs=[OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={"threshold": OrtCustomOpType.dt_float,
+                          "signed": OrtCustomOpType.dt_int64,
+                          "num_bits": OrtCustomOpType.dt_int64
+                          })
     def activation_pot_ort(input_tensor,
                            **kwargs):
         return quantize_sym_activations_numpy(input_tensor,
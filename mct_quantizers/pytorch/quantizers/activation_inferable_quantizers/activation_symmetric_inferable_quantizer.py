@@ -23,6 +23,7 @@ from mct_quantizers.pytorch.onnxruntime_validations import validate_activation_p
 
 if FOUND_TORCH:
     import torch
+    from mct_quantizers.pytorch.quantizer_utils import fake_quantize, fake_quantize_reduced_precision, qdq_fake_quantize
     from mct_quantizers.pytorch.quantizers.base_symmetric_inferable_quantizer import BaseSymmetricInferableQuantizer
     from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.base_activation_quantizer_autograd_function import BaseActivationQuantizerAutogradFunction
 
@@ -103,11 +104,34 @@ if FOUND_TORCH:
             Returns:
                 quantized tensor.
             """
+            if self._use_pointwise_ops(inputs):
+                return fake_quantize(inputs,
+                                     scale=self.scales,
+                                     zero_point=self.zero_points,
+                                     quant_min=self.min_quantized_domain,
+                                     quant_max=self.max_quantized_domain)
             if self._use_custom_impl and torch.jit.is_tracing():
+                if self._export_as_qdq():
+                    return qdq_fake_quantize(inputs,
+                                             scale=self.scales,
+                                             zero_point=self.zero_points,
+                                             quant_min=self.min_quantized_domain,
+                                             quant_max=self.max_quantized_domain)
                 return ActivationSymF.apply(inputs,
                                             self.threshold_np,
                                             self.signed,
                                             self.num_bits)
+            elif self._use_reduced_precision_ops(inputs,
+                                                 scale=self.scales,
+                                                 zero_point=self.zero_points,
+                                                 quant_min=self.min_quantized_domain,
+                                                 quant_max=self.max_quantized_domain):
+                with torch.no_grad():
+                    return fake_quantize_reduced_precision(inputs,
+                                                           scale=self.scales,
+                                                           zero_point=self.zero_points,
+                                                           quant_min=self.min_quantized_domain,
+                                                           quant_max=self.max_quantized_domain)
             else:
                 with torch.no_grad():
                     return torch.fake_quantize_per_tensor_affine(inputs,
@@ -175,18 +199,18 @@ else:
 
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
 
     # Add onnx op function to use during onnxruntime ActivationSymmetricQuantizer op inference
     # Using this decorator the op ActivationSymmetricQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::ActivationSymmetricQuantizer",
-             inputs=[PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={"threshold": PyCustomOpDef.dt_float,
-                    "signed": PyCustomOpDef.dt_int64,
-                    "num_bits": PyCustomOpDef.dt_int64
-                    }
-             )
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::ActivationSymmetricQuantizer",
+                   inputs=[OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={"threshold": OrtCustomOpType.dt_float,
+                          "signed": OrtCustomOpType.dt_int64,
+                          "num_bits": OrtCustomOpType.dt_int64
+                          }
+                   )
     def activation_sym_ort(input_tensor,
                            **kwargs):
         return quantize_sym_activations_numpy(input_tensor,
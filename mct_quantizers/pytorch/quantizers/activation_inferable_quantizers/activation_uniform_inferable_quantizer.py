@@ -24,6 +24,7 @@ from mct_quantizers.pytorch.onnxruntime_validations import validate_activation_p
 
 if FOUND_TORCH:
     import torch
+    from mct_quantizers.pytorch.quantizer_utils import fake_quantize, fake_quantize_reduced_precision, qdq_fake_quantize
     from mct_quantizers.pytorch.quantizers.base_uniform_inferable_quantizer import BaseUniformInferableQuantizer
     from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.base_activation_quantizer_autograd_function \
         import \
@@ -100,9 +101,10 @@ if FOUND_TORCH:
                 max_range) == 1, f'For activation, only per-tensor quantization is supported. Thus, max_range should be ' \
                                  f'of length 1 but is {len(max_range)}'
 
-            # Activation is per-tensor thus we expect only a single min/max values
-            self.min_range = self.min_range[0].cpu().item()
-            self.max_range = self.max_range[0].cpu().item()
+            # Activation is per-tensor thus we expect only a single min/max values, which replace the buffers
+            min_range, max_range = self.min_range[0].cpu().item(), self.max_range[0].cpu().item()
+            del self.min_range, self.max_range
+            self.min_range, self.max_range = min_range, max_range
 
             self.scale = float((self.max_range-self.min_range) / ((2 ** num_bits) - 1))
             self.zero_point = int(-np.round(self.min_range / self.scale))  # zp has to be positive, and a <=0, so we multiply by -1
@@ -117,8 +119,31 @@ if FOUND_TORCH:
             Returns:
                 quantized tensor.
             """
+            if self._use_pointwise_ops(inputs):
+                return fake_quantize(inputs,
+                                     scale=self.scale,
+                                     zero_point=self.zero_point,
+                                     quant_min=self.min_quantized_domain,
+                                     quant_max=self.max_quantized_domain)
             if self._use_custom_impl and torch.jit.is_tracing():
+                if self._export_as_qdq():
+                    return qdq_fake_quantize(inputs,
+                                             scale=self.scale,
+                                             zero_point=self.zero_point,
+                                             quant_min=self.min_quantized_domain,
+                                             quant_max=self.max_quantized_domain)
                 return ActivationUniformF.apply(inputs, self.min_range, self.max_range, self.num_bits)
+            elif self._use_reduced_precision_ops(inputs,
+                                                 scale=self.scale,
+                                                 zero_point=self.zero_point,
+                                                 quant_min=self.min_quantized_domain,
+                                                 quant_max=self.max_quantized_domain):
+                with torch.no_grad():
+                    return fake_quantize_reduced_precision(inputs,
+                                                           scale=self.scale,
+                                                           zero_point=self.zero_point,
+                                                           quant_min=self.min_quantized_domain,
+                                                           quant_max=self.max_quantized_domain)
             else:
                 with torch.no_grad():
                     return torch.fake_quantize_per_tensor_affine(inputs,
@@ -185,7 +210,7 @@ else:
                             'Could not find torch package.')
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
 
     def quantize_uniform_activations_numpy(tensor_data: np.ndarray,
                                            range_min: float,
@@ -224,13 +249,13 @@ if FOUND_ONNXRUNTIME_EXTENSIONS:
 
     # Add onnx op function to use during onnxruntime ActivationUniformQuantizer op inference
     # Using this decorator the op ActivationUniformQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::ActivationUniformQuantizer",
-             inputs=[PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={"num_bits": PyCustomOpDef.dt_int64,
-                    "min_range": PyCustomOpDef.dt_float,
-                    "max_range": PyCustomOpDef.dt_float}
-             )
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::ActivationUniformQuantizer",
+                   inputs=[OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={"num_bits": OrtCustomOpType.dt_int64,
+                          "min_range": OrtCustomOpType.dt_float,
+                          "max_range": OrtCustomOpType.dt_float}
+                   )
     def activation_uniform_ort(input_tensor: np.ndarray,
                                **kwargs):
         return quantize_uniform_activations_numpy(input_tensor,
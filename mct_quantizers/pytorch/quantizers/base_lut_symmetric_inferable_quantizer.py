@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 import warnings
-from typing import List
+from typing import List, Dict, Any, Tuple
 
 import numpy as np
 
@@ -22,7 +22,9 @@ from mct_quantizers.common.constants import FOUND_TORCH
 from mct_quantizers.common.quant_info import QuantizationMethod
 
 if FOUND_TORCH:
+    import torch
     from mct_quantizers.pytorch.quantizers.base_pytorch_inferable_quantizer import BasePyTorchInferableQuantizer
+    from mct_quantizers.pytorch.quantizer_utils import to_torch_tensor, sort_lut_values
 
     @mark_quantizer(quantization_target=None,
                     quantization_method=[QuantizationMethod.LUT_SYM_QUANTIZER],
@@ -93,6 +95,27 @@ if FOUND_TORCH:
             self.lut_values_bitwidth = lut_values_bitwidth
             self.eps = eps
 
+            # The lut values are sorted once, so values are assigned to them with a sorted-boundary search.
+            self._register_sorted_lut()
+
+        def _register_sorted_lut(self):
+            sorted_lut_values, sorted_lut_indices = sort_lut_values(to_torch_tensor(self._lut_values_np))
+            self._register_quantization_buffer('_sorted_lut_values_torch', sorted_lut_values)
+            self._register_quantization_buffer('_sorted_lut_indices_torch', sorted_lut_indices)
+
+        @property
+        def _sorted_lut_torch(self) -> Tuple[torch.Tensor, torch.Tensor]:
+            """
+            Returns: The sorted unique lut values and their indices in the lut values.
+            """
+            return self._sorted_lut_values_torch, self._sorted_lut_indices_torch
+
+        def __setstate__(self, state: Dict[str, Any]):
+            super(BaseLUTSymmetricInferableQuantizer, self).__setstate__(state)
+            # Quantizers saved before the lut values were sorted at construction.
+            if '_sorted_lut_values_torch' not in self._buffers:
+                self._register_sorted_lut()
+
 else:
     class BaseLUTSymmetricInferableQuantizer:  # pragma: no cover
         def __init__(self, *args, **kwargs):
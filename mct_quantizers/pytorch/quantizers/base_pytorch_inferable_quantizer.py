@@ -13,40 +13,200 @@
 # limitations under the License.
 # ==============================================================================
 from abc import abstractmethod
+from typing import Any, Dict
 
 from mct_quantizers.common.base_inferable_quantizer import BaseInferableQuantizer
 from mct_quantizers.common.constants import FOUND_TORCH
+from mct_quantizers.logger import Logger
 
 if FOUND_TORCH:
     import torch
+    from mct_quantizers.pytorch.quantizer_utils import is_grid_exact_in_dtype
+    from mct_quantizers.pytorch.quantizers.quantized_weights_cache import QuantizedWeightsCache
 
 
-    class BasePyTorchInferableQuantizer(BaseInferableQuantizer):
+    class BasePyTorchInferableQuantizer(BaseInferableQuantizer, torch.nn.Module):
         def __init__(self):
             """
             This class is a base quantizer for PyTorch quantizers for inference only.
+            The quantizer is a torch.nn.Module, and its quantization parameters tensors are registered as
+            (non-persistent) buffers, so they follow the device of the model the quantizer is in.
             """
             super(BasePyTorchInferableQuantizer, self).__init__()
+            torch.nn.Module.__init__(self)
             # By default the custom forward implementation is disabled. If someone wants to enable it
             # enable_custom_impl should be invoked.
             self._use_custom_impl = False
 
-            # Reuse output: run only first quantizer opertion, save the result
-            # and return it for others quantizer operation
+            # Reuse output: run the quantizer operation only when its input changed, save the result
+            # and return it for other quantizer operations on the same input
             self.reuse = False
             self.enable_reuse = False
-            self.quantizer_first_run = True
-            self.resue_outputs = None
+            self.reuse_cache = QuantizedWeightsCache()
+
+            # Compile mode: quantize with side-effect free, pointwise ops only, so torch.compile can capture the
+            # quantizer in a single graph.
+            self._compile_mode = False
+
+            # QDQ export: export the quantizer to ONNX as QuantizeLinear/DequantizeLinear nodes instead of a
+            # custom op.
+            self._qdq_export = False
+
+            # Whether fake quantization in a reduced precision dtype (bfloat16/float16) is exact, per dtype.
+            self._reduced_precision_exact = {}
+
+        def __setstate__(self, state: Dict[str, Any]):
+            # Quantizers saved before the reuse cache was introduced hold its state in separate attributes.
+            state.pop('quantizer_first_run', None)
+            state.pop('resue_outputs', None)
+            if '_buffers' in state:
+                torch.nn.Module.__setstate__(self, state)
+            else:
+                # Quantizers saved before they were modules hold their tensors as plain attributes.
+                torch.nn.Module.__init__(self)
+                tensors = {name: state.pop(name) for name, value in list(state.items())
+                           if isinstance(value, torch.Tensor)}
+                self.__dict__.update(state)
+                for name, tensor in tensors.items():
+                    self.register_buffer(name, tensor, persistent=False)
+            if 'reuse_cache' not in state:
+                self.reuse_cache = QuantizedWeightsCache()
+            if '_compile_mode' not in state:
+                self._compile_mode = False
+            if '_qdq_export' not in state:
+                self._qdq_export = False
+            if '_reduced_precision_exact' not in state:
+                self._reduced_precision_exact = {}
+
+        def _register_quantization_buffer(self, name: str, tensor: torch.Tensor):
+            """
+            Register a quantization parameters tensor as a non-persistent buffer, replacing an attribute
+            of the same name. The buffers are derived from the quantizer arguments, so they are not saved
+            in the state_dict.
+
+            Args:
+                name: Name of the buffer.
+                tensor: Quantization parameters tensor.
+
+            """
+            self.__dict__.pop(name, None)
+            self.register_buffer(name, tensor, persistent=False)
+
+        def _apply(self, fn, *args, **kwargs):
+            """
+            Apply fn to the buffers (e.g. on Module.to, Module.cuda or Module.half), keeping their dtype:
+            the quantization parameters follow the device of the model, but not its dtype.
+            """
+            def _keep_dtype(tensor):
+                # fn is applied to an empty tensor first to find its device and dtype, so each buffer is converted
+                # once: with fn if it keeps the dtype, or else only moved to the device.
+                applied = fn(tensor.new_empty(0))
+                return tensor.to(applied.device) if applied.dtype != tensor.dtype else fn(tensor)
+
+            return super(BasePyTorchInferableQuantizer, self)._apply(_keep_dtype, *args, **kwargs)
+
+        @property
+        def quantizer_first_run(self) -> bool:
+            """
+            Returns: Whether the reuse cache is empty.
+            """
+            return self.reuse_cache.outputs is None
+
+        @property
+        def resue_outputs(self):
+            """
+            Returns: The quantizer output held by the reuse cache (None if it is empty).
+            """
+            return self.reuse_cache.outputs
 
         def enable_custom_impl(self):
             self._use_custom_impl = True
 
+        def enable_qdq_export(self):
+            """
+            Export the quantizer to ONNX as standard QuantizeLinear/DequantizeLinear nodes instead of a custom op
+            (this also enables the custom implementation, which is used for the export). ONNX Runtime runs the QDQ
+            nodes natively and fuses them with the neighbouring nodes into integer kernels (e.g. QLinearConv).
+            Quantizers with a quantization domain wider than 8 bits, and non-uniform (LUT) quantizers, are still
+            exported as custom ops.
+            """
+            self._use_custom_impl = True
+            self._qdq_export = True
+
+        def disable_qdq_export(self):
+            self._qdq_export = False
+
+        def _export_as_qdq(self) -> bool:
+            """
+            Returns: Whether the QDQ export is enabled and the quantization domain fits in 8 bits.
+            """
+            return self._qdq_export and self.max_quantized_domain - self.min_quantized_domain <= 255
+
+        def enable_compile_mode(self):
+            """
+            Quantize with side-effect free, pointwise ops only. The reuse cache, the custom implementation for
+            export and the in-place changes of the inputs are skipped, so torch.compile captures the quantizer
+            without graph breaks and fuses the quantization into the neighbouring kernels.
+            """
+            self._compile_mode = True
+
+        def disable_compile_mode(self):
+            self._compile_mode = False
+
+        def _use_pointwise_ops(self, inputs: torch.Tensor) -> bool:
+            """
+            Whether to quantize with the pointwise ops of the compile mode. Meta tensors (of a model constructed
+            on the meta device) are always quantized this way, since the aten fake quant ops have no meta kernels.
+
+            Args:
+                inputs: input tensor to quantize.
+
+            Returns:
+                True in compile mode or for meta tensors.
+            """
+            return self._compile_mode or (isinstance(inputs, torch.Tensor) and inputs.is_meta)
+
+        def _use_reduced_precision_ops(self,
+                                       inputs: torch.Tensor,
+                                       scale: float,
+                                       zero_point: int,
+                                       quant_min: int,
+                                       quant_max: int) -> bool:
+            """
+            Whether to fake quantize bfloat16/float16 inputs in their own dtype, instead of in float32 like
+            torch.fake_quantize_per_tensor_affine does. This is done only when it is exact (a power-of-two scale
+            and a quantization grid representable in the dtype), and a warning is logged once per dtype when
+            it is not.
+
+            Args:
+                inputs: input tensor to quantize.
+                scale: Quantization scale.
+                zero_point: Quantization zero point.
+                quant_min: Minimal value of the quantization domain.
+                quant_max: Maximal value of the quantization domain.
+
+            Returns:
+                True for reduced precision inputs whose quantization grid is exact in their dtype.
+            """
+            if not isinstance(inputs, torch.Tensor) or inputs.dtype not in (torch.bfloat16, torch.float16):
+                return False
+            exact = self._reduced_precision_exact.get(inputs.dtype)
+            if exact is None:
+                exact = is_grid_exact_in_dtype(scale, zero_point, quant_min, quant_max, inputs.dtype)
+                self._reduced_precision_exact[inputs.dtype] = exact
+                if not exact:
+                    Logger.warning(f'The quantization grid of {type(self).__name__} (scale {scale}, zero point '
+                                   f'{zero_point}, {quant_max - quant_min + 1} levels) is not exact in '
+                                   f'{inputs.dtype}, so {inputs.dtype} inputs are quantized in float32.')
+            return exact
+
         def enable_reuse_quantizer(self):
             self.enable_reuse = True
-            self.quantizer_first_run = True
+            self.reuse_cache.clear()
 
         def disable_reuse_quantizer(self):
             self.enable_reuse = False
+            self.reuse_cache.clear()
 
         @abstractmethod
         def __call__(self, inputs: torch.Tensor):
@@ -58,8 +58,8 @@ if FOUND_TORCH:
             min_range, max_range = fix_range_to_include_zero(min_range,
                                                              max_range,
                                                              num_bits)
-            self.min_range = min_range
-            self.max_range = max_range
+            self._register_quantization_buffer('min_range', min_range)
+            self._register_quantization_buffer('max_range', max_range)
 
             self.num_bits = num_bits
             self.min_quantized_domain = 0
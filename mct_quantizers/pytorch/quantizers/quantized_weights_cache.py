@@ -0,0 +1,141 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import threading
+import weakref
+from typing import Any, Callable, Dict, NamedTuple
+
+from mct_quantizers.common.constants import FOUND_TORCH
+
+if FOUND_TORCH:
+    import torch
+
+
+    class _CacheEntry(NamedTuple):
+        inputs_ref: weakref.ref
+        inputs_key: tuple
+        outputs: torch.Tensor
+
+
+    class QuantizedWeightsCache:
+        def __init__(self):
+            """
+            A cache of a weights quantizer outputs, holding one output per (device, dtype) of the inputs.
+            A cached output is returned only for the same input tensor (identity) that was not modified since
+            it was quantized: an in-place update bumps the tensor's version counter, and replacing its data
+            (e.g. when moving a module) changes its data pointer, so both invalidate the cache.
+
+            The cache is safe to use from several threads (e.g. when serving one model from several inference
+            threads): entries are immutable and replaced atomically, so they are read without locking, and
+            get_or_compute populates a missing entry under a lock, so concurrent first runs quantize once. The hit &
+            miss counters are updated under the lock.
+            """
+            self.hits = 0
+            self.misses = 0
+            self._lock = threading.Lock()
+            self.clear()
+
+        def clear(self):
+            """
+            Drop the cached outputs. The hit & miss counters are kept.
+            """
+            self._entries = {}
+            self.outputs = None
+
+        @staticmethod
+        def _get_key(inputs: torch.Tensor) -> tuple:
+            return inputs._version, inputs.data_ptr(), inputs.shape
+
+        def _lookup(self, inputs: torch.Tensor):
+            entry = self._entries.get((inputs.device, inputs.dtype))
+            if entry is not None and entry.inputs_ref() is inputs and entry.inputs_key == self._get_key(inputs):
+                return entry.outputs
+            return None
+
+        def get(self, inputs: torch.Tensor):
+            """
+            Get the cached output for the inputs, and update the hit & miss counters.
+
+            Args:
+                inputs: The quantizer input tensor.
+
+            Returns:
+                The cached quantized tensor, or None if the inputs changed since it was cached.
+            """
+            outputs = self._lookup(inputs)
+            with self._lock:
+                if outputs is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            return outputs
+
+        def set(self, inputs: torch.Tensor, outputs: torch.Tensor):
+            """
+            Cache the quantizer output for the inputs, replacing the output cached for their device & dtype.
+
+            Args:
+                inputs: The quantizer input tensor.
+                outputs: The quantized tensor.
+            """
+            self._entries = {**self._entries,
+                             (inputs.device, inputs.dtype): _CacheEntry(weakref.ref(inputs),
+                                                                        self._get_key(inputs),
+                                                                        outputs)}
+            self.outputs = outputs
+
+        def get_or_compute(self, inputs: torch.Tensor, compute: Callable[[torch.Tensor], torch.Tensor]):
+            """
+            Get the cached output for the inputs, or compute it and cache it. A hit is read without locking;
+            on a miss the lock is taken and the cache is checked again, so threads that miss at the same time
+            compute the output once and share it.
+
+            Args:
+                inputs: The quantizer input tensor.
+                compute: A function that quantizes the inputs.
+
+            Returns:
+                The quantized tensor.
+            """
+            outputs = self._lookup(inputs)
+            if outputs is not None:
+                with self._lock:
+                    self.hits += 1
+                return outputs
+            with self._lock:
+                outputs = self._lookup(inputs)
+                if outputs is not None:
+                    self.hits += 1
+                    return outputs
+                self.misses += 1
+                outputs = compute(inputs)
+                self.set(inputs, outputs)
+            return outputs
+
+        def __getstate__(self) -> Dict[str, Any]:
+            # The cached outputs are not saved: a weak reference can't be pickled, and a loaded
+            # quantizer gets new input tensors anyway.
+            return {'hits': self.hits, 'misses': self.misses}
+
+        def __setstate__(self, state: Dict[str, Any]):
+            self.__dict__.update(state)
+            self._lock = threading.Lock()
+            self.clear()
+
+else:
+    class QuantizedWeightsCache:  # pragma: no cover
+        def __init__(self, *args, **kwargs):
+            raise Exception('Installing torch is mandatory '
+                            'when using QuantizedWeightsCache. '
+                            'Could not find torch package.')
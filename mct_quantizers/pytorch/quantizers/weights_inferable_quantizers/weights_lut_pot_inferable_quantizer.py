@@ -71,9 +71,9 @@ if FOUND_TORCH:
             assert is_threshold_pot, f'Expected threshold to be power of 2 but is {threshold}'
 
 
-        def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        def _custom_impl_apply(self, inputs: torch.Tensor) -> torch.Tensor:
             """
-            Quantize the given inputs using the quantizer parameters.
+            Quantize the inputs with the custom autograd function, which is exported to ONNX as a custom op.
 
             Args:
                 inputs: input tensor to quantize
@@ -81,27 +81,15 @@ if FOUND_TORCH:
             Returns:
                 quantized tensor.
             """
-            if self.enable_reuse and not self.quantizer_first_run:
-                return self.resue_outputs
-
-            if self._use_custom_impl and torch.jit.is_tracing():
-                outputs = WeightsLUTPOTF.apply(inputs,
-                                                self.num_bits,
-                                                self._lut_values_np,
-                                                self._threshold_np,
-                                                self.lut_values_bitwidth,
-                                                self.eps,
-                                                self.per_channel,
-                                                self.channel_axis,
-                                                self.input_rank)
-            else:
-                outputs = super(WeightsLUTPOTInferableQuantizer, self).__call__(inputs)
-
-            if self.enable_reuse and self.quantizer_first_run:
-                self.resue_outputs = outputs
-                self.quantizer_first_run = False
-
-            return outputs
+            return WeightsLUTPOTF.apply(inputs,
+                                        self.num_bits,
+                                        self._lut_values_np,
+                                        self._threshold_np,
+                                        self.lut_values_bitwidth,
+                                        self.eps,
+                                        self.per_channel,
+                                        self.channel_axis,
+                                        self.input_rank)
 
     class WeightsLUTPOTF(BaseWeightQuantizerAutogradFunction):
         """
@@ -191,23 +179,25 @@ else:
 
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
+    from mct_quantizers.pytorch.onnxruntime_kernels_cache import memoize_ort_kernel
     from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_lut_symmetric_inferable_quantizer import  quantize_lut_sym_weights_numpy
 
     # Add onnx op function to use during onnxruntime WeightsLUTPOTQuantizer op inference
     # Using this decorator the op WeightsLUTPOTQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsLUTPOTQuantizer",
-             inputs=[PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={
-                 "lut_values_bitwidth": PyCustomOpDef.dt_int64,
-                 "eps": PyCustomOpDef.dt_float,
-                 "per_channel": PyCustomOpDef.dt_int64,
-                 "channel_axis": PyCustomOpDef.dt_int64,
-                 "input_rank": PyCustomOpDef.dt_int64
-             })
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsLUTPOTQuantizer",
+                   inputs=[OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={
+                       "lut_values_bitwidth": OrtCustomOpType.dt_int64,
+                       "eps": OrtCustomOpType.dt_float,
+                       "per_channel": OrtCustomOpType.dt_int64,
+                       "channel_axis": OrtCustomOpType.dt_int64,
+                       "input_rank": OrtCustomOpType.dt_int64
+                   })
+    @memoize_ort_kernel
     def weight_lut_sym_ort(input_tensor: np.ndarray,
                            lut_values: np.ndarray,
                            threshold: np.ndarray,
@@ -12,19 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+import functools
+from typing import List, Dict, Sequence, Tuple
 
 import numpy as np
 
 from mct_quantizers.common.base_inferable_quantizer import mark_quantizer, QuantizationTarget, QuantizerID
 from mct_quantizers.common.constants import FOUND_TORCH, LUT_VALUES_BITWIDTH, EPS, ONNX_CUSTOM_OP_DOMAIN, \
-    FOUND_ONNXRUNTIME_EXTENSIONS
+    FOUND_ONNXRUNTIME_EXTENSIONS, INT_WEIGHTS_CODES, INT_WEIGHTS_LUT_VALUES, INT_WEIGHTS_THRESHOLDS, \
+    LUT_ASSIGNMENT_CHUNK_SIZE
 from mct_quantizers.common.quant_info import QuantizationMethod
-from mct_quantizers.common.quant_utils import lut_quantizer_np
+from mct_quantizers.common.quant_utils import lut_quantizer_np, sort_lut_values_np
 
 if FOUND_TORCH:
     import torch
-    from mct_quantizers.pytorch.quantizer_utils import to_torch_tensor, get_working_device, lut_quantizer
+    from mct_quantizers.pytorch.quantizer_utils import to_torch_tensor, get_working_device, lut_quantizer, \
+        lut_quantizer_indices, lut_dequantize, pack_int_codes, unpack_int_codes
     from mct_quantizers.pytorch.quantizers.base_lut_symmetric_inferable_quantizer import \
         BaseLUTSymmetricInferableQuantizer
     from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.base_weight_quantizer_autograd_function import \
@@ -83,8 +86,30 @@ if FOUND_TORCH:
                     threshold) == 1, f'In per-tensor quantization threshold should be of length 1 but is ' \
                                      f'{len(threshold)}'
 
-            self._threshold_torch = to_torch_tensor(self._threshold_np).to(get_working_device())
-            self._lut_values_torch = to_torch_tensor(self._lut_values_np).to(get_working_device())
+            self._register_quantization_buffer('_threshold_torch',
+                                               to_torch_tensor(self._threshold_np).to(get_working_device()))
+            self._register_quantization_buffer('_lut_values_torch',
+                                               to_torch_tensor(self._lut_values_np).to(get_working_device()))
+
+        def _custom_impl_apply(self, inputs: torch.Tensor) -> torch.Tensor:
+            """
+            Quantize the inputs with the custom autograd function, which is exported to ONNX as a custom op.
+
+            Args:
+                inputs: input tensor to quantize
+
+            Returns:
+                quantized tensor.
+            """
+            return WeightsLUTSymmetricF.apply(inputs,
+                                              self.num_bits,
+                                              self._lut_values_np,
+                                              self._threshold_np,
+                                              self.lut_values_bitwidth,
+                                              self.eps,
+                                              self.per_channel,
+                                              self.channel_axis,
+                                              self.input_rank)
 
         def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
             """
@@ -96,19 +121,35 @@ if FOUND_TORCH:
             Returns:
                 quantized tensor.
             """
-            if self.enable_reuse and not self.quantizer_first_run:
-                return self.resue_outputs
+            if self._use_pointwise_ops(inputs):
+                return lut_quantizer(inputs,
+                                     lut_values=self._lut_values_torch,
+                                     signed=True,
+                                     threshold=self._threshold_torch,
+                                     lut_values_bitwidth=self.lut_values_bitwidth,
+                                     eps=self.eps,
+                                     per_channel=self.per_channel,
+                                     channel_axis=self.channel_axis,
+                                     input_rank=self.input_rank,
+                                     sorted_lut=self._sorted_lut_torch,
+                                     chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
+
+            if self.enable_reuse:
+                return self.reuse_cache.get_or_compute(inputs, self._quantize)
+            return self._quantize(inputs)
+
+        def _quantize(self, inputs: torch.Tensor) -> torch.Tensor:
+            """
+            Quantize the given inputs, bypassing the reuse cache.
+
+            Args:
+                inputs: input tensor to quantize
 
+            Returns:
+                quantized tensor.
+            """
             if self._use_custom_impl and torch.jit.is_tracing():
-                outputs = WeightsLUTSymmetricF.apply(inputs,
-                                                      self.num_bits,
-                                                      self._lut_values_np,
-                                                      self._threshold_np,
-                                                      self.lut_values_bitwidth,
-                                                      self.eps,
-                                                      self.per_channel,
-                                                      self.channel_axis,
-                                                      self.input_rank)
+                outputs = self._custom_impl_apply(inputs)
             else:
                 inputs.requires_grad = False
                 outputs = lut_quantizer(inputs,
@@ -119,14 +160,66 @@ if FOUND_TORCH:
                                          eps=self.eps,
                                          per_channel=self.per_channel,
                                          channel_axis=self.channel_axis,
-                                         input_rank=self.input_rank)
-
-            if self.enable_reuse and self.quantizer_first_run:
-                self.resue_outputs = outputs
-                self.quantizer_first_run = False
+                                         input_rank=self.input_rank,
+                                         sorted_lut=self._sorted_lut_torch,
+                                         chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
 
             return outputs
 
+        @property
+        def lut_index_bits(self) -> int:
+            """
+            Returns: Number of bits needed to index the lut values.
+            """
+            return max(1, int(np.ceil(np.log2(len(self._lut_values_np)))))
+
+        def encode_int_weights(self, inputs: torch.Tensor) -> Dict[str, torch.Tensor]:
+            """
+            Quantize the given weights and encode them as packed indices into the lut values, with the lut values
+            and thresholds.
+
+            Args:
+                inputs: weights to quantize.
+
+            Returns:
+                A dictionary of the encoded weights tensors.
+            """
+            lut_values_assignments = lut_quantizer_indices(inputs,
+                                                           lut_values=self._lut_values_torch,
+                                                           signed=True,
+                                                           threshold=self._threshold_torch,
+                                                           lut_values_bitwidth=self.lut_values_bitwidth,
+                                                           eps=self.eps,
+                                                           per_channel=self.per_channel,
+                                                           channel_axis=self.channel_axis,
+                                                           input_rank=self.input_rank,
+                                                           sorted_lut=self._sorted_lut_torch,
+                                                           chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
+            return {INT_WEIGHTS_CODES: pack_int_codes(lut_values_assignments, self.lut_index_bits),
+                    INT_WEIGHTS_LUT_VALUES: self._lut_values_torch.clone(),
+                    INT_WEIGHTS_THRESHOLDS: self._threshold_torch.clone()}
+
+        def decode_int_weights(self, encoded_weights: Dict[str, torch.Tensor], shape: Sequence[int]) -> torch.Tensor:
+            """
+            Decode weights encoded by encode_int_weights.
+
+            Args:
+                encoded_weights: A dictionary of the encoded weights tensors.
+                shape: Shape of the weights.
+
+            Returns:
+                The quantized weights.
+            """
+            lut_values_assignments = unpack_int_codes(encoded_weights[INT_WEIGHTS_CODES], self.lut_index_bits, shape)
+            return lut_dequantize(lut_values_assignments.long(),
+                                  lut_values=encoded_weights[INT_WEIGHTS_LUT_VALUES],
+                                  signed=True,
+                                  threshold=encoded_weights[INT_WEIGHTS_THRESHOLDS],
+                                  lut_values_bitwidth=self.lut_values_bitwidth,
+                                  per_channel=self.per_channel,
+                                  channel_axis=self.channel_axis,
+                                  input_rank=self.input_rank)
+
     class WeightsLUTSymmetricF(BaseWeightQuantizerAutogradFunction):
         """
         Custom autograd function for symmetric weights quantizer.
@@ -153,7 +246,8 @@ if FOUND_TORCH:
                                  eps=eps,
                                  per_channel=per_channel,
                                  channel_axis=channel_axis,
-                                 input_rank=input_rank)
+                                 input_rank=input_rank,
+                                 chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
 
         @staticmethod
         def symbolic(g,
@@ -212,7 +306,15 @@ else:
                             'Could not find torch package.')
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
+    from mct_quantizers.pytorch.onnxruntime_kernels_cache import memoize_ort_kernel
+
+
+    @functools.lru_cache(maxsize=64)
+    def _sort_lut_values_bytes(lut_values: bytes) -> Tuple[np.ndarray, np.ndarray]:
+        return sort_lut_values_np(np.frombuffer(lut_values, dtype=np.float32))
+
+
     def quantize_lut_sym_weights_numpy(input_tensor: np.ndarray,
                                        lut_values,
                                        threshold,
@@ -222,6 +324,8 @@ if FOUND_ONNXRUNTIME_EXTENSIONS:
                                        channel_axis=None,
                                        input_rank=None
                                        ):
+        # The lut values of a node are the same on every run, so they are sorted once.
+        lut_values = np.asarray(lut_values, dtype=np.float32)
         quantized_tensor = lut_quantizer_np(tensor_data=input_tensor,
                                             lut_values=lut_values,
                                             signed=True,
@@ -230,24 +334,27 @@ if FOUND_ONNXRUNTIME_EXTENSIONS:
                                             eps=eps,
                                             per_channel=per_channel,
                                             channel_axis=channel_axis,
-                                            input_rank=input_rank)
+                                            input_rank=input_rank,
+                                            sorted_lut=_sort_lut_values_bytes(lut_values.tobytes()),
+                                            chunk_size=LUT_ASSIGNMENT_CHUNK_SIZE)
         return quantized_tensor
 
 
     # Add onnx op function to use during onnxruntime WeightsLUTSymmetricQuantizer op inference
     # Using this decorator the op WeightsLUTSymmetricQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsLUTSymmetricQuantizer",
-             inputs=[PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={
-                 "lut_values_bitwidth": PyCustomOpDef.dt_int64,
-                 "eps": PyCustomOpDef.dt_float,
-                 "per_channel": PyCustomOpDef.dt_int64,
-                 "channel_axis": PyCustomOpDef.dt_int64,
-                 "input_rank": PyCustomOpDef.dt_int64
-             })
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsLUTSymmetricQuantizer",
+                   inputs=[OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={
+                       "lut_values_bitwidth": OrtCustomOpType.dt_int64,
+                       "eps": OrtCustomOpType.dt_float,
+                       "per_channel": OrtCustomOpType.dt_int64,
+                       "channel_axis": OrtCustomOpType.dt_int64,
+                       "input_rank": OrtCustomOpType.dt_int64
+                   })
+    @memoize_ort_kernel
     def weight_lut_sym_ort(input_tensor: np.ndarray,
                            lut_values: np.ndarray,
                            threshold: np.ndarray,
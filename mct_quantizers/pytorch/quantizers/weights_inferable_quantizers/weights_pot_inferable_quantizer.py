@@ -67,9 +67,9 @@ if FOUND_TORCH:
                 np.round(np.log2(self.threshold_np.flatten())) == np.log2(self.threshold_np.flatten()))
             assert is_threshold_pot, f'Expected threshold to be power of 2 but is {threshold}'
 
-        def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        def _custom_impl_apply(self, inputs: torch.Tensor) -> torch.Tensor:
             """
-            Quantize the given inputs using the quantizer parameters.
+            Quantize the inputs with the custom autograd function, which is exported to ONNX as a custom op.
 
             Args:
                 inputs: input tensor to quantize
@@ -77,23 +77,11 @@ if FOUND_TORCH:
             Returns:
                 quantized tensor.
             """
-            if self.enable_reuse and not self.quantizer_first_run:
-                return self.resue_outputs
-
-            if self._use_custom_impl and torch.jit.is_tracing():
-                outputs = WeightsPOTF.apply(inputs,
-                                             self.num_bits,
-                                             self.threshold_np,
-                                             self.per_channel,
-                                             self.channel_axis)
-            else:
-                outputs = super(WeightsPOTInferableQuantizer, self).__call__(inputs)
-
-            if self.enable_reuse and self.quantizer_first_run:
-                self.resue_outputs = outputs
-                self.quantizer_first_run = False
-
-            return outputs
+            return WeightsPOTF.apply(inputs,
+                                     self.num_bits,
+                                     self.threshold_np,
+                                     self.per_channel,
+                                     self.channel_axis)
 
     class WeightsPOTF(BaseWeightQuantizerAutogradFunction):
         """
@@ -162,23 +150,25 @@ else:
                             'Could not find torch package.')
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
+    from mct_quantizers.pytorch.onnxruntime_kernels_cache import memoize_ort_kernel
     from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_symmetric_inferable_quantizer import \
         quantize_sym_weights_numpy
 
 
     # Add onnx op function to use during onnxruntime WeightsPOTQuantizer op inference
     # Using this decorator the op WeightsPOTQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsPOTQuantizer",
-             inputs=[PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={
-                 "num_bits": PyCustomOpDef.dt_int64,
-                 "per_channel": PyCustomOpDef.dt_int64,
-                 "channel_axis": PyCustomOpDef.dt_int64,
-             }
-             )
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsPOTQuantizer",
+                   inputs=[OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={
+                       "num_bits": OrtCustomOpType.dt_int64,
+                       "per_channel": OrtCustomOpType.dt_int64,
+                       "channel_axis": OrtCustomOpType.dt_int64,
+                   }
+                   )
+    @memoize_ort_kernel
     def weight_pot_ort(input_tensor: np.ndarray, threshold: np.ndarray, **kwargs):
         return quantize_sym_weights_numpy(input_tensor,
                                           kwargs["num_bits"],
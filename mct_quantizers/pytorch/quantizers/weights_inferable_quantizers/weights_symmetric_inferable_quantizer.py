@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+from typing import List, Dict, Sequence
 
 import numpy as np
 
@@ -24,7 +24,8 @@ from mct_quantizers.pytorch.onnxruntime_validations import validate_weight_param
 if FOUND_TORCH:
     import torch
     from mct_quantizers.pytorch.quantizers.base_symmetric_inferable_quantizer import BaseSymmetricInferableQuantizer
-    from mct_quantizers.pytorch.quantizer_utils import to_torch_tensor, get_working_device
+    from mct_quantizers.pytorch.quantizer_utils import to_torch_tensor, get_working_device, \
+        encode_uniform_int_weights, decode_uniform_int_weights, fake_quantize, qdq_fake_quantize
     from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.base_weight_quantizer_autograd_function import \
         BaseWeightQuantizerAutogradFunction
 
@@ -111,10 +112,27 @@ if FOUND_TORCH:
             self.per_channel = per_channel
             self.channel_axis = channel_axis
 
-            self.scales = to_torch_tensor(self.scales).to(get_working_device())
-            self.zero_points = torch.zeros(len(threshold), dtype=torch.int32).to(get_working_device())
+            self._register_quantization_buffer('scales', to_torch_tensor(self.scales).to(get_working_device()))
+            self._register_quantization_buffer('zero_points',
+                                               torch.zeros(len(threshold), dtype=torch.int32, device=get_working_device()))
 
 
+        def _custom_impl_apply(self, inputs: torch.Tensor) -> torch.Tensor:
+            """
+            Quantize the inputs with the custom autograd function, which is exported to ONNX as a custom op.
+
+            Args:
+                inputs: input tensor to quantize
+
+            Returns:
+                quantized tensor.
+            """
+            return WeightsSymmetricF.apply(inputs,
+                                           self.num_bits,
+                                           self.threshold_np,
+                                           self.per_channel,
+                                           self.channel_axis)
+
         def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
             """
             Quantize the given inputs using the quantizer parameters.
@@ -125,15 +143,37 @@ if FOUND_TORCH:
             Returns:
                 quantized tensor.
             """
-            if self.enable_reuse and not self.quantizer_first_run:
-                return self.resue_outputs
-
-            if self._use_custom_impl and torch.jit.is_tracing():
-                outputs = WeightsSymmetricF.apply(inputs,
-                                                   self.num_bits,
-                                                   self.threshold_np,
-                                                   self.per_channel,
-                                                   self.channel_axis)
+            if self._use_pointwise_ops(inputs):
+                return fake_quantize(inputs,
+                                     scale=self.scales,
+                                     zero_point=self.zero_points,
+                                     quant_min=self.min_quantized_domain,
+                                     quant_max=self.max_quantized_domain,
+                                     axis=self.channel_axis if self.per_channel else None)
+
+            if self.enable_reuse:
+                return self.reuse_cache.get_or_compute(inputs, self._quantize)
+            return self._quantize(inputs)
+
+        def _quantize(self, inputs: torch.Tensor) -> torch.Tensor:
+            """
+            Quantize the given inputs, bypassing the reuse cache.
+
+            Args:
+                inputs: input tensor to quantize
+
+            Returns:
+                quantized tensor.
+            """
+            if self._use_custom_impl and torch.jit.is_tracing() and self._export_as_qdq():
+                outputs = qdq_fake_quantize(inputs,
+                                            scale=self.scales.flatten() if self.per_channel else self.scales,
+                                            zero_point=self.zero_points.flatten() if self.per_channel else self.zero_points,
+                                            quant_min=self.min_quantized_domain,
+                                            quant_max=self.max_quantized_domain,
+                                            axis=self.channel_axis if self.per_channel else None)
+            elif self._use_custom_impl and torch.jit.is_tracing():
+                outputs = self._custom_impl_apply(inputs)
             elif self.per_channel:
                 inputs.requires_grad = False
                 outputs = torch.fake_quantize_per_channel_affine(inputs,
@@ -150,12 +190,42 @@ if FOUND_TORCH:
                                                                  quant_min=self.min_quantized_domain,
                                                                  quant_max=self.max_quantized_domain)
 
-            if self.enable_reuse and self.quantizer_first_run:
-                self.resue_outputs = outputs
-                self.quantizer_first_run = False
-
             return outputs
 
+        def encode_int_weights(self, inputs: torch.Tensor) -> Dict[str, torch.Tensor]:
+            """
+            Quantize the given weights and encode them as integer codes with their scales and zero points.
+
+            Args:
+                inputs: weights to quantize.
+
+            Returns:
+                A dictionary of the encoded weights tensors.
+            """
+            return encode_uniform_int_weights(self(inputs),
+                                              scales=self.scales,
+                                              zero_points=self.zero_points,
+                                              quant_min=self.min_quantized_domain,
+                                              num_bits=self.num_bits,
+                                              per_channel=self.per_channel,
+                                              channel_axis=self.channel_axis)
+
+        def decode_int_weights(self, encoded_weights: Dict[str, torch.Tensor], shape: Sequence[int]) -> torch.Tensor:
+            """
+            Decode weights encoded by encode_int_weights.
+
+            Args:
+                encoded_weights: A dictionary of the encoded weights tensors.
+                shape: Shape of the weights.
+
+            Returns:
+                The quantized weights.
+            """
+            return decode_uniform_int_weights(encoded_weights,
+                                              quant_min=self.min_quantized_domain,
+                                              num_bits=self.num_bits,
+                                              shape=shape)
+
     class WeightsSymmetricF(BaseWeightQuantizerAutogradFunction):
         """
         Custom autograd function for symmetric weights quantizer.
@@ -224,7 +294,8 @@ else:
                             'Could not find torch package.')
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
+    from mct_quantizers.pytorch.onnxruntime_kernels_cache import memoize_ort_kernel
     def quantize_sym_weights_numpy(input_tensor: np.ndarray,
                                    num_bits: int,
                                    threshold: np.ndarray,
@@ -267,15 +338,16 @@ if FOUND_ONNXRUNTIME_EXTENSIONS:
 
     # Add onnx op function to use during onnxruntime WeightsSymmetricQuantizer op inference
     # Using this decorator the op WeightsSymmetricQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsSymmetricQuantizer",
-             inputs=[PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={
-                 "num_bits": PyCustomOpDef.dt_int64,
-                 "per_channel": PyCustomOpDef.dt_int64,
-                 "channel_axis": PyCustomOpDef.dt_int64,
-             })
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsSymmetricQuantizer",
+                   inputs=[OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={
+                       "num_bits": OrtCustomOpType.dt_int64,
+                       "per_channel": OrtCustomOpType.dt_int64,
+                       "channel_axis": OrtCustomOpType.dt_int64,
+                   })
+    @memoize_ort_kernel
     def weight_sym_ort(input_tensor: np.ndarray,
                        threshold: np.ndarray,
                        **kwargs):
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+from typing import List, Dict, Sequence
 
 import numpy as np
 
@@ -26,7 +26,8 @@ from mct_quantizers.pytorch.onnxruntime_validations import validate_weight_param
 if FOUND_TORCH:
     import torch
     from mct_quantizers.pytorch.quantizers.base_uniform_inferable_quantizer import BaseUniformInferableQuantizer
-    from mct_quantizers.pytorch.quantizer_utils import fix_range_to_include_zero, get_working_device, to_torch_tensor
+    from mct_quantizers.pytorch.quantizer_utils import fix_range_to_include_zero, get_working_device, to_torch_tensor, \
+        encode_uniform_int_weights, decode_uniform_int_weights, fake_quantize, qdq_fake_quantize
     from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.base_weight_quantizer_autograd_function import \
         BaseWeightQuantizerAutogradFunction
 
@@ -120,11 +121,11 @@ if FOUND_TORCH:
             self.adjusted_max_range_np = self.max_range.cpu().numpy()
 
             # Compute the step size of quantized values.
-            self.scales = (self.max_range - self.min_range) / (2 ** num_bits - 1)
-            self.zero_points = -(self.min_range / self.scales).int()  # zp has to be positive, and a <=0, so we multiply by -1
+            scales = (self.max_range - self.min_range) / (2 ** num_bits - 1)
+            zero_points = -(self.min_range / scales).int()  # zp has to be positive, and a <=0, so we multiply by -1
 
-            self.scales = self.scales.to(get_working_device())
-            self.zero_points = self.zero_points.to(get_working_device())
+            self._register_quantization_buffer('scales', scales.to(get_working_device()))
+            self._register_quantization_buffer('zero_points', zero_points.to(get_working_device()))
 
         def __call__(self,
                      inputs: torch.Tensor) -> torch.Tensor:
@@ -136,10 +137,36 @@ if FOUND_TORCH:
             Returns:
                 quantized weights
             """
-            if self.enable_reuse and not self.quantizer_first_run:
-                return self.resue_outputs
+            if self._use_pointwise_ops(inputs):
+                return fake_quantize(inputs,
+                                     scale=self.scales.flatten(),
+                                     zero_point=self.zero_points.flatten(),
+                                     quant_min=self.min_quantized_domain,
+                                     quant_max=self.max_quantized_domain,
+                                     axis=self.channel_axis if self.per_channel else None)
+
+            if self.enable_reuse:
+                return self.reuse_cache.get_or_compute(inputs, self._quantize)
+            return self._quantize(inputs)
+
+        def _quantize(self, inputs: torch.Tensor) -> torch.Tensor:
+            """
+            Quantize the given inputs, bypassing the reuse cache.
+
+            Args:
+                inputs: input tensor to quantize
 
-            if self._use_custom_impl and torch.jit.is_tracing():
+            Returns:
+                quantized tensor.
+            """
+            if self._use_custom_impl and torch.jit.is_tracing() and self._export_as_qdq():
+                outputs = qdq_fake_quantize(inputs,
+                                            scale=self.scales.flatten() if self.per_channel else self.scales,
+                                            zero_point=self.zero_points.flatten() if self.per_channel else self.zero_points,
+                                            quant_min=self.min_quantized_domain,
+                                            quant_max=self.max_quantized_domain,
+                                            axis=self.channel_axis if self.per_channel else None)
+            elif self._use_custom_impl and torch.jit.is_tracing():
                 outputs = WeightsUniformF.apply(inputs,
                                                  self.num_bits,
                                                  self.adjusted_min_range_np,
@@ -147,7 +174,6 @@ if FOUND_TORCH:
                                                  self.per_channel,
                                                  self.channel_axis)
 
-
             elif self.per_channel:
                 inputs.requires_grad = False
                 outputs = torch.fake_quantize_per_channel_affine(inputs,
@@ -164,12 +190,42 @@ if FOUND_TORCH:
                                                                  quant_min=self.min_quantized_domain,
                                                                  quant_max=self.max_quantized_domain)
 
-            if self.enable_reuse and self.quantizer_first_run:
-                self.resue_outputs = outputs
-                self.quantizer_first_run = False
-
             return outputs
 
+        def encode_int_weights(self, inputs: torch.Tensor) -> Dict[str, torch.Tensor]:
+            """
+            Quantize the given weights and encode them as integer codes with their scales and zero points.
+
+            Args:
+                inputs: weights to quantize.
+
+            Returns:
+                A dictionary of the encoded weights tensors.
+            """
+            return encode_uniform_int_weights(self(inputs),
+                                              scales=self.scales,
+                                              zero_points=self.zero_points,
+                                              quant_min=self.min_quantized_domain,
+                                              num_bits=self.num_bits,
+                                              per_channel=self.per_channel,
+                                              channel_axis=self.channel_axis)
+
+        def decode_int_weights(self, encoded_weights: Dict[str, torch.Tensor], shape: Sequence[int]) -> torch.Tensor:
+            """
+            Decode weights encoded by encode_int_weights.
+
+            Args:
+                encoded_weights: A dictionary of the encoded weights tensors.
+                shape: Shape of the weights.
+
+            Returns:
+                The quantized weights.
+            """
+            return decode_uniform_int_weights(encoded_weights,
+                                              quant_min=self.min_quantized_domain,
+                                              num_bits=self.num_bits,
+                                              shape=shape)
+
     class WeightsUniformF(BaseWeightQuantizerAutogradFunction):
         """
         Custom autograd function for uniform weights quantizer.
@@ -241,7 +297,8 @@ else:
                          'Could not find torch package.')
 
 if FOUND_ONNXRUNTIME_EXTENSIONS:
-    from onnxruntime_extensions import onnx_op, PyCustomOpDef
+    from mct_quantizers.pytorch.onnxruntime_custom_ops import ort_custom_op, OrtCustomOpType
+    from mct_quantizers.pytorch.onnxruntime_kernels_cache import memoize_ort_kernel
 
     def quantize_uniform_weights_numpy(input_tensor: np.ndarray,
                                        num_bits: int,
@@ -291,18 +348,19 @@ if FOUND_ONNXRUNTIME_EXTENSIONS:
 
     # Add onnx op function to use during onnxruntime WeightsUniformQuantizer op inference
     # Using this decorator the op WeightsUniformQuantizer is defined using its inputs, outputs and attributes.
-    @onnx_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsUniformQuantizer",
-             inputs=[PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float,
-                     PyCustomOpDef.dt_float
-                     ],
-             outputs=[PyCustomOpDef.dt_float],
-             attrs={
-                 "num_bits": PyCustomOpDef.dt_int64,
-                 "per_channel": PyCustomOpDef.dt_int64,
-                 "channel_axis": PyCustomOpDef.dt_int64,
-             }
-             )
+    @ort_custom_op(op_type=f"{ONNX_CUSTOM_OP_DOMAIN}::WeightsUniformQuantizer",
+                   inputs=[OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float,
+                           OrtCustomOpType.dt_float
+                           ],
+                   outputs=[OrtCustomOpType.dt_float],
+                   attrs={
+                       "num_bits": OrtCustomOpType.dt_int64,
+                       "per_channel": OrtCustomOpType.dt_int64,
+                       "channel_axis": OrtCustomOpType.dt_int64,
+                   }
+                   )
+    @memoize_ort_kernel
     def weight_uniform_ort(x, min_range, max_range, **kwargs):
         return quantize_uniform_weights_numpy(x,
                                               kwargs["num_bits"],
@@ -406,3 +406,32 @@ class TestKerasWeightsInferableQuantizers(unittest.TestCase):
         input_tensor = tf.constant(np.random.rand(2, 3, 4, 5), dtype=tf.float32)
         fake_quantized_tensor = quantizer(input_tensor)
         self.assertTrue(np.linalg.norm(fake_quantized_tensor - input_tensor) < 0.04)
+
+    def test_per_channel_quantizer_matches_tf_fake_quant(self):
+        input_shape = (3, 4, 16, 8)
+        for channel_axis in range(-len(input_shape), len(input_shape)):
+            for num_bits in [2, 8]:
+                num_channels = input_shape[channel_axis]
+                min_range = (-np.random.rand(num_channels) * 2 - 0.01).tolist()
+                max_range = (np.random.rand(num_channels) * 2 + 0.01).tolist()
+                quantizer = WeightsUniformInferableQuantizer(num_bits=num_bits,
+                                                             per_channel=True,
+                                                             min_range=min_range,
+                                                             max_range=max_range,
+                                                             channel_axis=channel_axis,
+                                                             input_rank=len(input_shape))
+                input_tensor = tf.constant(np.random.randn(*input_shape) * 2, dtype=tf.float32)
+
+                # Quantize with tf's per-channel fake quant op along the last axis.
+                perm_vec = list(range(len(input_shape)))
+                perm_vec[channel_axis], perm_vec[-1] = perm_vec[-1], perm_vec[channel_axis]
+                with tf.GradientTape(persistent=True) as tape:
+                    tape.watch(input_tensor)
+                    expected_tensor = tf.transpose(tf.quantization.fake_quant_with_min_max_vars_per_channel(
+                        tf.transpose(input_tensor, perm_vec), min=quantizer.min_range_np, max=quantizer.max_range_np,
+                        num_bits=num_bits), perm_vec)
+                    fake_quantized_tensor = quantizer(input_tensor)
+
+                self.assertTrue(np.array_equal(fake_quantized_tensor.numpy(), expected_tensor.numpy()))
+                self.assertTrue(np.array_equal(tape.gradient(fake_quantized_tensor, input_tensor).numpy(),
+                                               tape.gradient(expected_tensor, input_tensor).numpy()))
@@ -17,6 +17,8 @@ import unittest
 import numpy as np
 import tensorflow as tf
 
+from mct_quantizers.common.quant_utils import sort_lut_values_np
+from mct_quantizers.keras.quantizer_utils import lut_nearest_indices
 from mct_quantizers.keras.quantizers.weights_inferable_quantizers.weights_lut_pot_inferable_quantizer import \
     WeightsLUTPOTInferableQuantizer
 from mct_quantizers.keras.quantizers.weights_inferable_quantizers.weights_lut_symmetric_inferable_quantizer import \
@@ -232,3 +234,17 @@ class TestKerasWeightsLutQuantizers(unittest.TestCase):
         fake_quantized_tensor = quantizer(input_tensor)
         self.assertTrue(np.linalg.norm(fake_quantized_tensor - input_tensor) < 0.04)
 
+    def test_lut_nearest_indices(self):
+        # Unsorted lut values with repeated values.
+        lut_values = np.array([17, -64, 3, 0, 3, -100, 127, -64, 50], dtype=np.float32)
+        sorted_values = np.unique(lut_values)
+        # Values exactly half-way between lut values must be assigned to the first index, like argmin does.
+        tensor = np.concatenate([300 * np.random.rand(500) - 150,
+                                 sorted_values,
+                                 (sorted_values[1:] + sorted_values[:-1]) / 2]).astype(np.float32).reshape(-1, 3)
+        expected = np.argmin(np.abs(tensor[..., None] - lut_values.reshape(1, 1, -1)), axis=-1)
+        indices = lut_nearest_indices(tf.constant(tensor), *sort_lut_values_np(lut_values))
+        self.assertTrue(np.array_equal(indices.numpy(), expected))
+        # A chunk size that does not divide the number of values.
+        indices = lut_nearest_indices(tf.constant(tensor), *sort_lut_values_np(lut_values), chunk_size=100)
+        self.assertTrue(np.array_equal(indices.numpy(), expected))
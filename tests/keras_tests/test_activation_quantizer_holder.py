@@ -79,3 +79,17 @@ class TestKerasActivationQuantizationHolder(unittest.TestCase):
                                                              ActivationPOTInferableQuantizer.__name__: ActivationPOTInferableQuantizer})
         os.remove(tmp_h5_file)
         loaded_model(x)
+
+    def test_replaced_quantizer_gets_training(self):
+        class TrainingQuantizer:
+            def __call__(self, inputs, training):
+                return inputs + 1. if training else inputs
+
+        holder = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[8.],
+                                                                                   signed=True))
+        x = tf.constant([[0.5, -1.5]])
+        holder(x)
+        # The quantizer call arguments are resolved again for a quantizer that replaces the built quantizer.
+        holder.activation_holder_quantizer = TrainingQuantizer()
+        self.assertTrue(np.array_equal(holder(x, training=True), x + 1.))
+        self.assertTrue(np.array_equal(holder(x, training=False), x))
@@ -0,0 +1,169 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+from packaging import version
+
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+if version.parse(tf.__version__) >= version.parse("2.13"):
+    from keras.src.layers.core import TFOpLambda
+else:
+    from keras.layers.core import TFOpLambda
+
+from mct_quantizers.common.constants import QUANTIZED_POSITIONAL_WEIGHT
+from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
+from mct_quantizers.keras.export_model import keras_export_tflite_model, keras_tflite_model_parity
+from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
+from mct_quantizers.keras.quantizers import ActivationLutPOTInferableQuantizer, ActivationPOTInferableQuantizer, \
+    ActivationSymmetricInferableQuantizer, WeightsPOTInferableQuantizer, WeightsSymmetricInferableQuantizer, \
+    WeightsUniformInferableQuantizer
+
+
+def _holder(threshold, signed=True):
+    return KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[threshold],
+                                                                             signed=signed))
+
+
+class TestKerasExportModel(unittest.TestCase):
+
+    def _wrapper_attributes(self, wrapper):
+        attributes = {name: getattr(wrapper.layer, name) for name in wrapper.weights_quantizers
+                      if isinstance(name, str)}
+        attributes.update({name: getattr(wrapper, name) for name in vars(wrapper)
+                           if name.startswith(QUANTIZED_POSITIONAL_WEIGHT)})
+        attributes.update({f'weights_{i}': w for i, w in enumerate(wrapper.weights + wrapper.layer.weights)})
+        return attributes
+
+    def _tensor_scales(self, tflite_model):
+        interpreter = tf.lite.Interpreter(model_content=tflite_model)
+        return [d['quantization_parameters']['scales'] for d in interpreter.get_tensor_details()]
+
+    def _assert_has_scales(self, tflite_model, scales):
+        self.assertTrue(any(len(s) == len(scales) and np.allclose(s, scales, rtol=1e-6)
+                            for s in self._tensor_scales(tflite_model)), scales)
+
+    def test_export_tflite_model(self):
+        conv_thresholds = np.random.rand(8) + 0.5
+        dense_thresholds = np.random.rand(10) * 0.1 + 0.05
+        inputs = keras.layers.Input((16, 16, 3))
+        x = _holder(4.)(inputs)
+        x = KerasQuantizationWrapper(keras.layers.Conv2D(8, 3, activation='relu'),
+                                     {'kernel': WeightsSymmetricInferableQuantizer(
+                                         num_bits=8, threshold=conv_thresholds.tolist(), per_channel=True,
+                                         channel_axis=3, input_rank=4)})(x)
+        x = _holder(4., signed=False)(x)
+        y = KerasQuantizationWrapper(keras.layers.DepthwiseConv2D(3, padding='same'),
+                                     {'depthwise_kernel': WeightsPOTInferableQuantizer(
+                                         num_bits=8, threshold=[1.] * 8, per_channel=True, channel_axis=2,
+                                         input_rank=4)})(x)
+        y = _holder(4.)(y)
+        x = _holder(8.)(keras.layers.Add()([x, y]))
+        x = KerasQuantizationWrapper(TFOpLambda(tf.add),
+                                     {1: WeightsSymmetricInferableQuantizer(num_bits=8, threshold=[2.],
+                                                                            per_channel=False)},
+                                     {1: np.random.randn(8).astype(np.float32)})(x)
+        x = _holder(8.)(x)
+        x = keras.layers.Flatten()(keras.layers.MaxPooling2D()(x))
+        x = KerasQuantizationWrapper(keras.layers.Dense(10),
+                                     {'kernel': WeightsSymmetricInferableQuantizer(
+                                         num_bits=8, threshold=dense_thresholds.tolist(), per_channel=True,
+                                         channel_axis=1, input_rank=2)})(x)
+        outputs = _holder(8.)(x)
+        x = KerasQuantizationWrapper(keras.layers.Dense(5),
+                                     {'kernel': WeightsSymmetricInferableQuantizer(num_bits=4, threshold=[0.5],
+                                                                                   per_channel=False)})(outputs)
+        model = keras.Model(inputs=inputs, outputs=[outputs, _holder(8.)(x)])
+
+        x = np.random.randn(4, 16, 16, 3) * 2
+        outputs = [y.numpy() for y in model(x)]
+        wrappers = [layer for layer in model.layers if isinstance(layer, KerasQuantizationWrapper)]
+        wrappers_attributes = [self._wrapper_attributes(wrapper) for wrapper in wrappers]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'model.tflite')
+            tflite_model = keras_export_tflite_model(model, path)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), tflite_model)
+
+        # The weights and activations scales are those of the quantizers.
+        self._assert_has_scales(tflite_model, conv_thresholds / 128)
+        self._assert_has_scales(tflite_model, np.ones(8) / 128)
+        self._assert_has_scales(tflite_model, dense_thresholds / 128)
+        self._assert_has_scales(tflite_model, [0.5 / 8])
+        self._assert_has_scales(tflite_model, [2. / 128])
+        self._assert_has_scales(tflite_model, [4. / 256])
+
+        interpreter = tf.lite.Interpreter(model_content=tflite_model)
+        self.assertTrue(all(d['dtype'] == np.int8 for d in
+                            interpreter.get_input_details() + interpreter.get_output_details()))
+        # The Dense layer with a per-channel kernel is a 1x1 convolution.
+        self.assertEqual([op['op_name'] for op in interpreter._get_ops_details()].count('CONV_2D'), 2)
+
+        # The export doesn't change the model.
+        for wrapper, attributes in zip(wrappers, wrappers_attributes):
+            for name, value in self._wrapper_attributes(wrapper).items():
+                self.assertIs(value, attributes[name], f'{wrapper.name}: {name}')
+        for y, expected_y in zip(model(x), outputs):
+            self.assertTrue(np.array_equal(y.numpy(), expected_y))
+
+        parity = keras_tflite_model_parity(model, tflite_model, x)
+        self.assertEqual(set(parity), set(model.output_names))
+        self.assertLessEqual(parity[model.output_names[0]]['max_steps'], 1)
+        # The second output is computed from the first one, so a step of the first output may add up with a step of
+        # the Dense layer in between.
+        self.assertLessEqual(parity[model.output_names[1]]['max_steps'], 2)
+
+    def test_export_nested_model_with_inputs(self):
+        nested_model = keras.Sequential([
+            keras.layers.Input((8,)),
+            KerasQuantizationWrapper(keras.layers.Dense(8),
+                                     {'kernel': WeightsSymmetricInferableQuantizer(num_bits=8, threshold=[1.],
+                                                                                   per_channel=False)}),
+            _holder(8.)])
+        inputs = [keras.layers.Input((8,)), keras.layers.Input((8,))]
+        x = keras.layers.Concatenate()([nested_model(_holder(4.)(inputs[0])), _holder(8.)(inputs[1])])
+        model = keras.Model(inputs=inputs, outputs=_holder(8.)(x))
+
+        tflite_model = keras_export_tflite_model(model)
+        parity = keras_tflite_model_parity(model, tflite_model, [np.random.randn(3, 8), np.random.randn(3, 8)])
+        self.assertLessEqual(parity[model.output_names[0]]['max_steps'], 1)
+
+    def test_export_unsupported_quantizers(self):
+        weights_quantizer = lambda: WeightsSymmetricInferableQuantizer(num_bits=8, threshold=[1.], per_channel=False)
+
+        def _model(input_holder, weights_quantizer, output_holder):
+            inputs = keras.layers.Input((8,))
+            x = input_holder(inputs) if input_holder is not None else inputs
+            x = KerasQuantizationWrapper(keras.layers.Dense(8), {'kernel': weights_quantizer})(x)
+            return keras.Model(inputs=inputs, outputs=output_holder(x))
+
+        models = [
+            (_model(_holder(4.), weights_quantizer(), KerasActivationQuantizationHolder(
+                ActivationLutPOTInferableQuantizer(num_bits=4, lut_values=[-25., 25.], threshold=[2.], signed=True))),
+             'Only uniform, symmetric and power-of-two activation quantizers of 8 bits'),
+            (_model(_holder(4.), weights_quantizer(), KerasActivationQuantizationHolder(
+                ActivationSymmetricInferableQuantizer(num_bits=4, threshold=[2.], signed=True))),
+             'Only uniform, symmetric and power-of-two activation quantizers of 8 bits'),
+            (_model(_holder(4.), WeightsUniformInferableQuantizer(num_bits=8, min_range=[-0.5], max_range=[1.],
+                                                                  per_channel=False), _holder(8.)),
+             'TFLite weights are quantized symmetrically'),
+            (_model(None, weights_quantizer(), _holder(8.)), 'is not quantized'),
+        ]
+        for model, message in models:
+            with self.assertRaises(Exception) as e:
+                keras_export_tflite_model(model)
+            self.assertIn(message, str(e.exception))
@@ -26,6 +26,7 @@ if version.parse(tf.__version__) >= version.parse("2.13"):
 else:
     from keras.layers.core import TFOpLambda
 
+from mct_quantizers.common.constants import POSITIONAL_WEIGHT_REFERENCE, REFERENCE_POSITIONAL_WEIGHTS, WEIGHTS_VALUES
 from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
 from mct_quantizers.keras.load_model import keras_load_quantized_model
 from mct_quantizers.keras.metadata import add_metadata, get_metadata
@@ -236,3 +237,73 @@ class TestKerasLoadModel(unittest.TestCase):
         os.remove(tmp_keras_file)
 
         self.assertTrue(get_metadata(loaded_model) == get_metadata(model))
+
+    def test_save_and_load_large_positional_weight(self):
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False, threshold=[4.])
+        small_value = np.random.randn(16).astype(np.float32)
+        large_value = np.random.randn(64, 128).astype(np.float32)
+        _input = tf.keras.layers.Input((64,))
+        x = KerasQuantizationWrapper(TFOpLambda(tf.matmul), {1: quantizer}, {1: large_value},
+                                     reference_positional_weights=True)(_input)
+        x = KerasQuantizationWrapper(TFOpLambda(tf.add), {1: quantizer}, {1: small_value},
+                                     reference_positional_weights=True)(x[:, :16])
+        model = tf.keras.Model(inputs=_input, outputs=x)
+        large_wrapper, small_wrapper = model.layers[1], model.layers[3]
+
+        # The large weight is referenced from the config, and the small weight is serialized in it.
+        large_config = large_wrapper.get_config()[WEIGHTS_VALUES][1]
+        self.assertEqual(large_config, {'class_name': POSITIONAL_WEIGHT_REFERENCE,
+                                        'config': {'shape': [64, 128], 'dtype': 'float32'}})
+        self.assertEqual(small_wrapper.get_config()[WEIGHTS_VALUES][1]['config']['value'], small_value.tolist())
+        self.assertLess(len(model.to_json()), large_value.size)
+
+        x = np.random.randn(2, 64).astype(np.float32)
+        pred = model(x)
+        for suffix in ['.h5', '.keras']:
+            _, tmp_file = tempfile.mkstemp(suffix)
+            keras.models.save_model(model, tmp_file)
+            loaded_model = keras_load_quantized_model(tmp_file)
+            os.remove(tmp_file)
+
+            self.assertTrue(np.array_equal(loaded_model(x), pred))
+            self.assertTrue(np.array_equal(np.asarray(loaded_model.layers[1].weight_values[1]), large_value))
+            loaded_config = loaded_model.layers[1].get_config()
+            self.assertTrue(loaded_config[REFERENCE_POSITIONAL_WEIGHTS])
+            self.assertEqual(loaded_config[WEIGHTS_VALUES][1]['class_name'], POSITIONAL_WEIGHT_REFERENCE)
+
+    def test_large_positional_weight_serialized_by_default(self):
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False, threshold=[4.])
+        large_value = np.random.randn(64, 128).astype(np.float32)
+        _input = tf.keras.layers.Input((64,))
+        model = tf.keras.Model(inputs=_input, outputs=KerasQuantizationWrapper(TFOpLambda(tf.matmul), {1: quantizer},
+                                                                              {1: large_value})(_input))
+        # The config is readable by older versions.
+        config = model.layers[1].get_config()
+        self.assertNotIn(REFERENCE_POSITIONAL_WEIGHTS, config)
+        self.assertEqual(config[WEIGHTS_VALUES][1]['config']['value'], large_value.tolist())
+        wrapper = KerasQuantizationWrapper.from_config(config)
+        self.assertTrue(np.array_equal(np.asarray(wrapper.weight_values[1]), large_value))
+
+    def test_clone_model_with_large_positional_weight(self):
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False, threshold=[4.])
+        large_value = np.random.randn(64, 128).astype(np.float32)
+        _input = tf.keras.layers.Input((64,))
+        model = tf.keras.Model(inputs=_input, outputs=KerasQuantizationWrapper(TFOpLambda(tf.matmul), {1: quantizer},
+                                                                              {1: large_value},
+                                                                              reference_positional_weights=True)(_input))
+        x = np.random.randn(2, 64).astype(np.float32)
+
+        # Like the layers weights, the referenced weights get their values from the model weights.
+        cloned_model = keras.models.clone_model(model)
+        self.assertFalse(np.any(cloned_model.layers[1].weight_values[1]))
+        cloned_model.set_weights(model.get_weights())
+        self.assertTrue(np.array_equal(np.asarray(cloned_model.layers[1].weight_values[1]), large_value))
+        self.assertTrue(np.array_equal(cloned_model(x), model(x)))
+
+    def test_unbuilt_wrapper_serializes_large_positional_weight(self):
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False, threshold=[4.])
+        large_value = np.random.randn(64, 128).astype(np.float32)
+        wrapper = KerasQuantizationWrapper(TFOpLambda(tf.matmul), {1: quantizer}, {1: large_value},
+                                           reference_positional_weights=True)
+        # The weight isn't stored in a variable before the wrapper is built, so it's serialized in the config.
+        self.assertEqual(wrapper.get_config()[WEIGHTS_VALUES][1]['config']['value'], large_value.tolist())
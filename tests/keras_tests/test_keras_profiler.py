@@ -0,0 +1,70 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+
+from mct_quantizers import KerasActivationQuantizationHolder, KerasQuantizationProfiler, KerasQuantizationWrapper
+from mct_quantizers.keras.quantizers import ActivationPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
+
+
+class TestKerasQuantizationProfiler(unittest.TestCase):
+
+    def setUp(self):
+        inputs = keras.layers.Input(shape=(16, 16, 3))
+        weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True, threshold=[0.5] * 8,
+                                                               channel_axis=3, input_rank=4)
+        x = KerasQuantizationWrapper(keras.layers.Conv2D(8, 3, name='conv'), {'kernel': weights_quantizer})(inputs)
+        x = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.],
+                                                                              signed=True), name='conv_act')(x)
+        self.model = keras.Model(inputs=inputs, outputs=x)
+        self.inputs = tf.constant(np.random.randn(2, 16, 16, 3), dtype=tf.float32)
+        self.wrapper_name = self.model.layers[1].name
+
+    def test_profile_layers(self):
+        expected_outputs = self.model(self.inputs)
+        with KerasQuantizationProfiler(self.model) as profiler:
+            for _ in range(3):
+                outputs = self.model(self.inputs)
+        self.assertTrue(np.array_equal(outputs.numpy(), expected_outputs.numpy()))
+
+        records = {r['layer']: r for r in profiler.records()}
+        self.assertEqual(set(records.keys()), {self.wrapper_name, 'conv_act'})
+        wrapper_record, holder_record = records[self.wrapper_name], records['conv_act']
+        self.assertEqual(wrapper_record['type'], 'Conv2D')
+        self.assertEqual(wrapper_record['calls'], 3)
+        self.assertGreater(wrapper_record['weights_quantization_ms'], 0)
+        self.assertGreater(wrapper_record['layer_op_ms'], 0)
+        self.assertEqual(holder_record['type'], 'KerasActivationQuantizationHolder')
+        self.assertEqual(holder_record['calls'], 3)
+        self.assertGreater(holder_record['activation_quantization_ms'], 0)
+        self.assertEqual(len(profiler.report().splitlines()), 4)
+
+    def test_disabled_profiler_removes_instrumentation(self):
+        profiler = KerasQuantizationProfiler(self.model)
+        with profiler:
+            self.assertIn('call', self.model.layers[1].__dict__)
+        for layer in self.model.submodules:
+            self.assertNotIn('call', layer.__dict__)
+        self.model(self.inputs)
+        self.assertEqual(profiler.records(), [])
+
+    def test_graph_calls_are_not_profiled(self):
+        with KerasQuantizationProfiler(self.model) as profiler:
+            outputs = self.model.predict(self.inputs, verbose=0)
+        self.assertTrue(np.allclose(outputs, self.model(self.inputs).numpy()))
+        self.assertEqual(profiler.records(), [])
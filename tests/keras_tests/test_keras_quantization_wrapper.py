@@ -17,7 +17,9 @@ import unittest
 import numpy as np
 import tensorflow as tf
 
+from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
 from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
+from mct_quantizers.keras.quantizers import ActivationPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
 
 keras = tf.keras
 layers = keras.layers
@@ -117,3 +119,24 @@ class TestKerasQuantizationWrapper(unittest.TestCase):
         x = mul_wrapper.call(x)
         wrappers_output = matmul_wrapper.call(x)
         self.assertTrue(np.allclose(wrappers_output.numpy(), model_output.numpy()))
+
+    def test_xla_compiled_quantized_model(self):
+        _, conv_layer, sub_layer, mul_layer, matmul_layer = self.model.layers
+        weights_quantizer = WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True, threshold=[0.5] * 6,
+                                                               channel_axis=3, input_rank=4)
+        inputs = layers.Input(shape=self.input_shapes[0][1:])
+        x = KerasQuantizationWrapper(conv_layer, {WEIGHT: weights_quantizer})(inputs)
+        x = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[8.],
+                                                                              signed=True))(x)
+        x = KerasQuantizationWrapper(sub_layer, {0: IdentityWeightsQuantizer()}, {0: self.sub_const})(x)
+        x = KerasQuantizationWrapper(mul_layer, {1: IdentityWeightsQuantizer()}, {1: self.mul_const},
+                                     is_inputs_as_list=True)(x)
+        x = KerasQuantizationWrapper(matmul_layer, {1: IdentityWeightsQuantizer()}, {1: self.matmul_cont},
+                                     op_call_args=[False], op_call_kwargs={'transpose_b': True})(x)
+        quantized_model = keras.Model(inputs=inputs, outputs=x)
+
+        call_inputs = tf.constant(self.inputs[0], dtype=tf.float32)
+        eager_output = quantized_model(call_inputs, training=False).numpy()
+        for training in [False, None]:
+            xla_model = tf.function(lambda t: quantized_model(t, training=training), jit_compile=True)
+            self.assertTrue(np.allclose(xla_model(call_inputs).numpy(), eager_output, atol=1e-6))
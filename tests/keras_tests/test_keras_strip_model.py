@@ -0,0 +1,138 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+from packaging import version
+
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+if version.parse(tf.__version__) >= version.parse("2.13"):
+    from keras.src.layers.core import TFOpLambda
+else:
+    from keras.layers.core import TFOpLambda
+
+from mct_quantizers.keras.activation_quantization_holder import KerasActivationQuantizationHolder
+from mct_quantizers.keras.load_model import keras_load_quantized_model
+from mct_quantizers.keras.quantize_wrapper import KerasQuantizationWrapper
+from mct_quantizers.keras.quantizers import ActivationLutPOTInferableQuantizer, ActivationPOTInferableQuantizer, \
+    ActivationUniformInferableQuantizer, WeightsPOTInferableQuantizer, WeightsSymmetricInferableQuantizer, \
+    WeightsUniformInferableQuantizer
+from mct_quantizers.keras.strip_model import keras_strip_quantized_model
+
+
+def _quantized_model():
+    inputs = keras.layers.Input((16, 16, 3))
+    x = KerasQuantizationWrapper(keras.layers.Conv2D(8, 3),
+                                 {'kernel': WeightsSymmetricInferableQuantizer(num_bits=4, threshold=[0.5] * 8,
+                                                                               per_channel=True, channel_axis=3,
+                                                                               input_rank=4)})(inputs)
+    x = KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.],
+                                                                          signed=True))(x)
+    x = keras.layers.BatchNormalization()(x)
+    x = KerasQuantizationWrapper(keras.layers.DepthwiseConv2D(3),
+                                 {'depthwise_kernel': WeightsPOTInferableQuantizer(num_bits=8, threshold=[1.] * 8,
+                                                                                   per_channel=True, channel_axis=2,
+                                                                                   input_rank=4)})(x)
+    x = KerasQuantizationWrapper(TFOpLambda(tf.add),
+                                 {1: WeightsSymmetricInferableQuantizer(num_bits=8, threshold=[2.],
+                                                                        per_channel=False)},
+                                 {1: np.random.randn(8).astype(np.float32)})(x)
+    x = KerasActivationQuantizationHolder(ActivationUniformInferableQuantizer(num_bits=8, min_range=[-2.],
+                                                                              max_range=[6.]))(x)
+    x = keras.layers.Flatten()(x)
+    x = KerasQuantizationWrapper(keras.layers.Dense(10),
+                                 {'kernel': WeightsUniformInferableQuantizer(num_bits=8, min_range=[-1.],
+                                                                             max_range=[1.],
+                                                                             per_channel=False)})(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+class TestKerasStripModel(unittest.TestCase):
+
+    def test_strip_model(self):
+        model = _quantized_model()
+        x = np.random.randn(2, 16, 16, 3).astype(np.float32)
+        stripped_model = keras_strip_quantized_model(model)
+
+        self.assertFalse(any(isinstance(layer, (KerasQuantizationWrapper, KerasActivationQuantizationHolder))
+                             for layer in stripped_model.layers))
+        self.assertFalse(any('optimizer_step' in w.name for w in stripped_model.weights))
+        self.assertTrue(np.array_equal(model(x).numpy(), stripped_model(x).numpy()))
+
+        # The kernels are the quantized kernels.
+        self.assertTrue(np.array_equal(model.layers[1].get_quantized_weights()['kernel'].numpy(),
+                                       stripped_model.layers[1].kernel.numpy()))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for file_name in ['model.keras', 'model.h5']:
+                path = os.path.join(tmp_dir, file_name)
+                stripped_model.save(path)
+                loaded_model = keras.models.load_model(path)
+                self.assertTrue(np.array_equal(model(x).numpy(), loaded_model(x).numpy()), file_name)
+
+    def test_strip_shared_and_nested_layers(self):
+        weights_quantizer = lambda: WeightsSymmetricInferableQuantizer(num_bits=4, threshold=[0.5], per_channel=False)
+        nested_model = keras.Sequential([
+            keras.layers.Input((8,)),
+            KerasQuantizationWrapper(keras.layers.Dense(8), {'kernel': weights_quantizer()}),
+            KerasActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.],
+                                                                              signed=True))])
+        inputs = keras.layers.Input((8,))
+        shared_layer = KerasQuantizationWrapper(keras.layers.Dense(8), {'kernel': weights_quantizer()})
+        outputs = keras.layers.Concatenate()([shared_layer(inputs), shared_layer(nested_model(inputs))])
+        model = keras.Model(inputs=inputs, outputs=outputs)
+        x = np.random.randn(3, 8).astype(np.float32)
+
+        stripped_model = keras_strip_quantized_model(model)
+        self.assertIsInstance(stripped_model.layers[1], keras.Model)
+        self.assertEqual([type(layer) for layer in stripped_model.layers[2:]],
+                         [keras.layers.Dense, keras.layers.Concatenate])
+        self.assertEqual(len(stripped_model.layers[2].inbound_nodes), 2)
+        self.assertEqual([type(layer) for layer in stripped_model.layers[1].layers],
+                         [keras.layers.InputLayer, keras.layers.Dense, TFOpLambda])
+        self.assertTrue(np.array_equal(model(x).numpy(), stripped_model(x).numpy()))
+
+    def test_strip_model_keeps_lut_holders(self):
+        inputs = keras.layers.Input((8,))
+        outputs = KerasActivationQuantizationHolder(
+            ActivationLutPOTInferableQuantizer(num_bits=4, lut_values=[-25., 25.], threshold=[2.], signed=True))(
+            keras.layers.Dense(8)(inputs))
+        model = keras.Model(inputs=inputs, outputs=outputs)
+        x = np.random.randn(3, 8).astype(np.float32)
+
+        stripped_model = keras_strip_quantized_model(model)
+        self.assertIsInstance(stripped_model.layers[-1], KerasActivationQuantizationHolder)
+        self.assertTrue(np.array_equal(model(x).numpy(), stripped_model(x).numpy()))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'model.keras')
+            stripped_model.save(path)
+            self.assertTrue(np.array_equal(model(x).numpy(), keras_load_quantized_model(path)(x).numpy()))
+
+    def test_strip_subclassed_model(self):
+        with self.assertRaises(Exception) as e:
+            keras_strip_quantized_model(keras.Sequential([keras.layers.Dense(3)]))
+        self.assertIn('Only functional and Sequential models with known inputs can be stripped', str(e.exception))
+
+    def test_strip_model_unsupported_keras(self):
+        inputs = keras.Input((4,))
+        model = keras.Model(inputs, keras.layers.Dense(3)(inputs))
+        # Keras versions whose functional models don't have the nodes attributes are not supported.
+        model._nodes_by_depth = None
+        with self.assertRaises(Exception) as e:
+            keras_strip_quantized_model(model)
+        self.assertIn('is only supported with Keras 2', str(e.exception))
@@ -0,0 +1,136 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import tempfile
+import unittest
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import torch
+from onnx import numpy_helper
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers import fold_onnx_weights_quantizers, get_ort_session_options
+from mct_quantizers import pytorch_quantizers
+from mct_quantizers.common.constants import ONNX_CUSTOM_OP_DOMAIN, ONNX_FOLDED_WEIGHTS_METADATA_PREFIX
+
+THRESHOLDS = [0.5, 0.25, 1., 0.5]
+
+
+def _weights_quantizers():
+    return [pytorch_quantizers.WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True,
+                                                                  threshold=THRESHOLDS, channel_axis=0),
+            pytorch_quantizers.WeightsPOTInferableQuantizer(num_bits=4, per_channel=False, threshold=[1.]),
+            pytorch_quantizers.WeightsUniformInferableQuantizer(num_bits=8, per_channel=True,
+                                                                min_range=[-t for t in THRESHOLDS],
+                                                                max_range=THRESHOLDS, channel_axis=0),
+            pytorch_quantizers.WeightsLUTSymmetricInferableQuantizer(num_bits=4, lut_values=[-8., 0., 7.],
+                                                                     threshold=THRESHOLDS, per_channel=True,
+                                                                     channel_axis=0, input_rank=4),
+            pytorch_quantizers.WeightsLUTPOTInferableQuantizer(num_bits=4, lut_values=[-8., 0., 7.],
+                                                               threshold=[0.5, 0.25, 1., 0.5], per_channel=True,
+                                                               channel_axis=0, input_rank=4)]
+
+
+class QuantizedConvsModel(torch.nn.Module):
+    def __init__(self, activation_quantizer=None):
+        super().__init__()
+        self.convs = torch.nn.ModuleList([PytorchQuantizationWrapper(torch.nn.Conv2d(3 if i == 0 else 4, 4, 3,
+                                                                                     padding=1), {'weight': q})
+                                          for i, q in enumerate(_weights_quantizers())])
+        self.act = None if activation_quantizer is None else PytorchActivationQuantizationHolder(activation_quantizer)
+
+    def forward(self, x):
+        for conv in self.convs:
+            x = torch.relu(conv(x))
+        return x if self.act is None else self.act(x)
+
+
+def _export_model(model, inputs):
+    for module in model.modules():
+        if isinstance(module, PytorchQuantizationWrapper):
+            module.weights_quantizers['weight'].enable_custom_impl()
+        elif isinstance(module, PytorchActivationQuantizationHolder):
+            module.activation_holder_quantizer.enable_custom_impl()
+    _, onnx_file_path = tempfile.mkstemp('.onnx')
+    torch.onnx.export(model, inputs, onnx_file_path, opset_version=16, input_names=['input'],
+                      output_names=['output'], dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+    return onnx.load(onnx_file_path)
+
+
+def _run(onnx_model, inputs, session_options):
+    sess = ort.InferenceSession(onnx_model.SerializeToString(), session_options, providers=['CPUExecutionProvider'])
+    return sess.run(None, {'input': inputs})[0]
+
+
+class TestONNXFoldWeightsQuantizers(unittest.TestCase):
+
+    def test_fold_weights_quantizers(self):
+        model = QuantizedConvsModel().eval()
+        inputs = np.random.randn(2, 3, 8, 8).astype(np.float32)
+        onnx_model = _export_model(model, torch.from_numpy(inputs))
+        expected = _run(onnx_model, inputs, get_ort_session_options())
+        folded_model = fold_onnx_weights_quantizers(onnx_model)
+
+        # All the weights quantizers are folded, and the model runs without the custom ops library.
+        self.assertFalse(any(n.domain == ONNX_CUSTOM_OP_DOMAIN for n in folded_model.graph.node))
+        self.assertFalse(any(o.domain == ONNX_CUSTOM_OP_DOMAIN for o in folded_model.opset_import))
+        self.assertEqual([n.op_type for n in folded_model.graph.node], ['Conv', 'Relu'] * 5)
+        onnx.checker.check_model(folded_model)
+        # With constant weights, ONNX Runtime may run different convolution kernels, so the outputs match up to
+        # float round-off, while the folded weights are exactly the quantized weights.
+        self.assertTrue(np.allclose(_run(folded_model, inputs, ort.SessionOptions()), expected, rtol=1e-5, atol=1e-6))
+        initializers = {i.name: numpy_helper.to_array(i) for i in folded_model.graph.initializer}
+        conv_nodes = [n for n in folded_model.graph.node if n.op_type == 'Conv']
+        for conv_node, wrapper in zip(conv_nodes, model.convs):
+            with torch.no_grad():
+                quantized_weights = wrapper.weights_quantizers['weight'](wrapper.layer.weight.detach()).numpy()
+            self.assertTrue(np.allclose(initializers[conv_node.input[1]], quantized_weights, atol=1e-7))
+
+        metadata = {p.key: json.loads(p.value) for p in folded_model.metadata_props
+                    if p.key.startswith(ONNX_FOLDED_WEIGHTS_METADATA_PREFIX)}
+        self.assertEqual(sorted(m['op_type'] for m in metadata.values()),
+                         sorted(['WeightsSymmetricQuantizer', 'WeightsPOTQuantizer', 'WeightsUniformQuantizer',
+                                 'WeightsLUTSymmetricQuantizer', 'WeightsLUTPOTQuantizer']))
+        folded_weights = {i.name for i in folded_model.graph.initializer}
+        for key, meta in metadata.items():
+            self.assertIn(key.split('/', 1)[1], folded_weights)
+            if meta['op_type'] == 'WeightsSymmetricQuantizer':
+                self.assertEqual(meta['qparams']['threshold'], THRESHOLDS)
+                self.assertEqual(meta['attributes']['num_bits'], 8)
+            elif meta['op_type'] == 'WeightsUniformQuantizer':
+                self.assertEqual(set(meta['qparams']), {'min_range', 'max_range'})
+            elif meta['op_type'] == 'WeightsLUTPOTQuantizer':
+                self.assertEqual(meta['qparams']['lut_values'], [-8., 0., 7.])
+
+    def test_fold_keeps_activation_quantizers(self):
+        model = QuantizedConvsModel(pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                       threshold=[4.],
+                                                                                       signed=False)).eval()
+        inputs = np.random.randn(2, 3, 8, 8).astype(np.float32)
+        onnx_model = _export_model(model, torch.from_numpy(inputs))
+        expected = _run(onnx_model, inputs, get_ort_session_options())
+        folded_model = fold_onnx_weights_quantizers(onnx_model)
+
+        self.assertEqual([n.op_type for n in folded_model.graph.node if n.domain == ONNX_CUSTOM_OP_DOMAIN],
+                         ['ActivationPOTQuantizer'])
+        self.assertTrue(any(o.domain == ONNX_CUSTOM_OP_DOMAIN for o in folded_model.opset_import))
+        self.assertTrue(np.allclose(_run(folded_model, inputs, get_ort_session_options()), expected,
+                                    rtol=1e-5, atol=1e-6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import tempfile
+import unittest
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import torch
+
+from mct_quantizers import PytorchQuantizationWrapper, get_ort_session_options, clear_ort_kernels_cache, \
+    fold_onnx_weights_quantizers
+from mct_quantizers import pytorch_quantizers
+from mct_quantizers.pytorch.onnxruntime_kernels_cache import OrtKernelsCache, ORT_KERNELS_CACHE
+
+
+class TestOrtKernelsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+    def _kernel(self, x, threshold, **kwargs):
+        self.calls += 1
+        return np.round(x / threshold * kwargs['levels']) * threshold / kwargs['levels']
+
+    def test_memoize_constant_inputs(self):
+        cache = OrtKernelsCache()
+        x, threshold = np.random.randn(64, 3000).astype(np.float32), np.array([1.], np.float32)
+        outputs = cache.get_or_compute(self._kernel, (x, threshold), {'levels': 128})
+        # New copies of the same inputs, as passed by onnxruntime on every run.
+        x_buffer, threshold_buffer = x.copy(), threshold.copy()
+        self.assertIs(cache.get_or_compute(self._kernel, (x_buffer, threshold_buffer), {'levels': 128}), outputs)
+        self.assertEqual((self.calls, cache.hits, cache.misses), (1, 1, 1))
+        self.assertFalse(outputs.flags.writeable)
+
+        # Different attributes or quantization params.
+        cache.get_or_compute(self._kernel, (x_buffer, threshold_buffer), {'levels': 8})
+        cache.get_or_compute(self._kernel, (x_buffer, threshold_buffer * 2), {'levels': 128})
+        self.assertEqual(self.calls, 3)
+
+        # An input that differs in a single element, which is not sampled in its fingerprint (onnxruntime reuses
+        # the inputs buffers for different contents).
+        y = x.copy()
+        y[0, 1] += 1.
+        x_buffer[...] = y
+        self.assertTrue(np.array_equal(cache.get_or_compute(self._kernel, (x_buffer, threshold_buffer),
+                                                            {'levels': 128}),
+                                       self._kernel(y, threshold, levels=128)))
+        self.assertEqual(self.calls, 5)
+
+    def test_lru_eviction(self):
+        cache = OrtKernelsCache(maxsize=2)
+        inputs = [(np.full(4, i, np.float32), np.array([1.], np.float32)) for i in range(3)]
+        for x in inputs[:2]:
+            cache.get_or_compute(self._kernel, x, {'levels': 2})
+        cache.get_or_compute(self._kernel, inputs[0], {'levels': 2})
+        # Evicts the least recently used inputs[1].
+        cache.get_or_compute(self._kernel, inputs[2], {'levels': 2})
+        self.assertEqual(self.calls, 3)
+        cache.get_or_compute(self._kernel, inputs[0], {'levels': 2})
+        self.assertEqual(self.calls, 3)
+        cache.get_or_compute(self._kernel, inputs[1], {'levels': 2})
+        self.assertEqual(self.calls, 4)
+
+    def test_bounded_size(self):
+        cache = OrtKernelsCache(maxsize=2)
+        inputs = [(np.full(4, i, np.float32), np.array([1.], np.float32)) for i in range(5)]
+        # A model with more weights quantizers nodes than maxsize does not grow the cache.
+        for _ in range(2):
+            for x in inputs:
+                cache.get_or_compute(self._kernel, tuple(a.copy() for a in x), {'levels': 2})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(self.calls, 10)
+
+    def test_disabled_cache(self):
+        cache = OrtKernelsCache(maxsize=0)
+        x = (np.ones(4, np.float32), np.array([1.], np.float32))
+        for _ in range(3):
+            cache.get_or_compute(self._kernel, x, {'levels': 2})
+        self.assertEqual((self.calls, cache.hits, cache.misses), (3, 0, 3))
+
+    def _export_model(self, features):
+        model = torch.nn.Sequential(*[PytorchQuantizationWrapper(torch.nn.Linear(features, features), {'weight': q})
+                                      for q in [pytorch_quantizers.WeightsSymmetricInferableQuantizer(
+                                                    num_bits=8, per_channel=True, threshold=[1.] * features,
+                                                    channel_axis=0),
+                                                pytorch_quantizers.WeightsUniformInferableQuantizer(
+                                                    num_bits=4, per_channel=False, min_range=[-1.],
+                                                    max_range=[1.])]]).eval()
+        for wrapper in model:
+            wrapper.weights_quantizers['weight'].enable_custom_impl()
+        _, onnx_file_path = tempfile.mkstemp('.onnx')
+        torch.onnx.export(model, torch.randn(1, features), onnx_file_path, opset_version=16,
+                          input_names=['input'], output_names=['output'],
+                          dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+        return model, onnx_file_path
+
+    def test_ort_session_runs(self):
+        features = 16
+        model, onnx_file_path = self._export_model(features)
+        ORT_KERNELS_CACHE.clear()
+        misses = ORT_KERNELS_CACHE.misses
+        sess = ort.InferenceSession(onnx_file_path, get_ort_session_options(), providers=['CPUExecutionProvider'])
+        inputs = np.random.randn(4, features).astype(np.float32)
+        with torch.no_grad():
+            expected = model(torch.from_numpy(inputs)).numpy()
+        for _ in range(3):
+            self.assertTrue(np.allclose(sess.run(None, {'input': inputs})[0], expected, atol=1e-6))
+        # The weights of each layer are quantized once.
+        self.assertEqual(ORT_KERNELS_CACHE.misses - misses, 2)
+
+    def test_clear_model(self):
+        features = 16
+        _, onnx_file_path = self._export_model(features)
+        _, other_onnx_file_path = self._export_model(features)
+        ORT_KERNELS_CACHE.clear()
+        for path in [onnx_file_path, other_onnx_file_path]:
+            sess = ort.InferenceSession(path, get_ort_session_options(), providers=['CPUExecutionProvider'])
+            sess.run(None, {'input': np.random.randn(1, features).astype(np.float32)})
+        self.assertEqual(len(ORT_KERNELS_CACHE), 4)
+
+        # Only the outputs of the nodes of the first model are dropped.
+        clear_ort_kernels_cache(onnx.load(onnx_file_path))
+        self.assertEqual(len(ORT_KERNELS_CACHE), 2)
+        clear_ort_kernels_cache()
+        self.assertEqual(len(ORT_KERNELS_CACHE), 0)
+
+    def test_fold_leaves_cache_empty(self):
+        _, onnx_file_path = self._export_model(16)
+        ORT_KERNELS_CACHE.clear()
+        fold_onnx_weights_quantizers(onnx.load(onnx_file_path))
+        self.assertEqual(len(ORT_KERNELS_CACHE), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import onnxruntime as ort
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers import clear_ort_sessions_pool, get_ort_session, get_ort_session_options
+from mct_quantizers import pytorch_quantizers
+
+
+def _export_model(onnx_file_path):
+    weights_quantizer = pytorch_quantizers.WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False,
+                                                                             threshold=[1.])
+    activation_quantizer = pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.],
+                                                                              signed=True)
+    model = torch.nn.Sequential(PytorchQuantizationWrapper(torch.nn.Conv2d(3, 4, 3), {'weight': weights_quantizer}),
+                                PytorchActivationQuantizationHolder(activation_quantizer)).eval()
+    weights_quantizer.enable_custom_impl()
+    activation_quantizer.enable_custom_impl()
+    torch.onnx.export(model, torch.randn(1, 3, 8, 8), onnx_file_path, opset_version=16, input_names=['input'],
+                      output_names=['output'], dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+
+
+class TestOrtSession(unittest.TestCase):
+
+    def setUp(self):
+        clear_ort_sessions_pool()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.onnx_file_path = os.path.join(self.tmp_dir, 'model.onnx')
+        _export_model(self.onnx_file_path)
+        self.inputs = {'input': np.random.randn(2, 3, 8, 8).astype(np.float32)}
+
+    def tearDown(self):
+        clear_ort_sessions_pool()
+
+    def test_session_options(self):
+        options = get_ort_session_options(intra_op_num_threads=2,
+                                          inter_op_num_threads=3,
+                                          execution_mode=ort.ExecutionMode.ORT_PARALLEL,
+                                          graph_optimization_level=ort.GraphOptimizationLevel.ORT_ENABLE_BASIC)
+        self.assertEqual((options.intra_op_num_threads, options.inter_op_num_threads), (2, 3))
+        self.assertEqual(options.execution_mode, ort.ExecutionMode.ORT_PARALLEL)
+        self.assertEqual(options.graph_optimization_level, ort.GraphOptimizationLevel.ORT_ENABLE_BASIC)
+        # Defaults are kept for options that are not given.
+        self.assertEqual(get_ort_session_options().intra_op_num_threads, ort.SessionOptions().intra_op_num_threads)
+
+    def test_plain_session_options(self):
+        # A session created with the onnxruntime-extensions library, without get_ort_session_options, runs the
+        # model once the quantizers are imported (in a new interpreter, in which the custom ops are not registered
+        # by other tests).
+        code = ('import numpy as np\n'
+                'import onnxruntime as ort\n'
+                'from onnxruntime_extensions import get_library_path\n'
+                'from mct_quantizers import pytorch_quantizers\n'
+                'opt = ort.SessionOptions()\n'
+                'opt.register_custom_ops_library(get_library_path())\n'
+                f'sess = ort.InferenceSession({self.onnx_file_path!r}, opt, providers=["CPUExecutionProvider"])\n'
+                f'np.save({os.path.join(self.tmp_dir, "output.npy")!r}, '
+                f'sess.run(None, {{"input": np.load({os.path.join(self.tmp_dir, "input.npy")!r})}})[0])\n')
+        np.save(os.path.join(self.tmp_dir, 'input.npy'), self.inputs['input'])
+        subprocess.run([sys.executable, '-c', code], check=True)
+        self.assertTrue(np.array_equal(np.load(os.path.join(self.tmp_dir, 'output.npy')),
+                                       get_ort_session(self.onnx_file_path).run(None, self.inputs)[0]))
+
+    def test_sessions_pool(self):
+        sess = get_ort_session(self.onnx_file_path, intra_op_num_threads=1)
+        self.assertEqual(sess.get_session_options().intra_op_num_threads, 1)
+        self.assertIs(get_ort_session(self.onnx_file_path, intra_op_num_threads=1), sess)
+        self.assertIsNot(get_ort_session(self.onnx_file_path, intra_op_num_threads=2), sess)
+
+        # A modified model file gets a new session.
+        os.utime(self.onnx_file_path, ns=(0, os.stat(self.onnx_file_path).st_mtime_ns + 10 ** 9))
+        self.assertIsNot(get_ort_session(self.onnx_file_path, intra_op_num_threads=1), sess)
+
+        clear_ort_sessions_pool()
+        self.assertIsNot(get_ort_session(self.onnx_file_path, intra_op_num_threads=1), sess)
+
+    def test_optimized_model_cache(self):
+        optimized_model_dir = os.path.join(self.tmp_dir, 'optimized')
+        expected = get_ort_session(self.onnx_file_path).run(None, self.inputs)[0]
+
+        sess = get_ort_session(self.onnx_file_path, optimized_model_dir=optimized_model_dir)
+        self.assertEqual(len(os.listdir(optimized_model_dir)), 1)
+        self.assertTrue(np.array_equal(sess.run(None, self.inputs)[0], expected))
+
+        # A new session (e.g. in a new worker process) loads the optimized model without optimizing it again.
+        clear_ort_sessions_pool()
+        sess = get_ort_session(self.onnx_file_path, optimized_model_dir=optimized_model_dir)
+        self.assertEqual(sess.get_session_options().graph_optimization_level,
+                         ort.GraphOptimizationLevel.ORT_DISABLE_ALL)
+        self.assertEqual(len(os.listdir(optimized_model_dir)), 1)
+        self.assertTrue(np.array_equal(sess.run(None, self.inputs)[0], expected))
+
+        # Other session options are optimized into another file.
+        get_ort_session(self.onnx_file_path, optimized_model_dir=optimized_model_dir,
+                        graph_optimization_level=ort.GraphOptimizationLevel.ORT_ENABLE_BASIC)
+        self.assertEqual(len(os.listdir(optimized_model_dir)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
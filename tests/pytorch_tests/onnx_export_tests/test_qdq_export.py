@@ -0,0 +1,123 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import tempfile
+import unittest
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers import get_ort_session_options, pytorch_set_quantizers_qdq_export
+from mct_quantizers import pytorch_quantizers
+
+
+class QuantizedConvModel(torch.nn.Module):
+    def __init__(self, weights_quantizer, activation_quantizer, out_activation_quantizer):
+        super().__init__()
+        self.input_act = PytorchActivationQuantizationHolder(activation_quantizer)
+        self.conv = PytorchQuantizationWrapper(torch.nn.Conv2d(3, 4, 3), {'weight': weights_quantizer})
+        self.output_act = PytorchActivationQuantizationHolder(out_activation_quantizer)
+
+    def forward(self, inputs):
+        return self.output_act(torch.relu(self.conv(self.input_act(inputs))))
+
+
+def _export_model(model, inputs):
+    _, onnx_file_path = tempfile.mkstemp('.onnx')
+    torch.onnx.export(model, inputs, onnx_file_path, opset_version=16, input_names=['input'],
+                      output_names=['output'], dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}})
+    return onnx_file_path
+
+
+class TestONNXQDQExport(unittest.TestCase):
+
+    def _export_and_compare(self, model, output_step, custom_ops=()):
+        model.eval()
+        inputs = torch.randn(2, 3, 8, 8)
+        with torch.no_grad():
+            expected = model(inputs).numpy()
+        pytorch_set_quantizers_qdq_export(model)
+        onnx_file_path = _export_model(model, inputs)
+
+        op_types = [n.op_type for n in onnx.load(onnx_file_path).graph.node]
+        self.assertIn('QuantizeLinear', op_types)
+        self.assertIn('DequantizeLinear', op_types)
+        mct_ops = [n.op_type for n in onnx.load(onnx_file_path).graph.node if n.domain == 'mct_quantizers']
+        self.assertEqual(sorted(mct_ops), sorted(custom_ops))
+
+        # Without graph optimizations, ONNX Runtime computes the QDQ nodes exactly like the quantizers.
+        options = get_ort_session_options() if custom_ops else ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        sess = ort.InferenceSession(onnx_file_path, options, providers=['CPUExecutionProvider'])
+        self.assertTrue(np.array_equal(sess.run(None, {'input': inputs.numpy()})[0], expected))
+
+        # With graph optimizations, the QDQ nodes are fused into integer kernels, whose requantization may round
+        # outputs on a rounding boundary to the neighbouring quantization step.
+        options = get_ort_session_options() if custom_ops else ort.SessionOptions()
+        _, options.optimized_model_filepath = tempfile.mkstemp('.onnx')
+        sess = ort.InferenceSession(onnx_file_path, options, providers=['CPUExecutionProvider'])
+        outputs = sess.run(None, {'input': inputs.numpy()})[0]
+        self.assertLessEqual(np.abs(outputs - expected).max(), output_step + 1e-6)
+        self.optimized_op_types = [n.op_type for n in onnx.load(options.optimized_model_filepath).graph.node]
+        return op_types
+
+    def test_qdq_export_8bit(self):
+        model = QuantizedConvModel(
+            pytorch_quantizers.WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True,
+                                                                  threshold=[0.5, 0.25, 1., 0.5], channel_axis=0),
+            pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.], signed=True),
+            pytorch_quantizers.ActivationUniformInferableQuantizer(num_bits=8, min_range=[0.], max_range=[3.]))
+        op_types = self._export_and_compare(model, output_step=3. / 255)
+        # Input, weights and output quantizers.
+        self.assertEqual(op_types.count('QuantizeLinear'), 3)
+        self.assertNotIn('Clip', op_types)
+        self.assertIn('QLinearConv', self.optimized_op_types)
+
+    def test_qdq_export_low_bits(self):
+        model = QuantizedConvModel(
+            pytorch_quantizers.WeightsUniformInferableQuantizer(num_bits=4, per_channel=True,
+                                                                min_range=[-0.5, -0.25, -1., 0.],
+                                                                max_range=[0.5, 0.25, 1., 1.], channel_axis=0),
+            pytorch_quantizers.ActivationSymmetricInferableQuantizer(num_bits=4, threshold=[3.], signed=True),
+            pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=6, threshold=[2.], signed=False))
+        op_types = self._export_and_compare(model, output_step=2. / 64)
+        # The narrower domains are applied by clipping before the 8-bit QDQ pairs: Clip for the activations, and
+        # Max/Min with per-channel bounds for the weights.
+        self.assertEqual(op_types.count('Clip'), 2)
+        self.assertEqual((op_types.count('Max'), op_types.count('Min')), (1, 1))
+
+    def test_qdq_export_keeps_lut_custom(self):
+        model = QuantizedConvModel(
+            pytorch_quantizers.WeightsLUTSymmetricInferableQuantizer(num_bits=8, lut_values=[-8., 0., 8.],
+                                                                     threshold=[0.5, 0.25, 1., 0.5],
+                                                                     per_channel=True, channel_axis=0,
+                                                                     input_rank=4),
+            pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.], signed=True),
+            pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.], signed=False))
+        self._export_and_compare(model, output_step=4. / 256, custom_ops=['WeightsLUTSymmetricQuantizer'])
+
+    def test_disable_qdq_export(self):
+        quantizer = pytorch_quantizers.ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.], signed=True)
+        model = pytorch_set_quantizers_qdq_export(torch.nn.Sequential(PytorchActivationQuantizationHolder(quantizer)))
+        pytorch_set_quantizers_qdq_export(model, enable=False)
+        onnx_file_path = _export_model(model, torch.randn(1, 3, 8, 8))
+        op_types = [n.op_type for n in onnx.load(onnx_file_path).graph.node]
+        self.assertEqual(op_types, ['ActivationPOTQuantizer'])
+
+
+if __name__ == '__main__':
+    unittest.main()
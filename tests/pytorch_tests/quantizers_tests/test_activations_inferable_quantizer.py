@@ -248,3 +248,29 @@ class TestPytorchActivationInferableQuantizers(unittest.TestCase):
         manually_quantized_tensor = torch.round((torch.clip(input_tensor.to(get_working_device()), min_range,
                                                             max_range) - min_range) / scale) * scale + min_range
         self.assertTrue(torch.allclose(manually_quantized_tensor, quantized_tensor))
+
+    def test_reduced_precision_activation_quantizers(self):
+        input_tensor = (torch.randn(2, 8, 16, 16) * 4).to(get_working_device())
+        exact_quantizers = [ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.], signed=True),
+                            ActivationSymmetricInferableQuantizer(num_bits=8, threshold=[2.], signed=False),
+                            ActivationUniformInferableQuantizer(num_bits=8, min_range=[-8.], max_range=[7.9375])]
+        for quantizer in exact_quantizers:
+            for dtype in [torch.bfloat16, torch.float16]:
+                inputs = input_tensor.to(dtype)
+                quantized_tensor = quantizer(inputs)
+                self.assertTrue(quantized_tensor.dtype == dtype)
+                self.assertTrue(quantizer._reduced_precision_exact[dtype])
+                # Identical to quantizing in float32.
+                self.assertTrue(torch.equal(quantized_tensor, quantizer(inputs.float()).to(dtype)))
+                self.assertTrue(torch.equal(quantized_tensor.float(), quantizer(inputs.float())))
+
+        # A grid that does not fit in bfloat16 (or a scale which is not a power of two) is quantized in float32,
+        # with a warning.
+        for quantizer in [ActivationSymmetricInferableQuantizer(num_bits=12, threshold=[4.], signed=True),
+                          ActivationSymmetricInferableQuantizer(num_bits=8, threshold=[3.], signed=True)]:
+            inputs = input_tensor.to(torch.bfloat16)
+            with self.assertLogs(level='WARNING'):
+                quantized_tensor = quantizer(inputs)
+            self.assertFalse(quantizer._reduced_precision_exact[torch.bfloat16])
+            self.assertTrue(quantized_tensor.dtype == torch.bfloat16)
+            self.assertTrue(torch.equal(quantized_tensor, quantizer(inputs.float()).to(torch.bfloat16)))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================g
+import threading
 import unittest
 
 import numpy as np
@@ -315,3 +316,129 @@ class TestPytorchWeightsInferableQuantizers(unittest.TestCase):
                                                      max_range=max_range)
         # Test reuse quantizer
         self.quantizer_reuse_test(quantizer)
+
+    def test_reuse_cache_invalidation(self):
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                       per_channel=False,
+                                                       threshold=[4])
+        quantizer.enable_reuse_quantizer()
+        weight = torch.nn.Parameter(torch.rand(1, 50, 50, 3).to(get_working_device()), requires_grad=False)
+
+        quantized_tensor1 = quantizer(weight)
+        quantized_tensor2 = quantizer(weight)
+        self.assertTrue(quantized_tensor1 is quantized_tensor2)
+        self.assertTrue(quantizer.reuse_cache.hits == 1 and quantizer.reuse_cache.misses == 1)
+
+        # An in-place update of the weight (e.g. load_state_dict) invalidates the cache.
+        with torch.no_grad():
+            weight.copy_(weight * 2)
+        quantized_tensor3 = quantizer(weight)
+        self.assertTrue(quantizer.reuse_cache.misses == 2)
+        self.assertFalse(torch.allclose(quantized_tensor1, quantized_tensor3))
+        quantizer.disable_reuse_quantizer()
+        self.assertTrue(torch.equal(quantized_tensor3, quantizer(weight)))
+        quantizer.enable_reuse_quantizer()
+
+        # So does a different input tensor with the same values.
+        quantizer(weight)
+        quantizer(weight.clone())
+        self.assertTrue(quantizer.reuse_cache.misses == 4)
+        self.assertTrue(quantizer.reuse_cache.hits == 1)
+
+        quantizer.disable_reuse_quantizer()
+        self.assertTrue(quantizer.resue_outputs is None)
+
+    def test_reuse_cache_threads(self):
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=8,
+                                                       per_channel=True,
+                                                       threshold=[4.] * 3,
+                                                       channel_axis=3)
+        quantizer.enable_reuse_quantizer()
+        weight = torch.nn.Parameter(torch.rand(1, 50, 50, 3).to(get_working_device()), requires_grad=False)
+        half_weight = weight.detach().half()
+        expected = {torch.float32: quantizer._quantize(weight), torch.float16: quantizer._quantize(half_weight)}
+
+        num_threads, num_calls = 8, 50
+        barrier = threading.Barrier(num_threads)
+        outputs = [[] for _ in range(num_threads)]
+
+        def run(thread_index):
+            barrier.wait()
+            for i in range(num_calls):
+                outputs[thread_index].append(quantizer(weight if (i + thread_index) % 2 else half_weight))
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each (device, dtype) is quantized once, and all the threads share its output.
+        self.assertTrue(quantizer.reuse_cache.misses == 2)
+        # No counter update is lost.
+        self.assertTrue(quantizer.reuse_cache.hits + quantizer.reuse_cache.misses == num_threads * num_calls)
+        for dtype in [torch.float32, torch.float16]:
+            dtype_outputs = [o for thread_outputs in outputs for o in thread_outputs if o.dtype == dtype]
+            self.assertTrue(len(dtype_outputs) == num_threads * num_calls // 2)
+            self.assertTrue(all(o is dtype_outputs[0] for o in dtype_outputs))
+            self.assertTrue(torch.equal(dtype_outputs[0], expected[dtype]))
+
+    def test_int_weights_encoding(self):
+        quantizers = [WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=True, threshold=[3., 6., 2.],
+                                                         channel_axis=3),
+                      WeightsSymmetricInferableQuantizer(num_bits=3, per_channel=False, threshold=[1.]),
+                      WeightsPOTInferableQuantizer(num_bits=4, per_channel=True, threshold=[2., 4., 1.],
+                                                   channel_axis=3),
+                      WeightsPOTInferableQuantizer(num_bits=2, per_channel=False, threshold=[0.5]),
+                      WeightsUniformInferableQuantizer(num_bits=5, per_channel=True, min_range=[-3., -6., 0.],
+                                                       max_range=[3., 16., 12.], channel_axis=3),
+                      WeightsUniformInferableQuantizer(num_bits=8, per_channel=False, min_range=[-10.],
+                                                       max_range=[4.])]
+        # An odd number of elements, to check the packing padding.
+        input_tensor = 8 * torch.rand(5, 3, 7, 3).to(get_working_device()) - 4
+        for quantizer in quantizers:
+            encoded_weights = quantizer.encode_int_weights(input_tensor)
+            codes = encoded_weights['codes']
+            self.assertTrue(codes.dtype == torch.uint8)
+            self.assertTrue(codes.numel() == np.ceil(input_tensor.numel() * (2 if quantizer.num_bits <= 2 else
+                                                                             4 if quantizer.num_bits <= 4 else 8) / 8))
+            decoded_weights = quantizer.decode_int_weights(encoded_weights, input_tensor.shape)
+            self.assertTrue(torch.equal(decoded_weights, quantizer(input_tensor)),
+                            f'Decoded weights do not match the quantized weights of {quantizer}')
+
+    def test_quantizer_buffers(self):
+        quantizers = [WeightsSymmetricInferableQuantizer(num_bits=4, per_channel=True, threshold=[2., 0.5, 1.],
+                                                         channel_axis=0),
+                      WeightsUniformInferableQuantizer(num_bits=4, per_channel=False, min_range=[-1.], max_range=[3.])]
+        for quantizer in quantizers:
+            self.assertTrue(isinstance(quantizer, torch.nn.Module))
+            self.assertTrue('scales' in dict(quantizer.named_buffers()))
+            # The buffers are derived from the quantizer arguments, so they are not saved in the state_dict.
+            self.assertTrue(len(quantizer.state_dict()) == 0)
+
+            # The buffers follow the module device, but keep their dtype.
+            quantizer.double()
+            self.assertTrue(quantizer.scales.dtype == torch.float32)
+            # Each buffer is converted once: a dtype cast isn't applied to it at all.
+            buffers_conversions = []
+            def half(tensor):
+                if tensor.numel() > 0:
+                    buffers_conversions.append(tensor)
+                return tensor.half()
+            quantizer._apply(half)
+            self.assertTrue(len(buffers_conversions) == 0)
+            self.assertTrue(quantizer.scales.dtype == torch.float32)
+            quantizer.to('meta')
+            self.assertTrue(quantizer.scales.device.type == 'meta')
+            self.assertTrue(quantizer.zero_points.device.type == 'meta')
+
+        # Quantizers pickled before they were modules hold their tensors as plain attributes.
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=4, per_channel=True, threshold=[2., 0.5, 1.],
+                                                       channel_axis=0)
+        input_tensor = torch.rand(3, 4, 5).to(get_working_device())
+        state = {k: v for k, v in quantizer.__dict__.items() if not k.startswith('_') or k.startswith('_use')}
+        state.update(quantizer._buffers)
+        restored = WeightsSymmetricInferableQuantizer.__new__(WeightsSymmetricInferableQuantizer)
+        restored.__setstate__(state)
+        self.assertTrue('scales' in dict(restored.named_buffers()))
+        self.assertTrue(torch.equal(restored(input_tensor), quantizer(input_tensor)))
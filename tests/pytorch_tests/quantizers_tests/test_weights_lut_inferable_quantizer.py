@@ -17,7 +17,10 @@ import unittest
 import numpy as np
 import torch
 
-from mct_quantizers.pytorch.quantizer_utils import get_working_device
+from mct_quantizers.common.quant_utils import sort_lut_values_np, lut_nearest_indices_np
+from mct_quantizers.pytorch.quantizer_utils import get_working_device, sort_lut_values, lut_nearest_indices
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_lut_pot_inferable_quantizer import \
+    WeightsLUTPOTInferableQuantizer
 from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_lut_symmetric_inferable_quantizer import \
     WeightsLUTSymmetricInferableQuantizer
 
@@ -184,3 +187,66 @@ class TestPytorchWeightsLutQuantizers(unittest.TestCase):
                                          threshold=threshold, lut_values=lut_values,
                                          per_channel=per_channel, channel_axis=channel_axis,
                                          lut_values_bitwidth=lut_values_bitwidth)
+
+    def test_weights_lut_quantizer_int_weights_encoding(self):
+        quantizers = [WeightsLUTSymmetricInferableQuantizer(num_bits=4,
+                                                            lut_values=[-100, -64, -7, 0, 3, 17, 50, 127,
+                                                                        -128, -90, -30, -1, 9, 33, 70, 101],
+                                                            threshold=[3., 8., 7.],
+                                                            per_channel=True,
+                                                            channel_axis=1,
+                                                            input_rank=4),
+                      WeightsLUTPOTInferableQuantizer(num_bits=2,
+                                                      lut_values=[-25, 0, 25, 60],
+                                                      threshold=[4.],
+                                                      per_channel=False),
+                      WeightsLUTSymmetricInferableQuantizer(num_bits=8,
+                                                            lut_values=list(range(-128, 128, 5)),
+                                                            threshold=[2.],
+                                                            per_channel=False)]
+        # An odd number of elements, to check the packing padding.
+        input_tensor = (16 * torch.rand(5, 3, 7, 3) - 8).to(get_working_device())
+        for quantizer, expected_index_bits in zip(quantizers, [4, 2, 6]):
+            self.assertTrue(quantizer.lut_index_bits == expected_index_bits)
+            encoded_weights = quantizer.encode_int_weights(input_tensor)
+            codes = encoded_weights['codes']
+            self.assertTrue(codes.dtype == torch.uint8)
+            # Indices of 2 bits are packed four to a byte, of 4 bits two to a byte.
+            self.assertTrue(codes.numel() == np.ceil(input_tensor.numel() / {4: 2, 2: 4, 6: 1}[expected_index_bits]))
+            decoded_weights = quantizer.decode_int_weights(encoded_weights, input_tensor.shape)
+            self.assertTrue(torch.equal(decoded_weights, quantizer(input_tensor)),
+                            f'Decoded weights do not match the quantized weights of {quantizer}')
+
+    def test_lut_nearest_indices(self):
+        # Unsorted lut values with repeated values.
+        lut_values = torch.Tensor([17, -64, 3, 0, 3, -100, 127, -64, 50])
+        sorted_values = torch.unique(lut_values)
+        # Random values, values equal to the lut values and values exactly half-way between them, where the
+        # first index of the nearest lut values must be chosen, like argmin does.
+        tensor = torch.cat([300 * torch.rand(500) - 150,
+                            sorted_values,
+                            (sorted_values[1:] + sorted_values[:-1]) / 2]).reshape(-1, 3)
+        expected = torch.argmin(torch.abs(tensor.unsqueeze(-1) - lut_values.reshape(1, 1, -1)), dim=-1)
+
+        sorted_lut = sort_lut_values(lut_values)
+        self.assertTrue(torch.equal(lut_nearest_indices(tensor, *sorted_lut), expected))
+        self.assertTrue(torch.equal(lut_nearest_indices(tensor, *sorted_lut, chunk_size=100), expected))
+
+        sorted_lut_np = sort_lut_values_np(lut_values.numpy())
+        self.assertTrue(np.array_equal(lut_nearest_indices_np(tensor.numpy(), *sorted_lut_np), expected.numpy()))
+        self.assertTrue(np.array_equal(lut_nearest_indices_np(tensor.numpy(), *sorted_lut_np, chunk_size=100),
+                                       expected.numpy()))
+
+    def test_numpy_kernel_sorts_lut_values_once(self):
+        from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers import \
+            weights_lut_symmetric_inferable_quantizer as lut_sym_module
+
+        lut_values = np.random.permutation(np.arange(-128, 128, 16)).astype(np.float32)
+        input_tensor = np.random.randn(3, 4, 5, 6).astype(np.float32)
+        misses = lut_sym_module._sort_lut_values_bytes.cache_info().misses
+        outputs = [lut_sym_module.quantize_lut_sym_weights_numpy(input_tensor, lut_values.copy(),
+                                                                 np.array([2.] * 6, np.float32), 8, 1e-8, True,
+                                                                 3, 4)
+                   for _ in range(3)]
+        self.assertEqual(lut_sym_module._sort_lut_values_bytes.cache_info().misses - misses, 1)
+        self.assertTrue(all(np.array_equal(o, outputs[0]) for o in outputs))
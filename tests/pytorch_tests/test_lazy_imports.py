@@ -0,0 +1,76 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import subprocess
+import sys
+import unittest
+
+import mct_quantizers
+from mct_quantizers.common.constants import FOUND_ONNXRUNTIME_EXTENSIONS
+
+
+def _imported_modules(code: str) -> dict:
+    """
+    Run code in a new interpreter, and return which of the frameworks modules it imported.
+    """
+    code += ('\nimport sys, json\nprint(json.dumps({m: m in sys.modules for m in '
+             '["tensorflow", "torch", "onnxruntime", "onnxruntime_extensions"]}))')
+    outputs = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return json.loads(outputs.splitlines()[-1])
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_package_import_is_lazy(self):
+        self.assertFalse(any(_imported_modules('import mct_quantizers').values()))
+
+    def test_framework_attributes_import_their_framework(self):
+        modules = _imported_modules('import mct_quantizers\nmct_quantizers.PytorchQuantizationWrapper')
+        self.assertTrue(modules['torch'])
+        self.assertFalse(modules['tensorflow'])
+        # The quantizers, which register their onnxruntime custom ops, are not imported yet.
+        self.assertFalse(modules['onnxruntime_extensions'])
+
+        # Importing the quantizers registers their onnxruntime custom ops.
+        modules = _imported_modules('import mct_quantizers\nmct_quantizers.pytorch_quantizers')
+        self.assertEqual(modules['onnxruntime_extensions'], FOUND_ONNXRUNTIME_EXTENSIONS)
+        self.assertFalse(modules['tensorflow'])
+
+        modules = _imported_modules('from mct_quantizers import get_ort_session_options\nget_ort_session_options()')
+        self.assertTrue(modules['onnxruntime_extensions'])
+        self.assertFalse(modules['tensorflow'])
+
+    def test_lazy_attributes(self):
+        from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+        from mct_quantizers.pytorch import quantizers
+        self.assertIs(mct_quantizers.PytorchQuantizationWrapper, PytorchQuantizationWrapper)
+        self.assertIs(mct_quantizers.pytorch_quantizers, quantizers)
+        self.assertIn('PytorchQuantizationWrapper', dir(mct_quantizers))
+        self.assertIn('PytorchQuantizationWrapper', vars(mct_quantizers))
+        with self.assertRaises(AttributeError):
+            mct_quantizers.NotAnAttribute
+
+    def test_lazy_subpackages(self):
+        # Each framework subpackage resolves without importing the other framework first.
+        modules = _imported_modules('import mct_quantizers as mctq\nmctq.pytorch.quantizers.WeightsPOTInferableQuantizer')
+        self.assertTrue(modules['torch'])
+        self.assertFalse(modules['tensorflow'])
+
+        modules = _imported_modules('import mct_quantizers as mctq\nmctq.keras.quantizers.WeightsPOTInferableQuantizer')
+        self.assertTrue(modules['tensorflow'])
+        self.assertFalse(modules['torch'])
+
+        self.assertIs(mct_quantizers.common.constants, mct_quantizers.constants)
+        self.assertIn('keras', dir(mct_quantizers))
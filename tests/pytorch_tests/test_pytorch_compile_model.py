@@ -0,0 +1,102 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder
+from mct_quantizers.pytorch.compile_model import pytorch_compile_quantized_model, pytorch_set_quantizers_compile_mode
+from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizer_utils import get_working_device
+from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_lut_pot_inferable_quantizer import \
+    ActivationLutPOTInferableQuantizer
+from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_pot_inferable_quantizer import \
+    ActivationPOTInferableQuantizer
+from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_uniform_inferable_quantizer import \
+    ActivationUniformInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_lut_symmetric_inferable_quantizer import \
+    WeightsLUTSymmetricInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_pot_inferable_quantizer import \
+    WeightsPOTInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_symmetric_inferable_quantizer import \
+    WeightsSymmetricInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_uniform_inferable_quantizer import \
+    WeightsUniformInferableQuantizer
+
+
+class CompileTestModel(torch.nn.Module):
+    """
+    Dummy quantized model with all kinds of weights and activation quantizers for the compile test
+    """
+    def __init__(self):
+        super().__init__()
+        self.conv = PytorchQuantizationWrapper(torch.nn.Conv2d(3, 4, 3),
+                                               {'weight': WeightsSymmetricInferableQuantizer(num_bits=4,
+                                                                                             per_channel=True,
+                                                                                             threshold=[1., 2., 0.5, 4.],
+                                                                                             channel_axis=0)})
+        self.conv_act = PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                            threshold=[4.],
+                                                                                            signed=True))
+        self.sub = PytorchQuantizationWrapper(torch.sub,
+                                              {1: WeightsPOTInferableQuantizer(num_bits=3,
+                                                                               per_channel=False,
+                                                                               threshold=[1.0])},
+                                              weight_values={1: torch.rand((4, 1, 1))})
+        self.sub_act = PytorchActivationQuantizationHolder(ActivationUniformInferableQuantizer(num_bits=8,
+                                                                                               min_range=[-3.],
+                                                                                               max_range=[5.]))
+        self.linear = PytorchQuantizationWrapper(torch.nn.Linear(6, 5),
+                                                 {'weight': WeightsUniformInferableQuantizer(num_bits=6,
+                                                                                             per_channel=True,
+                                                                                             min_range=[-1.] * 5,
+                                                                                             max_range=[2.] * 5,
+                                                                                             channel_axis=0),
+                                                  'bias': WeightsLUTSymmetricInferableQuantizer(
+                                                      num_bits=2,
+                                                      lut_values=[-25, 0, 25, 60],
+                                                      threshold=[4.],
+                                                      per_channel=False)})
+        self.linear_act = PytorchActivationQuantizationHolder(ActivationLutPOTInferableQuantizer(
+            num_bits=3, lut_values=[-25, -10, 0, 10, 25, 60], threshold=[8.], signed=True))
+
+    def forward(self, inputs):
+        x = self.conv_act(torch.relu(self.conv(inputs)))
+        x = self.sub_act(self.sub(x))
+        return self.linear_act(self.linear(x))
+
+
+class TestPytorchCompileModel(unittest.TestCase):
+
+    def test_compile_mode(self):
+        model = CompileTestModel().to(get_working_device()).eval()
+        inputs = torch.randn(2, 3, 8, 8).to(get_working_device())
+        with torch.no_grad():
+            expected = model(inputs)
+
+            pytorch_set_quantizers_compile_mode(model)
+            self.assertTrue(model.conv.weights_quantizers['weight']._compile_mode)
+            self.assertTrue(model.linear_act.activation_holder_quantizer._compile_mode)
+            self.assertTrue(torch.equal(model(inputs), expected))
+
+            # The model is captured in a single graph: fullgraph=True raises on any graph break.
+            torch._dynamo.reset()
+            compiled_model = pytorch_compile_quantized_model(model, fullgraph=True, backend='eager')
+            self.assertTrue(torch.equal(compiled_model(inputs), expected))
+            self.assertTrue(torch._dynamo.explain(model)(inputs).graph_break_count == 0)
+
+            pytorch_set_quantizers_compile_mode(model, enable=False)
+            self.assertFalse(model.sub.weights_quantizers[1]._compile_mode)
+            self.assertTrue(torch.equal(model(inputs), expected))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import copy
 import os
 import tempfile
 import unittest
@@ -21,7 +22,8 @@ import onnx
 import torch
 
 from mct_quantizers import PytorchActivationQuantizationHolder
-from mct_quantizers.pytorch.load_model import pytorch_load_quantized_model
+from mct_quantizers.pytorch.freeze_model import pytorch_freeze_quantized_model
+from mct_quantizers.pytorch.load_model import pytorch_load_quantized_model, pytorch_materialize_quantized_model
 from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
 from mct_quantizers.pytorch.metadata import add_metadata, add_onnx_metadata, get_metadata, get_onnx_metadata
 from mct_quantizers.pytorch.quantizer_utils import get_working_device
@@ -57,6 +59,27 @@ class TestModel(torch.nn.Module):
         return self.fc(inputs) + 5
 
 
+class TestQuantizedModel(torch.nn.Module):
+    """
+    Dummy quantized model for freeze test
+    """
+    def __init__(self):
+        super().__init__()
+        self.conv = PytorchQuantizationWrapper(torch.nn.Conv2d(3, 4, 3),
+                                               {'weight': WeightsSymmetricInferableQuantizer(num_bits=4,
+                                                                                             per_channel=True,
+                                                                                             threshold=[1., 2., 0.5, 4.],
+                                                                                             channel_axis=0)})
+        self.sub = PytorchQuantizationWrapper(torch.sub,
+                                              {1: WeightsPOTInferableQuantizer(num_bits=3,
+                                                                               per_channel=False,
+                                                                               threshold=[1.0])},
+                                              weight_values={1: torch.rand((4, 1, 1))})
+
+    def forward(self, inputs):
+        return self.sub(self.conv(inputs))
+
+
 class TestPytorchLoadModel(unittest.TestCase):
 
     def setUp(self):
@@ -220,6 +243,103 @@ class TestPytorchLoadModel(unittest.TestCase):
                                                           {'weight': quantizer}).to(self.device)
         self._one_layer_model_save_and_load(layer_with_quantizer)
 
+    def test_save_and_load_frozen_model(self):
+        x = torch.from_numpy(np.random.rand(1, 3, 16, 16).astype(np.float32)).to(self.device)
+        model = TestQuantizedModel().to(self.device)
+        pred = model(x).detach().cpu().numpy()
+
+        pytorch_freeze_quantized_model(model)
+        self.assertTrue(all([w.is_frozen for w in [model.conv, model.sub]]))
+        self.assertTrue(len(list(model.parameters())) == 1, 'Only the conv bias should remain a parameter')
+        self.assertTrue(np.allclose(model(x).detach().cpu().numpy(), pred))
+
+        # Save & load the whole frozen model.
+        _, tmp_pt_file = tempfile.mkstemp('.pt')
+        torch.save(model, tmp_pt_file)
+        loaded_model = pytorch_load_quantized_model(tmp_pt_file, weights_only=False)
+        self.assertTrue(np.allclose(loaded_model(x).detach().cpu().numpy(), pred))
+
+        # Load the frozen state_dict to a model frozen the same way.
+        torch.save(model.state_dict(), tmp_pt_file)
+        new_model = pytorch_freeze_quantized_model(TestQuantizedModel().to(self.device))
+        new_model.load_state_dict(pytorch_load_quantized_model(tmp_pt_file))
+        os.remove(tmp_pt_file)
+        self.assertTrue(np.allclose(new_model(x).detach().cpu().numpy(), pred))
+
+    def test_save_and_load_frozen_int_weights_model(self):
+        x = torch.from_numpy(np.random.rand(1, 3, 16, 16).astype(np.float32)).to(self.device)
+        model = TestQuantizedModel().to(self.device)
+        pred = model(x).detach().cpu().numpy()
+        float_state_dict_size = sum([t.numel() * t.element_size() for t in model.state_dict().values()])
+
+        for cache_dequantized_weights in [False, True]:
+            frozen_model = pytorch_freeze_quantized_model(TestQuantizedModel().to(self.device),
+                                                          int_weights=True,
+                                                          cache_dequantized_weights=cache_dequantized_weights)
+            frozen_model.load_state_dict(pytorch_freeze_quantized_model(copy.deepcopy(model),
+                                                                        int_weights=True).state_dict())
+            self.assertTrue(np.array_equal(frozen_model(x).detach().cpu().numpy(), pred))
+            self.assertTrue(frozen_model.conv.weight_codes.dtype == torch.uint8)
+            # 4-bit weights are packed two to a byte.
+            self.assertTrue(frozen_model.conv.weight_codes.numel() == frozen_model.conv.layer.weight.numel() // 2)
+            self.assertTrue('conv.weight' not in frozen_model.state_dict())
+            int_state_dict_size = sum([t.numel() * t.element_size() for t in frozen_model.state_dict().values()])
+            self.assertTrue(int_state_dict_size < float_state_dict_size / 2)
+
+            _, tmp_pt_file = tempfile.mkstemp('.pt')
+            torch.save(frozen_model, tmp_pt_file)
+            loaded_model = pytorch_load_quantized_model(tmp_pt_file, weights_only=False)
+            os.remove(tmp_pt_file)
+            self.assertTrue(np.array_equal(loaded_model(x).detach().cpu().numpy(), pred))
+            self.assertTrue(np.array_equal(loaded_model.conv.get_quantized_weights()['weight'].cpu().numpy(),
+                                           model.conv.get_quantized_weights()['weight'].cpu().numpy()))
+
+    def test_save_and_load_frozen_lut_weights(self):
+        x = torch.from_numpy(np.random.rand(1, 3, 16, 16).astype(np.float32)).to(self.device)
+        quantizer = WeightsLUTSymmetricInferableQuantizer(num_bits=2,
+                                                          lut_values=[-100, -25, 25, 100],
+                                                          threshold=[3., 8., 7., 1.],
+                                                          per_channel=True,
+                                                          channel_axis=0,
+                                                          input_rank=4)
+        model = PytorchQuantizationWrapper(torch.nn.Conv2d(3, 4, 3), {'weight': quantizer}).to(self.device)
+        pred = model(x).detach().cpu().numpy()
+
+        model.freeze(int_weights=True)
+        self.assertTrue(np.array_equal(model(x).detach().cpu().numpy(), pred))
+        # 2-bit indices are packed four to a byte.
+        self.assertTrue(model.weight_codes.numel() == model.layer.weight.numel() // 4)
+        self._one_layer_model_save_and_load(model)
+
+    def test_materialize_meta_model(self):
+        x = torch.from_numpy(np.random.rand(1, 3, 16, 16).astype(np.float32)).to(self.device)
+        model = TestQuantizedModel().to(self.device)
+        pred = model(x).detach().cpu().numpy()
+
+        for freeze_kwargs in [None, {}, {'int_weights': True}, {'int_weights': True, 'cache_dequantized_weights': True}]:
+            saved_model = copy.deepcopy(model)
+            with torch.device('meta'):
+                meta_model = TestQuantizedModel()
+            if freeze_kwargs is not None:
+                pytorch_freeze_quantized_model(saved_model, **freeze_kwargs)
+                pytorch_freeze_quantized_model(meta_model, **freeze_kwargs)
+            self.assertTrue(meta_model.conv.layer.weight.is_meta)
+            self.assertFalse(meta_model.conv.weights_quantizers['weight'].scales.is_meta)
+
+            _, tmp_pt_file = tempfile.mkstemp('.pt')
+            torch.save(saved_model.state_dict(), tmp_pt_file)
+            loaded_model = pytorch_materialize_quantized_model(meta_model, tmp_pt_file, map_location=self.device)
+            self.assertTrue(np.array_equal(loaded_model(x).detach().cpu().numpy(), pred))
+            del loaded_model, meta_model
+            os.remove(tmp_pt_file)
+
+        with torch.device('meta'):
+            meta_model = TestQuantizedModel()
+        state_dict = model.state_dict()
+        state_dict.pop('conv.layer.bias')
+        with self.assertRaises(Exception):
+            pytorch_materialize_quantized_model(meta_model, state_dict, strict=False)
+
     def test_save_and_load_metadata(self):
         model = TestModel()
         model = add_metadata(model, {'test': 'test123',
@@ -0,0 +1,118 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder
+from mct_quantizers.pytorch.freeze_model import pytorch_freeze_quantized_model
+from mct_quantizers.pytorch.lower_model import pytorch_lower_quantized_model, pytorch_lowered_model_parity, \
+    PytorchLoweredQuantizedLayer
+from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_pot_inferable_quantizer import \
+    ActivationPOTInferableQuantizer
+from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_symmetric_inferable_quantizer import \
+    ActivationSymmetricInferableQuantizer
+from mct_quantizers.pytorch.quantizers.activation_inferable_quantizers.activation_uniform_inferable_quantizer import \
+    ActivationUniformInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_pot_inferable_quantizer import \
+    WeightsPOTInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_symmetric_inferable_quantizer import \
+    WeightsSymmetricInferableQuantizer
+from mct_quantizers.pytorch.quantizers.weights_inferable_quantizers.weights_uniform_inferable_quantizer import \
+    WeightsUniformInferableQuantizer
+
+
+class LowerTestModel(torch.nn.Module):
+    """
+    Dummy quantized model with layers that are lowered to integer kernels and layers that are not
+    """
+    def __init__(self):
+        super().__init__()
+        self.input_act = PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                             threshold=[4.],
+                                                                                             signed=True))
+        self.conv1 = PytorchQuantizationWrapper(torch.nn.Conv2d(3, 8, 3, padding=1),
+                                                {'weight': WeightsSymmetricInferableQuantizer(
+                                                    num_bits=8, per_channel=True, threshold=[0.5] * 8,
+                                                    channel_axis=0)})
+        self.relu = torch.nn.ReLU()
+        self.conv1_act = PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                             threshold=[4.],
+                                                                                             signed=False))
+        self.conv2 = PytorchQuantizationWrapper(torch.nn.Conv2d(8, 8, 3, stride=2, groups=2),
+                                                {'weight': WeightsPOTInferableQuantizer(
+                                                    num_bits=4, per_channel=False, threshold=[0.5])})
+        self.conv2_act = PytorchActivationQuantizationHolder(ActivationSymmetricInferableQuantizer(num_bits=8,
+                                                                                                   threshold=[3.],
+                                                                                                   signed=True))
+        # Uniform weights are not lowered.
+        self.conv3 = PytorchQuantizationWrapper(torch.nn.Conv2d(8, 4, 1),
+                                                {'weight': WeightsUniformInferableQuantizer(
+                                                    num_bits=8, per_channel=False, min_range=[-0.5], max_range=[0.5])})
+        self.conv3_act = PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                             threshold=[4.],
+                                                                                             signed=True))
+        self.linear = PytorchQuantizationWrapper(torch.nn.Linear(36, 10),
+                                                 {'weight': WeightsSymmetricInferableQuantizer(
+                                                     num_bits=8, per_channel=True, threshold=[0.25] * 10,
+                                                     channel_axis=0)})
+        self.linear_act = PytorchActivationQuantizationHolder(ActivationUniformInferableQuantizer(num_bits=8,
+                                                                                                 min_range=[-2.],
+                                                                                                 max_range=[6.]))
+
+    def forward(self, inputs):
+        x = self.input_act(inputs)
+        x = self.conv1_act(self.relu(self.conv1(x)))
+        x = self.conv2_act(self.conv2(x))
+        x = self.conv3_act(self.conv3(x))
+        return self.linear_act(torch.relu(self.linear(torch.flatten(x, 1))))
+
+
+class TestPytorchLowerModel(unittest.TestCase):
+
+    def test_lower_quantized_model(self):
+        model = LowerTestModel().eval()
+        inputs = torch.randn(4, 3, 8, 8)
+        with torch.no_grad():
+            expected = model(inputs)
+
+        for frozen in [False, True]:
+            if frozen:
+                pytorch_freeze_quantized_model(model, int_weights=True)
+            lowered_model = pytorch_lower_quantized_model(model)
+            lowered_layers = {name: m for name, m in lowered_model.named_modules()
+                              if isinstance(m, PytorchLoweredQuantizedLayer)}
+            self.assertTrue(set(lowered_layers) == {'conv1_act', 'conv2_act', 'linear_act'})
+            self.assertTrue(isinstance(lowered_model.conv3, PytorchQuantizationWrapper))
+            self.assertFalse(hasattr(lowered_model, 'conv1') or hasattr(lowered_model, 'relu'))
+            # conv1 passes its quint8 outputs to conv2.
+            self.assertFalse(lowered_layers['conv1_act'].dequantize_outputs)
+            self.assertFalse(lowered_layers['conv2_act'].quantize_inputs)
+            self.assertTrue(lowered_layers['conv2_act'].dequantize_outputs)
+            # The original model is not changed.
+            self.assertTrue(isinstance(model.conv1_act, PytorchActivationQuantizationHolder))
+
+            # Each lowered layer is within a single quantization step of the fake quant layers.
+            parity = pytorch_lowered_model_parity(model, lowered_model, inputs)
+            self.assertTrue(set(parity) == set(lowered_layers))
+            for name, layer_parity in parity.items():
+                self.assertTrue(layer_parity['max_steps'] <= 1 + 1e-3, f'{name}: {layer_parity}')
+                self.assertTrue(layer_parity['mismatch'] < 0.01, f'{name}: {layer_parity}')
+
+            with torch.no_grad():
+                outputs = lowered_model(inputs)
+            self.assertTrue(outputs.dtype == torch.float32 and outputs.shape == expected.shape)
+            self.assertTrue(torch.max(torch.abs(outputs - expected)) <= 8. / 255 * 4)
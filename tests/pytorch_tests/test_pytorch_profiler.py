@@ -0,0 +1,115 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import torch
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchPreservingActivationQuantizationHolder, \
+    PytorchQuantizationProfiler, PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizers import ActivationPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
+
+
+class ProfilerTestModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = PytorchQuantizationWrapper(torch.nn.Conv2d(3, 8, 3),
+                                               {'weight': WeightsSymmetricInferableQuantizer(
+                                                   num_bits=8, per_channel=True, threshold=[0.5] * 8,
+                                                   channel_axis=0)})
+        self.conv_act = PytorchActivationQuantizationHolder(ActivationPOTInferableQuantizer(num_bits=8,
+                                                                                            threshold=[4.],
+                                                                                            signed=True))
+        self.sub = PytorchQuantizationWrapper(torch.sub,
+                                              {1: WeightsSymmetricInferableQuantizer(num_bits=8, per_channel=False,
+                                                                                     threshold=[1.])},
+                                              weight_values={1: torch.rand(8, 1, 1)})
+        self.sub_act = PytorchPreservingActivationQuantizationHolder(
+            ActivationPOTInferableQuantizer(num_bits=8, threshold=[4.], signed=True), quantization_bypass=False)
+
+    def forward(self, x):
+        return self.sub_act(self.sub(self.conv_act(self.conv(x))))
+
+
+class TestPytorchQuantizationProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.model = ProfilerTestModel().eval()
+        self.inputs = torch.randn(2, 3, 16, 16)
+
+    def test_profile_layers(self):
+        expected_outputs = self.model(self.inputs)
+        with PytorchQuantizationProfiler(self.model) as profiler:
+            for _ in range(3):
+                outputs = self.model(self.inputs)
+        self.assertTrue(torch.equal(outputs, expected_outputs))
+
+        records = {r['layer']: r for r in profiler.records()}
+        self.assertEqual(set(records.keys()), {'conv', 'conv_act', 'sub', 'sub_act'})
+        self.assertEqual(records['conv']['type'], 'Conv2d')
+        self.assertEqual(records['sub']['type'], 'sub')
+        self.assertEqual(records['sub_act']['type'], 'PytorchPreservingActivationQuantizationHolder')
+        for name in ['conv', 'sub']:
+            self.assertEqual(records[name]['calls'], 3)
+            self.assertGreater(records[name]['weights_quantization_ms'], 0)
+            self.assertGreater(records[name]['layer_op_ms'], 0)
+            self.assertEqual(records[name]['activation_quantization_ms'], 0)
+        for name in ['conv_act', 'sub_act']:
+            self.assertEqual(records[name]['calls'], 3)
+            self.assertGreater(records[name]['activation_quantization_ms'], 0)
+            self.assertEqual(records[name]['layer_op_ms'], 0)
+            self.assertEqual(records[name]['quantization_fraction'], 1)
+
+        totals = [r['quantization_ms'] for r in profiler.records(sort_by='quantization_ms')]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+        report = profiler.report(sort_by='layer', descending=False)
+        self.assertEqual([line.split()[0] for line in report.splitlines()[1:]],
+                         ['conv', 'conv_act', 'sub', 'sub_act', 'total'])
+        with self.assertRaises(Exception):
+            profiler.records(sort_by='unknown')
+
+    def test_disabled_profiler_removes_instrumentation(self):
+        profiler = PytorchQuantizationProfiler(self.model)
+        with profiler:
+            self.assertIsNot(self.model.sub.layer, torch.sub)
+            self.assertTrue(len(self.model.conv._forward_pre_hooks) > 0)
+        self.assertIs(self.model.sub.layer, torch.sub)
+        for module in self.model.modules():
+            self.assertEqual(len(module._forward_pre_hooks), 0)
+            self.assertEqual(len(module._forward_hooks), 0)
+
+        # Calls outside the profiler are not recorded.
+        self.model(self.inputs)
+        self.assertEqual(profiler.records(), [])
+
+    def test_torch_profiler_labels(self):
+        with torch.profiler.profile() as torch_profiler, PytorchQuantizationProfiler(self.model, track_memory=False):
+            self.model(self.inputs)
+        labels = {e.name for e in torch_profiler.events()}
+        for label in ['conv/weights_quantization', 'conv/layer_op', 'conv_act/activation_quantization',
+                      'sub/weights_quantization', 'sub/layer_op', 'sub_act/activation_quantization']:
+            self.assertIn(label, labels)
+
+    def test_track_memory(self):
+        # The peak memory counters are not reset by default.
+        with PytorchQuantizationProfiler(self.model) as profiler:
+            self.model(self.inputs)
+        self.assertTrue(all(r['layer_op_peak_mb'] is None for r in profiler.records()))
+
+        with PytorchQuantizationProfiler(self.model, track_memory=True) as profiler:
+            self.model(self.inputs)
+        # The peak memory is measured on Linux only.
+        if profiler.records()[0]['layer_op_peak_mb'] is not None:
+            self.assertTrue(all(r['weights_quantization_peak_mb'] >= 0 for r in profiler.records()
+                                if r['layer'] in ['conv', 'sub']))
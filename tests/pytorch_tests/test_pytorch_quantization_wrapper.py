@@ -20,6 +20,7 @@ import numpy as np
 
 from mct_quantizers.common.constants import POSITIONAL_WEIGHT, QUANTIZED_POSITIONAL_WEIGHT
 from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
+from mct_quantizers.pytorch.quantizers import WeightsPOTInferableQuantizer, WeightsSymmetricInferableQuantizer
 
 WEIGHT = 'weight'
 
@@ -42,6 +43,23 @@ class ZeroWeightsQuantizer:
         return {}
 
 
+class ZeroInferableWeightsQuantizer:
+    """
+    A dummy quantizer for test usage - like ZeroWeightsQuantizer, without a training argument
+    """
+
+    def __call__(self,
+                 inputs: nn.Parameter) -> nn.Parameter:
+
+        return inputs * 0
+
+    def convert2inferable(self):
+        return self
+
+    def initialize_quantization(self, tensor_shape, name, layer):
+        return {}
+
+
 class ZeroActivationsQuantizer:
     """
     A dummy quantizer for test usage - "quantize" the layer's activation to 0
@@ -127,3 +145,76 @@ class TestPytorchWeightsQuantizationWrapper(unittest.TestCase):
                                                           self.inputs,
                                                           torch.zeros_like(self.cat_const2)],
                                                           **wrapper.op_call_kwargs)))  # check the wrapper's outputs are equal to biases
+
+    def test_forward_plan(self):
+        wrapper = PytorchQuantizationWrapper(self.layers[2], {2: ZeroWeightsQuantizer(), 0: ZeroWeightsQuantizer()},
+                                             weight_values={2: self.cat_const2, 0: self.cat_const1},
+                                             op_call_kwargs={'dim': 1}, is_inputs_as_list=True)
+        # The plan is built at construction: positional weights sorted by position, training flag resolved.
+        self.assertTrue(wrapper._positional_weights_plan == [(0, f'{QUANTIZED_POSITIONAL_WEIGHT}_0'),
+                                                             (2, f'{QUANTIZED_POSITIONAL_WEIGHT}_2')])
+        self.assertTrue(all([p[3] for p in wrapper._weights_quantization_plan]))
+
+        # The plan is rebuilt when the quantizers are replaced.
+        wrapper = PytorchQuantizationWrapper(self.layers[0], {'weight': ZeroWeightsQuantizer()})
+        wrapper.weights_quantizers = {'weight': ZeroInferableWeightsQuantizer()}
+        wrapper.convert_to_inferable_quantizers()
+        self.assertTrue(len(wrapper._weights_quantization_plan) == 1)
+        self.assertFalse(wrapper._weights_quantization_plan[0][3])
+        wrapper(self.inputs)
+        self.assertTrue((0 == getattr(wrapper.layer, 'weight')).all())
+
+        # Wrappers pickled before the plan existed rebuild it when unpickled.
+        state = wrapper.__dict__.copy()
+        for attr in ['is_frozen', '_int_weights_info', '_weights_quantization_plan', '_positional_weights_plan',
+                     '_frozen_weights_plan', '_int_weights_plan']:
+            del state[attr]
+        restored = PytorchQuantizationWrapper.__new__(PytorchQuantizationWrapper)
+        restored.__setstate__(state)
+        self.assertTrue(len(restored._weights_quantization_plan) == 1)
+        self.assertFalse(restored.is_frozen)
+        self.assertTrue(torch.allclose(restored(self.inputs), wrapper(self.inputs)))
+
+    def test_freeze(self):
+        wrapper = PytorchQuantizationWrapper(nn.Conv2d(3, 20, 3), {'weight': ZeroWeightsQuantizer()})
+        wrapper.freeze()
+        self.assertTrue(wrapper.is_frozen)
+        self.assertTrue('weight' not in dict(wrapper.named_parameters()))
+        self.assertTrue((0 == dict(wrapper.named_buffers())['weight']).all())
+        self.assertTrue(len(wrapper._weights_quantization_plan) == 0)
+        y = wrapper(self.inputs)
+        self.assertTrue(torch.allclose(y[0, :, 0, 0], getattr(wrapper.layer, 'bias')))
+        self.assertTrue(set(wrapper.state_dict().keys()) == {'weight', 'layer.bias'})
+
+        wrapper = PytorchQuantizationWrapper(self.layers[2], {0: ZeroWeightsQuantizer(), 2: ZeroWeightsQuantizer()},
+                                             weight_values={0: self.cat_const1, 2: self.cat_const2},
+                                             op_call_kwargs={'dim': 1}, is_inputs_as_list=True)
+        wrapper.freeze()
+        self.assertTrue(len(list(wrapper.parameters())) == 0)
+        y = wrapper(self.inputs)
+        self.assertTrue(torch.allclose(y, self.layers[2]([torch.zeros_like(self.cat_const1),
+                                                          self.inputs,
+                                                          torch.zeros_like(self.cat_const2)], dim=1)))
+        with self.assertRaises(Exception):
+            wrapper.convert_to_inferable_quantizers()
+
+    def test_quantizers_submodules(self):
+        wrapper = PytorchQuantizationWrapper(self.layers[1], {0: WeightsPOTInferableQuantizer(num_bits=4,
+                                                                                               per_channel=False,
+                                                                                               threshold=[2.])},
+                                             weight_values={0: self.sub_const})
+        self.assertTrue(dict(wrapper.named_modules())['weights_quantizer_0'] is wrapper.weights_quantizers[0])
+        # The quantizers buffers are not saved in the state_dict.
+        self.assertTrue(set(wrapper.state_dict().keys()) == {f'{POSITIONAL_WEIGHT}_0'})
+        wrapper.to('meta')
+        self.assertTrue(wrapper.weights_quantizers[0].scales.device.type == 'meta')
+
+        # Replacing the quantizers replaces the registered submodules.
+        quantizer = WeightsSymmetricInferableQuantizer(num_bits=4, per_channel=True, threshold=[1.] * 4,
+                                                       channel_axis=0)
+        trainable_quantizer = ZeroWeightsQuantizer()
+        trainable_quantizer.convert2inferable = lambda: quantizer
+        wrapper = PytorchQuantizationWrapper(nn.Conv2d(3, 4, 3), {'weight': trainable_quantizer})
+        self.assertTrue(len(list(wrapper.children())) == 1)
+        wrapper.convert_to_inferable_quantizers()
+        self.assertTrue(list(wrapper.children())[1] is quantizer)
@@ -0,0 +1,83 @@
+# Copyright 2025 Sony Semiconductor Solutions, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import gc
+import unittest
+
+from mct_quantizers.common.base_inferable_quantizer import QUANTIZERS_REGISTRY, BaseInferableQuantizer, \
+    QuantizationTarget, QuantizerID, mark_quantizer
+from mct_quantizers.common.get_all_subclasses import get_all_subclasses
+from mct_quantizers.common.get_quantizers import get_inferable_quantizer_class
+from mct_quantizers.common.quant_info import QuantizationMethod
+from mct_quantizers.pytorch.quantizers import BasePyTorchInferableQuantizer, WeightsSymmetricInferableQuantizer
+
+
+class TestQuantizersRegistry(unittest.TestCase):
+
+    def test_registry_matches_subclasses_scan(self):
+        # Collect the dead classes of other tests, so they are not collected between the compared calls.
+        gc.collect()
+        for base in [BaseInferableQuantizer, BasePyTorchInferableQuantizer, WeightsSymmetricInferableQuantizer]:
+            self.assertEqual(QUANTIZERS_REGISTRY.subclasses(base), get_all_subclasses(base))
+            self.assertEqual(dict(QUANTIZERS_REGISTRY.subclasses_by_name(base)),
+                             {c.__name__: c for c in get_all_subclasses(base)})
+
+    def test_find_marked_quantizers(self):
+        self.assertEqual(QUANTIZERS_REGISTRY.find(BasePyTorchInferableQuantizer, QuantizationTarget.Weights,
+                                                  QuantizationMethod.SYMMETRIC, QuantizerID.INFERABLE),
+                         [WeightsSymmetricInferableQuantizer])
+        self.assertEqual(QUANTIZERS_REGISTRY.find(BasePyTorchInferableQuantizer, QuantizationTarget.Weights,
+                                                  QuantizationMethod.SYMMETRIC, 'other identifier'), [])
+
+    def test_new_quantizer_class(self):
+        class CustomBase(BasePyTorchInferableQuantizer):
+            pass
+
+        # Unmarked, it is indexed by the attributes it inherits.
+        class CustomQuantizer(CustomBase, WeightsSymmetricInferableQuantizer):
+            pass
+        self.assertEqual(QUANTIZERS_REGISTRY.find(CustomBase, QuantizationTarget.Weights,
+                                                  QuantizationMethod.SYMMETRIC, QuantizerID.INFERABLE),
+                         [CustomQuantizer])
+
+        # Marking it reindexes it.
+        mark_quantizer(quantization_target=QuantizationTarget.Activation,
+                       quantization_method=[QuantizationMethod.LUT_POT_QUANTIZER],
+                       identifier=QuantizerID.INFERABLE)(CustomQuantizer)
+        self.assertEqual(QUANTIZERS_REGISTRY.find(CustomBase, QuantizationTarget.Weights,
+                                                  QuantizationMethod.SYMMETRIC, QuantizerID.INFERABLE), [])
+        self.assertIs(get_inferable_quantizer_class(QuantizationTarget.Activation,
+                                                    QuantizationMethod.LUT_POT_QUANTIZER, CustomBase),
+                      CustomQuantizer)
+        self.assertIs(QUANTIZERS_REGISTRY.subclasses_by_name(BasePyTorchInferableQuantizer)['CustomQuantizer'],
+                      CustomQuantizer)
+
+        # The registry doesn't keep the classes alive.
+        del CustomQuantizer, CustomBase
+        gc.collect()
+        self.assertNotIn('CustomQuantizer', QUANTIZERS_REGISTRY.subclasses_by_name(BasePyTorchInferableQuantizer))
+        self.assertEqual(QUANTIZERS_REGISTRY.subclasses(BasePyTorchInferableQuantizer),
+                         get_all_subclasses(BasePyTorchInferableQuantizer))
+
+    def test_non_quantizer_base_class(self):
+        class NotAQuantizer:
+            pass
+
+        @mark_quantizer(quantization_target=QuantizationTarget.Weights,
+                        quantization_method=[QuantizationMethod.SYMMETRIC],
+                        identifier=QuantizerID.INFERABLE)
+        class Quantizer(NotAQuantizer):
+            pass
+        self.assertIs(get_inferable_quantizer_class(QuantizationTarget.Weights, QuantizationMethod.SYMMETRIC,
+                                                    NotAQuantizer), Quantizer)